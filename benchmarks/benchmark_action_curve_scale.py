@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Measure the action curves rescale used by the animation export with a rescaled rig.
+#  The addon need be installed and enabled.
+#  blender --background --python benchmarks/benchmark_action_curve_scale.py -- --actions 500 --keys 10000
+# ----------------------------------------------------------------
+
+import argparse
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import List
+
+import bpy
+import numpy as np
+
+
+def get_addon_module() -> ModuleType:
+    for addon_name in bpy.context.preferences.addons.keys():
+        module = importlib.import_module(addon_name)
+        if hasattr(module, "bfu_utils"):
+            return module
+    raise RuntimeError("Blender For UnrealEngine addon is not enabled.")
+
+
+def create_armature_object() -> bpy.types.Object:
+    armature = bpy.data.armatures.new("BenchmarkArmature")
+    obj = bpy.data.objects.new("BenchmarkArmature", armature)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.animation_data_create()
+    return obj
+
+
+def add_location_fcurves(obj: bpy.types.Object, action: bpy.types.Action, bone_count: int, keys_per_fcurve: int) -> None:
+    # Assign the action first to create the slot in Blender 4.4+.
+    obj.animation_data.action = action
+    frames = np.arange(keys_per_fcurve, dtype=np.float32)
+    for bone_index in range(bone_count):
+        for axis in range(3):
+            data_path = f'pose.bones["Bone{bone_index}"].location'
+            if bpy.app.version >= (4, 4, 0):
+                fcurve = action.fcurve_ensure_for_datablock(obj, data_path, index=axis)  # type: ignore
+            else:
+                fcurve = action.fcurves.new(data_path, index=axis)  # type: ignore
+            fcurve.keyframe_points.add(keys_per_fcurve)
+            coords = np.empty(keys_per_fcurve * 2, dtype=np.float32)
+            coords[0::2] = frames
+            coords[1::2] = np.sin(frames * 0.1)
+            fcurve.keyframe_points.foreach_set("co", coords)
+            fcurve.keyframe_points.foreach_set("handle_left", coords)
+            fcurve.keyframe_points.foreach_set("handle_right", coords)
+
+
+def create_actions(obj: bpy.types.Object, action_count: int, key_count: int) -> List[bpy.types.Action]:
+    # Each action has key_count keys, shared by 10 bones (30 location fcurves).
+    bone_count = 10
+    keys_per_fcurve = max(key_count // (bone_count * 3), 1)
+    actions: List[bpy.types.Action] = []
+    for index in range(action_count):
+        action = bpy.data.actions.new(f"BenchmarkAction_{index:04d}")
+        add_location_fcurves(obj, action, bone_count, keys_per_fcurve)
+        actions.append(action)
+    return actions
+
+
+def legacy_rescale_all_actions(scale: float) -> None:
+    # Previous implementation: all the actions, key by key.
+    def rescale_fcurves(fcurves: bpy.types.bpy_prop_collection) -> None:
+        for fcurve in fcurves:
+            if fcurve.data_path.split(".")[-1] == "location":
+                for key in fcurve.keyframe_points:
+                    key.co[1] *= scale
+                    key.handle_left[1] *= scale
+                    key.handle_right[1] *= scale
+
+    for action in bpy.data.actions:
+        if bpy.app.version >= (4, 4, 0):
+            for layer in action.layers:
+                for strip in layer.strips:
+                    for channelbag in strip.channelbags:
+                        rescale_fcurves(channelbag.fcurves)
+        else:
+            rescale_fcurves(action.fcurves)  # type: ignore
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Action curve scale benchmark")
+    parser.add_argument("--actions", type=int, default=500, help="Number of actions in the file")
+    parser.add_argument("--keys", type=int, default=10000, help="Number of keys per action")
+    parser.add_argument("--skip_legacy", action="store_true", help="Skip the previous implementation (slow)")
+    args = parser.parse_args(argv)
+
+    bfu_utils = get_addon_module().bfu_utils
+    obj = create_armature_object()
+    actions = create_actions(obj, args.actions, args.keys)
+    obj.animation_data.action = actions[0]
+    print(f"{len(actions)} actions with {args.keys} keys each.")
+
+    # Rescale then restore, like one animation export.
+    start = time.perf_counter()
+    action_curve_scale = bfu_utils.ActionCurveScale(100.0, [obj])
+    action_curve_scale.rescale_for_export()
+    action_curve_scale.restore_scale_after_export()
+    print(f"Scoped to the export selection: {(time.perf_counter() - start) * 1000:.2f} ms per export")
+
+    start = time.perf_counter()
+    action_curve_scale = bfu_utils.ActionCurveScale(100.0)
+    action_curve_scale.rescale_for_export()
+    action_curve_scale.restore_scale_after_export()
+    print(f"All actions, NumPy: {(time.perf_counter() - start) * 1000:.2f} ms per export")
+
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        legacy_rescale_all_actions(100.0)
+        legacy_rescale_all_actions(0.01)
+        print(f"All actions, key by key (legacy): {(time.perf_counter() - start) * 1000:.2f} ms per export")
+
+
+if __name__ == "__main__":
+    main()
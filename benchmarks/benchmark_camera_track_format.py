@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Compare the camera track formats: JSON size, write time and read time.
+#  The encoder and decoder modules are loaded from their files, Blender is not needed.
+#  python benchmarks/benchmark_camera_track_format.py --frames 10000
+# ----------------------------------------------------------------
+
+import argparse
+import importlib.util
+import json
+import math
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict
+
+ADDON_PATH = Path(__file__).resolve().parent.parent / "blender_for_unrealengine"
+
+
+def load_module_from_file(name: str, path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_transform_track(frame_count: int) -> Dict[int, Any]:
+    # Camera dolly with a constant height and scale, like most of the shots.
+    track: Dict[int, Any] = {}
+    for frame in range(frame_count):
+        track[frame] = {
+            "location_x": round(math.sin(frame * 0.01) * 500, 8),
+            "location_y": round(frame * 0.5, 8),
+            "location_z": 170.0,
+            "rotation_x": 0.0,
+            "rotation_y": round(-10 + frame * 0.001, 8),
+            "rotation_z": round(frame * 0.01, 8),
+            "scale_x": 1.0,
+            "scale_y": 1.0,
+            "scale_z": 1.0,
+        }
+    return track
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Camera track format benchmark")
+    parser.add_argument("--frames", type=int, default=10000, help="Number of frames in the transform track")
+    args = parser.parse_args()
+
+    track_format = load_module_from_file("bfu_camera_track_format", ADDON_PATH / "bfu_camera" / "bfu_camera_track_format.py")
+    sequencer_track_format = load_module_from_file("sequencer_track_format", ADDON_PATH / "bfu_import_module" / "sequencer_track_format.py")
+    track = create_transform_track(args.frames)
+
+    for format_name in [track_format.TRACK_FORMAT_DICT, track_format.TRACK_FORMAT_COLUMNAR, track_format.TRACK_FORMAT_COLUMNAR_BASE64]:
+        start = time.perf_counter()
+        text = json.dumps(track_format.format_track(track, format_name), indent=4)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        channel_keys = sequencer_track_format.get_track_channel_keys(json.loads(text))
+        read_time = time.perf_counter() - start
+
+        key_count = sum(len(frames) for frames, _ in channel_keys.values())
+        print(f"{format_name}: {len(text) / 1024:.1f} KiB, write {write_time * 1000:.2f} ms, read {read_time * 1000:.2f} ms, {key_count} keys to add")
+
+
+if __name__ == "__main__":
+    main()
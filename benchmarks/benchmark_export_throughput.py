@@ -0,0 +1,475 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Measure the export throughput on a generated scene, from the asset search to the data files.
+#  The addon need be installed and enabled.
+#  blender --background --python benchmarks/benchmark_export_throughput.py -- --static-meshes 100 --vertices 10000 --report report.json
+#
+#  Save a baseline, then compare the next runs with it:
+#  blender --background --python benchmarks/benchmark_export_throughput.py -- --report baseline.json
+#  blender --background --python benchmarks/benchmark_export_throughput.py -- --baseline baseline.json
+#  The script exit with the code 1 when a phase or a time log step is slower than the baseline.
+#
+#  Compare the fast FK bake with the default animation bake:
+#  blender --background --python benchmarks/benchmark_export_throughput.py -- --report default_bake.json
+#  blender --background --python benchmarks/benchmark_export_throughput.py -- --fast-fk-bake --baseline default_bake.json
+# ----------------------------------------------------------------
+
+import argparse
+import importlib
+import json
+import math
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+import bpy
+import numpy as np
+
+try:
+    import resource  # Not available on Windows.
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+
+def get_addon_module() -> ModuleType:
+    for addon_name in bpy.context.preferences.addons.keys():
+        module = importlib.import_module(addon_name)
+        if hasattr(module, "bfu_export"):
+            return module
+    raise RuntimeError("Blender For UnrealEngine addon is not enabled.")
+
+
+# -------------------------------------------------------------------
+#   Synthetic scene
+# -------------------------------------------------------------------
+
+def clear_scene() -> None:
+    bpy.data.batch_remove(list(bpy.data.objects))
+    for data_collection in (bpy.data.meshes, bpy.data.armatures, bpy.data.cameras, bpy.data.curves, bpy.data.actions, bpy.data.collections):
+        bpy.data.batch_remove(list(data_collection))
+
+
+def link_object(obj: bpy.types.Object, collection: Optional[bpy.types.Collection] = None) -> None:
+    if collection is None:
+        collection = bpy.context.scene.collection
+    collection.objects.link(obj)
+
+
+def set_export_recursive(obj: bpy.types.Object) -> None:
+    obj.bfu_export_type = "export_recursive"  # type: ignore[attr-defined]
+
+
+def create_grid_mesh(name: str, vertex_count: int) -> bpy.types.Mesh:
+    # Grid of quads with about vertex_count vertices.
+    size = max(int(math.sqrt(vertex_count)), 2)
+    x, y = np.meshgrid(np.arange(size, dtype=np.float32), np.arange(size, dtype=np.float32))
+    coords = np.stack([x.ravel(), y.ravel(), np.sin(x.ravel() * 0.3) * 0.2], axis=1) / size
+
+    grid = np.arange(size * size, dtype=np.int32).reshape(size, size)
+    quads = np.stack([grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]], axis=2).reshape(-1)
+    face_count = len(quads) // 4
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(size * size)
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.loops.add(len(quads))
+    mesh.loops.foreach_set("vertex_index", quads)
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(quads), 4, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(face_count, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    mesh.uv_layers.new(name="UVMap")
+    return mesh
+
+
+def create_static_meshes(count: int, vertex_count: int, collections: List[bpy.types.Collection]) -> None:
+    for index in range(count):
+        obj = bpy.data.objects.new(f"SM_Benchmark_{index:04d}", create_grid_mesh(f"SM_Benchmark_{index:04d}", vertex_count))
+        obj.location.x = index * 2.0
+        link_object(obj, collections[index % len(collections)] if collections else None)
+        if not collections:
+            set_export_recursive(obj)
+
+
+def create_collections(count: int) -> List[bpy.types.Collection]:
+    scene = bpy.context.scene
+    collections: List[bpy.types.Collection] = []
+    for index in range(count):
+        collection = bpy.data.collections.new(f"COL_Benchmark_{index:04d}")
+        scene.collection.children.link(collection)
+        item = scene.bfu_static_collection_asset_list.add()  # type: ignore[attr-defined]
+        item.name = collection.name
+        item.use = True
+        collections.append(collection)
+    return collections
+
+
+def create_armature(name: str, bone_count: int) -> bpy.types.Object:
+    # Chain of bones, edit bones need the edit mode.
+    armature = bpy.data.armatures.new(name)
+    obj = bpy.data.objects.new(name, armature)
+    link_object(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    for bone_index in range(bone_count):
+        bone = armature.edit_bones.new(f"Bone{bone_index}")
+        bone.head = (0.0, 0.0, bone_index * 0.1)
+        bone.tail = (0.0, 0.0, (bone_index + 1) * 0.1)
+        if bone_index > 0:
+            bone.parent = armature.edit_bones[f"Bone{bone_index - 1}"]
+            bone.use_connect = True
+    bpy.ops.object.mode_set(mode="OBJECT")
+    return obj
+
+
+def add_bone_fcurves(obj: bpy.types.Object, action: bpy.types.Action, bone_count: int, frame_count: int) -> None:
+    # Assign the action first to create the slot in Blender 4.4+.
+    obj.animation_data.action = action
+    frames = np.arange(frame_count, dtype=np.float32)
+    for bone_index in range(bone_count):
+        for axis in range(3):
+            data_path = f'pose.bones["Bone{bone_index}"].rotation_euler'
+            if bpy.app.version >= (4, 4, 0):
+                fcurve = action.fcurve_ensure_for_datablock(obj, data_path, index=axis)  # type: ignore
+            else:
+                fcurve = action.fcurves.new(data_path, index=axis)  # type: ignore
+            fcurve.keyframe_points.add(frame_count)
+            coords = np.empty(frame_count * 2, dtype=np.float32)
+            coords[0::2] = frames
+            coords[1::2] = np.sin(frames * 0.1 + bone_index + axis) * 0.3
+            fcurve.keyframe_points.foreach_set("co", coords)
+            fcurve.keyframe_points.foreach_set("handle_left", coords)
+            fcurve.keyframe_points.foreach_set("handle_right", coords)
+            fcurve.update()
+
+
+def create_skeletal_rigs(count: int, vertex_count: int, bone_count: int, action_count: int, frame_count: int) -> None:
+    for rig_index in range(count):
+        rig = create_armature(f"SK_Benchmark_{rig_index:04d}", bone_count)
+        rig.location.y = rig_index * 4.0
+        for bone in rig.pose.bones:
+            bone.rotation_mode = "XYZ"
+        set_export_recursive(rig)
+
+        # Skinned mesh, each vertex is weighted to the bone at the same height.
+        mesh = create_grid_mesh(f"SK_Benchmark_{rig_index:04d}_Mesh", vertex_count)
+        mesh_obj = bpy.data.objects.new(mesh.name, mesh)
+        link_object(mesh_obj)
+        mesh_obj.parent = rig
+        modifier = mesh_obj.modifiers.new("Armature", "ARMATURE")
+        modifier.object = rig  # type: ignore[attr-defined]
+        groups = [mesh_obj.vertex_groups.new(name=f"Bone{bone_index}") for bone_index in range(bone_count)]
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        bone_indices = np.minimum((coords[1::3] * bone_count).astype(np.int64), bone_count - 1)
+        for bone_index, group in enumerate(groups):
+            group.add(np.flatnonzero(bone_indices == bone_index).tolist(), 1.0, "REPLACE")
+
+        rig.animation_data_create()
+        for action_index in range(action_count):
+            action = bpy.data.actions.new(f"Anim_Benchmark_{rig_index:04d}_{action_index:04d}")
+            add_bone_fcurves(rig, action, bone_count, frame_count)
+        rig.animation_data.action = None
+
+
+def create_cameras(count: int, frame_count: int) -> None:
+    for index in range(count):
+        camera = bpy.data.objects.new(f"CAM_Benchmark_{index:04d}", bpy.data.cameras.new(f"CAM_Benchmark_{index:04d}"))
+        link_object(camera)
+        set_export_recursive(camera)
+        for frame in range(0, frame_count, 10):
+            camera.location = (math.cos(frame * 0.05) * 10.0, math.sin(frame * 0.05) * 10.0, 2.0 + index)
+            camera.keyframe_insert("location", frame=frame)
+            camera.data.lens = 35.0 + (frame % 50)
+            camera.data.keyframe_insert("lens", frame=frame)
+
+
+def create_splines(count: int, point_count: int) -> None:
+    for index in range(count):
+        curve = bpy.data.curves.new(f"SPL_Benchmark_{index:04d}", "CURVE")
+        curve.dimensions = "3D"
+        spline = curve.splines.new("BEZIER")
+        spline.bezier_points.add(point_count - 1)
+        t = np.linspace(0.0, 4.0 * math.pi, point_count, dtype=np.float32)
+        coords = np.stack([np.cos(t) * 5.0, np.sin(t) * 5.0, t * 0.2 + index], axis=1).ravel()
+        spline.bezier_points.foreach_set("co", coords)
+        spline.bezier_points.foreach_set("handle_left", coords)
+        spline.bezier_points.foreach_set("handle_right", coords)
+        obj = bpy.data.objects.new(curve.name, curve)
+        link_object(obj)
+        set_export_recursive(obj)
+
+
+def create_benchmark_scene(args: argparse.Namespace) -> None:
+    clear_scene()
+    scene = bpy.context.scene
+    scene.frame_start = 0
+    scene.frame_end = args.frames
+    collections = create_collections(args.collections)
+    create_static_meshes(args.static_meshes, args.vertices, collections)
+    create_skeletal_rigs(args.rigs, args.vertices, args.bones, args.actions, args.frames)
+    create_cameras(args.cameras, args.frames)
+    create_splines(args.splines, args.spline_points)
+
+
+def set_export_dirpath(export_dirpath: Path) -> None:
+    scene = bpy.context.scene
+    for prop_name, folder_name in (
+        ("bfu_export_static_mesh_file_path", "StaticMesh"),
+        ("bfu_export_skeletal_mesh_file_path", "SkeletalMesh"),
+        ("bfu_export_skeletal_animation_file_path", "Animation"),
+        ("bfu_export_alembic_file_path", "Alembic"),
+        ("bfu_export_groom_file_path", "Groom"),
+        ("bfu_export_camera_file_path", "Camera"),
+        ("bfu_export_spline_file_path", "Spline"),
+        ("bfu_export_other_file_path", "Other"),
+    ):
+        setattr(scene, prop_name, str(export_dirpath / folder_name) + "/")
+
+
+# -------------------------------------------------------------------
+#   Measures
+# -------------------------------------------------------------------
+
+def get_peak_rss_mb() -> Optional[float]:
+    # Peak resident memory of the Blender process.
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)  # Bytes on macOS
+    return peak / 1024  # KiB on Linux
+
+
+def get_export_files_info(export_dirpath: Path) -> Dict[str, Any]:
+    files = [path for path in export_dirpath.rglob("*") if path.is_file()]
+    return {
+        "count": len(files),
+        "size_mb": sum(path.stat().st_size for path in files) / (1024 * 1024),
+    }
+
+
+def get_time_log_groups(addon: ModuleType) -> Dict[str, Dict[str, float]]:
+    # Sum the addon time logs by step, without the asset names.
+    store = addon.bfu_export_logs.bfu_process_time_logs_types.process_time_log_store
+    groups: Dict[str, Dict[str, float]] = {}
+    for record in store.get_records():
+        if not record.finished_success:
+            continue
+        step_name = record.process_info.split(":")[0].split("'")[0].strip()
+        group = groups.setdefault(step_name, {"count": 0, "seconds": 0.0})
+        group["count"] += 1
+        group["seconds"] += record.end_time - record.start_time
+    return groups
+
+
+def run_phase(phases: Dict[str, float], name: str, function: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = function()
+    phases[name] = time.perf_counter() - start
+    return result
+
+
+def run_export(addon: ModuleType, export_dirpath: Path) -> Dict[str, Any]:
+    # Same steps as the export operator.
+    cached_assets = addon.bfu_cached_assets.bfu_cached_assets_blender_class
+    text_files_process = addon.bfu_export_text_files.bfu_export_text_files_process
+    phases: Dict[str, float] = {}
+
+    addon.bfu_export_logs.clear_all_logs()
+    final_asset_cache = cached_assets.get_final_asset_cache()
+    asset_list = run_phase(phases, "asset_search", lambda: final_asset_cache.get_final_asset_list(
+        cached_assets.AssetToSearch.ALL_ASSETS,
+        cached_assets.AssetDataSearchMode.FULL,
+        force_cache_update=True
+    ))
+    run_phase(phases, "general_fix", lambda: addon.bfu_check_potential_error.bfu_check_utils.process_general_fix())
+
+    data_files_writer = text_files_process.DataFilesStreamWriter()
+    data_files_writer.begin()
+    exported_asset_log = run_phase(phases, "export", lambda: addon.bfu_export.bfu_export_asset.process_export(
+        None,  # type: ignore[arg-type]
+        asset_list,
+        on_asset_exported=data_files_writer.add_exported_asset
+    ))
+    run_phase(phases, "data_files", lambda: text_files_process.write_all_data_files(exported_asset_log, data_files_writer))
+
+    result = {
+        "phases": phases,
+        "time_log_groups": get_time_log_groups(addon),
+        "asset_count": len(asset_list),
+        "exported_asset_count": len(exported_asset_log),
+        "export_files": get_export_files_info(export_dirpath),
+    }
+    addon.bfu_export_logs.clear_all_logs()
+    return result
+
+
+def get_median_time_log_groups(runs: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    # Median by step, like the phases. Steps missing in a run count as 0 seconds.
+    step_names = {name for run in runs for name in run["time_log_groups"]}
+    groups: Dict[str, Dict[str, float]] = {}
+    for name in sorted(step_names):
+        run_groups = [run["time_log_groups"].get(name, {"count": 0, "seconds": 0.0}) for run in runs]
+        groups[name] = {
+            "count": statistics.median(group["count"] for group in run_groups),
+            "seconds": statistics.median(group["seconds"] for group in run_groups),
+        }
+    return groups
+
+
+def get_median_phases(runs: List[Dict[str, Any]]) -> Dict[str, float]:
+    phase_names = runs[0]["phases"].keys()
+    phases = {name: statistics.median(run["phases"][name] for run in runs) for name in phase_names}
+    phases["total"] = sum(phases.values())
+    return phases
+
+
+# -------------------------------------------------------------------
+#   Baseline
+# -------------------------------------------------------------------
+
+def compare_seconds(kind: str, name: str, seconds: float, baseline_seconds: float, tolerance: float, min_seconds: float) -> Dict[str, Any]:
+    # A time is a regression when it is slower than the tolerance and than min_seconds.
+    ratio = seconds / baseline_seconds if baseline_seconds > 0 else math.inf
+    regression = ratio > 1.0 + tolerance and seconds - baseline_seconds > min_seconds
+    return {
+        "kind": kind,
+        "name": name,
+        "seconds": seconds,
+        "baseline_seconds": baseline_seconds,
+        "ratio": ratio,
+        "regression": regression,
+    }
+
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, min_seconds: float) -> List[Dict[str, Any]]:
+    # Compare the phases, then the time log steps to find the step that regressed inside a phase.
+    comparisons: List[Dict[str, Any]] = []
+    for name, seconds in report["phases"].items():
+        baseline_seconds = baseline.get("phases", {}).get(name)
+        if baseline_seconds is not None:
+            comparisons.append(compare_seconds("phase", name, seconds, baseline_seconds, tolerance, min_seconds))
+
+    baseline_groups = baseline.get("time_log_groups", {})
+    for name, group in report["time_log_groups"].items():
+        baseline_group = baseline_groups.get(name)
+        if baseline_group is not None:
+            comparisons.append(compare_seconds("step", name, group["seconds"], baseline_group["seconds"], tolerance, min_seconds))
+    return comparisons
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("Phase                 Time")
+    for name, seconds in report["phases"].items():
+        print(f"{name:<20} {seconds:8.3f}s")
+    print(f"Assets: {report['asset_count']}, files: {report['export_files']['count']} ({report['export_files']['size_mb']:.1f} MB)")
+    if report["peak_rss_mb"] is not None:
+        print(f"Peak memory (process): {report['peak_rss_mb']:.1f} MB")
+    if report["peak_python_mb"] is not None:
+        print(f"Peak memory (Python allocations): {report['peak_python_mb']:.1f} MB")
+
+    print("Slowest time log steps:")
+    time_log_groups = sorted(report["time_log_groups"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    for step_name, group in time_log_groups[:15]:
+        print(f"  {group['seconds']:8.3f}s  x{int(group['count']):<5} {step_name}")
+
+    if "baseline_comparison" in report:
+        print("Baseline comparison:")
+        for comparison in report["baseline_comparison"]:
+            if comparison["kind"] == "step" and not comparison["regression"]:
+                continue  # Only the regressed steps, the list is long.
+            result = "REGRESSION" if comparison["regression"] else "ok"
+            print(f"  {comparison['kind']:<5} {comparison['name']:<40} {comparison['seconds']:8.3f}s / {comparison['baseline_seconds']:8.3f}s  x{comparison['ratio']:.2f}  {result}")
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--static-meshes", type=int, default=20)
+    parser.add_argument("--vertices", type=int, default=10000, help="Vertices per mesh.")
+    parser.add_argument("--rigs", type=int, default=2)
+    parser.add_argument("--bones", type=int, default=30)
+    parser.add_argument("--actions", type=int, default=5, help="Actions per rig.")
+    parser.add_argument("--cameras", type=int, default=2)
+    parser.add_argument("--frames", type=int, default=250, help="Frames of the actions and cameras.")
+    parser.add_argument("--splines", type=int, default=5)
+    parser.add_argument("--spline-points", type=int, default=100)
+    parser.add_argument("--collections", type=int, default=0, help="Export the static meshes in N collections instead of per object.")
+    parser.add_argument("--repeat", type=int, default=1, help="Export runs, the median time is reported.")
+    parser.add_argument("--trace-memory", action="store_true", help="Also measure the peak Python allocations (slower).")
+    parser.add_argument("--fast-fk-bake", action="store_true", help="Bake the FK only actions without scene.frame_set() for each frame.")
+    parser.add_argument("--export-dir", type=str, default="")
+    parser.add_argument("--report", type=str, default="")
+    parser.add_argument("--baseline", type=str, default="")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown compared to the baseline.")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Ignore slowdowns smaller than this.")
+    args = parser.parse_args(argv)
+
+    addon = get_addon_module()
+    addon.bfu_addon_prefs.get_addon_preferences().use_fast_fk_bake = args.fast_fk_bake
+    export_dirpath = Path(args.export_dir) if args.export_dir else Path(tempfile.mkdtemp(prefix="bfu_benchmark_"))
+    export_dirpath.mkdir(parents=True, exist_ok=True)
+
+    generate_start = time.perf_counter()
+    create_benchmark_scene(args)
+    set_export_dirpath(export_dirpath)
+    # Same as the export operator, the file need be saved.
+    bpy.ops.wm.save_as_mainfile(filepath=str(export_dirpath / "benchmark_scene.blend"))
+    generate_time = time.perf_counter() - generate_start
+
+    if args.trace_memory:
+        tracemalloc.start()
+    runs = [run_export(addon, export_dirpath) for _ in range(max(args.repeat, 1))]
+    peak_python_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024) if args.trace_memory else None
+    if args.trace_memory:
+        tracemalloc.stop()
+
+    report: Dict[str, Any] = {
+        "config": vars(args),
+        "blender_version": bpy.app.version_string,
+        "platform": platform.platform(),
+        "scene_generation_seconds": generate_time,
+        "phases": get_median_phases(runs),
+        "time_log_groups": get_median_time_log_groups(runs),
+        "asset_count": runs[-1]["asset_count"],
+        "exported_asset_count": runs[-1]["exported_asset_count"],
+        "export_files": runs[-1]["export_files"],
+        "peak_rss_mb": get_peak_rss_mb(),
+        "peak_python_mb": peak_python_mb,
+    }
+
+    has_regression = False
+    if args.baseline:
+        with open(args.baseline, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        report["baseline_comparison"] = compare_with_baseline(report, baseline, args.tolerance, args.min_seconds)
+        has_regression = any(comparison["regression"] for comparison in report["baseline_comparison"])
+
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as report_file:
+            json.dump(report, report_file, indent=4)
+        print(f"Report saved in {args.report}")
+
+    if has_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
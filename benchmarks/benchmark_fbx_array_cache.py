@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Measure the FBX compressed array cache: the same generated hierarchy is written several times,
+#  like a skeletal mesh exported with each of its actions.
+#  The script exit with the code 1 when a file written with the cache is not the same as without it.
+#  encode_bin is loaded from the fbxio folder, Blender is not needed.
+#  python benchmarks/benchmark_fbx_array_cache.py --exports 10 --cache-size 512 --fbxio io_scene_fbx_5_0
+# ----------------------------------------------------------------
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark_fbx_stream_writer import load_encode_bin, write_full_tree
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FBX compressed array cache benchmark")
+    parser.add_argument("--exports", type=int, default=10, help="Number of files written with the same meshes")
+    parser.add_argument("--meshes", type=int, default=10, help="Number of generated meshes")
+    parser.add_argument("--vertices", type=int, default=50000, help="Number of vertices per mesh")
+    parser.add_argument("--frames", type=int, default=1000, help="Number of keys per animation curve")
+    parser.add_argument("--cache-size", type=int, default=512, help="Cache size in MiB")
+    parser.add_argument("--fbxio", default="io_scene_fbx_5_0", help="fbxio folder")
+    args = parser.parse_args()
+
+    encode_bin = load_encode_bin(args.fbxio)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filepath = Path(temp_dir) / "export.fbx"
+
+        start = time.perf_counter()
+        for _ in range(args.exports):
+            write_full_tree(encode_bin, filepath, args)
+        no_cache_time = time.perf_counter() - start
+        no_cache_data = filepath.read_bytes()
+
+        cache = encode_bin.FBXCompressedArrayCache(args.cache_size * 1024 * 1024)
+        previous_cache = encode_bin.set_compressed_array_cache(cache)
+        try:
+            start = time.perf_counter()
+            for _ in range(args.exports):
+                write_full_tree(encode_bin, filepath, args)
+            cache_time = time.perf_counter() - start
+        finally:
+            encode_bin.set_compressed_array_cache(previous_cache)
+        cache_data = filepath.read_bytes()
+
+    print(f"Without cache: {no_cache_time:.3f} s for {args.exports} export(s)")
+    print(f"With cache: {cache_time:.3f} s for {args.exports} export(s)")
+    print(f"{cache.hits} hit(s), {cache.misses} miss(es), {cache.evictions} eviction(s), {cache.size / (1024 * 1024):.1f} MiB cached")
+
+    if no_cache_data != cache_data:
+        print("The file written with the cache is not the same!")
+        sys.exit(1)
+    print("Files are the same.")
+
+
+if __name__ == "__main__":
+    main()
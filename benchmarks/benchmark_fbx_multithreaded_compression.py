@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Compare the FBX array compression on the main thread (before) and with multiple threads (after)
+#  for each fbxio version, with generated heavy meshes.
+#  The script exit with the code 1 when the files are not the same.
+#  encode_bin is loaded from the fbxio folders, Blender is not needed.
+#  python benchmarks/benchmark_fbx_multithreaded_compression.py --meshes 10 --vertices 200000
+#  python benchmarks/benchmark_fbx_multithreaded_compression.py --fbxio io_scene_fbx_3_6 io_scene_fbx_4_0
+# ----------------------------------------------------------------
+
+import argparse
+import array
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, List
+
+FBXIO_PATH = Path(__file__).resolve().parent.parent / "blender_for_unrealengine" / "fbxio"
+FBX_VERSION = 7400
+FBXIO_MODULES = ["encode_bin", "data_types", "fbx_utils_threading"]
+
+
+def load_encode_bin(fbxio_name: str) -> ModuleType:
+    # Each version has its own encode_bin, data_types and fbx_utils_threading modules.
+    for module_name in FBXIO_MODULES:
+        sys.modules.pop(module_name, None)
+    sys.path.insert(0, str(FBXIO_PATH / fbxio_name))
+    try:
+        import encode_bin
+    finally:
+        sys.path.pop(0)
+    return encode_bin
+
+
+def create_mesh_arrays(vertex_count: int, seed: int) -> List[array.array]:
+    # array.array is supported by all the versions, numpy arrays only by the newer ones.
+    vertices = array.array('d', (math.sin(i * 0.37 + seed) * 100.0 for i in range(vertex_count * 3)))
+    normals = array.array('d', (math.cos(i * 0.11 + seed) for i in range(vertex_count * 3)))
+    indices = array.array('i', ((i * 7 + seed) % vertex_count for i in range(vertex_count * 4)))
+    uvs = array.array('d', ((i * 0.001 + seed) % 1.0 for i in range(vertex_count * 2)))
+    return [vertices, normals, indices, uvs]
+
+
+def build_tree(encode_bin: ModuleType, meshes: List[List[array.array]]) -> Any:
+    FBXElem = encode_bin.FBXElem
+    root = FBXElem(b"")
+    file_id = FBXElem(b"FileId")
+    file_id.add_bytes(b"\0" * 16)
+    creation_time = FBXElem(b"CreationTime")
+    creation_time.add_string(b"1970-01-01 10:00:00:000")
+    objects = FBXElem(b"Objects")
+    root.elems += [file_id, creation_time, objects]
+
+    for index, (vertices, normals, indices, uvs) in enumerate(meshes):
+        geometry = FBXElem(b"Geometry")
+        geometry.add_int64(1000 + index)
+        objects.elems.append(geometry)
+        for name, data in ((b"Vertices", vertices), (b"Normals", normals), (b"UV", uvs)):
+            elem = FBXElem(name)
+            elem.add_float64_array(data)
+            geometry.elems.append(elem)
+        elem = FBXElem(b"PolygonVertexIndex")
+        elem.add_int32_array(indices)
+        geometry.elems.append(elem)
+    return root
+
+
+def write_tree(encode_bin: ModuleType, filepath: Path, meshes: List[List[array.array]], use_multithreading: bool) -> float:
+    start = time.perf_counter()
+    if use_multithreading:
+        with encode_bin.FBXElem.enable_multithreading_cm():
+            root = build_tree(encode_bin, meshes)
+    else:
+        root = build_tree(encode_bin, meshes)
+    encode_bin.write(str(filepath), root, FBX_VERSION)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    all_fbxio = sorted(path.name for path in FBXIO_PATH.glob("io_scene_fbx_*") if path.is_dir())
+    parser = argparse.ArgumentParser(description="FBX multithreaded array compression benchmark")
+    parser.add_argument("--meshes", type=int, default=10, help="Number of generated meshes")
+    parser.add_argument("--vertices", type=int, default=100000, help="Number of vertices per mesh")
+    parser.add_argument("--fbxio", nargs="*", default=all_fbxio, help="fbxio folders to compare")
+    args = parser.parse_args()
+
+    meshes = [create_mesh_arrays(args.vertices, seed) for seed in range(args.meshes)]
+    same_files = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for fbxio_name in args.fbxio:
+            encode_bin = load_encode_bin(fbxio_name)
+            if not hasattr(encode_bin.FBXElem, "enable_multithreading_cm"):
+                print(f"{fbxio_name}: no multithreaded compression")
+                continue
+
+            before_path = Path(temp_dir) / f"{fbxio_name}_before.fbx"
+            after_path = Path(temp_dir) / f"{fbxio_name}_after.fbx"
+            before_time = write_tree(encode_bin, before_path, meshes, False)
+            after_time = write_tree(encode_bin, after_path, meshes, True)
+            is_same = before_path.read_bytes() == after_path.read_bytes()
+            same_files = same_files and is_same
+            # Same thread count as MultiThreadedTaskConsumer.new_cpu_bound_cm(), 0 when it falls back to the main thread.
+            fbx_utils_threading = sys.modules["fbx_utils_threading"]
+            thread_count = min(fbx_utils_threading.get_cpu_count() - 1, 32) if fbx_utils_threading._MULTITHREADING_ENABLED else 0
+            print(
+                f"{fbxio_name}: before {before_time:.3f} s, after {after_time:.3f} s "
+                f"(x{before_time / after_time:.2f}, {max(thread_count, 0)} compression thread(s))"
+                f"{'' if is_same else ' FILES ARE NOT THE SAME!'}"
+            )
+
+    if not same_files:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
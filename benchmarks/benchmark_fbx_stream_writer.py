@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Compare the FBX stream writer with encode_bin.write(): written bytes, write time and memory peak.
+#  A generated FBX hierarchy is written with both, the script exit with the code 1 when the files are not the same.
+#  encode_bin is loaded from the fbxio folder, Blender is not needed.
+#  python benchmarks/benchmark_fbx_stream_writer.py --meshes 50 --vertices 50000 --fbxio io_scene_fbx_5_0
+# ----------------------------------------------------------------
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, ContextManager
+
+import numpy as np
+
+FBXIO_PATH = Path(__file__).resolve().parent.parent / "blender_for_unrealengine" / "fbxio"
+FBX_VERSION = 7400
+
+
+def load_encode_bin(fbxio_name: str) -> ModuleType:
+    # encode_bin import data_types and fbx_utils_threading without package when it is not in one.
+    sys.path.insert(0, str(FBXIO_PATH / fbxio_name))
+    import encode_bin
+    return encode_bin
+
+
+def elem_empty(encode_bin: ModuleType, parent: Any, name: bytes) -> Any:
+    elem = encode_bin.FBXElem(name)
+    if parent is not None:
+        parent.elems.append(elem)
+    return elem
+
+
+def elem_single(encode_bin: ModuleType, parent: Any, name: bytes, add_func: str, value: Any) -> Any:
+    elem = elem_empty(encode_bin, parent, name)
+    getattr(elem, add_func)(value)
+    return elem
+
+
+def create_root_header(encode_bin: ModuleType) -> Any:
+    # Same root elements as save_single() before Objects.
+    root = elem_empty(encode_bin, None, b"")
+    header = elem_empty(encode_bin, root, b"FBXHeaderExtension")
+    elem_single(encode_bin, header, b"FBXHeaderVersion", "add_int32", 1003)
+    elem_single(encode_bin, header, b"FBXVersion", "add_int32", FBX_VERSION)
+    elem_single(encode_bin, root, b"FileId", "add_bytes", b"\0" * 16)
+    elem_single(encode_bin, root, b"CreationTime", "add_string", b"1970-01-01 10:00:00:000")
+    elem_single(encode_bin, root, b"Creator", "add_string_unicode", "Blender (Blender for UnrealEngine specialized FBX IO)")
+    settings = elem_empty(encode_bin, root, b"GlobalSettings")
+    elem_single(encode_bin, settings, b"Version", "add_int32", 1000)
+    elem_empty(encode_bin, root, b"Documents")
+    elem_empty(encode_bin, root, b"References")
+    elem_empty(encode_bin, root, b"Definitions")
+    return root
+
+
+def add_mesh(encode_bin: ModuleType, objects: Any, index: int, vertex_count: int) -> None:
+    rng = np.random.default_rng(index)
+    geometry = elem_single(encode_bin, objects, b"Geometry", "add_int64", 1000 + index)
+    geometry.add_string(b"Mesh%d\x00\x01Geometry" % index)
+    geometry.add_string(b"Mesh")
+    elem_single(encode_bin, geometry, b"Vertices", "add_float64_array", rng.random(vertex_count * 3))
+    elem_single(encode_bin, geometry, b"PolygonVertexIndex", "add_int32_array", rng.integers(0, vertex_count, vertex_count * 4, dtype=np.int32))
+    normals = elem_single(encode_bin, geometry, b"LayerElementNormal", "add_int32", 0)
+    elem_single(encode_bin, normals, b"Normals", "add_float64_array", rng.random(vertex_count * 3))
+    # Element without props and children, its data depend on whether it is the last one.
+    elem_empty(encode_bin, geometry, b"Layer")
+
+
+def add_animation(encode_bin: ModuleType, objects: Any, frame_count: int) -> None:
+    elem_single(encode_bin, objects, b"AnimationStack", "add_int64", 1)
+    elem_single(encode_bin, objects, b"AnimationLayer", "add_int64", 2)
+    for index in range(8):
+        curve = elem_single(encode_bin, objects, b"AnimationCurve", "add_int64", 100 + index)
+        elem_single(encode_bin, curve, b"KeyTime", "add_int64_array", np.arange(frame_count, dtype=np.int64) * 1539538600)
+        elem_single(encode_bin, curve, b"KeyValueFloat", "add_float32_array", np.sin(np.arange(frame_count, dtype=np.float32) + index))
+
+
+def create_objects(encode_bin: ModuleType, root: Any, step: Callable[[], ContextManager[Any]], args: argparse.Namespace) -> Any:
+    # Same steps as fbx_objects_elements().
+    objects = elem_empty(encode_bin, root, b"Objects")
+    yield objects
+    for index in range(args.meshes):
+        with step():
+            add_mesh(encode_bin, objects, index, args.vertices)
+    with step():
+        for index in range(args.meshes):
+            elem_single(encode_bin, objects, b"Model", "add_int64", 2000 + index)
+    with step():
+        add_animation(encode_bin, objects, args.frames)
+    with step():
+        # Last Objects child without props and children.
+        elem_empty(encode_bin, objects, b"Pose")
+
+
+def create_root_footer(encode_bin: ModuleType, root: Any, args: argparse.Namespace) -> None:
+    connections = elem_empty(encode_bin, root, b"Connections")
+    for index in range(args.meshes):
+        connection = elem_single(encode_bin, connections, b"C", "add_string", b"OO")
+        connection.add_int64(1000 + index)
+        connection.add_int64(2000 + index)
+    takes = elem_empty(encode_bin, root, b"Takes")
+    elem_single(encode_bin, takes, b"Current", "add_string", b"")
+
+
+def write_full_tree(encode_bin: ModuleType, filepath: Path, args: argparse.Namespace) -> None:
+    with encode_bin.FBXElem.enable_multithreading_cm():
+        root = create_root_header(encode_bin)
+        for _objects in create_objects(encode_bin, root, nullcontext, args):
+            pass
+        create_root_footer(encode_bin, root, args)
+    encode_bin.write(str(filepath), root, FBX_VERSION)
+
+
+def write_stream(encode_bin: ModuleType, filepath: Path, args: argparse.Namespace) -> None:
+    with encode_bin.FBXElemStreamWriter(str(filepath), FBX_VERSION) as stream_writer:
+        root = create_root_header(encode_bin)
+        objects_steps = create_objects(encode_bin, root, lambda: stream_writer.write_step_cm(objects), args)
+        objects = next(objects_steps)
+        stream_writer.open_elem(root, objects)
+        for _ in objects_steps:
+            pass
+        stream_writer.close_elem(objects)
+        create_root_footer(encode_bin, root, args)
+        stream_writer.close(root)
+
+
+def measure(write_func: Callable[..., None], encode_bin: ModuleType, filepath: Path, args: argparse.Namespace) -> bytes:
+    tracemalloc.start()
+    start = time.perf_counter()
+    write_func(encode_bin, filepath, args)
+    elapsed = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    data = filepath.read_bytes()
+    print(f"{write_func.__name__}: {elapsed:.3f} s, memory peak {peak / (1024 * 1024):.1f} MiB, {len(data) / (1024 * 1024):.1f} MiB written")
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FBX stream writer benchmark")
+    parser.add_argument("--meshes", type=int, default=20, help="Number of generated meshes")
+    parser.add_argument("--vertices", type=int, default=50000, help="Number of vertices per mesh")
+    parser.add_argument("--frames", type=int, default=1000, help="Number of keys per animation curve")
+    parser.add_argument("--fbxio", default="io_scene_fbx_5_0", help="fbxio folder with the stream writer (4.1 and newer)")
+    args = parser.parse_args()
+
+    encode_bin = load_encode_bin(args.fbxio)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        full_data = measure(write_full_tree, encode_bin, Path(temp_dir) / "full_tree.fbx", args)
+        stream_data = measure(write_stream, encode_bin, Path(temp_dir) / "stream.fbx", args)
+
+    if full_data != stream_data:
+        print("The stream writer file is not the same as the encode_bin.write() file!")
+        sys.exit(1)
+    print("Files are the same.")
+
+
+if __name__ == "__main__":
+    main()
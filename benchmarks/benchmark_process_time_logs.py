@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Measure the overhead of the export process time logs.
+#  The addon need be installed and enabled.
+#  blender --background --python benchmarks/benchmark_process_time_logs.py -- --timers 10000
+# ----------------------------------------------------------------
+
+import argparse
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import Callable
+
+import bpy
+
+
+def get_addon_module() -> ModuleType:
+    for addon_name in bpy.context.preferences.addons.keys():
+        module = importlib.import_module(addon_name)
+        if hasattr(module, "bfu_export_logs"):
+            return module
+    raise RuntimeError("Blender For UnrealEngine addon is not enabled.")
+
+
+def run_nested_timers(start_time_log: Callable[[str], object], timer_count: int) -> None:
+    # Same pattern as a package export: one parent timer with a child timer.
+    for index in range(timer_count // 2):
+        parent = start_time_log(f"Export asset {index}")
+        child = start_time_log("Export file")
+        child.end_time_log()  # type: ignore[attr-defined]
+        parent.end_time_log()  # type: ignore[attr-defined]
+
+
+def run_legacy_rna_timers(scene: bpy.types.Scene, timer_count: int) -> None:
+    # Previous behavior: each timer is added in the scene collection
+    # and found back with a linear scan of the collection.
+    time_logs = scene.bfu_export_process_time_logs  # type: ignore[attr-defined]
+    for index in range(timer_count):
+        process_id = "pid_" + str(len(time_logs))
+        process_task = time_logs.add()
+        process_task.process_id = process_id
+        process_task.process_info = f"Timer {index}"
+        process_task.start_time = time.perf_counter()
+        for process_task in time_logs:
+            if process_task.process_id == process_id:
+                process_task.end_time = time.perf_counter()
+                process_task.finished_success = True
+                break
+
+
+def print_result(name: str, timer_count: int, elapsed: float) -> None:
+    print(f"{name}: {timer_count} timers in {elapsed * 1000:.2f} ms, {elapsed / timer_count * 1000000:.2f} us per timer")
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Process time logs benchmark")
+    parser.add_argument("--timers", type=int, default=10000, help="Number of timers to start and end")
+    parser.add_argument("--legacy_timers", type=int, default=2000, help="Number of timers for the legacy RNA scan (quadratic)")
+    args = parser.parse_args(argv)
+
+    addon = get_addon_module()
+    bfu_export_logs = addon.bfu_export_logs
+    time_logs_utils = bfu_export_logs.bfu_process_time_logs_utils
+    scene = bpy.context.scene
+
+    bfu_export_logs.clear_all_logs()
+    start = time.perf_counter()
+    run_nested_timers(time_logs_utils.start_time_log, args.timers)
+    print_result("Time log store", args.timers, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    time_logs_utils.get_process_time_logs_details()
+    print(f"Details text: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    time_logs_utils.get_process_time_logs()
+    print(f"Flush to scene: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    bfu_export_logs.clear_all_logs()
+    if args.legacy_timers > 0:
+        start = time.perf_counter()
+        run_legacy_rna_timers(scene, args.legacy_timers)
+        print_result("Legacy RNA scan", args.legacy_timers, time.perf_counter() - start)
+        bfu_export_logs.clear_all_logs()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  Measure the true minimum volume bounding box on convex hulls from 10 to 10k faces.
+#  The addon need be installed and enabled.
+#  blender --background --python benchmarks/benchmark_true_mvbb.py -- --legacy_max_faces 200
+# ----------------------------------------------------------------
+
+import argparse
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import Any, List
+
+import bmesh
+import bpy
+import numpy as np
+
+
+def get_addon_module() -> ModuleType:
+    for addon_name in bpy.context.preferences.addons.keys():
+        module = importlib.import_module(addon_name)
+        if hasattr(module, "bfu_collision"):
+            return module
+    raise RuntimeError("Blender For UnrealEngine addon is not enabled.")
+
+
+def create_point_cloud_bmesh(point_count: int, seed: int) -> bmesh.types.BMesh:
+    # Random points on a rotated ellipsoid, all points are on the hull.
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(point_count, 3))
+    points /= np.linalg.norm(points, axis=1)[:, None]
+    points *= np.array([2.0, 1.0, 0.5])
+    rotation, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    points = points @ rotation.T
+
+    bm = bmesh.new()
+    for point in points:
+        bm.verts.new(tuple(float(x) for x in point))
+    return bm
+
+
+def get_box_volume(corners: Any) -> float:
+    # Corners are ordered x, y, z like in true_mvbb.
+    edges = np.stack([corners[4] - corners[0], corners[2] - corners[0], corners[1] - corners[0]])
+    return abs(float(np.linalg.det(edges)))
+
+
+def calculate_legacy_volume(bm: bmesh.types.BMesh) -> float:
+    # Previous implementation: pairwise normal deduplication and all normal triplets.
+    coords = np.array([v.co[:] for v in bm.verts], dtype=np.float64)
+    C = coords - coords.mean(axis=0)
+    uniq: List[Any] = []
+    for f in bm.faces:
+        n = np.array(f.normal[:], dtype=np.float64)
+        n /= np.linalg.norm(n)
+        if n[0] < 0 or (abs(n[0]) < 1e-12 and (n[1] < 0 or (abs(n[1]) < 1e-12 and n[2] < 0))):
+            n = -n
+        if not any(np.linalg.norm(n - m) < 1e-5 for m in uniq):
+            uniq.append(n)
+
+    best = float("inf")
+    for i in range(len(uniq)):
+        for j in range(i + 1, len(uniq)):
+            if abs(np.dot(uniq[i], uniq[j])) > 0.9995:
+                continue
+            for k in range(j + 1, len(uniq)):
+                if abs(np.dot(np.cross(uniq[i], uniq[j]), uniq[k])) < 1e-4:
+                    continue
+                n1 = uniq[i]
+                n2 = uniq[j] - n1 * np.dot(n1, uniq[j])
+                n2 /= np.linalg.norm(n2)
+                R = np.stack([n1, n2, np.cross(n1, n2)])
+                CR = C @ R.T
+                best = min(best, float(np.prod(CR.max(axis=0) - CR.min(axis=0))))
+    return best
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="True MVBB benchmark")
+    parser.add_argument("--faces", type=int, nargs="+", default=[10, 100, 1000, 10000], help="Hull sizes in faces")
+    parser.add_argument("--legacy_max_faces", type=int, default=200, help="Compare with the previous implementation up to this hull size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    true_mvbb = get_addon_module().bfu_collision.shape_algorithms.true_mvbb
+
+    for face_count in args.faces:
+        # A triangulated convex hull with V vertices has 2V - 4 faces.
+        bm = create_point_cloud_bmesh(max(face_count // 2 + 2, 4), args.seed)
+        start = time.perf_counter()
+        corners = true_mvbb.calculate_true_mvbb(bm)
+        elapsed = time.perf_counter() - start
+        volume = get_box_volume(corners)
+        line = f"{len(bm.faces)} faces: {elapsed * 1000:.2f} ms, volume {volume:.6f}"
+
+        if len(bm.faces) <= args.legacy_max_faces:
+            start = time.perf_counter()
+            legacy_volume = calculate_legacy_volume(bm)
+            legacy_elapsed = time.perf_counter() - start
+            line += f" | legacy: {legacy_elapsed * 1000:.2f} ms, volume {legacy_volume:.6f}"
+            if volume > legacy_volume * (1.0 + 1e-6):
+                line += " BIGGER THAN LEGACY"
+        print(line)
+        bm.free()
+
+
+if __name__ == "__main__":
+    main()
@@ -76,6 +76,7 @@ try:
     from . import bfu_export_text_files
     from . import bfu_basics
     from . import bfu_utils
+    from . import bfu_frame_sampler
     from . import bfu_unreal_utils
     from . import bfu_naming
     from . import fbxio
@@ -184,6 +185,8 @@ try:
         importlib.reload(bfu_basics)
     if "bfu_utils" in locals():
         importlib.reload(bfu_utils)
+    if "bfu_frame_sampler" in locals():
+        importlib.reload(bfu_frame_sampler)
     if "bfu_unreal_utils" in locals():
         importlib.reload(bfu_unreal_utils)
     if "bfu_naming" in locals():
@@ -41,15 +41,11 @@ class BFU_PT_CorrectAndImprov(bpy.types.Panel):
             )
 
         def execute(self, context):
-            if bpy.context.active_object.mode == "EDIT":
-                bfu_utils.CorrectExtremeUV(step_scale=self.step_scale, move_to_absolute=self.move_to_absolute)
-                self.report(
-                    {'INFO'},
-                    "UV corrected!")
-            else:
-                self.report(
-                    {'WARNING'},
-                    "Move to Edit mode for correct extrem UV.")
+            # Works in Object and Edit mode.
+            bfu_utils.CorrectExtremeUV(step_scale=self.step_scale, move_to_absolute=self.move_to_absolute)
+            self.report(
+                {'INFO'},
+                "UV corrected!")
             return {'FINISHED'}
 
 
@@ -127,6 +127,16 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         default=True,
         )
 
+    duplicate_method: bpy.props.EnumProperty(  # type: ignore
+        name="Duplicate method",
+        description="How the objects are duplicated before export. The export time logs show the duplicate time of each method.",
+        items=[
+            ("DATA_API", "Data API", "Copy the objects and their data in a temporary collection. Faster with large hierarchies."),
+            ("OPERATOR", "Operator (Legacy)", "Use the Blender duplicate operator."),
+        ],
+        default="DATA_API",
+        )
+
     collisionColor:  bpy.props.FloatVectorProperty(  # type: ignore
         name=bpy.app.translations.pgettext("Collision color", "interface.collision_color_name"),
         description=bpy.app.translations.pgettext("Color of the collision in Blender.", "tooltips.collision_color_desc"),
@@ -141,6 +151,26 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         description=bpy.app.translations.pgettext("Notify as potential error if the unit scale is not equal to 0.01.", "tooltips.notify_unit_scale_potential_error_desc"),
         default=True,
         )
+
+    use_fbx_stream_writer: bpy.props.BoolProperty(  # type: ignore
+        name="Stream FBX writing",
+        description="Write the FBX objects to the file as soon as they are created to use less memory with large scenes. Only with Blender 4.1 and newer. The written file is the same.",
+        default=False,
+        )
+
+    use_fast_fk_bake: bpy.props.BoolProperty(  # type: ignore
+        name="Fast FK animation bake",
+        description="Bake the armatures only animated by the F-Curves of their bones (no constraints, drivers or NLA mix) without changing the scene frame for each frame. Other rigs use the default bake. The bake is checked against the evaluated pose on a few frames. Only with Blender 4.0 and newer.",
+        default=False,
+        )
+
+    fbx_array_cache_size: bpy.props.IntProperty(  # type: ignore
+        name="FBX array cache size (MiB)",
+        description="Memory used to reuse the compressed FBX arrays and the extracted mesh elements between the files of an export, like a mesh exported with each action. Used by each of the two caches. 0 disables the caches.",
+        default=512,
+        min=0,
+        soft_max=4096,
+        )
     
     #CAMERA
 
@@ -162,6 +192,17 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         default=True,
         )
     
+    camera_track_format: bpy.props.EnumProperty(  # type: ignore
+        name="Camera tracks format",
+        description="Format of the camera animated tracks in the additional data files.",
+        items=[
+            ("COLUMNAR_BASE64", "Columnar (Base64)", "Packed float32 array per channel, constant channels use a single value. Smallest files and fastest import."),
+            ("COLUMNAR", "Columnar", "Float array per channel, constant channels use a single value."),
+            ("DICT", "Per frame (Legacy)", "One value per frame. Use it with import scripts from older versions."),
+        ],
+        default="COLUMNAR_BASE64",
+        )
+
     if TYPE_CHECKING:
         bakeArmatureAction: bool
         add_skeleton_root_bone: bool
@@ -176,11 +217,16 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         revertExportPath: bool
         show_hiden_linked_propertys: bool
         useGeneratedScripts: bool
+        duplicate_method: str
         collisionColor: Tuple[float, float, float, float]
         notifyUnitScalePotentialError: bool
+        use_fbx_stream_writer: bool
+        fbx_array_cache_size: int
+        use_fast_fk_bake: bool
         bake_only_key_visible_in_cut: bool
         scale_camera_fstop_with_unit_scale: bool
         scale_camera_focus_distance_with_unit_scale: bool
+        camera_track_format: str
 
     
     class BFU_OT_NewReleaseInfo(bpy.types.Operator):
@@ -233,12 +279,17 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         layout_doc_button.add_right_doc_page_operator(camera, text="About depth of Field -> ", url="https://github.com/xavier150/Blender-For-UnrealEngine-Addons/wiki/Camera-Depth-of-Field")
         camera.prop(self, "scale_camera_fstop_with_unit_scale")  # type: ignore
         camera.prop(self, "scale_camera_focus_distance_with_unit_scale")  # type: ignore
+        camera.prop(self, "camera_track_format")  # type: ignore
 
         data = ColumnRight.box()
         data.label(text='DATA')  # type: ignore
         data.prop(self, "ignoreNLAForAction")  # type: ignore
         data.prop(self, "bakeArmatureAction")  # type: ignore
         data.prop(self, "revertExportPath")  # type: ignore
+        data.prop(self, "duplicate_method")  # type: ignore
+        data.prop(self, "use_fbx_stream_writer")  # type: ignore
+        data.prop(self, "fbx_array_cache_size")  # type: ignore
+        data.prop(self, "use_fast_fk_bake")  # type: ignore
 
         other = ColumnRight.box()
         other.label(text='OTHER')  # type: ignore
@@ -14,6 +14,7 @@ from . import bfu_anim_action_operator_action_group
 from . import bfu_anim_action_props
 from . import bfu_anim_action_operators
 from . import bfu_anim_action_ui
+from . import bfu_anim_action_index
 from . import bfu_anim_action_utils
 
 if "bfu_anim_action_operator_action_group" in locals():
@@ -24,6 +25,8 @@ if "bfu_anim_action_operators" in locals():
     importlib.reload(bfu_anim_action_operators)
 if "bfu_anim_action_ui" in locals():
     importlib.reload(bfu_anim_action_ui)
+if "bfu_anim_action_index" in locals():
+    importlib.reload(bfu_anim_action_index)
 if "bfu_anim_action_utils" in locals():
     importlib.reload(bfu_anim_action_utils)
 
@@ -38,11 +41,13 @@ def register():
     bfu_anim_action_operator_action_group.register()
     bfu_anim_action_props.register()
     bfu_anim_action_operators.register()
+    bfu_anim_action_index.register()
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    bfu_anim_action_index.unregister()
     bfu_anim_action_operators.unregister()
     bfu_anim_action_props.unregister()
     bfu_anim_action_operator_action_group.unregister()
\ No newline at end of file
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Persistent index of the actions used by the action asset search.
+# - Bone index: {slot identifier: {bone name: action pointers}} built from the fcurve data paths.
+# - Name index: sorted action names for the prefix search.
+# Only the added, removed and edited actions are indexed again.
+
+import bisect
+import bpy
+from bpy.app.handlers import persistent
+from bpy_extras import anim_utils
+from typing import List, Dict, Set, Tuple, Optional, Any
+
+# Slot key used for the actions fcurves without slots (Blender 4.3 and older).
+LEGACY_SLOT_KEY = ""
+
+# Characters that make a prefix a fnmatch pattern.
+FNMATCH_SPECIAL_CHARS = ("*", "?", "[")
+
+
+def get_fcurve_target_name(data_path: str) -> Optional[str]:
+    # Same parsing as get_can_associate_fcurve_list_with_armature(): 'pose.bones["Bone"].location' -> 'Bone'
+    start = data_path.find('["')
+    end = data_path.rfind('"]')
+    if start > 0 and end > 0:
+        return data_path[start+2:end]
+    return None
+
+
+def get_fcurves_target_names(fcurves: Any) -> Set[str]:
+    names: Set[str] = set()
+    for fcurve in fcurves:
+        name = get_fcurve_target_name(fcurve.data_path)
+        if name is not None:
+            names.add(name)
+    return names
+
+
+def use_action_slots() -> bool:
+    return bpy.app.version >= (4, 4, 0)
+
+
+class ActionIndexEntry():
+    def __init__(self, name: str, names_by_slot: Dict[str, Set[str]], slot_count: int):
+        self.name: str = name
+        self.names_by_slot: Dict[str, Set[str]] = names_by_slot
+        self.slot_count: int = slot_count
+
+
+class ActionIndex():
+
+    def __init__(self):
+        self.entries: Dict[int, ActionIndexEntry] = {}  # Local actions only.
+        self.bone_index: Dict[str, Dict[str, Set[int]]] = {}
+        self.sorted_names: List[Tuple[str, int]] = []  # All actions, library actions included.
+        self.actions: Dict[int, bpy.types.Action] = {}
+        self.action_orders: Dict[int, int] = {}
+        self.dirty_actions: Set[int] = set()
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bone_index.clear()
+        self.sorted_names.clear()
+        self.actions.clear()
+        self.action_orders.clear()
+        self.dirty_actions.clear()
+
+    def mark_action_dirty(self, action: bpy.types.Action) -> None:
+        self.dirty_actions.add(action.as_pointer())
+
+    def read_action_names_by_slot(self, action: bpy.types.Action) -> Dict[str, Set[str]]:
+        names_by_slot: Dict[str, Set[str]] = {}
+        if use_action_slots():
+            for slot in action.slots:
+                action_channel_bag: Optional[bpy.types.ActionChannelbag] = anim_utils.action_get_channelbag_for_slot(action, slot)  # type: ignore
+                if action_channel_bag:
+                    names_by_slot[slot.identifier] = get_fcurves_target_names(action_channel_bag.fcurves)
+        else:
+            names_by_slot[LEGACY_SLOT_KEY] = get_fcurves_target_names(action.fcurves)  # type: ignore
+        return names_by_slot
+
+    def get_action_slot_count(self, action: bpy.types.Action) -> int:
+        if use_action_slots():
+            return len(action.slots)
+        return 0
+
+    def add_entry(self, pointer: int, action: bpy.types.Action) -> None:
+        entry = ActionIndexEntry(action.name, self.read_action_names_by_slot(action), self.get_action_slot_count(action))
+        self.entries[pointer] = entry
+        for slot_key, names in entry.names_by_slot.items():
+            slot_index = self.bone_index.setdefault(slot_key, {})
+            for name in names:
+                slot_index.setdefault(name, set()).add(pointer)
+
+    def remove_entry(self, pointer: int) -> None:
+        entry = self.entries.pop(pointer)
+        for slot_key, names in entry.names_by_slot.items():
+            slot_index = self.bone_index[slot_key]
+            for name in names:
+                pointers = slot_index[name]
+                pointers.discard(pointer)
+                if not pointers:
+                    del slot_index[name]
+            if not slot_index:
+                del self.bone_index[slot_key]
+
+    def update(self) -> None:
+        # Cheap scan of bpy.data.actions, only new, edited or renamed actions are read again.
+        self.actions.clear()
+        self.action_orders.clear()
+        names: List[Tuple[str, int]] = []
+        for order, action in enumerate(bpy.data.actions):
+            pointer = action.as_pointer()
+            self.actions[pointer] = action
+            self.action_orders[pointer] = order
+            names.append((action.name, pointer))
+
+            if action.library:
+                continue
+            entry = self.entries.get(pointer)
+            if entry is not None:
+                if pointer not in self.dirty_actions and entry.name == action.name and entry.slot_count == self.get_action_slot_count(action):
+                    continue
+                self.remove_entry(pointer)
+            self.add_entry(pointer, action)
+
+        for pointer in [pointer for pointer in self.entries if pointer not in self.actions or self.actions[pointer].library]:
+            self.remove_entry(pointer)
+        names.sort()
+        self.sorted_names = names
+        self.dirty_actions.clear()
+
+    def get_sorted_actions(self, pointers: Set[int]) -> List[bpy.types.Action]:
+        # Same order as bpy.data.actions
+        return [self.actions[pointer] for pointer in sorted(pointers, key=lambda pointer: self.action_orders[pointer])]
+
+    def get_armature_actions(self, armature: bpy.types.Armature, slot_identifier: str = LEGACY_SLOT_KEY) -> List[bpy.types.Action]:
+        # Local actions with at least one fcurve that targets a bone of the armature.
+        slot_index = self.bone_index.get(slot_identifier)
+        if not slot_index:
+            return []
+
+        pointers: Set[int] = set()
+        bone_names = armature.bones.keys()
+        if len(bone_names) <= len(slot_index):
+            for bone_name in bone_names:
+                pointers.update(slot_index.get(bone_name, ()))
+        else:
+            for name in slot_index.keys() & set(bone_names):
+                pointers.update(slot_index[name])
+        return self.get_sorted_actions(pointers)
+
+    def get_prefix_actions(self, prefix: str) -> Optional[List[bpy.types.Action]]:
+        # Actions with a name that starts with the prefix.
+        # Returns None when the prefix is a fnmatch pattern.
+        if any(char in prefix for char in FNMATCH_SPECIAL_CHARS):
+            return None
+        start = bisect.bisect_left(self.sorted_names, (prefix,))
+        pointers: Set[int] = set()
+        for name, pointer in self.sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            pointers.add(pointer)
+        return self.get_sorted_actions(pointers)
+
+
+action_index = ActionIndex()
+
+
+def get_updated_action_index() -> ActionIndex:
+    action_index.update()
+    return action_index
+
+
+@persistent
+def bfu_anim_action_index_depsgraph_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    for update in depsgraph.updates:
+        update_id = update.id.original
+        if isinstance(update_id, bpy.types.Action):
+            action_index.mark_action_dirty(update_id)
+
+
+@persistent
+def bfu_anim_action_index_clear_handler(*args: Any) -> None:
+    # Pointers are not valid after a load or an undo.
+    action_index.clear()
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(bfu_anim_action_index_depsgraph_handler)
+    bpy.app.handlers.load_post.append(bfu_anim_action_index_clear_handler)
+    bpy.app.handlers.undo_post.append(bfu_anim_action_index_clear_handler)
+    bpy.app.handlers.redo_post.append(bfu_anim_action_index_clear_handler)
+
+
+def unregister():
+    bpy.app.handlers.redo_post.remove(bfu_anim_action_index_clear_handler)
+    bpy.app.handlers.undo_post.remove(bfu_anim_action_index_clear_handler)
+    bpy.app.handlers.load_post.remove(bfu_anim_action_index_clear_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(bfu_anim_action_index_depsgraph_handler)
+    action_index.clear()
@@ -9,12 +9,12 @@
 
 import fnmatch
 import bpy
-from bpy_extras import anim_utils
 from typing import List, Tuple, Set, Dict, Optional
 from .. import bfu_debug_settings
 from .. import bfu_export_filter
 from .. import bfu_anim_nla
 from . import bfu_anim_action_props
+from . import bfu_anim_action_index
 from .bfu_anim_action_props import BFU_AnimActionExportEnum
 
 
@@ -78,6 +78,10 @@ def optimizated_asset_search(scene: bpy.types.Scene, objects: List[bpy.types.Obj
     events = bfu_debug_settings.root_events
     armature_actions_map: List[Tuple[bpy.types.Object, bpy.types.Action]] = []
 
+    events.add_sub_event("Update action index")
+    action_index = bfu_anim_action_index.get_updated_action_index()
+    events.stop_last_event()
+
     for obj in objects:
         if not object_support_action_export(obj):
             continue
@@ -92,23 +96,15 @@ def optimizated_asset_search(scene: bpy.types.Scene, objects: List[bpy.types.Obj
                     # Found compatible actions using action slot and amature bones
                     if obj.animation_data:
                         last_slot_identifier: str = obj.animation_data.last_slot_identifier
-                        events.stop_last_and_start_new_event(f'Export Auto "{obj.name}" Loop actions')
-                        for action in bpy.data.actions:
-                            if not action.library:
-                                if last_slot_identifier in action.slots:
-                                    slot: bpy.types.ActionSlot = action.slots[last_slot_identifier]
-                                    action_channel_bag: Optional[bpy.types.ActionChannelbag] = anim_utils.action_get_channelbag_for_slot(action, slot)  # type: ignore
-                                    if action_channel_bag:
-                                        if get_can_associate_fcurve_list_with_armature(obj, action_channel_bag.fcurves):
-                                            armature_actions_map.append((obj, action))
+                        events.stop_last_and_start_new_event(f'Export Auto "{obj.name}" Search actions in index')
+                        for action in action_index.get_armature_actions(obj.data, last_slot_identifier):
+                            armature_actions_map.append((obj, action))
 
                 else:
                     # Found compatible actions using armature bones
-                    events.stop_last_and_start_new_event(f'Export Auto "{obj.name}" Loop actions')
-                    for action in bpy.data.actions:
-                        if not action.library:
-                            if get_can_associate_fcurve_list_with_armature(obj, action.fcurves): #type: ignore
-                                armature_actions_map.append((obj, action))
+                    events.stop_last_and_start_new_event(f'Export Auto "{obj.name}" Search actions in index')
+                    for action in action_index.get_armature_actions(obj.data):
+                        armature_actions_map.append((obj, action))
                 
                 events.stop_last_event()
 
@@ -127,9 +123,12 @@ def optimizated_asset_search(scene: bpy.types.Scene, objects: List[bpy.types.Obj
             # Export Specific Prefix
             elif action_export_enum.value == BFU_AnimActionExportEnum.EXPORT_SPECIFIC_PREFIX.value:
                 events.add_sub_event(f'Export Specific Prefix "{obj.name}"')
-                for action in bpy.data.actions:
-                    if get_action_use_prefix(obj, action):
-                        armature_actions_map.append((obj, action))
+                prefix_actions = action_index.get_prefix_actions(bfu_anim_action_props.object_prefix_name_to_export(obj))
+                if prefix_actions is None:
+                    # The prefix use fnmatch wildcards.
+                    prefix_actions = [action for action in bpy.data.actions if get_action_use_prefix(obj, action)]
+                for action in prefix_actions:
+                    armature_actions_map.append((obj, action))
                 events.stop_last_event()
 
             # Export Current
@@ -210,6 +210,7 @@ class AssetPackage:
         self.collection: Optional[bpy.types.Collection] = None
         self.action: Optional[bpy.types.Action] = None  # Action for animations
         self.export_function: Optional[Callable[..., Any]] = None
+        self.export_session_key: Optional[Any] = None  # Packages with the same key share the export session (bfu_export_session.py)
         self.frame_range: Optional[Tuple[float, float]] = None  # Frame range for animations, e.g., (start, end)
 
     def set_file(self, dirpath: Path, filename: str, file_type: BFU_FileTypeEnum) -> PackageFile:
@@ -461,6 +462,11 @@ class BFU_BaseAssetClass(ABC):
                     if additional_data:
                         self.set_additional_data_file(additional_data, data, details)
 
+    def prepare_asset_export_data(self, datas: List[Any], search_mode: AssetDataSearchMode) -> None:
+        # Called once with all the supported data before get_asset_export_data().
+        # Can be used to evaluate the data of all the assets at the same time.
+        pass
+
     @abstractmethod
     def get_asset_export_data(self, data: Any, details: Any, search_mode: AssetDataSearchMode) -> List[AssetToExport]:
         # Direct access asset export data. without checking can_export_asset()
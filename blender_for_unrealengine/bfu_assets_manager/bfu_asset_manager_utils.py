@@ -36,6 +36,13 @@ def get_custom_type_supported_asset_class(custom_type: str, data: Any, details:
                 supported_classes.append(asset)
     return supported_classes
 
+def prepare_custom_type_asset_export_data(custom_type: str, datas: List[Any], search_mode: bfu_asset_manager_type.AssetDataSearchMode) -> None:
+    # Let each asset class prepare all its data at once before the asset search.
+    for asset in bfu_asset_manager_registred_assets.get_registred_asset_class_by_type(custom_type):
+        supported_datas = [data for data in datas if asset.support_asset_type(data) and asset.can_export_asset(data)]
+        if supported_datas:
+            asset.prepare_asset_export_data(supported_datas, search_mode)
+
 def get_primary_supported_asset_class(data: Any, details: Any = None) -> Optional[bfu_asset_manager_type.BFU_BaseAssetClass]:
     for asset in bfu_asset_manager_registred_assets.get_registred_asset_class():
         asset: bfu_asset_manager_type.BFU_BaseAssetClass
@@ -10,8 +10,11 @@
 import bpy
 import importlib
 
+from . import bfu_cached_assets_types
 from . import bfu_cached_assets_blender_class
 
+if "bfu_cached_assets_types" in locals():
+    importlib.reload(bfu_cached_assets_types)
 if "bfu_cached_assets_blender_class" in locals():
     importlib.reload(bfu_cached_assets_blender_class)
 
@@ -23,10 +26,12 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    bfu_cached_assets_types.register()
     bfu_cached_assets_blender_class.register()
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
-    bfu_cached_assets_blender_class.unregister()
\ No newline at end of file
+    bfu_cached_assets_blender_class.unregister()
+    bfu_cached_assets_types.unregister()
\ No newline at end of file
@@ -9,7 +9,7 @@
 
 
 import bpy
-from typing import List, Optional
+from typing import List, Dict, Optional
 from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport, AssetToSearch, AssetDataSearchMode, AssetType
 from .. import bfu_assets_manager
 from .. import bfu_export_control
@@ -17,7 +17,7 @@ from .. import bfu_debug_settings
 from .. import bfu_collection_as_staticmesh
 from .. import bfu_export_filter
 from ..bfu_export_filter.bfu_export_filter_props import BFU_ExportSelectionFilterEnum
-
+from . import bfu_cached_assets_types
 
 
 class BFU_FinalExportAssetCache(bpy.types.PropertyGroup):
@@ -41,9 +41,28 @@ class BFU_FinalExportAssetCache(bpy.types.PropertyGroup):
 
         scene = bpy.context.scene
         if not scene:
+            events.stop_last_event()
+            events.stop_last_event()
             return []
         export_filter: BFU_ExportSelectionFilterEnum = bfu_export_filter.bfu_export_filter_props.scene_export_selection_filter(scene)
 
+        events.stop_last_and_start_new_event("Check Cache")
+        cache_manager = bfu_cached_assets_types.cached_final_asset_manager
+        cached_list = cache_manager.get_cached_list(asset_to_search, search_mode)
+        fingerprint = cache_manager.get_scene_fingerprint(scene)
+        if not force_cache_update and cache_manager.get_can_use_cache(cached_list, fingerprint):
+            events.stop_last_event()
+            events.stop_last_event()
+            return list(cached_list.final_asset_list)
+
+        # Full rebuild when forced or when the scene fingerprint changed.
+        # Otherwise only the objects tagged by the depsgraph handler are recomputed.
+        full_update = force_cache_update or cache_manager.get_need_full_update(cached_list, fingerprint)
+        if full_update:
+            cached_list.clear()
+            cache_manager.set_object_parents(scene)
+        dirty_object_names = cached_list.dirty_object_names
+
         target_asset_to_export: List[AssetToExport] = []
 
         events.stop_last_and_start_new_event("Search Assets")
@@ -72,12 +91,24 @@ class BFU_FinalExportAssetCache(bpy.types.PropertyGroup):
                             obj_list.append(parent_target)
                 events.stop_last_event()
 
-            events.add_sub_event("Create object assets class")
+            events.add_sub_event("Prepare object assets class")
+            objs_to_search = [obj for obj in obj_list if obj.name not in cached_list.object_assets or obj.name in dirty_object_names]
+            bfu_assets_manager.bfu_asset_manager_utils.prepare_custom_type_asset_export_data("Object", objs_to_search, search_mode)
+
+            events.stop_last_and_start_new_event("Create object assets class")
             # Search for objects assets
+            object_assets: Dict[str, List[AssetToExport]] = {}
             for obj in obj_list:
-                asset_class_list = bfu_assets_manager.bfu_asset_manager_utils.get_custom_type_supported_asset_class("Object", obj)
-                for asset_class in asset_class_list:
-                    target_asset_to_export.extend(asset_class.get_asset_export_data(obj, None, search_mode=search_mode))
+                if obj.name in cached_list.object_assets and obj.name not in dirty_object_names:
+                    obj_assets = cached_list.object_assets[obj.name]
+                else:
+                    obj_assets = []
+                    asset_class_list = bfu_assets_manager.bfu_asset_manager_utils.get_custom_type_supported_asset_class("Object", obj)
+                    for asset_class in asset_class_list:
+                        obj_assets.extend(asset_class.get_asset_export_data(obj, None, search_mode=search_mode))
+                object_assets[obj.name] = obj_assets
+                target_asset_to_export.extend(obj_assets)
+            cached_list.object_assets = object_assets
             events.stop_last_event()
 
 
@@ -85,21 +116,25 @@ class BFU_FinalExportAssetCache(bpy.types.PropertyGroup):
         if asset_to_search.value in [AssetToSearch.ALL_ASSETS.value, AssetToSearch.COLLECTION_ONLY.value]:
         
             if export_filter.value == BFU_ExportSelectionFilterEnum.DEFAULT.value:
-                collection_list: List[bpy.types.Collection] = []
-                events.add_sub_event("-> S1")
-            
-                # Search for collections
-                collection_list = bfu_collection_as_staticmesh.bfu_static_col_utils.optimized_collection_search(scene)
-    
-                events.stop_last_and_start_new_event("Create collection assets class")
-                # Search for collections assets
-                for collection in collection_list:
-                    asset_class_list = bfu_assets_manager.bfu_asset_manager_utils.get_custom_type_supported_asset_class("Scene", collection)
-                    if asset_class_list:
-                        for asset_class in asset_class_list:
-                            target_asset_to_export.extend(asset_class.get_asset_export_data(collection, None, search_mode=search_mode))
+                # Collection assets use objects inside the collections, so any object change need an update.
+                if cached_list.collections_dirty or dirty_object_names:
+                    collection_list: List[bpy.types.Collection] = []
+                    events.add_sub_event("-> S1")
+                
+                    # Search for collections
+                    collection_list = bfu_collection_as_staticmesh.bfu_static_col_utils.optimized_collection_search(scene)
+        
+                    events.stop_last_and_start_new_event("Create collection assets class")
+                    # Search for collections assets
+                    cached_list.collection_assets = []
+                    for collection in collection_list:
+                        asset_class_list = bfu_assets_manager.bfu_asset_manager_utils.get_custom_type_supported_asset_class("Scene", collection)
+                        if asset_class_list:
+                            for asset_class in asset_class_list:
+                                cached_list.collection_assets.extend(asset_class.get_asset_export_data(collection, None, search_mode=search_mode))
 
-                events.stop_last_event()
+                    events.stop_last_event()
+                target_asset_to_export.extend(cached_list.collection_assets)
 
 
         events.stop_last_and_start_new_event("Search Armatures")
@@ -124,15 +159,28 @@ class BFU_FinalExportAssetCache(bpy.types.PropertyGroup):
 
             events.stop_last_and_start_new_event("-> S2")
 
-            # Search for armature animation assets
-            for armature in armature_list:
-                asset_class_list = bfu_assets_manager.bfu_asset_manager_utils.get_custom_type_supported_asset_class("ArmatureAnimation", armature)
-                for asset_class in asset_class_list:
-                    target_asset_to_export.extend(asset_class.get_asset_export_data(armature, None, search_mode=search_mode))
-            
-            # Get batch action assets export data from asset classes
-            for asset in bfu_assets_manager.bfu_asset_manager_registred_assets.get_registred_asset_class_by_type("ArmatureActions"):
-                target_asset_to_export.extend(asset.get_batch_asset_export_data(search_mode=search_mode, force_cache_update=force_cache_update))
+            armature_names = [armature.name for armature in armature_list]
+            need_armature_update = (
+                full_update
+                or cached_list.actions_dirty
+                or armature_names != cached_list.armature_names
+                or not dirty_object_names.isdisjoint(armature_names)
+            )
+
+            if need_armature_update:
+                cached_list.armature_assets = []
+                cached_list.armature_names = armature_names
+
+                # Search for armature animation assets
+                for armature in armature_list:
+                    asset_class_list = bfu_assets_manager.bfu_asset_manager_utils.get_custom_type_supported_asset_class("ArmatureAnimation", armature)
+                    for asset_class in asset_class_list:
+                        cached_list.armature_assets.extend(asset_class.get_asset_export_data(armature, None, search_mode=search_mode))
+                
+                # Get batch action assets export data from asset classes
+                for asset in bfu_assets_manager.bfu_asset_manager_registred_assets.get_registred_asset_class_by_type("ArmatureActions"):
+                    cached_list.armature_assets.extend(asset.get_batch_asset_export_data(search_mode=search_mode, force_cache_update=force_cache_update or cached_list.actions_dirty))
+            target_asset_to_export.extend(cached_list.armature_assets)
 
 
         events.stop_last_and_start_new_event("Search Other Assets")
@@ -157,9 +205,12 @@ class BFU_FinalExportAssetCache(bpy.types.PropertyGroup):
             return type_priority.get(asset.asset_type, len(asset_type_order))
         
         target_asset_to_export.sort(key=sort_key)
+
+        cached_list.final_asset_list = target_asset_to_export
+        cache_manager.set_cache_updated(cached_list, fingerprint)
         events.stop_last_event()
         events.stop_last_event()
-        return target_asset_to_export
+        return list(target_asset_to_export)
 
 
 def get_final_asset_cache() -> BFU_FinalExportAssetCache: # type: ignore
@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+
+import bpy
+from typing import List, Dict, Set, Tuple, Any, Optional
+from bpy.app.handlers import persistent
+from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport, AssetToSearch, AssetDataSearchMode
+from .. import bfu_debug_settings
+from .. import bfu_addon_prefs
+from .. import bfu_export_filter
+from ..bfu_export_filter.bfu_export_filter_props import BFU_ExportSelectionFilterEnum
+
+
+# Scene properties that store UI states or export results and don't change the asset list.
+IGNORED_SCENE_PROP_NAMES = {
+    "bfu_export_potential_errors",
+    "bfu_export_process_time_logs",
+    "bfu_export_process_current_sub_step",
+    "bfu_export_process_faster_time",
+    "bfu_export_process_slower_time",
+}
+
+def is_scene_asset_setting_prop(identifier: str) -> bool:
+    if not identifier.startswith("bfu_"):
+        return False
+    if identifier.endswith("_expanded"):
+        return False
+    return identifier not in IGNORED_SCENE_PROP_NAMES
+
+
+def get_rna_value_hash(struct: Any, prop_names: List[str]) -> int:
+    # Hash the values of the given RNA properties.
+    # Collection properties are hashed with the values of their items.
+    values: List[Any] = []
+    for prop_name in prop_names:
+        value = getattr(struct, prop_name, None)
+        if isinstance(value, bpy.types.bpy_prop_collection):
+            values.append(tuple(get_rna_struct_hash(item) for item in value))
+        elif isinstance(value, bpy.types.bpy_prop_array):
+            values.append(tuple(value))
+        elif isinstance(value, bpy.types.ID):
+            values.append(value.name_full)
+        elif isinstance(value, (bool, int, float, str)):
+            values.append(value)
+        elif isinstance(value, set):
+            values.append(tuple(sorted(value)))
+    return hash(tuple(values))
+
+
+def get_rna_struct_hash(struct: Any) -> int:
+    prop_names = [prop.identifier for prop in struct.bl_rna.properties if prop.identifier != "rna_type"]
+    return get_rna_value_hash(struct, prop_names)
+
+
+class CachedFinalAssetList():
+    # Cached result of get_final_asset_list() for one asset_to_search / search_mode pair.
+    def __init__(self) -> None:
+        self.fingerprint: Optional[Tuple[Any, ...]] = None
+        self.update_counter: int = -1
+
+        # Each part of the final asset list is cached separately.
+        self.object_assets: Dict[str, List[AssetToExport]] = {}
+        self.collection_assets: List[AssetToExport] = []
+        self.armature_assets: List[AssetToExport] = []
+        self.armature_names: List[str] = []
+        self.final_asset_list: List[AssetToExport] = []
+
+        # Filled by the depsgraph handler.
+        self.dirty_object_names: Set[str] = set()
+        self.collections_dirty: bool = True
+        self.actions_dirty: bool = True
+
+    def clear(self) -> None:
+        self.fingerprint = None
+        self.update_counter = -1
+        self.object_assets.clear()
+        self.collection_assets.clear()
+        self.armature_assets.clear()
+        self.armature_names.clear()
+        self.final_asset_list.clear()
+        self.dirty_object_names.clear()
+        self.collections_dirty = True
+        self.actions_dirty = True
+
+    def is_dirty(self) -> bool:
+        return bool(self.dirty_object_names) or self.collections_dirty or self.actions_dirty
+
+    def clear_dirty(self) -> None:
+        self.dirty_object_names.clear()
+        self.collections_dirty = False
+        self.actions_dirty = False
+
+
+class CachedFinalAssetManager():
+    def __init__(self) -> None:
+        self.depsgraph_update_counter: int = 0
+        self.cached_lists: Dict[Tuple[str, str], CachedFinalAssetList] = {}
+        self.scene_prop_names: List[str] = []
+        self.addon_prefs_prop_names: List[str] = []
+        # Last known parent of each object, used to find the old parent when an object is reparented.
+        self.object_parent_names: Dict[str, str] = {}
+
+    def get_cached_list(self, asset_to_search: AssetToSearch, search_mode: AssetDataSearchMode) -> CachedFinalAssetList:
+        key = (asset_to_search.value, search_mode.value)
+        if key not in self.cached_lists:
+            self.cached_lists[key] = CachedFinalAssetList()
+        return self.cached_lists[key]
+
+    def clear(self) -> None:
+        for cached_list in self.cached_lists.values():
+            cached_list.clear()
+        self.object_parent_names.clear()
+
+    def set_object_parents(self, scene: bpy.types.Scene) -> None:
+        self.object_parent_names = {obj.name: obj.parent.name for obj in scene.objects if obj.parent is not None}
+
+    def get_scene_fingerprint(self, scene: bpy.types.Scene) -> Tuple[Any, ...]:
+        # Cheap scene fingerprint. When it changes the full asset list is rebuilt.
+        if not self.scene_prop_names:
+            self.scene_prop_names = [prop.identifier for prop in scene.bl_rna.properties if is_scene_asset_setting_prop(prop.identifier)]
+
+        addon_prefs = bfu_addon_prefs.get_addon_preferences()
+        if not self.addon_prefs_prop_names:
+            self.addon_prefs_prop_names = [prop.identifier for prop in addon_prefs.bl_rna.properties if prop.identifier != "rna_type"]
+
+        export_filter: BFU_ExportSelectionFilterEnum = bfu_export_filter.bfu_export_filter_props.scene_export_selection_filter(scene)
+        selected_names: Tuple[str, ...] = ()
+        if export_filter.value != BFU_ExportSelectionFilterEnum.DEFAULT.value:
+            selected_names = tuple(obj.name for obj in bpy.context.selected_objects)
+
+        return (
+            scene.name_full,
+            len(scene.objects),
+            len(bpy.data.collections),
+            len(bpy.data.actions),
+            export_filter.value,
+            selected_names,
+            get_rna_value_hash(scene, self.scene_prop_names),
+            get_rna_value_hash(addon_prefs, self.addon_prefs_prop_names),
+        )
+
+    def get_need_full_update(self, cached_list: CachedFinalAssetList, fingerprint: Tuple[Any, ...]) -> bool:
+        if bfu_debug_settings.DISABLE_ASSET_SEARCH_CACHING:
+            return True
+        if cached_list.fingerprint != fingerprint:
+            return True
+        return False
+
+    def get_can_use_cache(self, cached_list: CachedFinalAssetList, fingerprint: Tuple[Any, ...]) -> bool:
+        if self.get_need_full_update(cached_list, fingerprint):
+            return False
+        if cached_list.update_counter == self.depsgraph_update_counter:
+            return True
+        return not cached_list.is_dirty()
+
+    def set_cache_updated(self, cached_list: CachedFinalAssetList, fingerprint: Tuple[Any, ...]) -> None:
+        cached_list.fingerprint = fingerprint
+        cached_list.update_counter = self.depsgraph_update_counter
+        cached_list.clear_dirty()
+
+    def on_depsgraph_update(self, depsgraph: bpy.types.Depsgraph) -> None:
+        self.depsgraph_update_counter += 1
+        dirty_object_names: Set[str] = set()
+        collections_dirty = False
+        actions_dirty = False
+
+        def add_parent_chain(obj: Optional[bpy.types.Object]) -> None:
+            while obj is not None:
+                dirty_object_names.add(obj.name)
+                obj = obj.parent
+
+        for update in depsgraph.updates:
+            update_id = update.id.original
+            if isinstance(update_id, bpy.types.Object):
+                # Parent assets include their children, so they need an update too.
+                add_parent_chain(update_id)
+
+                # When reparented, the old parent chain lose the object and also need an update.
+                parent_name = update_id.parent.name if update_id.parent is not None else None
+                old_parent_name = self.object_parent_names.get(update_id.name)
+                if old_parent_name != parent_name:
+                    if old_parent_name is not None:
+                        add_parent_chain(bpy.data.objects.get(old_parent_name))
+                    if parent_name is not None:
+                        self.object_parent_names[update_id.name] = parent_name
+                    else:
+                        self.object_parent_names.pop(update_id.name, None)
+            elif isinstance(update_id, bpy.types.Collection):
+                collections_dirty = True
+            elif isinstance(update_id, bpy.types.Action):
+                actions_dirty = True
+            # Scene and addon property changes are detected with the scene fingerprint.
+            # Object data (mesh, armature, curve...) updates are also reported with the owner object.
+
+        if not (dirty_object_names or collections_dirty or actions_dirty):
+            return
+
+        for cached_list in self.cached_lists.values():
+            cached_list.dirty_object_names.update(dirty_object_names)
+            if collections_dirty:
+                cached_list.collections_dirty = True
+            if actions_dirty:
+                cached_list.actions_dirty = True
+
+
+cached_final_asset_manager = CachedFinalAssetManager()
+
+
+@persistent
+def bfu_cached_assets_depsgraph_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    cached_final_asset_manager.on_depsgraph_update(depsgraph)
+
+
+@persistent
+def bfu_cached_assets_clear_handler(*args: Any) -> None:
+    # Cached assets keep StructRNA references, they become invalid after a load or an undo.
+    cached_final_asset_manager.clear()
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(bfu_cached_assets_depsgraph_handler)
+    bpy.app.handlers.load_post.append(bfu_cached_assets_clear_handler)
+    bpy.app.handlers.undo_post.append(bfu_cached_assets_clear_handler)
+    bpy.app.handlers.redo_post.append(bfu_cached_assets_clear_handler)
+
+
+def unregister():
+    bpy.app.handlers.redo_post.remove(bfu_cached_assets_clear_handler)
+    bpy.app.handlers.undo_post.remove(bfu_cached_assets_clear_handler)
+    bpy.app.handlers.load_post.remove(bfu_cached_assets_clear_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(bfu_cached_assets_depsgraph_handler)
+    cached_final_asset_manager.clear()
@@ -15,6 +15,7 @@ from . import bfu_camera_props
 from . import bfu_camera_ui
 from . import bfu_camera_utils
 from . import bfu_camera_unreal_utils
+from . import bfu_camera_track_format
 from . import bfu_camera_data
 from . import bfu_camera_write_text
 from . import bfu_camera_write_paste_commands
@@ -32,6 +33,8 @@ if "bfu_camera_utils" in locals():
     importlib.reload(bfu_camera_utils)
 if "bfu_camera_unreal_utils" in locals():
     importlib.reload(bfu_camera_unreal_utils)
+if "bfu_camera_track_format" in locals():
+    importlib.reload(bfu_camera_track_format)
 if "bfu_camera_data" in locals():
     importlib.reload(bfu_camera_data)
 if "bfu_camera_write_text" in locals():
@@ -10,12 +10,15 @@
 import bpy
 import math
 import mathutils
-from typing import Dict, Any, List, Tuple, TYPE_CHECKING
+import numpy as np
+from typing import Dict, Any, List, Tuple, Optional, TYPE_CHECKING
 from . import bfu_camera_unreal_utils
+from . import bfu_camera_track_format
 from .. import bpl
 from .. import bbpl
 from .. import bfu_utils
 from .. import bfu_addon_prefs
+from .. import bfu_frame_sampler
 
 
 def set_current_frame(new_frame: int) -> None:
@@ -32,31 +35,17 @@ def getCameraFocusDistance(Camera: bpy.types.Object, Target: bpy.types.Object) -
     return diff.length
 
 def getAllCamDistKeys(Camera: bpy.types.Object, Target: bpy.types.Object, frame_start: int, frame_end: int) -> List[Tuple[int, float]]:
-    scene = bpy.context.scene
-    if scene is None:
-        return []
-    saveFrame = scene.frame_current  # Save current frame
-    keys: List[Tuple[int, float]] = []
-    for frame in range(frame_start, frame_end):
-        set_current_frame(frame)
-        v = getCameraFocusDistance(Camera, Target)
-        keys.append((frame, v))
-    set_current_frame(saveFrame)  # Resets previous start frame
-    return keys
+    sampler = bfu_frame_sampler.FrameSampler(frame_start, frame_end)
+    channel = sampler.add_channel(lambda frame: getCameraFocusDistance(Camera, Target))
+    sampler.sample()
+    return list(zip(channel.get_frames().astype(int).tolist(), channel.get_values()[:, 0].tolist()))
 
 def getAllKeysByMatrix(obj: bpy.types.Object, frame_start: int, frame_end: int) -> List[Tuple[int, Any]]:
-    scene = bpy.context.scene
-    if scene is None:
-        return []
-
-    saveFrame = scene.frame_current  # Save current frame
-    keys: List[Tuple[int, Any]] = []
-    for frame in range(frame_start, frame_end):
-        set_current_frame(frame)
-        v = obj.matrix_world*1
-        keys.append((frame, v))
-    set_current_frame(saveFrame)  # Resets previous start frame
-    return keys
+    sampler = bfu_frame_sampler.FrameSampler(frame_start, frame_end)
+    channel = sampler.add_attribute_channel(obj, "matrix_world", 16)
+    sampler.sample()
+    matrices = channel.get_values().reshape(-1, 4, 4)
+    return [(frame, mathutils.Matrix(matrix)) for frame, matrix in zip(channel.get_frames().astype(int).tolist(), matrices.tolist())]
 
 def get_one_keys_by_fcurves(obj: bpy.types.Object, data_path: str, data_value: Any, frame: int, is_data: bool = True) -> Any:
     if is_data and obj.data is not None:
@@ -92,6 +81,20 @@ def get_all_keys_by_fcurves(obj: bpy.types.Object, data_path: str, data_value: A
         return keys
     return[(frame_start, data_value)]
 
+TRANSFORM_CHANNEL_NAMES = ["location_x", "location_y", "location_z", "rotation_x", "rotation_y", "rotation_z", "scale_x", "scale_y", "scale_z"]
+SHIFT_CHANNEL_NAMES = ["x", "y"]
+
+def create_empty_track(channel_names: Optional[List[str]] = None, value_type: Optional[str] = None) -> bfu_camera_track_format.ColumnTrack:
+    width = len(channel_names) if channel_names else 1
+    return bfu_camera_track_format.ColumnTrack(np.zeros(0, dtype=np.int64), np.zeros((0, width)), channel_names, value_type)
+
+def round_transform_values(transforms: np.ndarray) -> np.ndarray:
+    # Location and rotation with 8 digits, scale with 4.
+    rounded = np.empty_like(transforms)
+    rounded[:, :6] = np.round(transforms[:, :6], 8)
+    rounded[:, 6:] = np.round(transforms[:, 6:], 4)
+    return rounded
+
 class BFU_CameraTracks():
 
     def __init__(self, camera: bpy.types.Object):
@@ -117,31 +120,41 @@ class BFU_CameraTracks():
         self.ue_camera_actor: str = bfu_camera_unreal_utils.get_camera_unreal_actor(camera)
 
         # Blender Camera Data
-        self.transform_track: Dict[int, Any] = {}
-        self.near_clipping_plane: Dict[int, Any] = {}
-        self.far_clipping_plane: Dict[int, Any] = {}
-        self.field_of_view: Dict[int, Any] = {}
-        self.angle: Dict[int, Any] = {}
-        self.lens: Dict[int, Any] = {}
-        self.sensor_width: Dict[int, Any] = {}
-        self.sensor_height: Dict[int, Any] = {}
-        self.projection_shift: Dict[int, Any] = {}
-        self.focus_distance: Dict[int, Any] = {}
-        self.aperture_fstop: Dict[int, Any] = {}
-        self.hide_viewport: Dict[int, Any] = {}
+        self.transform_track = create_empty_track(TRANSFORM_CHANNEL_NAMES)
+        self.near_clipping_plane = create_empty_track()
+        self.far_clipping_plane = create_empty_track()
+        self.field_of_view = create_empty_track()
+        self.angle = create_empty_track()
+        self.lens = create_empty_track()
+        self.sensor_width = create_empty_track()
+        self.sensor_height = create_empty_track()
+        self.projection_shift = create_empty_track(SHIFT_CHANNEL_NAMES)
+        self.focus_distance = create_empty_track()
+        self.aperture_fstop = create_empty_track()
+        self.hide_viewport = create_empty_track(value_type="bool")
 
         # Formated data for Unreal Engine
-        self.ue_transform_track: Dict[int, Any] = {}
-        self.ue_sensor_width: Dict[int, Any] = {}
-        self.ue_sensor_height: Dict[int, Any] = {}
+        self.ue_transform_track = create_empty_track(TRANSFORM_CHANNEL_NAMES)
+        self.ue_sensor_width = create_empty_track()
+        self.ue_sensor_height = create_empty_track()
         self.ue_lens_min_fstop: float = 1.2  # Default value in Unreal Engine
         self.ue_lens_max_fstop: float = 22.0  # Default value in Unreal Engine
 
         # Formated data for ArchVis Tools in Unreal Engine
-        self.arch_projection_shift: Dict[int, Any] = {}
+        self.arch_projection_shift = create_empty_track(SHIFT_CHANNEL_NAMES)
+
+        # Frame sampler channels, read by read_frame_sampler_channels()
+        self.sample_channels: Dict[str, bfu_frame_sampler.FrameSampleChannel] = {}
+
+
+    def get_animated_values_as_dict(self, track_format: Optional[str] = None) -> Dict[str, Any]:
+        # track_format: see bfu_camera_track_format, use the addon preference when None.
+        if track_format is None:
+            track_format = bfu_addon_prefs.get_addon_preferences().camera_track_format
 
+        def format_track(track: bfu_camera_track_format.ColumnTrack) -> Any:
+            return bfu_camera_track_format.format_track(track, track_format)
 
-    def get_animated_values_as_dict(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {}
         # Static data
         data["camera_name"] = self.camera_name
@@ -156,109 +169,52 @@ class BFU_CameraTracks():
         data['ue_lens_maxfstop'] = self.ue_lens_max_fstop
 
         # Animated Tracks
-        data['camera_transform'] = self.transform_track
-        data['ue_camera_transform'] = self.ue_transform_track
-        data["camera_near_clipping_plane"] = self.near_clipping_plane
-        data["camera_far_clipping_plane"] = self.far_clipping_plane
-        data["camera_field_of_view"] = self.field_of_view
-        data["camera_focal_angle"] = self.angle
-        data['camera_focal_length'] = self.lens
-        data['camera_sensor_width'] = self.sensor_width
-        data['camera_sensor_height'] = self.sensor_height
-        data['camera_shift'] = self.projection_shift
-        data['archvis_camera_shift'] = self.arch_projection_shift
-        data['ue_camera_sensor_width'] = self.ue_sensor_width
-        data['ue_camera_sensor_height'] = self.ue_sensor_height
-        data['camera_focus_distance'] = self.focus_distance
-        data['camera_aperture'] = self.aperture_fstop
-        data['camera_spawned'] = self.hide_viewport
+        data['camera_transform'] = format_track(self.transform_track)
+        data['ue_camera_transform'] = format_track(self.ue_transform_track)
+        data["camera_near_clipping_plane"] = format_track(self.near_clipping_plane)
+        data["camera_far_clipping_plane"] = format_track(self.far_clipping_plane)
+        data["camera_field_of_view"] = format_track(self.field_of_view)
+        data["camera_focal_angle"] = format_track(self.angle)
+        data['camera_focal_length'] = format_track(self.lens)
+        data['camera_sensor_width'] = format_track(self.sensor_width)
+        data['camera_sensor_height'] = format_track(self.sensor_height)
+        data['camera_shift'] = format_track(self.projection_shift)
+        data['archvis_camera_shift'] = format_track(self.arch_projection_shift)
+        data['ue_camera_sensor_width'] = format_track(self.ue_sensor_width)
+        data['ue_camera_sensor_height'] = format_track(self.ue_sensor_height)
+        data['camera_focus_distance'] = format_track(self.focus_distance)
+        data['camera_aperture'] = format_track(self.aperture_fstop)
+        data['camera_spawned'] = format_track(self.hide_viewport)
         return data
     
 
 
-    def fix_transform_axis_flippings(self, camera: bpy.types.Object, array_rotation: List[float], frame: int, target_use: str):
+    def fix_transform_axis_flippings(self, camera: bpy.types.Object, frames: np.ndarray, array_rotations: np.ndarray) -> np.ndarray:
+        # array_rotations: (frames, 3) rotations in degrees.
 
-        # Define constants for target use
-        TRANSFORM_TRACKS = {
-            "Blender": self.transform_track,
-            "UnrealEngine": self.ue_transform_track,
-        }
-
-        # Get the correct transform track
-        transform_track = TRANSFORM_TRACKS.get(target_use)
-        if transform_track is None:
-            raise ValueError(f"Invalid target_use: {target_use}. Must be 'Blender' or 'UnrealEngine'.")
-           
         # convert warp_target to degrees        
         if TYPE_CHECKING:
             fix_axis_flippings_warp_target: mathutils.Vector = mathutils.Vector((0.0, 0.0, 0.0))
         else:
             fix_axis_flippings_warp_target = camera.bfu_fix_axis_flippings_warp_target
-        warp_target_degrees = [round(math.degrees(v), 1) for v in fix_axis_flippings_warp_target]
-
-        # Create a copy of the current rotation array
-        new_array_rotation = array_rotation.copy()
-
-        # Check if a previous frame exists in the transform track
-        if frame - 1 in transform_track:
-            previous_rotation = transform_track[frame - 1]
-            
-            # Calculate new rotations for each axis (X, Y, Z)
-            for i, axis in enumerate(["rotation_x", "rotation_y", "rotation_z"]):
-                previous_value = previous_rotation[axis]
-                # Compute the difference based on the warp target
-                diff = round((array_rotation[i] - previous_value) / warp_target_degrees[i]) * warp_target_degrees[i]
-                # Adjust the current rotation to eliminate flipping
-                new_array_rotation[i] = array_rotation[i] - diff
-        return new_array_rotation
-
-    def evaluate_camera_transform(self, camera: bpy.types.Object, frame: int, target_use: str):
-        transform: Dict[str, float] = {}
-
-
-        if target_use == "UnrealEngine":
-            camera_transform: Tuple[mathutils.Vector, List[float], mathutils.Vector]
-            camera_transform = bfu_utils.evaluate_camera_position_for_unreal(camera)
-            array_location: mathutils.Vector = camera_transform[0]
-            array_rotation: List[float] = camera_transform[1]
-            array_scale: mathutils.Vector = camera_transform[2]
-
-            # Fix axis flippings
-            if TYPE_CHECKING:
-                fix_axis_flippings: bool = True
-            else:
-                fix_axis_flippings = camera.bfu_fix_axis_flippings
-            if fix_axis_flippings:
-                array_rotation = self.fix_transform_axis_flippings(camera, array_rotation, frame, target_use)
-
-            transform: Dict[str, float] = {}
-            transform["location_x"] = round(array_location.x, 8)
-            transform["location_y"] = round(array_location.y, 8)
-            transform["location_z"] = round(array_location.z, 8)
-            transform["rotation_x"] = round(array_rotation[0], 8)
-            transform["rotation_y"] = round(array_rotation[1], 8)
-            transform["rotation_z"] = round(array_rotation[2], 8)
-            transform["scale_x"] = round(array_scale.x, 4)
-            transform["scale_y"] = round(array_scale.y, 4)
-            transform["scale_z"] = round(array_scale.z, 4)
-            return transform
-
-        else:
-            camera_transform = bfu_utils.evaluate_camera_position(camera)
-            transform: Dict[str, float] = {}
-            transform["location_x"] = round(camera.location.x, 8)
-            transform["location_y"] = round(camera.location.y, 8)
-            transform["location_z"] = round(camera.location.z, 8)
-            transform["rotation_x"] = round(camera.rotation_euler.x, 8)
-            transform["rotation_y"] = round(camera.rotation_euler.y, 8)
-            transform["rotation_z"] = round(camera.rotation_euler.z, 8)
-            transform["scale_x"] = round(camera.scale.x, 4)
-            transform["scale_y"] = round(camera.scale.y, 4)
-            transform["scale_z"] = round(camera.scale.z, 4)
-            return transform
-        
-
-    def get_ue_crop_sensor_height(self, sensor_width: float, sensor_height: float):
+        warp_target_degrees = np.array([round(math.degrees(v), 1) for v in fix_axis_flippings_warp_target])
+        safe_warp_target_degrees = np.where(warp_target_degrees == 0.0, 1.0, warp_target_degrees)
+
+        new_array_rotations = array_rotations.copy()
+
+        # A frame is only fixed when the previous frame is in the track (not cut by a camera marker).
+        # Each rotation move to the nearest warp of the previous fixed rotation,
+        # so the fixed rotations are the first rotation plus the warped differences.
+        segment_starts = np.flatnonzero(np.diff(frames) != 1) + 1
+        for segment in np.split(np.arange(len(frames)), segment_starts):
+            if len(segment) < 2:
+                continue
+            diff = np.diff(array_rotations[segment], axis=0)
+            diff -= np.round(diff / safe_warp_target_degrees) * warp_target_degrees
+            new_array_rotations[segment[1:]] = array_rotations[segment[0]] + np.cumsum(diff, axis=0)
+        return new_array_rotations
+
+    def get_ue_crop_sensor_height(self, sensor_width: Any, sensor_height: Any) -> Any:
         res_ratio = self.resolution_x / self.resolution_y
         pixel_ratio = self.pixel_aspect_x / self.pixel_aspect_y
         crop_sensor_height = (sensor_width / (res_ratio * pixel_ratio))
@@ -272,75 +228,163 @@ class BFU_CameraTracks():
             print("Error: The provided object is not a camera.")
             return
 
+        sampler = bfu_frame_sampler.FrameSampler(frame, frame + 1)
+        self.add_to_frame_sampler(sampler, camera, use_marker_sequences=False)
+        sampler.sample()
+        self.read_frame_sampler_channels(camera)
+
+    def add_to_frame_sampler(
+        self,
+        sampler: bfu_frame_sampler.FrameSampler,
+        camera: bpy.types.Object,
+        use_marker_sequences: bool = True,
+        timeline_marker_sequence: Optional[bfu_utils.TimelineMarkerSequence] = None,
+        frame_range: Optional[Tuple[int, int]] = None
+    ):
+        # The values of each frame are written in the sampler channels,
+        # call read_frame_sampler_channels() after sampler.sample().
+        scene = bpy.context.scene
+        if scene is None:
+            return
+        if not isinstance(camera.data, bpy.types.Camera):
+            print("Error: The provided object is not a camera.")
+            return
+
         addon_prefs = bfu_addon_prefs.get_addon_preferences()
         unit_scale = bfu_utils.get_scene_unit_scale()
-        set_current_frame(frame)
-
-        self.transform_track[frame] = self.evaluate_camera_transform(camera, frame, "Blender")
-        self.ue_transform_track[frame] = self.evaluate_camera_transform(camera, frame, "UnrealEngine")
+        camera_data = camera.data
+        render_engine = scene.render.engine
 
-        # Get FOV FocalLength SensorWidth SensorHeight
-        self.angle[frame] = get_one_keys_by_fcurves(camera, "angle", camera.data.angle, frame)
-        self.lens[frame] = get_one_keys_by_fcurves(camera, "lens", camera.data.lens, frame)
+        frame_filter: Optional[bfu_frame_sampler.FrameFilter] = None
+        if use_marker_sequences and addon_prefs.bake_only_key_visible_in_cut:
+            # Bake only frames visible in cuts
+            frame_filter = bfu_frame_sampler.get_camera_cut_frame_filter(camera, timeline_marker_sequence)
+
+        def get_transform(frame: float) -> Tuple[float, ...]:
+            return (*camera.location, *camera.rotation_euler, *camera.scale)
+
+        def get_ue_transform(frame: float) -> Tuple[float, ...]:
+            array_location, array_rotation, array_scale = bfu_utils.evaluate_camera_position_for_unreal(camera)
+            return (*array_location, *array_rotation, *array_scale)
+
+        def get_lens(frame: float) -> Tuple[float, ...]:
+            # Get FOV FocalLength SensorWidth SensorHeight
+            int_frame = int(frame)
+            return (
+                get_one_keys_by_fcurves(camera, "angle", camera_data.angle, int_frame),
+                get_one_keys_by_fcurves(camera, "lens", camera_data.lens, int_frame),
+                get_one_keys_by_fcurves(camera, "sensor_width", camera_data.sensor_width, int_frame),
+                get_one_keys_by_fcurves(camera, "sensor_height", camera_data.sensor_height, int_frame),
+            )
+
+        def get_shift(frame: float) -> Tuple[float, ...]:
+            int_frame = int(frame)
+            return (
+                get_one_keys_by_fcurves(camera, "shift_x", camera_data.shift_x, int_frame),
+                get_one_keys_by_fcurves(camera, "shift_y", camera_data.shift_y, int_frame),
+            )
+
+        def get_clipping(frame: float) -> Tuple[float, ...]:
+            int_frame = int(frame)
+            return (
+                get_one_keys_by_fcurves(camera, "clip_start", camera_data.clip_start, int_frame),
+                get_one_keys_by_fcurves(camera, "clip_end", camera_data.clip_end, int_frame),
+            )
+
+        def get_focus_distance(frame: float) -> float:
+            if camera_data.dof and camera_data.dof.use_dof:
+                if camera_data.dof.focus_object is not None:
+                    key = getCameraFocusDistance(camera, camera_data.dof.focus_object)
+                else:
+                    key = get_one_keys_by_fcurves(camera, "dof.focus_distance", camera_data.dof.focus_distance, int(frame))
+
+                if addon_prefs.scale_camera_focus_distance_with_unit_scale:
+                    return key * 100 * unit_scale
+                return key * 100
+            return 100000  # 100000 is default value in Unreal Engine
+
+        def get_aperture_fstop(frame: float) -> float:
+            # Write Aperture (Depth of Field) keys
+            if render_engine in ["BLENDER_EEVEE", "CYCLES", "BLENDER_WORKBENCH"] and camera_data.dof:
+                key = get_one_keys_by_fcurves(camera, "dof.aperture_fstop", camera_data.dof.aperture_fstop, int(frame))
+                key = round(key, 8) # Avoid microscopic offsets.
+                if addon_prefs.scale_camera_fstop_with_unit_scale:
+                    return key / unit_scale
+                return key
+            return 2.8  # 2.8 is default value in Unreal Engine
+
+        def get_hide_viewport(frame: float) -> float:
+            return get_one_keys_by_fcurves(camera, "hide_viewport", camera.hide_viewport, int(frame), False)
+
+        def add_channel(getter: bfu_frame_sampler.ChannelGetter, width: int = 1) -> bfu_frame_sampler.FrameSampleChannel:
+            return sampler.add_channel(getter, width, frame_filter, frame_range)
+
+        self.sample_channels = {
+            "transform": add_channel(get_transform, 9),
+            "ue_transform": add_channel(get_ue_transform, 9),
+            "lens": add_channel(get_lens, 4),
+            "shift": add_channel(get_shift, 2),
+            "clipping": add_channel(get_clipping, 2),
+            "focus_distance": add_channel(get_focus_distance),
+            "aperture_fstop": add_channel(get_aperture_fstop),
+            "hide_viewport": add_channel(get_hide_viewport),
+        }
 
-        sensor_width = get_one_keys_by_fcurves(camera, "sensor_width", camera.data.sensor_width, frame)
-        sensor_height = get_one_keys_by_fcurves(camera, "sensor_height", camera.data.sensor_height, frame)
+    def read_frame_sampler_channels(self, camera: bpy.types.Object):
+        # Create the tracks from the sampled arrays.
+        if not self.sample_channels:
+            return
+        channels = self.sample_channels
+        self.sample_channels = {}
+        unit_scale = bfu_utils.get_scene_unit_scale()
+        frames = channels["transform"].get_frames().astype(np.int64)
 
-        self.sensor_width[frame] = sensor_width 
-        self.sensor_height[frame] = sensor_height
-        self.ue_sensor_width[frame] = sensor_width 
-        self.ue_sensor_height[frame] = self.get_ue_crop_sensor_height(sensor_width, sensor_height)
+        self.transform_track = bfu_camera_track_format.ColumnTrack(frames, round_transform_values(channels["transform"].get_values()), TRANSFORM_CHANNEL_NAMES)
 
-        # Camera shift
-        shift_x = get_one_keys_by_fcurves(camera, "shift_x", camera.data.shift_x, frame)
-        shift_y = get_one_keys_by_fcurves(camera, "shift_y", camera.data.shift_y, frame)
-        self.projection_shift[frame] = {"x": shift_x, "y": shift_y}
-
-        arch_shift_x = shift_x * 2 # x2
-        arch_shift_y = shift_y * 2 * (self.resolution_x / self.resolution_y) # Use screen ratio.
-        self.arch_projection_shift[frame] = {"x": arch_shift_x, "y": arch_shift_y}
+        ue_transforms = channels["ue_transform"].get_values().copy()
+        # Fix axis flippings
+        if TYPE_CHECKING:
+            fix_axis_flippings: bool = True
+        else:
+            fix_axis_flippings = camera.bfu_fix_axis_flippings
+        if fix_axis_flippings:
+            ue_transforms[:, 3:6] = self.fix_transform_axis_flippings(camera, frames, ue_transforms[:, 3:6])
+        self.ue_transform_track = bfu_camera_track_format.ColumnTrack(frames, round_transform_values(ue_transforms), TRANSFORM_CHANNEL_NAMES)
+
+        lens_values = channels["lens"].get_values()
+        angle, lens, sensor_width, sensor_height = lens_values.T
+        self.angle = bfu_camera_track_format.ColumnTrack(frames, angle)
+        self.lens = bfu_camera_track_format.ColumnTrack(frames, lens)
+        self.sensor_width = bfu_camera_track_format.ColumnTrack(frames, sensor_width)
+        self.sensor_height = bfu_camera_track_format.ColumnTrack(frames, sensor_height)
+        self.ue_sensor_width = bfu_camera_track_format.ColumnTrack(frames, sensor_width)
+        self.ue_sensor_height = bfu_camera_track_format.ColumnTrack(frames, self.get_ue_crop_sensor_height(sensor_width, sensor_height))
 
         #FOV
-        self.field_of_view[frame] = round(math.degrees(self.angle[frame]), 8)
-
-        # Get Clip
-        self.near_clipping_plane[frame] = get_one_keys_by_fcurves(camera, "clip_start", camera.data.clip_start, frame) * 100 * unit_scale
-        self.far_clipping_plane[frame] = get_one_keys_by_fcurves(camera, "clip_end", camera.data.clip_end, frame) * 100 * unit_scale
-
-        # Get FocusDistance
-        if camera.data.dof and camera.data.dof.use_dof:
-            if camera.data.dof.focus_object is not None:
-                key = getCameraFocusDistance(camera, camera.data.dof.focus_object)
+        self.field_of_view = bfu_camera_track_format.ColumnTrack(frames, np.round(np.degrees(angle), 8))
 
-            else:
-                key = get_one_keys_by_fcurves(camera, "dof.focus_distance", camera.data.dof.focus_distance, frame)
-
-            if addon_prefs.scale_camera_focus_distance_with_unit_scale:
-                self.focus_distance[frame] = key * 100 * unit_scale
-            else:
-                self.focus_distance[frame] = key * 100
+        # Camera shift
+        shift = channels["shift"].get_values()
+        self.projection_shift = bfu_camera_track_format.ColumnTrack(frames, shift, SHIFT_CHANNEL_NAMES)
+        arch_shift_scale = np.array((2, 2 * (self.resolution_x / self.resolution_y)))  # x2, use screen ratio for y.
+        self.arch_projection_shift = bfu_camera_track_format.ColumnTrack(frames, shift * arch_shift_scale, SHIFT_CHANNEL_NAMES)
 
-        else:
-            self.focus_distance[frame] = 100000  # 100000 is default value in Unreal Engine
+        # Get Clip
+        clipping = channels["clipping"].get_values() * 100 * unit_scale
+        self.near_clipping_plane = bfu_camera_track_format.ColumnTrack(frames, clipping[:, 0])
+        self.far_clipping_plane = bfu_camera_track_format.ColumnTrack(frames, clipping[:, 1])
 
-        # Write Aperture (Depth of Field) keys
-        render_engine = scene.render.engine
-        if render_engine in ["BLENDER_EEVEE", "CYCLES", "BLENDER_WORKBENCH"] and camera.data.dof:
-            key = get_one_keys_by_fcurves(camera, "dof.aperture_fstop", camera.data.dof.aperture_fstop, frame)
-            key = round(key, 8) # Avoid microscopic offsets.
-            if addon_prefs.scale_camera_fstop_with_unit_scale:
-                self.aperture_fstop[frame] = key / unit_scale
-            else:
-                self.aperture_fstop[frame] = key
-        else:
-            self.aperture_fstop[frame] = 2.8  # 2.8 is default value in Unreal Engine
+        self.focus_distance = bfu_camera_track_format.ColumnTrack(frames, channels["focus_distance"].get_values())
+        aperture_fstop = channels["aperture_fstop"].get_values()
+        self.aperture_fstop = bfu_camera_track_format.ColumnTrack(frames, aperture_fstop)
 
         #Update min and max lens FStop
-        self.ue_lens_min_fstop = min(self.ue_lens_min_fstop, self.aperture_fstop[frame])
-        self.ue_lens_max_fstop = max(self.ue_lens_max_fstop, self.aperture_fstop[frame])
+        if len(aperture_fstop):
+            self.ue_lens_min_fstop = min(self.ue_lens_min_fstop, float(aperture_fstop.min()))
+            self.ue_lens_max_fstop = max(self.ue_lens_max_fstop, float(aperture_fstop.max()))
 
-        boolKey = get_one_keys_by_fcurves(camera, "hide_viewport", camera.hide_viewport, frame, False)
-        self.hide_viewport[frame] = (boolKey < 1)  # Inversed for convert hide to spawn
+        # Inversed for convert hide to spawn
+        self.hide_viewport = bfu_camera_track_format.ColumnTrack(frames, channels["hide_viewport"].get_values() < 1, value_type="bool")
 
     def evaluate_all_tracks(self, camera: bpy.types.Object, start_frame: float, end_frame: float):
 
@@ -348,31 +392,16 @@ class BFU_CameraTracks():
         if scene is None:
             return
 
-        addon_prefs = bfu_addon_prefs.get_addon_preferences()
-
         #print(f"Start evaluate camera {camera.name} Frames:({str(frame_start)}-{str(frame_end)})")
         counter = bpl.utils.CounterTimer()
-        
-        slms = bfu_utils.TimelineMarkerSequence()
-        
-        # Save scene data
-        save_current_frame = scene.frame_current
 
         int_frame_start: int = min(int(start_frame) - 1, 0) # -1 for secure range
         int_frame_end: int = int(end_frame) + 1 # +1 for secure range
 
-        for frame in range(int_frame_start, int_frame_end):
-            if len(slms.marker_sequences) > 0 and addon_prefs.bake_only_key_visible_in_cut:
-                # Bake only frames visible in cut
-                marker_sequence = slms.get_marker_sequence_at_frame(frame)
-                if marker_sequence and marker_sequence.marker:
-                    if marker_sequence.marker.camera == camera:
-                        self.evaluate_track_at_frame(camera, frame)
-            else:
-                # Bake all frames
-                self.evaluate_track_at_frame(camera, frame)
-
-        set_current_frame(save_current_frame)
+        sampler = bfu_frame_sampler.FrameSampler(int_frame_start, int_frame_end)
+        self.add_to_frame_sampler(sampler, camera)
+        sampler.sample()
+        self.read_frame_sampler_channels(camera)
 
         print("Evaluate " + camera.name + " finished in " + counter.get_str_time())
         print("-----")
@@ -383,12 +412,16 @@ class BFU_MultiCameraTracks():
 
     def __init__(self):
         self.cameras_to_evaluate: List[bpy.types.Object] = []
+        self.camera_frame_ranges: Dict[str, Tuple[int, int]] = {}
         self.frame_start: int = 0
         self.frame_end: int = 1
         self.evaluate_cameras: Dict[str, BFU_CameraTracks] = {}
 
-    def add_camera_to_evaluate(self, obj: bpy.types.Object):
+    def add_camera_to_evaluate(self, obj: bpy.types.Object, frame_range: Optional[Tuple[int, int]] = None):
+        # frame_range limits the camera to its own frames inside the evaluated range.
         self.cameras_to_evaluate.append(obj)
+        if frame_range is not None:
+            self.camera_frame_ranges[obj.name] = frame_range
 
     def set_start_end_frames(self, frame_start: int, frame_end: int):
         self.frame_start = frame_start
@@ -401,48 +434,26 @@ class BFU_MultiCameraTracks():
         if scene is None:
             return
 
-        def optimizated_evaluate_track_at_frame(evaluate: BFU_CameraTracks):
-            marker_sequence = slms.get_marker_sequence_at_frame(frame)
-            if marker_sequence:
-                marker = marker_sequence.marker
-                if marker and marker.camera == camera:
-                    evaluate.evaluate_track_at_frame(camera, frame)
-
-
-
-        frame_start = self.frame_start
-        frame_end = self.frame_end
-        addon_prefs = bfu_addon_prefs.get_addon_preferences()
-
         counter = bpl.utils.CounterTimer()
         slms = bfu_utils.TimelineMarkerSequence()
         save_simplfy = bbpl.utils.SaveUserRenderSimplify()
 
         # Save scene data
-        save_current_frame = scene.frame_current
         if not preview:
             save_simplfy.save_scene()
             save_simplfy.simplify_scene()
 
-        for camera in self.cameras_to_evaluate:
-            self.evaluate_cameras[camera.name] = BFU_CameraTracks(camera)
-
         #print(f"Start evaluate {str(len(self.cameras_to_evaluate))} camera(s). Frames:({str(frame_start)}-{str(frame_end)})")
-        for frame in range(frame_start, frame_end):
-            for camera in self.cameras_to_evaluate:
-                evaluate = self.evaluate_cameras[camera.name]
-                
-                if len(slms.marker_sequences) > 0 and addon_prefs.bake_only_key_visible_in_cut and ignore_marker_sequences is False:
-                    # Bake only frames visible in cuts
-                    optimizated_evaluate_track_at_frame(evaluate)
-
-                else:
-                    # Bake all frames
-                    evaluate.evaluate_track_at_frame(camera, frame)
+        sampler = bfu_frame_sampler.FrameSampler(self.frame_start, self.frame_end)
+        for camera in self.cameras_to_evaluate:
+            evaluate = self.evaluate_cameras[camera.name] = BFU_CameraTracks(camera)
+            evaluate.add_to_frame_sampler(sampler, camera, not ignore_marker_sequences, slms, self.camera_frame_ranges.get(camera.name))
+        sampler.sample()
+        for camera in self.cameras_to_evaluate:
+            self.evaluate_cameras[camera.name].read_frame_sampler_channels(camera)
 
         if not preview:
             save_simplfy.reset_scene()
-        scene.frame_current = save_current_frame
 
         if print_counter:
             print("Evaluate all cameras finished in " + counter.get_str_time())
@@ -451,8 +462,7 @@ class BFU_MultiCameraTracks():
     def get_evaluate_camera_data(self, obj: bpy.types.Object):
         return self.evaluate_cameras[obj.name]
     
-    def get_evaluate_camera_data_as_dict(self, obj: bpy.types.Object) -> Dict[str, Any]:
+    def get_evaluate_camera_data_as_dict(self, obj: bpy.types.Object, track_format: Optional[str] = None) -> Dict[str, Any]:
         data: Dict[str, Any] = {}
-        data.update(self.evaluate_cameras[obj.name].get_animated_values_as_dict())
-        data.update(self.evaluate_cameras[obj.name].get_animated_values_as_dict())
+        data.update(self.evaluate_cameras[obj.name].get_animated_values_as_dict(track_format))
         return data
\ No newline at end of file
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Compact columnar encoding of the camera animated tracks.
+# A {frame: value} track is written as the frame range and one packed array per channel.
+# Constant channels are collapsed to a single value.
+# Read back in Unreal Engine by bfu_import_module/sequencer_track_format.py
+
+import base64
+import numpy as np
+from typing import Dict, Any, List, Optional, Union
+
+TRACK_FORMAT_NAME = "columnar"
+TRACK_FORMAT_VERSION = 1
+
+# Values of the addon preference camera_track_format
+TRACK_FORMAT_DICT = "DICT"
+TRACK_FORMAT_COLUMNAR = "COLUMNAR"
+TRACK_FORMAT_COLUMNAR_BASE64 = "COLUMNAR_BASE64"
+
+# Channel name used for the tracks with a single value per frame.
+SINGLE_VALUE_CHANNEL = "value"
+
+
+class ColumnTrack():
+    # Track stored as arrays, values[i] is the value at frames[i].
+    # channel_names is None for the tracks with a single value per frame.
+
+    def __init__(self, frames: np.ndarray, values: np.ndarray, channel_names: Optional[List[str]] = None, value_type: Optional[str] = None):
+        self.frames: np.ndarray = frames.astype(np.int64)  # (n,)
+        self.values: np.ndarray = values.reshape(len(frames), -1)  # (n, width)
+        self.channel_names: Optional[List[str]] = channel_names
+        self.value_type: Optional[str] = value_type  # "bool" or None for float
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def get_columns(self) -> Dict[str, np.ndarray]:
+        if self.channel_names is None:
+            return {SINGLE_VALUE_CHANNEL: self.values[:, 0]}
+        return {name: self.values[:, index] for index, name in enumerate(self.channel_names)}
+
+    def get_row_value(self, row: List[float]) -> Any:
+        if self.channel_names is None:
+            return bool(row[0]) if self.value_type == "bool" else row[0]
+        return dict(zip(self.channel_names, row))
+
+    def __getitem__(self, frame: int) -> Any:
+        indices = np.flatnonzero(self.frames == frame)
+        if len(indices) == 0:
+            raise KeyError(frame)
+        return self.get_row_value(self.values[indices[0]].tolist())
+
+    def to_dict(self) -> Dict[int, Any]:
+        # Same as the {frame: value} tracks.
+        return {frame: self.get_row_value(row) for frame, row in zip(self.frames.tolist(), self.values.tolist())}
+
+
+def encode_frames(frames: List[int]) -> Dict[str, Any]:
+    # Regular frames are stored as start, step and count.
+    # Filtered frames (Eg. camera cuts) are stored as a list.
+    if len(frames) == 0:
+        return {"start": 0, "step": 1, "count": 0}
+    if len(frames) == 1:
+        return {"start": frames[0], "step": 1, "count": 1}
+
+    frames_array = np.array(frames, dtype=np.int64)
+    steps = np.diff(frames_array)
+    if steps[0] > 0 and np.all(steps == steps[0]):
+        return {"start": frames[0], "step": int(steps[0]), "count": len(frames)}
+    return {"values": frames}
+
+
+def encode_channel(values: np.ndarray[Any, np.dtype[np.float64]], use_base64: bool) -> Dict[str, Any]:
+    if len(values) > 0 and np.all(values == values[0]):
+        return {"constant": float(values[0])}
+    if use_base64:
+        # Little-endian float32, same size on all the platforms.
+        packed = values.astype("<f4").tobytes()
+        return {"dtype": "<f4", "base64": base64.b64encode(packed).decode("ascii")}
+    return {"values": values.tolist()}
+
+
+def encode_columns(frames: List[int], columns: Dict[str, np.ndarray], value_type: Optional[str], use_base64: bool = True) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "track_format": TRACK_FORMAT_NAME,
+        "version": TRACK_FORMAT_VERSION,
+        "frames": encode_frames(frames),
+        "channels": {},
+    }
+    if len(frames) == 0:
+        return data
+
+    if value_type is not None:
+        data["value_type"] = value_type
+    for channel_name, values in columns.items():
+        data["channels"][channel_name] = encode_channel(values.astype(np.float64, copy=False), use_base64)
+    return data
+
+
+def encode_track(track: Dict[int, Any], use_base64: bool = True) -> Dict[str, Any]:
+    frames = sorted(track.keys())
+    if len(frames) == 0:
+        return encode_columns(frames, {}, None, use_base64)
+
+    first_value = track[frames[0]]
+    value_type = "bool" if isinstance(first_value, bool) else None
+
+    columns: Dict[str, np.ndarray[Any, np.dtype[np.float64]]] = {}
+    if isinstance(first_value, dict):
+        # Eg. transform track: {"location_x": ..., "location_y": ...}
+        for channel_name in first_value.keys():
+            columns[channel_name] = np.array([track[frame][channel_name] for frame in frames], dtype=np.float64)
+    else:
+        columns[SINGLE_VALUE_CHANNEL] = np.array([track[frame] for frame in frames], dtype=np.float64)
+
+    return encode_columns(frames, columns, value_type, use_base64)
+
+
+def format_track(track: Union[Dict[int, Any], ColumnTrack], track_format: str) -> Any:
+    if isinstance(track, ColumnTrack):
+        # Already stored as columns.
+        if track_format == TRACK_FORMAT_COLUMNAR_BASE64:
+            return encode_columns(track.frames.tolist(), track.get_columns(), track.value_type, use_base64=True)
+        if track_format == TRACK_FORMAT_COLUMNAR:
+            return encode_columns(track.frames.tolist(), track.get_columns(), track.value_type, use_base64=False)
+        return track.to_dict()
+
+    if track_format == TRACK_FORMAT_COLUMNAR_BASE64:
+        return encode_track(track, use_base64=True)
+    if track_format == TRACK_FORMAT_COLUMNAR:
+        return encode_track(track, use_base64=False)
+    return track
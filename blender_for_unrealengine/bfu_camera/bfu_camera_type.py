@@ -8,7 +8,7 @@
 # ----------------------------------------------
 
 from pathlib import Path
-from typing import List, Any, Optional, Dict
+from typing import List, Any, Optional, Dict, Tuple
 import bpy
 from .. import bfu_camera
 from .. import bfu_assets_manager
@@ -16,6 +16,7 @@ from ..bfu_assets_manager.bfu_asset_manager_type import AssetType, BFU_ObjectAss
 from .. import bfu_base_object
 from ..bfu_simple_file_type_enum import BFU_FileTypeEnum
 from .. import bfu_export_filter
+from .. import bfu_addon_prefs
 from . import bfu_export_camera_package
 from . import bfu_export_procedure
 from . import bfu_camera_utils
@@ -24,6 +25,7 @@ from . import bfu_camera_utils
 class BFU_Camera(BFU_ObjectAssetClass):
     def __init__(self):
         super().__init__()
+        self.pre_baked_cameras: Dict[str, bfu_camera.bfu_camera_data.BFU_CameraTracks] = {}
 
 
 # ###################################################################
@@ -102,13 +104,48 @@ class BFU_Camera(BFU_ObjectAssetClass):
         asset_list.append(asset)
         return asset_list
 
+    def prepare_asset_export_data(self, datas: List[bpy.types.Object], search_mode: AssetDataSearchMode) -> None:
+        # Evaluate all the cameras in one timeline pass instead of one pass per camera.
+        self.pre_baked_cameras.clear()
+        if search_mode.value != AssetDataSearchMode.FULL.value or not search_mode.search_package_content():
+            return
+
+        scene = bpy.context.scene
+        if scene is None:
+            return
+        addon_prefs = bfu_addon_prefs.get_addon_preferences()
+        if not (scene.bfu_use_text_additional_data and addon_prefs.useGeneratedScripts):  # type: ignore[attr-defined]
+            return
+
+        camera_frame_ranges: Dict[str, Tuple[int, int]] = {}
+        for data in datas:
+            frame_range = bfu_camera_utils.get_desired_camera_start_end_range(data)
+            # Same secure range as BFU_CameraTracks.evaluate_all_tracks()
+            camera_frame_ranges[data.name] = (min(int(frame_range[0]) - 1, 0), int(frame_range[1]) + 1)
+        if not camera_frame_ranges:
+            return
+
+        # One pass over the union of the ranges, each camera is only evaluated in its own range.
+        multi_camera_tracks = bfu_camera.bfu_camera_data.BFU_MultiCameraTracks()
+        multi_camera_tracks.set_start_end_frames(
+            min(r[0] for r in camera_frame_ranges.values()),
+            max(r[1] for r in camera_frame_ranges.values())
+        )
+        for data in datas:
+            multi_camera_tracks.add_camera_to_evaluate(data, camera_frame_ranges[data.name])
+        multi_camera_tracks.evaluate_all_cameras(preview=True, print_counter=True)
+        self.pre_baked_cameras.update(multi_camera_tracks.evaluate_cameras)
+
     def get_asset_additional_data(self, data: bpy.types.Object, details: Any, search_mode: AssetDataSearchMode) -> Dict[str, Any]:
         additional_data: Dict[str, Any] = {}
         if search_mode.value == AssetDataSearchMode.FULL.value:
-            pre_bake_camera = bfu_camera.bfu_camera_data.BFU_CameraTracks(data)
-            if search_mode.search_package_content():
-                frame_range = bfu_camera_utils.get_desired_camera_start_end_range(data)
-                pre_bake_camera.evaluate_all_tracks(data, frame_range[0], frame_range[1])
+            # Already evaluated by prepare_asset_export_data()
+            pre_bake_camera = self.pre_baked_cameras.pop(data.name, None)
+            if pre_bake_camera is None:
+                pre_bake_camera = bfu_camera.bfu_camera_data.BFU_CameraTracks(data)
+                if search_mode.search_package_content():
+                    frame_range = bfu_camera_utils.get_desired_camera_start_end_range(data)
+                    pre_bake_camera.evaluate_all_tracks(data, frame_range[0], frame_range[1])
             additional_data.update(bfu_camera.bfu_camera_write_text.WriteCameraAnimationTracks(data, pre_bake_camera=pre_bake_camera))
         return additional_data
     
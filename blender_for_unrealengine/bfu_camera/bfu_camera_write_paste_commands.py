@@ -12,6 +12,7 @@ from typing import List, TYPE_CHECKING, Tuple
 from . import bfu_camera_data
 from . import bfu_camera_unreal_utils
 from . import bfu_camera_write_text
+from . import bfu_camera_track_format
 
 
 
@@ -34,7 +35,8 @@ def add_camera_to_command(camera: bpy.types.Object, pre_bake_camera: bfu_camera_
 
     # First I get the camera data.
     # This is a very bad way to do this. I need do a new python file specific to camera with class to get data.
-    data = bfu_camera_write_text.WriteOneFrameCameraAnimationTracks(camera, frame_current, pre_bake_camera)
+    # Per frame dict format to read the values at the current frame.
+    data = bfu_camera_write_text.WriteOneFrameCameraAnimationTracks(camera, frame_current, pre_bake_camera, bfu_camera_track_format.TRACK_FORMAT_DICT)
     transform_track = data["ue_camera_transform"][frame_current]
     location_x = transform_track["location_x"]
     location_y = transform_track["location_y"]
@@ -12,10 +12,10 @@ from typing import Any, Optional,Dict
 from . import bfu_camera_data
 from .. import bfu_export_text_files
 
-def WriteOneFrameCameraAnimationTracks(obj: bpy.types.Object, target_frame: int, pre_bake_camera: Optional[bfu_camera_data.BFU_CameraTracks] = None):
-    return WriteCameraAnimationTracks(obj, target_frame, target_frame+1, pre_bake_camera)
+def WriteOneFrameCameraAnimationTracks(obj: bpy.types.Object, target_frame: int, pre_bake_camera: Optional[bfu_camera_data.BFU_CameraTracks] = None, track_format: Optional[str] = None):
+    return WriteCameraAnimationTracks(obj, target_frame, target_frame+1, pre_bake_camera, track_format)
 
-def WriteCameraAnimationTracks(obj: bpy.types.Object, target_frame_start: Optional[int] = None, target_frame_end: Optional[int] = None, pre_bake_camera: Optional[bfu_camera_data.BFU_CameraTracks] = None) -> Dict[str, Any]:
+def WriteCameraAnimationTracks(obj: bpy.types.Object, target_frame_start: Optional[int] = None, target_frame_end: Optional[int] = None, pre_bake_camera: Optional[bfu_camera_data.BFU_CameraTracks] = None, track_format: Optional[str] = None) -> Dict[str, Any]:
     # Write as data camera animation tracks
 
     if bpy.context is None:
@@ -37,13 +37,13 @@ def WriteCameraAnimationTracks(obj: bpy.types.Object, target_frame_start: Option
 
  
     if pre_bake_camera:
-        camera_tracks = pre_bake_camera.get_animated_values_as_dict()
+        camera_tracks = pre_bake_camera.get_animated_values_as_dict(track_format)
     else:
         multi_camera_tracks = bfu_camera_data.BFU_MultiCameraTracks()
         multi_camera_tracks.add_camera_to_evaluate(obj)
         multi_camera_tracks.set_start_end_frames(target_frame_start, target_frame_end)
         multi_camera_tracks.evaluate_all_cameras(True)
-        camera_tracks = multi_camera_tracks.get_evaluate_camera_data_as_dict(obj)
+        camera_tracks = multi_camera_tracks.get_evaluate_camera_data_as_dict(obj, track_format)
 
     data.update(camera_tracks)
 
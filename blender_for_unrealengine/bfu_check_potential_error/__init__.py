@@ -10,6 +10,7 @@
 import bpy
 import importlib
 
+from . import bfu_check_snapshot
 from . import bfu_check_types
 from . import bfu_check_props
 from . import bfu_check_operators
@@ -17,6 +18,8 @@ from . import bfu_check_ui
 from . import bfu_check_utils
 from . import bfu_check_list
 
+if "bfu_check_snapshot" in locals():
+    importlib.reload(bfu_check_snapshot)
 if "bfu_check_types" in locals():
     importlib.reload(bfu_check_types)
 if "bfu_check_props" in locals():
@@ -38,6 +41,7 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    bfu_check_snapshot.register()
     bfu_check_types.register()
     bfu_check_props.register()
     bfu_check_operators.register()
@@ -48,4 +52,5 @@ def unregister():
 
     bfu_check_operators.unregister()
     bfu_check_props.unregister()
-    bfu_check_types.unregister()
\ No newline at end of file
+    bfu_check_types.unregister()
+    bfu_check_snapshot.unregister()
\ No newline at end of file
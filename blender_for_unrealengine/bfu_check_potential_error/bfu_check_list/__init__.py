@@ -11,9 +11,13 @@ import bpy
 import os
 import importlib
 import inspect
-from typing import List, Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Any, Dict, Set, Tuple
 from ..bfu_check_types import bfu_checker
 from .. import bfu_check_utils
+from .. import bfu_check_snapshot
+from ..bfu_check_snapshot import CheckTarget, PotentialErrorData, SnapshotKey
 from ... import bpl
 from ... import bfu_cached_assets
 from ...bfu_cached_assets.bfu_cached_assets_blender_class import AssetToSearch, AssetDataSearchMode
@@ -47,6 +51,15 @@ for module_name in module_names:
         if inspect.isclass(obj) and obj.__module__ == module.__name__ and obj not in all_classes
     ])
 
+def get_check_thread_count() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+def run_snapshot_check_targets(instance: bfu_checker, targets: List[CheckTarget]) -> Tuple[List[List[PotentialErrorData]], float]:
+    # Runs in a worker thread.
+    start_time = time.perf_counter()
+    results = [instance.run_snapshot_check(target) for target in targets]
+    return results, time.perf_counter() - start_time
+
 def run_all_check()-> Dict[str, str]:
     # Clear existing potential errors before starting the checks
     bfu_check_utils.clear_potential_errors()
@@ -66,35 +79,73 @@ def run_all_check()-> Dict[str, str]:
     final_asset_list_to_export = final_asset_cache.get_final_asset_list(AssetToSearch.ALL_ASSETS, AssetDataSearchMode.FULL, force_cache_update=True)
 
     check_info: Dict[str, str] = {}
-
-    for index, my_check_cls in enumerate(checker_classes, start=1):
+    scene = bpy.context.scene
+    snapshot_cache = bfu_check_snapshot.check_snapshot_cache
+    instances: List[bfu_checker] = [my_check_cls() for my_check_cls in checker_classes]
+    snapshot_targets: Dict[int, List[CheckTarget]] = {}
+    snapshot_futures: Dict[int, Future[Tuple[List[List[PotentialErrorData]], float]]] = {}
+    snapshot_dirty_targets: Dict[int, List[CheckTarget]] = {}
+    used_result_keys: Set[Tuple[str, SnapshotKey]] = set()
+
+    with ThreadPoolExecutor(max_workers=get_check_thread_count()) as executor:
+        # Read the shared snapshot on the main thread, then only check the objects changed since the last check.
         counter = bpl.utils.CounterTimer()
-        instance = my_check_cls()
-        check_name = instance.check_name
-        print(f"Check {index}/{total}: {check_name}...")
-
-        # Count errors before and after to determine how many were added by this check
-        before = len(bpy.context.scene.bfu_export_potential_errors)  # type: ignore
-
-        # First run the scene check
-        instance.run_scene_check(scene=bpy.context.scene)  # type: ignore
-
-        # Then run the asset check for each asset in the final asset list
-        for asset in final_asset_list_to_export:
-            instance.run_asset_check(asset)
-
-
-        after = len(bpy.context.scene.bfu_export_potential_errors)  # type: ignore
-        new_issues = after - before
-
-        # Display result with appropriate color
-        if new_issues > 0:
-            issue_result = bpl.color_set.red(f"{new_issues} issue(s)")
-        else:
-            issue_result = bpl.color_set.green("no issues")
-
-        print(f"{check_name} finished in: {counter.get_str_time()} with {issue_result}\n")
-
+        for index, instance in enumerate(instances):
+            if not instance.use_snapshot_check:
+                continue
+            targets: List[CheckTarget] = []
+            for asset in final_asset_list_to_export:
+                targets.extend(instance.get_snapshot_targets(asset, snapshot_cache))
+            dirty_targets: Dict[SnapshotKey, CheckTarget] = {}
+            for target in targets:
+                if snapshot_cache.get_cached_results(instance.check_name, target) is None:
+                    dirty_targets[target.get_key()] = target
+            snapshot_targets[index] = targets
+            snapshot_dirty_targets[index] = list(dirty_targets.values())
+            snapshot_futures[index] = executor.submit(run_snapshot_check_targets, instance, snapshot_dirty_targets[index])
+        print(f"Check snapshot read in: {counter.get_str_time()}\n")
+
+        for index, instance in enumerate(instances):
+            counter = bpl.utils.CounterTimer()
+            check_name = instance.check_name
+            print(f"Check {index + 1}/{total}: {check_name}...")
+
+            # Count errors before and after to determine how many were added by this check
+            before = len(scene.bfu_export_potential_errors)  # type: ignore
+
+            # First run the scene check
+            instance.run_scene_check(scene=scene)  # type: ignore
+
+            if instance.use_snapshot_check:
+                # Then add the results of the snapshot check, from the cache or from the worker thread.
+                dirty_results, thread_time = snapshot_futures[index].result()
+                for target, results in zip(snapshot_dirty_targets[index], dirty_results):
+                    snapshot_cache.set_cached_results(check_name, target, results)
+                for target in snapshot_targets[index]:
+                    used_result_keys.add((check_name, target.get_key()))
+                    for result in snapshot_cache.get_cached_results(check_name, target) or []:
+                        result.add_to_scene(scene)
+                checked = len(snapshot_dirty_targets[index])
+                cached = len(snapshot_targets[index]) - checked
+                print(f"{checked} target(s) checked in {bpl.utils.get_formatted_time(thread_time)} (worker thread), {cached} from cache.")
+            else:
+                # Then run the asset check for each asset in the final asset list
+                for asset in final_asset_list_to_export:
+                    instance.run_asset_check(asset)
+
+
+            after = len(scene.bfu_export_potential_errors)  # type: ignore
+            new_issues = after - before
+
+            # Display result with appropriate color
+            if new_issues > 0:
+                issue_result = bpl.color_set.red(f"{new_issues} issue(s)")
+            else:
+                issue_result = bpl.color_set.green("no issues")
+
+            print(f"{check_name} finished in: {counter.get_str_time()} with {issue_result}\n")
+
+    snapshot_cache.keep_only_results(used_result_keys)
 
     check_info["Total Check(s)"] = str(total) + " For more details, see console log."
     return check_info
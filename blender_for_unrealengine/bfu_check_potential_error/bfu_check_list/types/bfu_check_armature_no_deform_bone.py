@@ -7,8 +7,9 @@
 #  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
 # ----------------------------------------------
 
-import bpy
+from typing import List
 from ...bfu_check_types import bfu_checker
+from ...bfu_check_snapshot import CheckSnapshotCache, CheckTarget, PotentialErrorData
 from ....bfu_cached_assets.bfu_cached_assets_blender_class import AssetToExport
 
 class BFU_Checker_ArmatureNoDeformBone(bfu_checker):
@@ -16,23 +17,27 @@ class BFU_Checker_ArmatureNoDeformBone(bfu_checker):
     def __init__(self):
         super().__init__()
         self.check_name = "Armature No Deform Bone"
+        self.use_snapshot_check = True
 
-    # Check that the skeleton has at least one deform bone
-    def run_asset_check(self, asset: AssetToExport):
+    def get_snapshot_targets(self, asset: AssetToExport, snapshot_cache: CheckSnapshotCache) -> List[CheckTarget]:
         if not asset.asset_type.is_skeletal():
-            return
+            return []
+        return [CheckTarget(asset.asset_type, snapshot_cache.get_object_snapshot(obj)) for obj in self.get_armatures_to_check(asset)]
 
-        for obj in self.get_armatures_to_check(asset):
-            if obj.bfu_export_deform_only:  # type: ignore
-                if not isinstance(obj.data, bpy.types.Armature):
-                    continue
-                has_deform_bone = any(bone.use_deform for bone in obj.data.bones)
-                if not has_deform_bone:
-                    my_po_error = self.add_potential_error()
-                    my_po_error.name = obj.name
-                    my_po_error.type = 2
-                    my_po_error.text = (
-                        f'Object "{obj.name}" does not have any deform bones. '
+    # Check that the skeleton has at least one deform bone
+    def run_snapshot_check(self, target: CheckTarget) -> List[PotentialErrorData]:
+        snapshot = target.snapshot
+        if snapshot.export_deform_only:
+            if snapshot.type != "ARMATURE" or not snapshot.has_data:
+                return []
+            if snapshot.deform_bone_count == 0:
+                return [PotentialErrorData(
+                    name=snapshot.name,
+                    type=2,
+                    text=(
+                        f'Object "{snapshot.name}" does not have any deform bones. '
                         'Unreal will import it as a StaticMesh.'
-                    )
-                    my_po_error.object = obj
+                    ),
+                    object=snapshot.object
+                )]
+        return []
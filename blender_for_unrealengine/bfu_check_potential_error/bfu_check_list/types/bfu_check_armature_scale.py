@@ -7,7 +7,9 @@
 #  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
 # ----------------------------------------------
 
+from typing import List
 from ...bfu_check_types import bfu_checker
+from ...bfu_check_snapshot import CheckSnapshotCache, CheckTarget, PotentialErrorData
 from ....bfu_cached_assets.bfu_cached_assets_blender_class import AssetToExport
 
 class BFU_Checker_ArmatureScale(bfu_checker):
@@ -15,22 +17,24 @@ class BFU_Checker_ArmatureScale(bfu_checker):
     def __init__(self):
         super().__init__()
         self.check_name = "Armature Scale"
+        self.use_snapshot_check = True
 
-    # Check if the armature uses the same value on all scale axes
-    def run_asset_check(self, asset: AssetToExport):
+    def get_snapshot_targets(self, asset: AssetToExport, snapshot_cache: CheckSnapshotCache) -> List[CheckTarget]:
         if not asset.asset_type.is_skeletal():
-            return
+            return []
+        return [CheckTarget(asset.asset_type, snapshot_cache.get_object_snapshot(obj)) for obj in self.get_armatures_to_check(asset)]
 
-        obj_to_check = self.get_armatures_to_check(asset)
-        for obj in obj_to_check:
-            if obj.scale.z != obj.scale.y or obj.scale.z != obj.scale.x:
-                my_po_error = self.add_potential_error()
-                my_po_error.name = obj.name
-                my_po_error.type = 2
-                my_po_error.text = (
-                    f'In object "{obj.name}", the scale values are not consistent across all axes.'
-                )
-                my_po_error.text += (
-                    f'\nScale x: {obj.scale.x}, y: {obj.scale.y}, z: {obj.scale.z}'
-                )
-                my_po_error.object = obj
+    # Check if the armature uses the same value on all scale axes
+    def run_snapshot_check(self, target: CheckTarget) -> List[PotentialErrorData]:
+        snapshot = target.snapshot
+        scale_x, scale_y, scale_z = snapshot.scale
+        if scale_z != scale_y or scale_z != scale_x:
+            text = f'In object "{snapshot.name}", the scale values are not consistent across all axes.'
+            text += f'\nScale x: {scale_x}, y: {scale_y}, z: {scale_z}'
+            return [PotentialErrorData(
+                name=snapshot.name,
+                type=2,
+                text=text,
+                object=snapshot.object
+            )]
+        return []
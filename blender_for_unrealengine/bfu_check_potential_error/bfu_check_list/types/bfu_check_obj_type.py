@@ -8,7 +8,9 @@
 # ----------------------------------------------
 
 
+from typing import List
 from ...bfu_check_types import bfu_checker
+from ...bfu_check_snapshot import CheckSnapshotCache, CheckTarget, PotentialErrorData
 from ....bfu_cached_assets.bfu_cached_assets_blender_class import AssetToExport
 
 class BFU_Checker_ObjType(bfu_checker):
@@ -16,21 +18,26 @@ class BFU_Checker_ObjType(bfu_checker):
     def __init__(self):
         super().__init__()
         self.check_name = "Object Type"
+        self.use_snapshot_check = True
 
         self.non_recommended_types = {"SURFACE", "META", "FONT"}
 
-    def run_asset_check(self, asset: AssetToExport):
-        for package in asset.asset_packages:
-            for obj in package.objects:
-                obj_type = obj.type  # type: ignore
-                if obj_type in self.non_recommended_types:
-                    my_po_error = self.add_potential_error()
-                    my_po_error.name = obj.name
-                    my_po_error.type = 1
-                    my_po_error.text = (
-                        f'Object "{obj.name}" is a {obj_type}. The object of the type '
-                        'SURFACE, META, and FONT is not recommended.'
-                    )
-                    my_po_error.object = obj
-                    my_po_error.correct_ref = "ConvertToMesh"
-                    my_po_error.correct_label = 'Convert to mesh'
+    def get_snapshot_targets(self, asset: AssetToExport, snapshot_cache: CheckSnapshotCache) -> List[CheckTarget]:
+        return [CheckTarget(asset.asset_type, snapshot_cache.get_object_snapshot(obj)) for obj in self.get_objects_to_check(asset)]
+
+    def run_snapshot_check(self, target: CheckTarget) -> List[PotentialErrorData]:
+        snapshot = target.snapshot
+        obj_type = snapshot.type
+        if obj_type in self.non_recommended_types:
+            return [PotentialErrorData(
+                name=snapshot.name,
+                type=1,
+                text=(
+                    f'Object "{snapshot.name}" is a {obj_type}. The object of the type '
+                    'SURFACE, META, and FONT is not recommended.'
+                ),
+                object=snapshot.object,
+                correct_ref="ConvertToMesh",
+                correct_label='Convert to mesh'
+            )]
+        return []
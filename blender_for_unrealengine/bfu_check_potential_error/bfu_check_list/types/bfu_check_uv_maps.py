@@ -8,26 +8,33 @@
 # ----------------------------------------------
 
 
+from typing import List
 from ...bfu_check_types import bfu_checker
+from ...bfu_check_snapshot import CheckSnapshotCache, CheckTarget, PotentialErrorData
 from ....bfu_cached_assets.bfu_cached_assets_blender_class import AssetToExport
-from .... import bfu_collision
 
 class BFU_Checker_UVMaps(bfu_checker):
 
     def __init__(self):
         super().__init__()
         self.check_name = "UV Maps"
+        self.use_snapshot_check = True
+
+    def get_snapshot_targets(self, asset: AssetToExport, snapshot_cache: CheckSnapshotCache) -> List[CheckTarget]:
+        return [CheckTarget(asset.asset_type, snapshot_cache.get_object_snapshot(obj)) for obj in self.get_meshes_to_check(asset)]
 
     # Check that the objects have at least one valid UV map
-    def run_asset_check(self, asset: AssetToExport):
-        for obj in self.get_meshes_to_check(asset):
-            if obj.data:
-                if not bfu_collision.bfu_collision_utils.is_a_collision(obj):
-                    if len(obj.data.uv_layers) < 1:  # type: ignore
-                        my_po_error = self.add_potential_error()
-                        my_po_error.name = obj.name
-                        my_po_error.type = 1
-                        my_po_error.text = f'Object "{obj.name}" does not have any UV Layer.'
-                        my_po_error.object = obj
-                        my_po_error.correct_ref = "CreateUV"
-                        my_po_error.correct_label = 'Create Smart UV Project'
+    def run_snapshot_check(self, target: CheckTarget) -> List[PotentialErrorData]:
+        snapshot = target.snapshot
+        if snapshot.has_data:
+            if not snapshot.is_collision:
+                if snapshot.uv_layer_count < 1:
+                    return [PotentialErrorData(
+                        name=snapshot.name,
+                        type=1,
+                        text=f'Object "{snapshot.name}" does not have any UV Layer.',
+                        object=snapshot.object,
+                        correct_ref="CreateUV",
+                        correct_label='Create Smart UV Project'
+                    )]
+        return []
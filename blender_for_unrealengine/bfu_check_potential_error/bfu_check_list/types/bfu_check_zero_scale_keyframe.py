@@ -8,7 +8,9 @@
 # ----------------------------------------------
 
 
+from typing import List
 from ...bfu_check_types import bfu_checker
+from ...bfu_check_snapshot import CheckSnapshotCache, CheckTarget, PotentialErrorData
 from ....bfu_cached_assets.bfu_cached_assets_blender_class import AssetToExport, AssetType
 
 class BFU_Checker_ZeroScaleKeyframe(bfu_checker):
@@ -16,28 +18,37 @@ class BFU_Checker_ZeroScaleKeyframe(bfu_checker):
     def __init__(self):
         super().__init__()
         self.check_name = "Zero Scale Keyframe"
+        self.use_snapshot_check = True
 
-    # Check that animations do not use an invalid scale value
-    def run_asset_check(self, asset: AssetToExport):
+    def get_snapshot_targets(self, asset: AssetToExport, snapshot_cache: CheckSnapshotCache) -> List[CheckTarget]:
         if asset.asset_type not in [AssetType.ANIM_ACTION, AssetType.ANIM_POSE, AssetType.ANIM_NLA]:
             # This check is only relevant for skeletal assets with animations
-            return
+            return []
 
+        targets: List[CheckTarget] = []
         for packages in asset.asset_packages:
-            action = packages.action
-            action_name = action.name  # type: ignore
+            if packages.action is None:
+                continue
+            action = snapshot_cache.get_action_snapshot(packages.action)
             for obj in self.get_armatures_to_check(asset):
-                for fcurve in action.fcurves:  # type: ignore
-                    # Detect scale curves
-                    if fcurve.data_path.split(".")[-1] == "scale":
-                        for key in fcurve.keyframe_points:
-                            x_curve, y_curve = key.co
-                            if y_curve == 0:
-                                bone_name = fcurve.data_path.split('"')[1]
-                                my_po_error = self.add_potential_error()
-                                my_po_error.type = 2
-                                my_po_error.text = (
-                                    f'In action "{action_name}" used with object "{obj.name}" at frame {x_curve}, '
-                                    f'the bone named "{bone_name}" has a zero value in the scale '
-                                    'transform. This is invalid in Unreal.'
-                                )
+                targets.append(CheckTarget(asset.asset_type, snapshot_cache.get_object_snapshot(obj), action=action))
+        return targets
+
+    # Check that animations do not use an invalid scale value
+    def run_snapshot_check(self, target: CheckTarget) -> List[PotentialErrorData]:
+        if target.action is None:
+            return []
+
+        results: List[PotentialErrorData] = []
+        for data_path, frames, values in target.action.scale_curves:
+            for x_curve in frames[values == 0]:
+                bone_name = data_path.split('"')[1] if '"' in data_path else data_path
+                results.append(PotentialErrorData(
+                    type=2,
+                    text=(
+                        f'In action "{target.action.name}" used with object "{target.snapshot.name}" at frame {x_curve}, '
+                        f'the bone named "{bone_name}" has a zero value in the scale '
+                        'transform. This is invalid in Unreal.'
+                    )
+                ))
+        return results
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Shared data used by the snapshot checks.
+# bpy is not thread safe, so the snapshots are read on the main thread,
+# then the checks run in a thread pool with only the snapshot data.
+# Snapshots and check results are cached per object and reused while
+# the object, its data, its modifiers and its action don't change.
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from typing import List, Dict, Tuple, Optional, Set, Any
+from . import bfu_check_utils
+from .. import bfu_utils
+from .. import bfu_collision
+from ..bfu_assets_manager.bfu_asset_manager_type import AssetType
+
+SnapshotKey = Tuple[Any, ...]
+
+
+class PotentialErrorData():
+    # Plain copy of a potential error, added to the scene on the main thread.
+
+    def __init__(self, **values: Any):
+        self.values: Dict[str, Any] = values
+
+    def add_to_scene(self, scene: bpy.types.Scene) -> None:
+        my_po_error = scene.bfu_export_potential_errors.add()  # type: ignore
+        for prop_name, value in self.values.items():
+            setattr(my_po_error, prop_name, value)
+
+
+class ObjectCheckSnapshot():
+
+    def __init__(self, obj: bpy.types.Object, key: SnapshotKey):
+        self.key = key
+        self.object = obj  # Only used to add the potential errors.
+        self.name: str = obj.name
+        self.type: str = obj.type  # type: ignore
+        self.scale: Tuple[float, float, float] = tuple(obj.scale)  # type: ignore
+        self.has_data: bool = obj.data is not None
+        self.is_collision: bool = bfu_collision.bfu_collision_utils.is_a_collision(obj)
+        self.export_deform_only: bool = bool(getattr(obj, "bfu_export_deform_only", False))
+        self.modifiers: List[Tuple[str, str]] = [(modifier.name, modifier.type) for modifier in obj.modifiers]  # type: ignore
+
+        # Mesh
+        self.uv_layer_count: int = 0
+        self.shape_keys: List[Tuple[str, float, float]] = []
+        self.vertex_count: int = 0
+        self.vertex_group_names: List[str] = []
+        self.vertex_weights: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+        # Armature
+        self.bone_names: Set[str] = set()
+        self.deform_bone_count: int = 0
+
+        if isinstance(obj.data, bpy.types.Mesh):
+            self.uv_layer_count = len(obj.data.uv_layers)
+            if obj.data.shape_keys:
+                for key_block in obj.data.shape_keys.key_blocks:
+                    self.shape_keys.append((key_block.name, key_block.slider_min, key_block.slider_max))
+            self.vertex_count = len(obj.data.vertices)
+            self.vertex_group_names = [group.name for group in obj.vertex_groups]
+            if self.has_armature_modifier() and self.vertex_group_names:
+                self.vertex_weights = bfu_utils.read_vertex_group_weights(obj)
+
+        elif isinstance(obj.data, bpy.types.Armature):
+            self.bone_names = set(obj.data.bones.keys())
+            self.deform_bone_count = sum(1 for bone in obj.data.bones if bone.use_deform)
+
+    def has_armature_modifier(self) -> bool:
+        return any(modifier_type == "ARMATURE" for _, modifier_type in self.modifiers)
+
+
+class ActionCheckSnapshot():
+
+    def __init__(self, action: bpy.types.Action, key: SnapshotKey):
+        self.key = key
+        self.name: str = action.name
+        # (data path, keyframe frames, keyframe values) of the scale curves.
+        self.scale_curves: List[Tuple[str, np.ndarray, np.ndarray]] = []
+
+        for fcurve in action.fcurves:  # type: ignore
+            if fcurve.data_path.split(".")[-1] == "scale":
+                coords = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+                fcurve.keyframe_points.foreach_get("co", coords)
+                self.scale_curves.append((fcurve.data_path, coords[0::2], coords[1::2]))
+
+
+class CheckTarget():
+    # Data checked by one snapshot check.
+
+    def __init__(
+        self,
+        asset_type: AssetType,
+        snapshot: ObjectCheckSnapshot,
+        armature: Optional[ObjectCheckSnapshot] = None,
+        action: Optional[ActionCheckSnapshot] = None
+    ):
+        self.asset_type = asset_type
+        self.snapshot = snapshot
+        self.armature = armature
+        self.action = action
+
+    def get_key(self) -> SnapshotKey:
+        return (
+            self.asset_type.value,
+            self.snapshot.key,
+            self.armature.key if self.armature else None,
+            self.action.key if self.action else None,
+        )
+
+
+class CheckSnapshotCache():
+
+    def __init__(self):
+        self.revisions: Dict[int, int] = {}
+        self.object_snapshots: Dict[int, ObjectCheckSnapshot] = {}
+        self.action_snapshots: Dict[int, ActionCheckSnapshot] = {}
+        self.results: Dict[Tuple[str, SnapshotKey], List[PotentialErrorData]] = {}
+
+    def clear(self) -> None:
+        self.revisions.clear()
+        self.object_snapshots.clear()
+        self.action_snapshots.clear()
+        self.results.clear()
+
+    def mark_updated(self, id_data: bpy.types.ID) -> None:
+        pointer = id_data.as_pointer()
+        self.revisions[pointer] = self.revisions.get(pointer, 0) + 1
+
+    def get_id_key(self, id_data: Optional[bpy.types.ID]) -> SnapshotKey:
+        if id_data is None:
+            return ()
+        pointer = id_data.as_pointer()
+        return (pointer, id_data.name, self.revisions.get(pointer, 0))
+
+    def get_object_key(self, obj: bpy.types.Object) -> SnapshotKey:
+        data = obj.data
+        return (
+            self.get_id_key(obj),
+            self.get_id_key(data),
+            self.get_id_key(getattr(data, "shape_keys", None)),
+            tuple((modifier.name, modifier.type) for modifier in obj.modifiers),  # type: ignore
+            tuple(group.name for group in obj.vertex_groups),
+            bool(getattr(obj, "bfu_export_deform_only", False)),
+        )
+
+    def get_object_snapshot(self, obj: bpy.types.Object) -> ObjectCheckSnapshot:
+        key = self.get_object_key(obj)
+        snapshot = self.object_snapshots.get(obj.as_pointer())
+        if snapshot is None or snapshot.key != key:
+            snapshot = ObjectCheckSnapshot(obj, key)
+            self.object_snapshots[obj.as_pointer()] = snapshot
+        return snapshot
+
+    def get_action_snapshot(self, action: bpy.types.Action) -> ActionCheckSnapshot:
+        key = self.get_id_key(action)
+        snapshot = self.action_snapshots.get(action.as_pointer())
+        if snapshot is None or snapshot.key != key:
+            snapshot = ActionCheckSnapshot(action, key)
+            self.action_snapshots[action.as_pointer()] = snapshot
+        return snapshot
+
+    def get_cached_results(self, check_name: str, target: CheckTarget) -> Optional[List[PotentialErrorData]]:
+        return self.results.get((check_name, target.get_key()))
+
+    def set_cached_results(self, check_name: str, target: CheckTarget, results: List[PotentialErrorData]) -> None:
+        self.results[(check_name, target.get_key())] = results
+
+    def keep_only_results(self, result_keys: Set[Tuple[str, SnapshotKey]]) -> None:
+        # Remove the results of the objects that changed or are no longer checked.
+        for result_key in list(self.results.keys()):
+            if result_key not in result_keys:
+                del self.results[result_key]
+
+
+check_snapshot_cache = CheckSnapshotCache()
+
+
+@persistent
+def bfu_check_snapshot_depsgraph_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    for update in depsgraph.updates:
+        check_snapshot_cache.mark_updated(update.id.original)
+
+
+@persistent
+def bfu_check_snapshot_clear_handler(*args: Any) -> None:
+    # Pointers are not valid after a load or an undo.
+    check_snapshot_cache.clear()
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(bfu_check_snapshot_depsgraph_handler)
+    bpy.app.handlers.frame_change_post.append(bfu_check_snapshot_depsgraph_handler)
+    bpy.app.handlers.load_post.append(bfu_check_snapshot_clear_handler)
+    bpy.app.handlers.undo_post.append(bfu_check_snapshot_clear_handler)
+    bpy.app.handlers.redo_post.append(bfu_check_snapshot_clear_handler)
+
+
+def unregister():
+    bpy.app.handlers.redo_post.remove(bfu_check_snapshot_clear_handler)
+    bpy.app.handlers.undo_post.remove(bfu_check_snapshot_clear_handler)
+    bpy.app.handlers.load_post.remove(bfu_check_snapshot_clear_handler)
+    bpy.app.handlers.frame_change_post.remove(bfu_check_snapshot_depsgraph_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(bfu_check_snapshot_depsgraph_handler)
+    check_snapshot_cache.clear()
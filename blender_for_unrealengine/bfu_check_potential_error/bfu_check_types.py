@@ -10,6 +10,7 @@
 
 import bpy
 from . import bfu_check_props
+from .bfu_check_snapshot import CheckSnapshotCache, CheckTarget, PotentialErrorData
 from typing import List
 from abc import ABC
 from ..bfu_cached_assets.bfu_cached_assets_blender_class import AssetToExport
@@ -18,6 +19,8 @@ class bfu_checker(ABC):
 
     def __init__(self):
         self.check_name: str = "My Checker"
+        # Use get_snapshot_targets() and run_snapshot_check() instead of run_asset_check().
+        self.use_snapshot_check: bool = False
     
     # Helpers
 
@@ -84,6 +87,16 @@ class bfu_checker(ABC):
     def run_asset_check(self, asset: AssetToExport):
         pass
 
+    # Snapshot Check Methods
+
+    def get_snapshot_targets(self, asset: AssetToExport, snapshot_cache: CheckSnapshotCache) -> List[CheckTarget]:
+        # Called on the main thread.
+        return []
+
+    def run_snapshot_check(self, target: CheckTarget) -> List[PotentialErrorData]:
+        # Called in a worker thread, only use the target data here, never bpy.
+        return []
+
 
 # -------------------------------------------------------------------
 #   Register & Unregister
@@ -11,7 +11,8 @@
 import bpy
 import fnmatch
 import math
-from typing import List, TYPE_CHECKING, Set, Dict
+import numpy as np
+from typing import List, TYPE_CHECKING, Set, Dict, Optional, Tuple
 
 from . import bfu_check_props
 from .. import bbpl
@@ -56,31 +57,34 @@ def process_general_fix()-> Dict[str, str]:
     time_log.end_time_log()
     return fix_info
 
-def get_vertices_with_zero_weight(Armature: bpy.types.Object, Mesh: bpy.types.Object) -> List[bpy.types.MeshVertex]:
-    vertices: List[bpy.types.MeshVertex] = []
-
-    # Create a set of armature bone names for faster lookup
-    armature_bone_names: Set[str] = set(bone.name for bone in Armature.data.bones)
-
-    for vertex in Mesh.data.vertices:  # MeshVertex(bpy_struct)
-        cumulateWeight = 0
-
-        if vertex.groups:
-            for group_elem in vertex.groups:  # VertexGroupElement(bpy_struct)
-                if group_elem.weight > 0:
-                    group_index = group_elem.group
-                    group_len = len(Mesh.vertex_groups)
-                    if group_index <= group_len:
-                        group = Mesh.vertex_groups[group_elem.group]
-                        
-                        # Use the set of bone names to check membership in the armature
-                        if group.name in armature_bone_names:
-                            cumulateWeight += group_elem.weight
-        
-        if cumulateWeight == 0:
-            vertices.append(vertex)
-    
-    return vertices
+def get_zero_weight_vertex_indices(
+    vertex_count: int,
+    group_names: List[str],
+    bone_names: Set[str],
+    vertex_weights: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+) -> np.ndarray:
+    # Only use NumPy so it can run outside of the main thread.
+    # Vertex groups are valid when a bone has the same name.
+    valid_groups = np.array([name in bone_names for name in group_names], dtype=bool)
+    if vertex_weights is None or not np.any(valid_groups):
+        return np.arange(vertex_count)
+
+    group_counts, group_indices, weights = vertex_weights
+    vertex_indices = np.repeat(np.arange(vertex_count), group_counts)
+
+    is_valid = (weights > 0) & (group_indices < len(valid_groups))
+    is_valid[is_valid] = valid_groups[group_indices[is_valid]]
+    cumulate_weights = np.bincount(vertex_indices[is_valid], weights=weights[is_valid], minlength=vertex_count)
+    return np.flatnonzero(cumulate_weights == 0)
+
+def get_vertices_with_zero_weight(Armature: bpy.types.Object, Mesh: bpy.types.Object) -> np.ndarray:
+    # Returns the indices of the vertices without weight in a vertex group of an armature bone.
+    group_names = [group.name for group in Mesh.vertex_groups]
+    bone_names: Set[str] = set(Armature.data.bones.keys())
+    vertex_count = len(Mesh.data.vertices)
+    if not any(name in bone_names for name in group_names):
+        return np.arange(vertex_count)
+    return get_zero_weight_vertex_indices(vertex_count, group_names, bone_names, bfu_utils.read_vertex_group_weights(Mesh))
 
 def select_potential_issue_object(issue_index):
     # Select potential error
@@ -118,8 +122,9 @@ def select_potential_issue_vertices(issue_index):
 
     bbpl.utils.safe_mode_set('OBJECT')
     if my_po_error.select_option == "VertexWithZeroWeight":
-        for vertex in get_vertices_with_zero_weight(obj.parent, obj):
-            vertex.select = True
+        vertex_select = np.zeros(len(obj.data.vertices), dtype=bool)
+        vertex_select[get_vertices_with_zero_weight(obj.parent, obj)] = True
+        obj.data.vertices.foreach_set("select", vertex_select)
     bbpl.utils.safe_mode_set('EDIT')
     bpy.ops.view3d.view_selected()
     return obj
@@ -187,8 +187,7 @@ def export_collection_as_static_mesh(
         bfu_export.bfu_export_utils.reset_sockets_transform(obj)
 
     bfu_utils.clean_delete_objects(bpy.context.selected_objects)
-    for data in duplicate_data.data_to_remove:
-        data.remove_data()
+    duplicate_data.remove_duplicated_data()
 
     duplicate_data.reset_duplicate_name_after_export()
 
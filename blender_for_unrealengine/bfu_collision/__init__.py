@@ -15,7 +15,7 @@ from . import bfu_collision_props
 from . import bfu_collision_types
 from . import bfu_collision_ui
 from . import bfu_collision_utils
-from . import bfu_collision_mesh_shape
+from . import bfu_collision_batch
 from . import shape_algorithms
 
 if "bfu_collision_operator" in locals():
@@ -28,8 +28,8 @@ if "bfu_collision_ui" in locals():
     importlib.reload(bfu_collision_ui)
 if "bfu_collision_utils" in locals():
     importlib.reload(bfu_collision_utils)
-if "bfu_collision_mesh_shape" in locals():
-    importlib.reload(bfu_collision_mesh_shape)
+if "bfu_collision_batch" in locals():
+    importlib.reload(bfu_collision_batch)
 if "shape_algorithms" in locals():
     importlib.reload(shape_algorithms)
 
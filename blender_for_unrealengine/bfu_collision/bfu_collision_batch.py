@@ -0,0 +1,263 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Batch collision shapes generation.
+# 1. Mesh data is read on the main thread (foreach_get, convex hulls with bmesh).
+# 2. Box shapes (PCA and true MVBB) are computed with NumPy in a thread pool.
+# 3. Result meshes are written in one pass with from_pydata, without operators.
+#    When the original geometry is kept, the shape is added to it with bmesh to keep UVs and materials.
+
+import os
+import bpy
+import bmesh
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Any
+from .bfu_collision_types import CollisionShapeType
+from .shape_algorithms import pca_mvbb
+from .shape_algorithms import true_mvbb
+from .. import bpl
+
+
+# Vertex indexes of each face of a box built with true_mvbb._get_box_corners (x, y, z order).
+BOX_FACES = [
+    (0, 1, 3, 2),  # -X
+    (4, 6, 7, 5),  # +X
+    (0, 4, 5, 1),  # -Y
+    (2, 3, 7, 6),  # +Y
+    (0, 2, 6, 4),  # -Z
+    (1, 5, 7, 3),  # +Z
+]
+
+
+def read_mesh_coords(mesh: bpy.types.Mesh) -> np.ndarray[Any, np.dtype[np.float64]]:
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3).astype(np.float64)
+
+
+def read_mesh_hull(mesh: bpy.types.Mesh) -> true_mvbb.ConvexHullData:
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    hull = true_mvbb.get_hull_data(bm)
+    bm.free()
+    return hull
+
+
+class CollisionShapeSource():
+    # Source mesh data of one collision shape.
+    # Read on the main thread, the shape is then computed without any bpy access.
+
+    def __init__(
+        self,
+        obj: bpy.types.Object,
+        collision_shape: CollisionShapeType,
+        use_world_space: bool,
+        use_pca_approximation: bool,
+        keep_original: bool
+    ):
+        mesh = obj.data
+        if not isinstance(mesh, bpy.types.Mesh):
+            raise TypeError(f"Object {obj.name} has no mesh, cannot create collision shape.")
+
+        self.obj_name: str = obj.name
+        self.collision_shape: CollisionShapeType = collision_shape
+        self.use_world_space: bool = use_world_space
+        self.use_pca_approximation: bool = use_pca_approximation
+        self.keep_original: bool = keep_original
+        self.matrix_world = np.array(obj.matrix_world, dtype=np.float64)
+
+        self.coords = read_mesh_coords(mesh)
+        self.hull: Optional[true_mvbb.ConvexHullData] = None
+        if self.need_hull():
+            self.hull = read_mesh_hull(mesh)
+
+        # Filled by compute_shape()
+        # With keep_original, result_coords are the added vertices and result_faces
+        # index the original vertices first, then the added vertices.
+        self.result_coords: Optional[np.ndarray[Any, np.dtype[np.float64]]] = None
+        self.result_faces: List[List[int]] = []
+
+    def is_box(self) -> bool:
+        return self.collision_shape.value == CollisionShapeType.BOX.value
+
+    def need_hull(self) -> bool:
+        # BOX collision shape need a strict Box shape, other shapes use the convex hull.
+        if self.is_box():
+            return not self.use_pca_approximation
+        return True
+
+    def to_world(self, coords: np.ndarray[Any, np.dtype[np.float64]]) -> np.ndarray[Any, np.dtype[np.float64]]:
+        return coords @ self.matrix_world[:3, :3].T + self.matrix_world[:3, 3]
+
+    def to_local(self, coords: np.ndarray[Any, np.dtype[np.float64]]) -> np.ndarray[Any, np.dtype[np.float64]]:
+        inv_matrix = np.linalg.inv(self.matrix_world)
+        return coords @ inv_matrix[:3, :3].T + inv_matrix[:3, 3]
+
+    def compute_box_corners(self) -> np.ndarray[Any, np.dtype[np.float64]]:
+        if self.hull is None:
+            coords = self.to_world(self.coords) if self.use_world_space else self.coords
+            corners = pca_mvbb.calculate_mvbb_with_pca(coords)
+        else:
+            coords = self.hull.coords
+            face_normals = self.hull.face_normals
+            if self.use_world_space:
+                # The hull topology is the same in world space, only the normals need be transformed.
+                coords = self.to_world(coords)
+                face_normals = face_normals @ np.linalg.inv(self.matrix_world[:3, :3])
+                face_normals /= np.maximum(np.linalg.norm(face_normals, axis=1), 1e-20)[:, None]
+            corners = true_mvbb.calculate_mvbb_from_hull(coords, face_normals, self.hull.edge_verts, self.hull.edge_faces)
+
+        if self.use_world_space:
+            corners = self.to_local(corners)
+        return corners
+
+    def compute_shape(self) -> None:
+        # Called from the worker pool, no bpy access here.
+        if self.is_box():
+            corners = self.compute_box_corners()
+            faces = [list(face) for face in BOX_FACES]
+            edges = np.stack([corners[4] - corners[0], corners[2] - corners[0], corners[1] - corners[0]])
+            if np.linalg.det(edges) < 0:
+                # Mirrored box axes, flip faces to keep the normals outside.
+                faces = [face[::-1] for face in faces]
+            if self.keep_original:
+                offset = self.coords.shape[0]
+                self.result_coords = corners
+                self.result_faces = [[i + offset for i in face] for face in faces]
+            else:
+                self.result_coords = corners
+                self.result_faces = faces
+
+        elif self.hull is not None:
+            if self.keep_original:
+                # The hull is added on the original vertices.
+                self.result_coords = np.zeros((0, 3))
+                self.result_faces = [self.hull.source_indexes[face].tolist() for face in self.hull.faces]
+            else:
+                self.result_coords = self.hull.coords
+                self.result_faces = self.hull.faces
+
+
+def get_pool_worker_count(job_count: int) -> int:
+    return max(1, min(job_count, os.cpu_count() or 1))
+
+
+def compute_collision_shapes(sources: List[CollisionShapeSource]) -> None:
+    # NumPy releases the GIL, so the shapes are computed in parallel with threads.
+    if len(sources) <= 1:
+        for source in sources:
+            source.compute_shape()
+        return
+
+    with ThreadPoolExecutor(max_workers=get_pool_worker_count(len(sources))) as executor:
+        # list() to raise exceptions from the workers.
+        list(executor.map(lambda source: source.compute_shape(), sources))
+
+
+def add_shape_to_mesh(source: CollisionShapeSource, mesh: bpy.types.Mesh) -> None:
+    # Keep the original geometry with its UVs and materials, and add the shape around it.
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+    verts = list(bm.verts)
+    if source.result_coords is not None:
+        verts.extend(bm.verts.new(co) for co in source.result_coords.tolist())
+    for face in source.result_faces:
+        try:
+            bm.faces.new([verts[i] for i in face])
+        except ValueError:
+            # The face already exists in the original geometry.
+            pass
+    bm.to_mesh(mesh)
+    bm.free()
+
+
+def write_shape_to_mesh(source: CollisionShapeSource, mesh: bpy.types.Mesh) -> None:
+    if source.keep_original:
+        add_shape_to_mesh(source, mesh)
+    else:
+        mesh.clear_geometry()
+        if source.result_coords is not None:
+            mesh.from_pydata(source.result_coords.tolist(), [], source.result_faces)  # type: ignore
+    mesh.update()
+
+
+def create_collision_shape_sources(
+    objs: List[bpy.types.Object],
+    collision_shape: CollisionShapeType,
+    use_world_space: bool,
+    use_pca_approximation: bool,
+    keep_original: bool
+) -> List[CollisionShapeSource]:
+    sources: List[CollisionShapeSource] = []
+    for obj in objs:
+        if isinstance(obj.data, bpy.types.Mesh):
+            if obj.data.is_editmode:
+                print(f"Object {obj.name} is in edit mode, cannot convert to collision shape.")
+                continue
+            sources.append(CollisionShapeSource(obj, collision_shape, use_world_space, use_pca_approximation, keep_original))
+    return sources
+
+
+def apply_collision_shapes(
+    objs: List[bpy.types.Object],
+    collision_shape: CollisionShapeType,
+    use_world_space: bool = True,
+    use_pca_approximation: bool = True,
+    keep_original: bool = False
+) -> List[bpy.types.Object]:
+    # Replace the mesh of each object with its collision shape.
+    # Return the converted objects.
+    counter = bpl.utils.CounterTimer()
+    sources = create_collision_shape_sources(objs, collision_shape, use_world_space, use_pca_approximation, keep_original)
+    compute_collision_shapes(sources)
+
+    converted_objs: List[bpy.types.Object] = []
+    for source in sources:
+        obj = bpy.data.objects[source.obj_name]
+        if isinstance(obj.data, bpy.types.Mesh):
+            write_shape_to_mesh(source, obj.data)
+            converted_objs.append(obj)
+
+    print(f"{len(converted_objs)} collision shape(s) calculation time: ", counter.get_str_time())
+    return converted_objs
+
+
+def create_collision_shapes(
+    objs: List[bpy.types.Object],
+    collision_shape: CollisionShapeType,
+    use_world_space: bool = True,
+    use_pca_approximation: bool = True,
+    keep_original: bool = False
+) -> List[bpy.types.Object]:
+    # Create a new object with the collision shape of each object.
+    # The new objects are linked in the same collection as the original object.
+    counter = bpl.utils.CounterTimer()
+    sources = create_collision_shape_sources(objs, collision_shape, use_world_space, use_pca_approximation, keep_original)
+    compute_collision_shapes(sources)
+
+    new_objs: List[bpy.types.Object] = []
+    for source in sources:
+        obj = bpy.data.objects[source.obj_name]
+        if source.keep_original and isinstance(obj.data, bpy.types.Mesh):
+            # The copy keeps the UV layers and the material slots.
+            mesh = obj.data.copy()
+            mesh.name = obj.name + "_ColTemp"
+        else:
+            mesh = bpy.data.meshes.new(name=obj.name + "_ColTemp")
+        write_shape_to_mesh(source, mesh)
+        new_obj = bpy.data.objects.new(name=obj.name + "_ColTemp", object_data=mesh)
+        obj.users_collection[0].objects.link(new_obj) # Link in the same collection as the original object
+        new_obj.parent = obj
+        new_obj.matrix_world = obj.matrix_world.copy()
+        new_objs.append(new_obj)
+
+    print(f"{len(new_objs)} collision shape(s) calculation time: ", counter.get_str_time())
+    return new_objs
@@ -8,9 +8,9 @@
 # ----------------------------------------------
 
 import bpy
-from typing import List, Optional
+from typing import List, Optional, Set
 from .bfu_collision_types import CollisionShapeType
-from . import bfu_collision_mesh_shape
+from . import bfu_collision_batch
 from . import bfu_collision_props
 from .. import bfu_unreal_utils
 from .. import bfu_export_control
@@ -140,19 +140,33 @@ def create_unrealengine_collision_from_selection(collision_shape: CollisionShape
 def create_unrealengine_collision(collision_shape: CollisionShapeType, object_names: List[str]) -> List[str]:
     # Create Unreal Engine Collisions Shapes from object names
 
+    scene = bpy.context.scene
+    if scene is None:
+        raise ValueError("No active scene found!")
+
     # Better to use name to avoid rna loosed reference
-    new_collision_object_names: List[str] = []
+    objs: List[bpy.types.Object] = []
     for obj_name in object_names:
         obj = bpy.data.objects.get(obj_name)
         if obj is not None and isinstance(obj.data, bpy.types.Mesh):
-            # Create a new object
-            new_obj = bpy.data.objects.new(name=obj.name + "_ColTemp", object_data=obj.data.copy())
-            new_obj.parent = obj
-            new_obj.matrix_world = obj.matrix_world.copy()
-            new_obj.data = obj.data.copy()
-            obj.users_collection[0].objects.link(new_obj) # Link in the same collection as the original object
-            convert_to_unrealengine_collision(obj, [new_obj], collision_shape)
-            new_collision_object_names.append(new_obj.name)
+            objs.append(obj)
+
+    # All the shapes are created in one batch.
+    new_objs = bfu_collision_batch.create_collision_shapes(
+        objs,
+        collision_shape,
+        use_world_space=bfu_collision_props.get_scene_use_world_space_for_collision(scene),
+        use_pca_approximation=bfu_collision_props.get_scene_use_fast_bounding_box_approximation(scene),
+        keep_original=bfu_collision_props.get_scene_keep_original_geometry(scene),
+    )
+
+    existing_names: Set[str] = {obj.name for obj in scene.objects}
+    apply_collision_material_to_objects(new_objs)
+    new_collision_object_names: List[str] = []
+    for new_obj in new_objs:
+        if new_obj.parent is not None:
+            setup_collision_object(new_obj, new_obj.parent, collision_shape, existing_names)
+        new_collision_object_names.append(new_obj.name)
 
     return new_collision_object_names
 
@@ -171,6 +185,39 @@ def convert_select_to_unrealengine_collision(collision_shape: CollisionShapeType
 
     return convert_to_unrealengine_collision(collision_owner, objs_to_convert, collision_shape)
 
+def setup_collision_object(
+    obj: bpy.types.Object, 
+    collision_owner: bpy.types.Object, 
+    collision_shape: CollisionShapeType,
+    existing_names: Optional[Set[str]] = None
+) -> None:
+    # Set name, display and parent of a collision object.
+    # existing_names: Names of the scene objects, updated with the new name.
+    addon_prefs = bfu_addon_prefs.get_addon_preferences()
+    prefix_name: str = collision_shape.get_unreal_engine_prefix()
+
+    if existing_names is not None:
+        existing_names.discard(obj.name)
+    if is_a_collision(obj):
+        # Update the name if needed
+        obj.name = bfu_unreal_utils.generate_name_for_unreal_engine(obj.name, obj.name, existing_names)
+    else:
+        # Set a new name using the owner name as reference
+        obj.name = bfu_unreal_utils.generate_name_for_unreal_engine(prefix_name+collision_owner.name, obj.name, existing_names)
+    if existing_names is not None:
+        existing_names.add(obj.name)
+
+    obj.show_wire = True
+    obj.show_transparent = True
+    obj.display.show_shadows = False
+    obj.display_type = 'SOLID'
+    obj.color = addon_prefs.collisionColor
+
+    saved_matrix = obj.matrix_world.copy()
+    obj.parent = collision_owner
+    obj.matrix_world = saved_matrix
+
+
 def convert_to_unrealengine_collision(
     collision_owner: bpy.types.Object, 
     objs_to_convert: List[bpy.types.Object], 
@@ -183,61 +230,27 @@ def convert_to_unrealengine_collision(
     scene = bpy.context.scene
     if scene is None:
         raise ValueError("No active scene found!")
-    
-    addon_prefs = bfu_addon_prefs.get_addon_preferences()
 
-    def deselect_all_except_active() -> None:
-        for obj in bpy.context.selected_objects:
-            if obj != bpy.context.active_object:
-                obj.select_set(False)
+    mesh_objs: List[bpy.types.Object] = [obj for obj in objs_to_convert if obj != collision_owner and isinstance(obj.data, bpy.types.Mesh)]
 
+    if apply_collision_shape_on_mesh:
+        # All the shapes are computed in one batch.
+        mesh_objs = bfu_collision_batch.apply_collision_shapes(
+            mesh_objs,
+            collision_shape,
+            use_world_space=bfu_collision_props.get_scene_use_world_space_for_collision(scene),
+            use_pca_approximation=bfu_collision_props.get_scene_use_fast_bounding_box_approximation(scene),
+            keep_original=bfu_collision_props.get_scene_keep_original_geometry(scene),
+        )
 
+    existing_names: Set[str] = {obj.name for obj in scene.objects}
+    apply_collision_material_to_objects(mesh_objs)
     converted_objs: List[bpy.types.Object] = []
+    for obj in mesh_objs:
+        obj.modifiers.clear()
+        setup_collision_object(obj, collision_owner, collision_shape, existing_names)
+        converted_objs.append(obj)
 
-    for obj in objs_to_convert:
-        deselect_all_except_active()
-        obj.select_set(True)
-        if obj != collision_owner:
-
-            if isinstance(obj.data, bpy.types.Mesh):
-
-                if apply_collision_shape_on_mesh:
-                    keep_original: bool = bfu_collision_props.get_scene_keep_original_geometry(scene)
-                    use_world_space: bool = bfu_collision_props.get_scene_use_world_space_for_collision(scene)
-                    use_pca_approximation: bool = bfu_collision_props.get_scene_use_fast_bounding_box_approximation(scene)
-                    if collision_shape.value == CollisionShapeType.BOX.value:
-                        # BOX collision shape need a strict Box shape
-                        bfu_collision_mesh_shape.convert_to_box_shape(obj, use_world_space=use_world_space, use_pca_approximation=use_pca_approximation, keep_original=keep_original)
-                    else:
-                        bfu_collision_mesh_shape.convert_to_convex_hull_shape(obj, keep_original=keep_original)
-
-
-                obj.modifiers.clear()
-                apply_collision_material_to_object(obj)
-
-                prefix_name: str = collision_shape.get_unreal_engine_prefix()
-
-                if is_a_collision(obj):
-                    # Update the name if needed
-                    obj.name = bfu_unreal_utils.generate_name_for_unreal_engine(obj.name, obj.name)
-                else:
-                    # Set a new name using the owner name as reference
-                    obj.name = bfu_unreal_utils.generate_name_for_unreal_engine(prefix_name+collision_owner.name, obj.name)
-                obj.show_wire = True
-                obj.show_transparent = True
-                obj.display.show_shadows = False
-                obj.display_type = 'SOLID'
-                obj.color = addon_prefs.collisionColor
-
-
-                saved_matrix = obj.matrix_world.copy()
-                obj.parent = collision_owner
-                obj.matrix_world = saved_matrix
-                converted_objs.append(obj)
-
-    deselect_all_except_active()
-    for obj in objs_to_convert:
-        obj.select_set(True)  # Resets previous selected object
     return converted_objs
 
 
@@ -17,7 +17,7 @@
 
 import numpy as np
 import bmesh
-from typing import Any, Optional
+from typing import Any, Optional, List
 from ... import bpl
 
 # Compatibility fix for older Python versions - numpy type annotations
@@ -45,51 +45,168 @@ else:
     if not hasattr(np.dtype, '__class_getitem__'):
         np.dtype = dtype
 
-def _orthonormalize(
-    n1: np.ndarray[Any, np.dtype[np.float64]], 
-    n2: np.ndarray[Any, np.dtype[np.float64]], 
-    n3: np.ndarray[Any, np.dtype[np.float64]], 
-    eps: float = 1e-8
-) -> Optional[np.ndarray[Any, np.dtype[np.float64]]]:
-
-    """Orthonormalize three directions using Gram-Schmidt. Returns 3x3 or None if degenerate."""
-    # Normalize first
-    n1n = n1 / (np.linalg.norm(n1) + 1e-20)
-
-    # Make n2 orthogonal to n1
-    n2o = n2 - n1n * np.dot(n1n, n2)
-    n2n = n2o / (np.linalg.norm(n2o) + 1e-20)
-    if np.linalg.norm(n2o) < eps:
-        return None
-
-    # n3 as cross to ensure orthogonality (and best stability)
-    n3c = np.cross(n1n, n2n) # type: ignore
-    if np.linalg.norm(n3c) < eps: # type: ignore
-        return None
-    n3n = n3c / (np.linalg.norm(n3c) + 1e-20) # type: ignore
-
-    R = np.stack([n1n, n2n, n3n], axis=0)  # rows are axes # type: ignore
-    # Ensure right-handed
-    if np.linalg.det(R) < 0:
-        R[2] *= -1.0
-    return R
-
-def _pca_ref_volume(
-    coords: np.ndarray[Any, np.dtype[np.float64]]
-) -> float:
-
-    """Cheap reference volume using PCA-aligned AABB (for outlier filtering)."""
-    C = coords - coords.mean(axis=0)
-    cov = np.cov(C.T) # type: ignore
-    _, evecs = np.linalg.eigh(cov) # type: ignore
-    R = evecs.T
-    CR = C @ R.T
-    side = CR.max(axis=0) - CR.min(axis=0)
-    vol = float(np.prod(side)) # type: ignore
-    return max(vol, 1e-18)
+# Normals are deduplicated on a grid of this size (same tolerance as the previous pairwise check).
+NORMAL_QUANTIZATION = 1e-5
+# Number of candidate axes evaluated in one NumPy batch.
+AXIS_BATCH_SIZE = 256
 
-def calculate_true_mvbb(bm: bmesh.types.BMesh) -> np.ndarray[Any, np.dtype[np.float64]]:
-    # === STEP 1: Convex hull (clean) ===
+
+def _get_box_corners(mins: np.ndarray[Any, np.dtype[np.float64]], maxs: np.ndarray[Any, np.dtype[np.float64]]) -> np.ndarray[Any, np.dtype[np.float64]]:
+    return np.array([[x, y, z] for x in [mins[0], maxs[0]]
+                               for y in [mins[1], maxs[1]]
+                               for z in [mins[2], maxs[2]]])
+
+
+def _get_pca_box_corners(
+    C: np.ndarray[Any, np.dtype[np.float64]], 
+    center: np.ndarray[Any, np.dtype[np.float64]]
+) -> np.ndarray[Any, np.dtype[np.float64]]:
+
+    eig = np.linalg.eigh(np.cov(C.T))[1].T  # type: ignore
+    CR = C @ eig.T  # type: ignore
+    corners = _get_box_corners(CR.min(axis=0), CR.max(axis=0))
+    return corners @ eig + center
+
+
+def get_unique_axes(normals: np.ndarray[Any, np.dtype[np.float64]]) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """Normalize, fold the sign (n and -n give the same box) and deduplicate with quantized normals."""
+    lengths = np.linalg.norm(normals, axis=1)
+    normals = normals[lengths >= 1e-12] / lengths[lengths >= 1e-12, None]
+    if normals.shape[0] == 0:
+        return normals
+
+    # Fold to a consistent hemisphere: the first non zero component is positive.
+    non_zero = np.abs(normals) >= 1e-12
+    first_non_zero = np.argmax(non_zero, axis=1)
+    signs = np.sign(normals[np.arange(normals.shape[0]), first_non_zero])
+    normals = normals * signs[:, None]
+
+    # Hash quantized normals instead of comparing all pairs.
+    keys = np.round(normals / NORMAL_QUANTIZATION).astype(np.int64)
+    _, first_indexes = np.unique(keys, axis=0, return_index=True)
+    return normals[np.sort(first_indexes)]
+
+
+def calculate_mvbb_from_hull(
+    coords: np.ndarray[Any, np.dtype[np.float64]],
+    face_normals: np.ndarray[Any, np.dtype[np.float64]],
+    edge_verts: np.ndarray[Any, np.dtype[np.int64]],
+    edge_faces: np.ndarray[Any, np.dtype[np.int64]],
+) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """Minimum volume box with one face flush with a hull face.
+
+    coords: (V, 3) hull vertices.
+    face_normals: (F, 3) hull face normals.
+    edge_verts: (E, 2) vertex indexes of each hull edge.
+    edge_faces: (E, 2) face indexes on each side of the hull edge.
+
+    For each unique face normal the points are projected on the normal plane
+    and the minimum area rectangle is found with rotating calipers:
+    one side of the rectangle is collinear with an edge of the 2D hull.
+    The 2D hull of the projection is the silhouette of the 3D hull,
+    so only the silhouette edges and vertices are evaluated.
+    """
+
+    if coords.shape[0] < 3:
+        # Degenerate: build a tiny box around the point/segment
+        center = coords.mean(axis=0) if coords.size else np.zeros(3)
+        half = np.array([1e-6, 1e-6, 1e-6])
+        return _get_box_corners(center - half, center + half)
+
+    # Center for numerical stability
+    center = coords.mean(axis=0)
+    C = coords - center
+
+    axes = get_unique_axes(face_normals)
+    if axes.shape[0] < 3:
+        # Fallback to PCA box if not enough distinct directions
+        return _get_pca_box_corners(C, center)
+
+    edge_dirs = C[edge_verts[:, 1]] - C[edge_verts[:, 0]]  # (E, 3)
+    edge_normals_a = face_normals[edge_faces[:, 0]]  # (E, 3)
+    edge_normals_b = face_normals[edge_faces[:, 1]]
+
+    best_volume = float("inf")
+    best_R: Optional[np.ndarray[Any, np.dtype[np.float64]]] = None
+    silhouette_eps = 1e-9
+
+    for batch_start in range(0, axes.shape[0], AXIS_BATCH_SIZE):
+        batch_axes = axes[batch_start:batch_start + AXIS_BATCH_SIZE]  # (B, 3)
+
+        # Height of the box along each axis.
+        heights = np.ptp(C @ batch_axes.T, axis=0)  # (B,)
+
+        # Silhouette edges: the faces on each side of the edge don't look in the same direction.
+        # Grazing faces can add a few extra edges, they are only extra candidates.
+        silhouettes = (batch_axes @ edge_normals_a.T) * (batch_axes @ edge_normals_b.T) <= silhouette_eps  # (B, E)
+        axis_ids, edge_ids = np.nonzero(silhouettes)
+        bounds = np.searchsorted(axis_ids, np.arange(batch_axes.shape[0] + 1))
+
+        # Silhouette edge directions projected on the plane of their axis.
+        N = batch_axes[axis_ids]
+        U = edge_dirs[edge_ids]
+        U = U - N * np.einsum("ij,ij->i", U, N)[:, None]
+        lengths = np.linalg.norm(U, axis=1)
+        invalid_dirs = lengths <= 1e-12
+        U /= np.where(invalid_dirs, 1.0, lengths)[:, None]
+        UW = np.stack([U, np.cross(N, U)], axis=1)  # (M, 2, 3) rectangle axes for each edge
+        silhouette_verts = edge_verts[edge_ids]  # (M, 2)
+
+        for b in range(batch_axes.shape[0]):
+            height = heights[b]
+            start, end = bounds[b], bounds[b + 1]
+            if not np.isfinite(height) or height <= 0 or start == end:
+                continue
+
+            # Silhouette vertices contain the 2D hull.
+            S = C[silhouette_verts[start:end].ravel()]  # (S, 3)
+            proj = UW[start:end].reshape(-1, 3) @ S.T  # (2K, S)
+            extents = (proj.max(axis=1) - proj.min(axis=1)).reshape(-1, 2)
+            areas = extents[:, 0] * extents[:, 1]  # (K,)
+            areas[invalid_dirs[start:end]] = np.inf
+            k = int(np.argmin(areas))
+            volume = float(height * areas[k])
+            if np.isfinite(volume) and 0 < volume < best_volume:
+                best_volume = volume
+                best_R = np.stack([batch_axes[b], UW[start + k, 0], UW[start + k, 1]], axis=0)  # rows are axes, right-handed
+
+    # Fallback to PCA if no valid axis (very rare but safe)
+    if best_R is None:
+        return _get_pca_box_corners(C, center)
+
+    # Final extents with all the hull points.
+    CR = C @ best_R.T
+    corners = _get_box_corners(CR.min(axis=0), CR.max(axis=0))
+    return corners @ best_R + center
+
+
+class ConvexHullData():
+    # Convex hull as NumPy arrays, can be used outside the main thread.
+    def __init__(
+        self,
+        coords: np.ndarray[Any, np.dtype[np.float64]],
+        face_normals: np.ndarray[Any, np.dtype[np.float64]],
+        edge_verts: np.ndarray[Any, np.dtype[np.int64]],
+        edge_faces: np.ndarray[Any, np.dtype[np.int64]],
+        faces: List[List[int]],
+        source_indexes: np.ndarray[Any, np.dtype[np.int64]],
+    ):
+        self.coords = coords  # (V, 3) hull vertices
+        self.face_normals = face_normals  # (F, 3)
+        self.edge_verts = edge_verts  # (E, 2) vertex indexes of the manifold edges
+        self.edge_faces = edge_faces  # (E, 2) face indexes on each side of the edges
+        self.faces = faces  # Vertex indexes of each face
+        self.source_indexes = source_indexes  # (V,) index of each hull vertex in the source bmesh
+
+
+def get_hull_data(bm: bmesh.types.BMesh) -> ConvexHullData:
+    # Replace the bmesh content with its convex hull and read the hull as arrays.
+    bm.verts.index_update()
+    source_indexes_layer = bm.verts.layers.int.new("bfu_source_index")
+    for v in bm.verts:
+        v[source_indexes_layer] = v.index
+
+    # === Convex hull (clean) ===
     result = bmesh.ops.convex_hull(
         bm,
         input=bm.verts,  # type: ignore
@@ -103,119 +220,26 @@ def calculate_true_mvbb(bm: bmesh.types.BMesh) -> np.ndarray[Any, np.dtype[np.fl
     if bm.faces:
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)  # type: ignore
 
-    # Collect hull vertices as Nx3 array
-    coords = np.array([v.co[:] for v in bm.verts], dtype=np.float64)
-    if coords.shape[0] < 3:
-        # Degenerate: build a tiny box around the point/segment
-        center = coords.mean(axis=0) if coords.size else np.zeros(3)
-        half = np.array([1e-6, 1e-6, 1e-6])
-        corners = np.array([[x,y,z] for x in [center[0]-half[0], center[0]+half[0]]
-                                      for y in [center[1]-half[1], center[1]+half[1]]
-                                      for z in [center[2]-half[2], center[2]+half[2]]])
-        return corners
+    # === Hull topology ===
+    bm.verts.index_update()
+    bm.faces.index_update()
+    coords = np.array([v.co[:] for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+    source_indexes = np.array([v[source_indexes_layer] for v in bm.verts], dtype=np.int64)
+    face_normals = np.array([f.normal[:] for f in bm.faces], dtype=np.float64).reshape(-1, 3)
+    faces = [[v.index for v in f.verts] for f in bm.faces]
+    manifold_edges = [e for e in bm.edges if len(e.link_faces) == 2]
+    edge_verts = np.array([(e.verts[0].index, e.verts[1].index) for e in manifold_edges], dtype=np.int64).reshape(-1, 2)
+    edge_faces = np.array([(e.link_faces[0].index, e.link_faces[1].index) for e in manifold_edges], dtype=np.int64).reshape(-1, 2)
+    bm.verts.layers.int.remove(source_indexes_layer)
+    return ConvexHullData(coords, face_normals, edge_verts, edge_faces, faces, source_indexes)
 
-    # Center for numerical stability
-    center = coords.mean(axis=0)
-    C = coords - center
 
-    # Reference volume (PCA) to filter absurd cases
-    ref_vol = _pca_ref_volume(coords)
-    vol_upper_bound = ref_vol * 1e6  # generous outlier cap
-
-    # === STEP 2: Unique face normals (with tolerance) ===
-    # We gather directions up to sign (n and -n are equivalent for orientation).
-    uniq = []
-    for f in bm.faces:
-        n = np.array(f.normal[:], dtype=np.float64)
-        ln = np.linalg.norm(n)
-        if ln < 1e-12:
-            continue
-        n /= ln  # type: ignore
-        # fold sign to have a consistent hemisphere
-        if n[0] < 0 or (abs(n[0]) < 1e-12 and (n[1] < 0 or (abs(n[1]) < 1e-12 and n[2] < 0))):
-            n = -n  # type: ignore
-        if not any(np.linalg.norm(n - m) < 1e-5 for m in uniq):  # type: ignore
-            uniq.append(n)  # type: ignore
-
-    if len(uniq) < 3:  # type: ignore
-        # Fallback to PCA box if not enough distinct directions
-        eig = np.linalg.eigh(np.cov(C.T))[1].T  # type: ignore
-        CR = C @ eig.T
-        mins, maxs = CR.min(axis=0), CR.max(axis=0)
-        corners = np.array([[x,y,z] for x in [mins[0],maxs[0]]
-                                     for y in [mins[1],maxs[1]]
-                                     for z in [mins[2],maxs[2]]])
-        corners_world = corners @ eig + center
-        obb_bm = bmesh.new()
-        vs = [obb_bm.verts.new(co) for co in corners_world]
-        obb_bm.verts.ensure_lookup_table()
-        for f in [(0,1,3,2),(4,5,7,6),(0,1,5,4),(2,3,7,6),(0,2,6,4),(1,3,7,5)]:
-            obb_bm.faces.new([vs[i] for i in f])
-        obb_bm.normal_update()
-        return obb_bm  # type: ignore
-
-    normals = uniq
-    nN = len(normals)  # type: ignore
-
-    # === STEP 3: Enumerate robust triplets ===
-    best = (float("inf"), None, None, None)  # (vol, R, mins, maxs)
-
-    # thresholds
-    parallel_dot = 0.9995     # reject near-parallel pairs
-    coplanar_eps = 1e-4       # reject near-coplanar triplets
-
-    for i in range(nN):
-        n1 = normals[i]  # type: ignore
-        for j in range(i + 1, nN):
-            n2 = normals[j]  # type: ignore
-            if abs(np.dot(n1, n2)) > parallel_dot:  # type: ignore
-                continue
-            for k in range(j + 1, nN):
-                n3 = normals[k]  # type: ignore
-                # triple product magnitude -> coplanarity check
-                triple = abs(np.dot(np.cross(n1, n2), n3))  # type: ignore
-                if triple < coplanar_eps:
-                    continue
-
-                # Build a stable orthonormal basis (right-handed)
-                R = _orthonormalize(n1, n2, n3)  # type: ignore
-                if R is None:
-                    continue
-
-                # Project hull points
-                CR = C @ R.T  # type: ignore
-                mins = CR.min(axis=0)
-                maxs = CR.max(axis=0)
-
-                # Validate finite and reasonable volume
-                side = maxs - mins
-                if np.any(~np.isfinite(side)) or np.any(side <= 0):
-                    continue
-                volume = float(np.prod(side))  # type: ignore
-                if not np.isfinite(volume) or volume <= 0 or volume > vol_upper_bound:
-                    continue
-
-                if volume < best[0]:
-                    best = (volume, R.copy(), mins.copy(), maxs.copy())
-
-    # Fallback to PCA if no valid triplet (very rare but safe)
-    if best[1] is None:
-        eig = np.linalg.eigh(np.cov(C.T))[1].T  # type: ignore
-        CR = C @ eig.T  # type: ignore
-        mins, maxs = CR.min(axis=0), CR.max(axis=0)
-        corners = np.array([[x,y,z] for x in [mins[0],maxs[0]]
-                                     for y in [mins[1],maxs[1]]
-                                     for z in [mins[2],maxs[2]]])
-        corners_world = corners @ eig + center
-    else:
-        _, R_best, mins, maxs = best
-        corners = np.array([[x,y,z] for x in [mins[0],maxs[0]]
-                                     for y in [mins[1],maxs[1]]
-                                     for z in [mins[2],maxs[2]]])
-        corners_world = corners @ R_best + center
-
-    # === STEP 5: return final corners ===
-    return corners_world
+def calculate_true_mvbb(bm: bmesh.types.BMesh) -> np.ndarray[Any, np.dtype[np.float64]]:
+    # === STEP 1: Convex hull ===
+    hull = get_hull_data(bm)
+
+    # === STEP 2: Rotating calipers on each face normal ===
+    return calculate_mvbb_from_hull(hull.coords, hull.face_normals, hull.edge_verts, hull.edge_faces)
 
 def get_mvbb_bmesh(src_bm: bmesh.types.BMesh) -> bmesh.types.BMesh:
     counter = bpl.utils.CounterTimer()
@@ -15,6 +15,9 @@ from . import bfu_export_asset
 from . import bfu_export_get_info
 from . import bfu_export_single_generic
 from . import bfu_export_utils
+from . import bfu_export_manifest
+from . import bfu_export_distributed
+from . import bfu_export_session
     
 if "bfu_fbx_export" in locals():
     importlib.reload(bfu_fbx_export)
@@ -28,3 +31,9 @@ if "bfu_export_single_generic" in locals():
     importlib.reload(bfu_export_single_generic)
 if "bfu_export_utils" in locals():
     importlib.reload(bfu_export_utils)
+if "bfu_export_manifest" in locals():
+    importlib.reload(bfu_export_manifest)
+if "bfu_export_distributed" in locals():
+    importlib.reload(bfu_export_distributed)
+if "bfu_export_session" in locals():
+    importlib.reload(bfu_export_session)
@@ -9,13 +9,16 @@
 
 from pathlib import Path
 import bpy
-from typing import List
+from typing import List, Optional, Callable
 from .. import bbpl
 from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport
 from .. import bfu_basics
 from .. import bfu_export_logs
 from .. import bfu_addon_prefs
 from . import bfu_export_single_generic
+from . import bfu_export_manifest
+from . import bfu_export_session
+from . import bfu_fbx_export
 
 
 
@@ -49,12 +52,32 @@ def prepare_scene_for_export():
             if layer_collection.hide_viewport:
                 layer_collection.hide_viewport = False
 
-def process_export(op: bpy.types.Operator, final_asset_list_to_export: List[AssetToExport]) -> List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]:
+def remove_export_folders(scene: bpy.types.Scene) -> None:
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_static_mesh_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_skeletal_mesh_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_skeletal_animation_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_alembic_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_groom_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_camera_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_spline_file_path)).resolve())  # type: ignore
+    bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_other_file_path)).resolve())  # type: ignore
+
+def process_export(
+    op: bpy.types.Operator,
+    final_asset_list_to_export: List[AssetToExport],
+    clean_export_folders: bool = True,
+    on_asset_exported: Optional[Callable[[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog], None]] = None
+) -> List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]:
     prepare_all_export_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log("Prepare all export")
 
     scene = bpy.context.scene
     addon_prefs = bfu_addon_prefs.get_addon_preferences()
 
+    # Fingerprints need be computed before the scene is prepared for export.
+    export_manifest = bfu_export_manifest.get_export_manifest(scene)
+    if export_manifest:
+        export_manifest.compute_fingerprints(final_asset_list_to_export)
+
     # Save scene data before export
     bbpl.scene_utils.move_to_global_view()
     user_scene_save = bbpl.save_data.scene_save.UserSceneSave()
@@ -64,19 +87,14 @@ def process_export(op: bpy.types.Operator, final_asset_list_to_export: List[Asse
     bbpl.utils.safe_mode_set('OBJECT', user_scene_save.user_select_class.user_active)
     prepare_scene_for_export()
 
-    if addon_prefs.revertExportPath:
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_static_mesh_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_skeletal_mesh_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_skeletal_animation_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_alembic_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_groom_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_camera_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_spline_file_path)).resolve())  # type: ignore
-        bfu_basics.RemoveFolderTree(Path(bpy.path.abspath(scene.bfu_export_other_file_path)).resolve())  # type: ignore
+    if addon_prefs.revertExportPath and clean_export_folders:
+        remove_export_folders(scene)
 
 
     prepare_all_export_time_log.end_time_log()
-    exported_asset_log = export_all_from_asset_list(op, final_asset_list_to_export)
+    exported_asset_log = export_all_from_asset_list(op, final_asset_list_to_export, export_manifest, on_asset_exported)
+    if export_manifest:
+        export_manifest.save()
 
     post_export_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log("Clean after all export")
 
@@ -95,7 +113,23 @@ def process_export(op: bpy.types.Operator, final_asset_list_to_export: List[Asse
     return exported_asset_log
 
 
-def export_all_from_asset_list(op: bpy.types.Operator, asset_list: List[AssetToExport]) -> List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]:
+def get_write_asset_text_data(
+    new_log: bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog,
+    on_asset_exported: Optional[Callable[[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog], None]] = None
+) -> Callable[[], None]:
+    def write_asset_text_data() -> None:
+        bfu_export_single_generic.write_asset_additional_data(new_log.exported_asset)
+        if on_asset_exported:
+            on_asset_exported(new_log)
+    return write_asset_text_data
+
+
+def export_all_from_asset_list(
+    op: bpy.types.Operator,
+    asset_list: List[AssetToExport],
+    export_manifest: Optional[bfu_export_manifest.ExportManifest] = None,
+    on_asset_exported: Optional[Callable[[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog], None]] = None
+) -> List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]:
     scene = bpy.context.scene
     if scene is None:
         raise RuntimeError("Scene is not available for export. Please ensure you are in a valid Blender context.")
@@ -103,17 +137,25 @@ def export_all_from_asset_list(op: bpy.types.Operator, asset_list: List[AssetToE
     export_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log("TOTAL EXPORT")
     exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog] = []
 
-    for asset in asset_list:
-        export_asset_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Export '{asset.name}' as {asset.asset_type.get_friendly_name()}.")
-        # Save current start/end frame
-        user_start_frame = scene.frame_start
-        user_end_frame = scene.frame_end
-        exported_asset_log.append(bfu_export_single_generic.process_generic_export_from_asset(op, asset))
-
-        # Resets previous start/end frame
-        scene.frame_start = user_start_frame
-        scene.frame_end = user_end_frame
-        export_asset_time_log.end_time_log()
+    try:
+        with bfu_fbx_export.fbx_array_cache_cm():
+            for asset in asset_list:
+                export_asset_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Export '{asset.name}' as {asset.asset_type.get_friendly_name()}.")
+                # Save current start/end frame
+                user_start_frame = scene.frame_start
+                user_end_frame = scene.frame_end
+                new_log = bfu_export_single_generic.process_generic_export_from_asset(op, asset, export_manifest)
+                exported_asset_log.append(new_log)
+                # An open export session still changes the scene, the text data wait for the session close.
+                bfu_export_session.export_session_manager.call_when_closed(get_write_asset_text_data(new_log, on_asset_exported))
+
+                # Resets previous start/end frame
+                scene.frame_start = user_start_frame
+                scene.frame_end = user_end_frame
+                export_asset_time_log.end_time_log()
+    finally:
+        # Packages can keep an export session open for the next assets.
+        bfu_export_session.export_session_manager.close_active_session()
 
     export_time_log.end_time_log()
     return exported_asset_log
\ No newline at end of file
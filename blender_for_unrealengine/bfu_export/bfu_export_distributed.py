@@ -0,0 +1,354 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+import os
+import bpy
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import List, Dict, Set, Any, Optional
+from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport, AssetToSearch, AssetDataSearchMode
+from .. import bfu_export_logs
+from .. import bfu_addon_prefs
+from .. import bfu_cached_assets
+from . import bfu_export_asset
+from . import bfu_export_manifest
+
+WORKER_SCRIPT_NAME = "distributed_export_worker_script.py"
+WORKER_LOG_FOLDER_NAME = "DistributedExportLogs"
+
+
+def get_addon_module_name() -> str:
+    # Used by the workers to enable the addon with --addons.
+    return str(bfu_addon_prefs.__package__)
+
+
+def start_background_blender(blend_path: Path, script_path: Path, script_args: List[str], log_path: Path) -> "subprocess.Popen[bytes]":
+    # Same command and environment as bfu_builder/blender_exec.py, that is not shipped with the addon.
+    command = [
+        bpy.app.binary_path,
+        "--background",
+        str(blend_path),
+        "--addons", get_addon_module_name(),
+        "--python", str(script_path),
+        "--",  # Separator to indicate that the following arguments are for the Python script
+    ] + script_args
+
+    env = os.environ.copy()
+    if bpy.app.version[:2] == (4, 2):
+        # Disable TBB malloc replacement to avoid issues with Blender 4.2
+        # Details: https://projects.blender.org/blender/blender/issues/126109
+        env["TBB_MALLOC_DISABLE_REPLACEMENT"] = "1"
+        env["TBBMALLOC_PROXY_ENABLE"] = "0"
+
+    with open(log_path, "wb") as log_file:
+        # The child process keeps its own handle.
+        return subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+
+
+def write_json_file_atomic(data: Dict[str, Any], fullpath: Path) -> None:
+    temp_path = fullpath.with_suffix(fullpath.suffix + ".tmp")
+    with open(temp_path, "w") as json_file:
+        json.dump(data, json_file, ensure_ascii=False)
+    os.replace(temp_path, fullpath)
+
+
+def get_asset_export_cost(asset: AssetToExport) -> int:
+    # Rough export cost used to balance the shards.
+    cost = 0
+    for package in asset.asset_packages:
+        cost += 1 + len(package.objects)
+        if package.frame_range:
+            cost += max(0, int(package.frame_range[1] - package.frame_range[0])) // 100
+    return max(1, cost)
+
+
+def split_asset_list(asset_list: List[AssetToExport], asset_indexes: List[int], worker_count: int) -> List[List[int]]:
+    # Longest processing time first: Most expensive assets are given to the less loaded shard.
+    # Each shard keeps the asset order of the final asset list.
+    shards: List[List[int]] = [[] for _ in range(min(worker_count, len(asset_indexes)))]
+    if not shards:
+        return []
+    shard_costs = [0] * len(shards)
+    for index in sorted(asset_indexes, key=lambda i: get_asset_export_cost(asset_list[i]), reverse=True):
+        target = shard_costs.index(min(shard_costs))
+        shards[target].append(index)
+        shard_costs[target] += get_asset_export_cost(asset_list[index])
+    for shard in shards:
+        shard.sort()
+    return shards
+
+
+class DistributedExportWorker():
+    # One background Blender process that exports a shard of the final asset list.
+
+    def __init__(self, worker_index: int, blend_path: Path, work_dirpath: Path, log_dirpath: Path):
+        self.worker_index = worker_index
+        self.blend_path = blend_path
+        self.work_dirpath = work_dirpath
+        self.log_dirpath = log_dirpath
+        self.attempt = 0
+        self.asset_indexes: List[int] = []
+        self.asset_names: List[str] = []
+        self.process: Optional[subprocess.Popen[bytes]] = None
+        self.results: Dict[int, Dict[str, Any]] = {}
+        self.start_time = 0.0
+
+    def get_shard_path(self) -> Path:
+        return self.work_dirpath / f"worker_{self.worker_index}_shard.json"
+
+    def get_result_path(self) -> Path:
+        return self.work_dirpath / f"worker_{self.worker_index}_result.json"
+
+    def get_log_path(self) -> Path:
+        return self.log_dirpath / f"worker_{self.worker_index}_attempt_{self.attempt}.log"
+
+    def get_remaining_indexes(self) -> List[int]:
+        return [index for index in self.asset_indexes if index not in self.results]
+
+    def start(self, asset_list: List[AssetToExport], asset_indexes: List[int]) -> None:
+        self.attempt += 1
+        self.asset_indexes = asset_indexes
+        self.asset_names = [asset_list[index].name for index in asset_indexes]
+        shard_data = {
+            "assets": [{"index": index, "name": asset_list[index].name} for index in asset_indexes],
+            "result_path": str(self.get_result_path()),
+        }
+        write_json_file_atomic(shard_data, self.get_shard_path())
+
+        print(f"Start distributed export worker {self.worker_index} (attempt {self.attempt}) with {len(asset_indexes)} asset(s).")
+        self.start_time = time.perf_counter()
+        self.process = start_background_blender(
+            self.blend_path,
+            Path(__file__).parent / WORKER_SCRIPT_NAME,
+            ["--addon_module", get_addon_module_name(), "--shard", str(self.get_shard_path())],
+            self.get_log_path()
+        )
+
+    def poll(self) -> Optional[int]:
+        if self.process is None:
+            return None
+        return self.process.poll()
+
+    def read_results(self) -> None:
+        result_path = self.get_result_path()
+        if not result_path.exists():
+            return
+        try:
+            with open(result_path, "r") as result_file:
+                data = json.load(result_file)
+        except (OSError, ValueError) as e:
+            print(f"Cannot read result of distributed export worker {self.worker_index}: {e}")
+            return
+        for asset_result in data.get("assets", []):
+            self.results[int(asset_result["index"])] = asset_result["log"]
+
+
+def create_skipped_asset_log(asset: AssetToExport) -> bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog:
+    new_log = bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog(asset)
+    new_log.start_asset_export()
+    for package in asset.asset_packages:
+        new_log.start_package_export(package)
+        new_log.skip_package_export(package)
+    new_log.end_asset_export(True)
+    return new_log
+
+
+def create_failed_asset_log(asset: AssetToExport) -> bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog:
+    new_log = bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog(asset)
+    new_log.start_asset_export()
+    for package in asset.asset_packages:
+        new_log.start_package_export(package)
+        new_log.end_package_export(package, False)
+    new_log.end_asset_export(False)
+    return new_log
+
+
+class DistributedExport():
+    # Split the final asset list in shards and export each shard in a background Blender process.
+    # update() is called from a timer of the export operator, so the UI is not blocked while the workers run.
+
+    def __init__(self, final_asset_list_to_export: List[AssetToExport]):
+        self.final_asset_list_to_export = final_asset_list_to_export
+        self.export_manifest: Optional[bfu_export_manifest.ExportManifest] = None
+        self.skipped_indexes: Set[int] = set()
+        self.max_retry = 0
+        self.worker_blend_path = Path()
+        self.work_dirpath: Optional[Path] = None
+        self.workers: List[DistributedExportWorker] = []
+        self.running_workers: List[DistributedExportWorker] = []
+        self.export_time_log: Optional[bfu_export_logs.bfu_process_time_logs_types.SafeTimeLogHandle] = None
+
+    def start(self) -> None:
+        scene = bpy.context.scene
+        if scene is None:
+            raise RuntimeError("Scene is not available for export. Please ensure you are in a valid Blender context.")
+
+        prepare_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log("Prepare distributed export")
+        addon_prefs = bfu_addon_prefs.get_addon_preferences()
+        worker_count: int = scene.bfu_distributed_export_worker_count  # type: ignore[attr-defined]
+        self.max_retry = scene.bfu_distributed_export_max_retry  # type: ignore[attr-defined]
+
+        # Export folders are removed first, so the assets are not skipped with files that no longer exist.
+        if addon_prefs.revertExportPath:
+            bfu_export_asset.remove_export_folders(scene)
+
+        # Unchanged assets are handled here so the workers don't write the manifest.
+        self.export_manifest = bfu_export_manifest.get_export_manifest(scene)
+        asset_indexes: List[int] = list(range(len(self.final_asset_list_to_export)))
+        if self.export_manifest:
+            self.export_manifest.compute_fingerprints(self.final_asset_list_to_export)
+            for index, asset in enumerate(self.final_asset_list_to_export):
+                if asset.asset_packages and all(self.export_manifest.is_package_unchanged(package) for package in asset.asset_packages):
+                    self.skipped_indexes.add(index)
+            asset_indexes = [index for index in asset_indexes if index not in self.skipped_indexes]
+
+        # Workers open a copy of the current file saved next to it, so relative export paths stay valid.
+        blend_path = Path(bpy.data.filepath)
+        self.worker_blend_path = blend_path.with_name(f".{blend_path.stem}_bfu_distributed_export.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=str(self.worker_blend_path), copy=True, check_existing=False)
+
+        self.work_dirpath = Path(tempfile.mkdtemp(prefix="bfu_distributed_export_"))
+        log_dirpath = Path(bpy.path.abspath(scene.bfu_export_other_file_path)).resolve() / WORKER_LOG_FOLDER_NAME  # type: ignore[attr-defined]
+        log_dirpath.mkdir(parents=True, exist_ok=True)
+        prepare_time_log.end_time_log()
+
+        self.export_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Distributed export ({worker_count} workers)")
+        try:
+            for worker_index, shard in enumerate(split_asset_list(self.final_asset_list_to_export, asset_indexes, worker_count)):
+                worker = DistributedExportWorker(worker_index, self.worker_blend_path, self.work_dirpath, log_dirpath)
+                worker.start(self.final_asset_list_to_export, shard)
+                self.workers.append(worker)
+        except Exception:
+            self.cancel()
+            raise
+        self.running_workers = list(self.workers)
+
+    def update(self) -> bool:
+        # Returns True when all the workers are finished.
+        for worker in list(self.running_workers):
+            return_code = worker.poll()
+            if return_code is None:
+                continue
+
+            worker.read_results()
+            remaining_indexes = worker.get_remaining_indexes()
+            elapsed_time = time.perf_counter() - worker.start_time
+            print(f"Distributed export worker {worker.worker_index} finished with code {return_code} in {elapsed_time:.2f}s. Log: {worker.get_log_path()}")
+            if remaining_indexes and worker.attempt <= self.max_retry:
+                print(f"Retry {len(remaining_indexes)} asset(s) of distributed export worker {worker.worker_index}.")
+                worker.start(self.final_asset_list_to_export, remaining_indexes)
+            else:
+                self.running_workers.remove(worker)
+        return not self.running_workers
+
+    def wait(self) -> None:
+        # Without window there is no timer, used in background mode.
+        while not self.update():
+            process = self.running_workers[0].process
+            if process:
+                process.wait()
+
+    def clean(self) -> None:
+        for worker in self.workers:
+            if worker.poll() is None and worker.process:
+                worker.process.kill()
+        self.running_workers.clear()
+        if self.work_dirpath:
+            shutil.rmtree(self.work_dirpath, ignore_errors=True)
+            self.work_dirpath = None
+        if self.worker_blend_path.is_file():
+            self.worker_blend_path.unlink()
+
+    def cancel(self) -> None:
+        print("Distributed export canceled.")
+        self.clean()
+        if self.export_time_log:
+            self.export_time_log.end_time_log()
+            self.export_time_log = None
+
+    def finish(self) -> List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]:
+        self.clean()
+        if self.export_time_log:
+            self.export_time_log.end_time_log()
+            self.export_time_log = None
+
+        # Merge the worker results in the final asset order.
+        merge_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log("Merge distributed export results")
+        results: Dict[int, Dict[str, Any]] = {}
+        for worker in self.workers:
+            results.update(worker.results)
+
+        exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog] = []
+        for index, asset in enumerate(self.final_asset_list_to_export):
+            if index in self.skipped_indexes:
+                new_log = create_skipped_asset_log(asset)
+            elif index in results:
+                new_log = bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog(asset)
+                new_log.set_log_from_data(results[index])
+            else:
+                print(f"Asset '{asset.name}' was not exported by the distributed export workers.")
+                new_log = create_failed_asset_log(asset)
+
+            if self.export_manifest and index not in self.skipped_indexes:
+                for package in asset.asset_packages:
+                    success = package.name in new_log.package_logs and new_log.get_package_export_success(package)
+                    self.export_manifest.set_package_exported(package, success)
+            exported_asset_log.append(new_log)
+
+        if self.export_manifest:
+            self.export_manifest.save()
+        merge_time_log.end_time_log()
+        return exported_asset_log
+
+
+def run_worker(shard_path: Path) -> None:
+    # Executed inside a background Blender process by the worker script.
+    with open(shard_path, "r") as shard_file:
+        shard_data = json.load(shard_file)
+    result_path = Path(shard_data["result_path"])
+
+    scene = bpy.context.scene
+    if scene is None:
+        raise RuntimeError("Scene is not available for export.")
+    # The manifest is handled by the main process.
+    scene.bfu_export_changed_only = False  # type: ignore[attr-defined]
+
+    bfu_export_logs.clear_all_logs()
+    final_asset_cache = bfu_cached_assets.bfu_cached_assets_blender_class.get_final_asset_cache()
+    final_asset_list = final_asset_cache.get_final_asset_list(AssetToSearch.ALL_ASSETS, AssetDataSearchMode.FULL, force_cache_update=True)
+
+    # Assets are found with the index in the final asset list, then with the name if the list changed.
+    asset_by_name = {asset.name: asset for asset in final_asset_list}
+    shard_assets: List[AssetToExport] = []
+    asset_indexes: Dict[int, int] = {}
+    for shard_asset in shard_data["assets"]:
+        index: int = shard_asset["index"]
+        name: str = shard_asset["name"]
+        if index < len(final_asset_list) and final_asset_list[index].name == name:
+            asset = final_asset_list[index]
+        elif name in asset_by_name:
+            asset = asset_by_name[name]
+        else:
+            print(f"Distributed export worker: Asset '{name}' not found!")
+            continue
+        asset_indexes[id(asset)] = index
+        shard_assets.append(asset)
+
+    results: List[Dict[str, Any]] = []
+
+    def on_asset_exported(new_log: bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog) -> None:
+        # Write results after each asset so a retry only export the missing assets.
+        results.append({"index": asset_indexes[id(new_log.exported_asset)], "log": new_log.get_log_as_data()})
+        write_json_file_atomic({"assets": results}, result_path)
+
+    bfu_export_asset.process_export(None, shard_assets, clean_export_folders=False, on_asset_exported=on_asset_exported)  # type: ignore[arg-type]
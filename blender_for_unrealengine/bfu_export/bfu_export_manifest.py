@@ -0,0 +1,389 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+import bpy
+import json
+import hashlib
+import numpy as np
+from pathlib import Path
+from typing import List, Dict, Set, Any, Optional, AbstractSet
+from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport, AssetPackage
+from .. import bfu_utils
+from .. import bfu_addon_prefs
+from .. import bfu_export_filter
+from .. import addon_cached_propertys
+from ..bfu_cached_assets.bfu_cached_assets_types import is_scene_asset_setting_prop
+
+
+MANIFEST_FILE_NAME = "ExportManifest.json"
+MANIFEST_VERSION = 2
+
+# ID properties that change between sessions or with the users count.
+IGNORED_ID_PROP_NAMES = frozenset({
+    "session_uid", "users", "use_fake_user", "use_extra_user", "tag", "is_evaluated", "original",
+    "is_runtime_data", "is_missing", "is_library_indirect", "preview",
+})
+
+# Node properties that only change the node editor display.
+IGNORED_NODE_PROP_NAMES = frozenset({
+    "select", "location", "width", "height", "dimensions", "hide", "parent",
+    "show_options", "show_preview", "show_texture", "use_custom_color", "color",
+})
+
+# foreach_get() layout of each attribute data type: (property name, value size, dtype).
+ATTRIBUTE_ARRAY_LAYOUTS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+
+def get_manifest_path(scene: bpy.types.Scene) -> Path:
+    # The manifest is written next to ImportAssetData.json.
+    return Path(bpy.path.abspath(scene.bfu_export_other_file_path)).resolve() / MANIFEST_FILE_NAME  # type: ignore
+
+
+def get_stable_repr(value: Any) -> str:
+    # Set order depends on the session (ENUM_FLAG values), so sets are sorted.
+    if isinstance(value, (set, frozenset)):
+        return repr(tuple(sorted(value)))
+    return repr(value)
+
+
+def update_hash_with_rna(hasher: "hashlib._Hash", struct: Any, prefix: str = "", ignored_names: AbstractSet[str] = frozenset()) -> None:
+    # Python hash() is salted per session, so values are written with get_stable_repr() for a stable hash.
+    for prop in struct.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier == "rna_type" or not identifier.startswith(prefix) or identifier in ignored_names:
+            continue
+        if identifier in IGNORED_ID_PROP_NAMES:
+            continue
+        if identifier.endswith("_expanded"):
+            # UI accordion states.
+            continue
+        value = getattr(struct, identifier, None)
+        if isinstance(value, bpy.types.bpy_prop_collection):
+            for item in value:
+                update_hash_with_rna(hasher, item)
+        elif isinstance(value, bpy.types.bpy_prop_array):
+            hasher.update(repr(tuple(value)).encode())
+        elif isinstance(value, bpy.types.ID):
+            hasher.update(value.name_full.encode())
+        elif isinstance(value, (bool, int, float, str, set)):
+            hasher.update(f"{identifier}={get_stable_repr(value)};".encode())
+
+
+def update_hash_with_matrix(hasher: "hashlib._Hash", matrix: Any) -> None:
+    hasher.update(np.array(matrix, dtype=np.float32).tobytes())
+
+
+def update_hash_with_array(hasher: "hashlib._Hash", collection: Any, attribute: str, size: int, dtype: Any) -> None:
+    values = np.empty(len(collection) * size, dtype=dtype)
+    collection.foreach_get(attribute, values)
+    hasher.update(values.tobytes())
+
+
+def update_hash_with_image(hasher: "hashlib._Hash", image: bpy.types.Image) -> None:
+    # Image.pixels is not read, the file and its settings are enough.
+    hasher.update(f"{image.name_full};{image.filepath};{image.source};{image.alpha_mode};".encode())
+    hasher.update(f"{image.colorspace_settings.name};{tuple(image.size)!r};{image.is_dirty!r};".encode())
+    if image.packed_file:
+        hasher.update(repr(image.packed_file.size).encode())
+
+
+def update_hash_with_node_tree(hasher: "hashlib._Hash", node_tree: bpy.types.NodeTree, visited: Set[str]) -> None:
+    if node_tree.name_full in visited:
+        return
+    visited.add(node_tree.name_full)
+
+    for node in node_tree.nodes:
+        update_hash_with_rna(hasher, node, ignored_names=IGNORED_NODE_PROP_NAMES)
+        image = getattr(node, "image", None)
+        if isinstance(image, bpy.types.Image):
+            update_hash_with_image(hasher, image)
+        group_tree = getattr(node, "node_tree", None)
+        if isinstance(group_tree, bpy.types.NodeTree):
+            update_hash_with_node_tree(hasher, group_tree, visited)
+
+    for link in node_tree.links:
+        hasher.update(f"{link.from_node.name}.{link.from_socket.identifier}>{link.to_node.name}.{link.to_socket.identifier};".encode())
+
+
+def update_hash_with_material(hasher: "hashlib._Hash", material: Optional[bpy.types.Material], visited: Set[str]) -> None:
+    if material is None:
+        hasher.update(b"None;")
+        return
+    update_hash_with_rna(hasher, material)
+    if material.node_tree:
+        update_hash_with_node_tree(hasher, material.node_tree, visited)
+
+
+def update_hash_with_vertex_groups(hasher: "hashlib._Hash", obj: bpy.types.Object) -> None:
+    for vertex_group in obj.vertex_groups:
+        hasher.update(f"{vertex_group.name};".encode())
+    vertex_weights = bfu_utils.read_vertex_group_weights(obj)
+    if vertex_weights is not None:
+        for values in vertex_weights:
+            hasher.update(values.tobytes())
+
+
+def update_hash_with_shape_keys(hasher: "hashlib._Hash", mesh: bpy.types.Mesh) -> None:
+    # The evaluated mesh has no shape keys, they are read on the original mesh.
+    if mesh.shape_keys is None:
+        return
+    for key_block in mesh.shape_keys.key_blocks:
+        relative_key_name = key_block.relative_key.name if key_block.relative_key else ""
+        hasher.update(f"{key_block.name};{key_block.value!r};{key_block.mute!r};{relative_key_name};".encode())
+        hasher.update(f"{key_block.vertex_group};{key_block.slider_min!r};{key_block.slider_max!r};{key_block.interpolation};".encode())
+        update_hash_with_array(hasher, key_block.data, "co", 3, np.float32)
+
+
+def update_hash_with_mesh_attributes(hasher: "hashlib._Hash", mesh: bpy.types.Mesh) -> None:
+    # Generic attributes: color attributes, edge sharpness and crease, sharp faces, material indices...
+    for attribute in mesh.attributes:
+        if attribute.name.startswith("."):
+            # Internal attributes, like the selection and hide states.
+            continue
+        hasher.update(f"{attribute.name};{attribute.domain};{attribute.data_type};".encode())
+        layout = ATTRIBUTE_ARRAY_LAYOUTS.get(attribute.data_type)
+        if layout is not None:
+            update_hash_with_array(hasher, attribute.data, *layout)
+        else:
+            hasher.update(repr([getattr(item, "value", None) for item in attribute.data]).encode())
+
+
+def update_hash_with_mesh_normals(hasher: "hashlib._Hash", mesh: bpy.types.Mesh) -> None:
+    # Corner normals include the custom split normals and the sharp edges.
+    if bpy.app.version >= (4, 1, 0):
+        update_hash_with_array(hasher, mesh.corner_normals, "vector", 3, np.float32)
+    else:
+        mesh.calc_normals_split()
+        update_hash_with_array(hasher, mesh.loops, "normal", 3, np.float32)
+
+
+def update_hash_with_evaluated_mesh(hasher: "hashlib._Hash", obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> None:
+    obj_eval = obj.evaluated_get(depsgraph)
+    try:
+        mesh = obj_eval.to_mesh()
+    except RuntimeError:
+        # Object type without geometry.
+        return
+    if mesh is None:
+        return
+
+    update_hash_with_array(hasher, mesh.vertices, "co", 3, np.float32)
+    update_hash_with_array(hasher, mesh.loops, "vertex_index", 1, np.int32)
+
+    for uv_layer in mesh.uv_layers:
+        hasher.update(uv_layer.name.encode())
+        update_hash_with_array(hasher, uv_layer.data, "uv", 2, np.float32)
+
+    update_hash_with_mesh_attributes(hasher, mesh)
+    update_hash_with_mesh_normals(hasher, mesh)
+    if bpy.app.version < (4, 0, 0):
+        # Edge sharpness and crease are attributes since Blender 4.0.
+        update_hash_with_array(hasher, mesh.edges, "use_edge_sharp", 1, bool)
+        update_hash_with_array(hasher, mesh.edges, "crease", 1, np.float32)
+    if bpy.app.version < (3, 2, 0):
+        # Vertex colors are color attributes since Blender 3.2.
+        for vertex_color in mesh.vertex_colors:
+            hasher.update(vertex_color.name.encode())
+            update_hash_with_array(hasher, vertex_color.data, "color", 4, np.float32)
+
+    visited_node_trees: Set[str] = set()
+    for material in mesh.materials:
+        update_hash_with_material(hasher, material, visited_node_trees)
+
+    obj_eval.to_mesh_clear()
+
+    if isinstance(obj.data, bpy.types.Mesh):
+        update_hash_with_vertex_groups(hasher, obj)
+        update_hash_with_shape_keys(hasher, obj.data)
+
+
+def update_hash_with_action(hasher: "hashlib._Hash", action: bpy.types.Action) -> None:
+    hasher.update(action.name_full.encode())
+    fcurves: List[bpy.types.FCurve] = []
+    if bpy.app.version >= (4, 4, 0):
+        for layer in action.layers:
+            for strip in layer.strips:
+                for channelbag in strip.channelbags:
+                    fcurves.extend(channelbag.fcurves)
+    else:
+        fcurves.extend(action.fcurves)  # type: ignore
+
+    for fcurve in fcurves:
+        hasher.update(f"{fcurve.data_path}[{fcurve.array_index}]".encode())
+        key_count = len(fcurve.keyframe_points)
+        for attribute in ("co", "handle_left", "handle_right"):
+            values = np.empty(key_count * 2, dtype=np.float32)
+            fcurve.keyframe_points.foreach_get(attribute, values)
+            hasher.update(values.tobytes())
+        interpolations = [key.interpolation for key in fcurve.keyframe_points]
+        hasher.update(repr(interpolations).encode())
+        for modifier in fcurve.modifiers:
+            update_hash_with_rna(hasher, modifier)
+
+
+def update_hash_with_object(hasher: "hashlib._Hash", obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> None:
+    hasher.update(obj.name_full.encode())
+    hasher.update(obj.type.encode())
+    update_hash_with_matrix(hasher, obj.matrix_world)
+    if obj.parent:
+        hasher.update(obj.parent.name_full.encode())
+        hasher.update(obj.parent_bone.encode())
+
+    # Export settings stored on the object.
+    update_hash_with_rna(hasher, obj, "bfu_")
+
+    # Modifier stack
+    for modifier in obj.modifiers:
+        update_hash_with_rna(hasher, modifier)
+
+    if isinstance(obj.data, bpy.types.Armature):
+        for bone in obj.data.bones:
+            hasher.update(bone.name.encode())
+            hasher.update((bone.parent.name if bone.parent else "").encode())
+            update_hash_with_matrix(hasher, bone.matrix_local)
+    elif isinstance(obj.data, (bpy.types.Mesh, bpy.types.Curve, bpy.types.MetaBall)):
+        update_hash_with_evaluated_mesh(hasher, obj, depsgraph)
+    elif obj.data is not None:
+        update_hash_with_rna(hasher, obj.data)
+
+    if obj.animation_data and obj.animation_data.action:
+        update_hash_with_action(hasher, obj.animation_data.action)
+
+
+def get_package_fingerprint(package: AssetPackage, scene_hash: str, depsgraph: bpy.types.Depsgraph) -> str:
+    hasher = hashlib.sha1()
+    hasher.update(scene_hash.encode())
+    hasher.update(package.name.encode())
+    if package.file:
+        hasher.update(str(package.file.get_full_path()).encode())
+        hasher.update(package.file.file_type.value.encode())
+    if package.export_function:
+        hasher.update(package.export_function.__qualname__.encode())
+    if package.frame_range:
+        hasher.update(repr(package.frame_range).encode())
+
+    objects: List[bpy.types.Object] = list(package.objects)
+    if package.collection:
+        hasher.update(package.collection.name_full.encode())
+        objects.extend(bfu_utils.get_export_collection_objects(package.collection))
+    for obj in objects:
+        update_hash_with_object(hasher, obj, depsgraph)
+
+    if package.action:
+        update_hash_with_action(hasher, package.action)
+
+    return hasher.hexdigest()
+
+
+def get_scene_settings_hash(scene: bpy.types.Scene) -> str:
+    # Scene and addon settings are shared by all packages.
+    hasher = hashlib.sha1()
+    hasher.update(addon_cached_propertys.ADDON_VERSION_STR.encode())
+    hasher.update(repr(bpy.app.version).encode())
+    hasher.update(repr((scene.render.fps, scene.render.fps_base)).encode())
+    update_hash_with_rna(hasher, scene.unit_settings)
+    for prop in scene.bl_rna.properties:
+        if is_scene_asset_setting_prop(prop.identifier):
+            hasher.update(f"{prop.identifier}={get_stable_repr(getattr(scene, prop.identifier))};".encode())
+    for target_col in scene.bfu_static_collection_asset_list:  # type: ignore[attr-defined]
+        hasher.update(f"{target_col.name}={target_col.use!r};".encode())
+    update_hash_with_rna(hasher, bfu_addon_prefs.get_addon_preferences())
+    return hasher.hexdigest()
+
+
+class ExportManifest():
+    # Persistent per package fingerprints used by the "Export changed only" mode.
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path: Path = manifest_path
+        self.saved_fingerprints: Dict[str, str] = {}
+        self.new_fingerprints: Dict[str, str] = {}
+
+    def load(self) -> None:
+        self.saved_fingerprints.clear()
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r") as manifest_file:
+                data = json.load(manifest_file)
+        except (OSError, ValueError) as e:
+            print(f"Cannot read export manifest '{self.manifest_path}': {e}")
+            return
+
+        if data.get("manifest_version") != MANIFEST_VERSION:
+            return
+        if data.get("addon_version") != addon_cached_propertys.ADDON_VERSION_STR:
+            return
+        self.saved_fingerprints = data.get("packages", {})
+
+    def save(self) -> None:
+        data: Dict[str, Any] = {
+            "manifest_version": MANIFEST_VERSION,
+            "addon_version": addon_cached_propertys.ADDON_VERSION_STR,
+            "packages": self.saved_fingerprints,
+        }
+        if not bfu_utils.check_and_make_export_path(self.manifest_path):
+            print(f"Cannot write to '{self.manifest_path}': Path is invalid.")
+            return
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump(data, manifest_file, ensure_ascii=False, sort_keys=True, indent=4)
+
+    def compute_fingerprints(self, asset_list: List[AssetToExport]) -> None:
+        # Need be called before the scene is prepared for export, hidden objects are not evaluated.
+        scene = bpy.context.scene
+        if scene is None:
+            return
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        scene_hash = get_scene_settings_hash(scene)
+        self.new_fingerprints.clear()
+        for asset in asset_list:
+            for package in asset.asset_packages:
+                if package.file:
+                    key = str(package.file.get_full_path())
+                    self.new_fingerprints[key] = get_package_fingerprint(package, scene_hash, depsgraph)
+
+    def is_package_unchanged(self, package: AssetPackage) -> bool:
+        if package.file is None:
+            return False
+        fullpath = package.file.get_full_path()
+        key = str(fullpath)
+        if key not in self.new_fingerprints or key not in self.saved_fingerprints:
+            return False
+        if self.new_fingerprints[key] != self.saved_fingerprints[key]:
+            return False
+        return fullpath.exists()
+
+    def set_package_exported(self, package: AssetPackage, success: bool) -> None:
+        if package.file is None:
+            return
+        key = str(package.file.get_full_path())
+        if success and key in self.new_fingerprints:
+            self.saved_fingerprints[key] = self.new_fingerprints[key]
+        elif key in self.saved_fingerprints:
+            del self.saved_fingerprints[key]
+
+
+def get_export_manifest(scene: bpy.types.Scene) -> Optional[ExportManifest]:
+    if not bfu_export_filter.bfu_export_filter_props.scene_export_changed_only(scene):
+        return None
+    manifest = ExportManifest(get_manifest_path(scene))
+    manifest.load()
+    return manifest
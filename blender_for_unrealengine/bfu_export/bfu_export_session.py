@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Export sessions keep a prepared scene between several package exports.
+# Eg. the duplicated and rescaled rig used to export all the actions of an armature.
+# Packages with the same export_session_key share the session.
+# The active session is closed before a package with an other key and at the end of the export.
+# Data that read the user scene (Eg. the asset text data) is written after the session is closed.
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional
+import bpy
+from ..bfu_assets_manager.bfu_asset_manager_type import AssetPackage
+
+
+class PackageExportSession(ABC):
+    def __init__(self, session_key: Any):
+        self.session_key: Any = session_key
+
+    @abstractmethod
+    def open(self, op: bpy.types.Operator, package: AssetPackage) -> None:
+        # Prepare the scene with the first package of the session.
+        pass
+
+    @abstractmethod
+    def export_package(self, op: bpy.types.Operator, package: AssetPackage) -> bool:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        # Restore the scene as before open()
+        pass
+
+
+class PackageExportSessionManager():
+    def __init__(self):
+        self.active_session: Optional[PackageExportSession] = None
+        self.closed_callbacks: List[Callable[[], None]] = []
+
+    def get_active_session(self, session_key: Any) -> Optional[PackageExportSession]:
+        if session_key is None or self.active_session is None:
+            return None
+        if self.active_session.session_key != session_key:
+            return None
+        return self.active_session
+
+    def open_session(self, op: bpy.types.Operator, package: AssetPackage, session: PackageExportSession) -> PackageExportSession:
+        self.close_active_session()
+        try:
+            session.open(op, package)
+        except Exception:
+            # Restore what was prepared before the error.
+            session.close()
+            raise
+        if session.session_key is not None:
+            self.active_session = session
+        return session
+
+    def close_active_session(self) -> None:
+        if self.active_session is None:
+            return
+        # Clear first, the session can't be closed twice if close() fails.
+        session = self.active_session
+        self.active_session = None
+        closed_callbacks = self.closed_callbacks
+        self.closed_callbacks = []
+        session.close()
+        for callback in closed_callbacks:
+            callback()
+
+    def call_when_closed(self, callback: Callable[[], None]) -> None:
+        # Call now when no session is open, else after the active session is closed.
+        if self.active_session is None:
+            callback()
+        else:
+            self.closed_callbacks.append(callback)
+
+    def close_unused_session(self, package: AssetPackage) -> None:
+        # Call before a package export.
+        if self.get_active_session(package.export_session_key) is None:
+            self.close_active_session()
+
+
+export_session_manager = PackageExportSessionManager()
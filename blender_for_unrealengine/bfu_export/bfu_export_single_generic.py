@@ -9,8 +9,10 @@
 
 
 import bpy
-from typing import List
+from typing import List, Optional
 from . import bfu_export_utils
+from . import bfu_export_manifest
+from . import bfu_export_session
 from .. import bfu_export_logs
 from ..bfu_export_logs.bfu_process_time_logs_types import SafeTimeGroup
 from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport, AssetPackage
@@ -39,7 +41,8 @@ def prepare_scene_for_package_export(package: AssetPackage):
 
 def process_generic_export_from_asset(
     op: bpy.types.Operator,
-    asset: AssetToExport
+    asset: AssetToExport,
+    export_manifest: Optional[bfu_export_manifest.ExportManifest] = None
 ) -> bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog:
 
 
@@ -48,6 +51,14 @@ def process_generic_export_from_asset(
     for package in asset.asset_packages:
         new_log.start_package_export(package)
 
+        # Skip packages not changed since the last export.
+        if export_manifest and export_manifest.is_package_unchanged(package):
+            new_log.skip_package_export(package)
+            continue
+
+        # Restore the scene before the packages that don't use the active export session.
+        bfu_export_session.export_session_manager.close_unused_session(package)
+
         my_timer_group = SafeTimeGroup()
         my_timer_group.start_timer(f"Preparing scene for package export: {package.name}")
         prepare_scene_for_package_export(package)
@@ -73,9 +84,15 @@ def process_generic_export_from_asset(
         else:
             new_log.end_package_export(package, False)
 
-    if asset.additional_data and asset.additional_data.file:
-        bfu_export_utils.export_additional_data(asset.additional_data.file.get_full_path(), asset.additional_data.data)
+        if export_manifest:
+            export_manifest.set_package_exported(package, new_log.get_package_export_success(package))
 
     new_log.end_asset_export(True)
     return new_log
 
+
+def write_asset_additional_data(asset: AssetToExport) -> None:
+    # Written when the scene is restored, see export_session_manager.call_when_closed()
+    if asset.additional_data and asset.additional_data.file:
+        bfu_export_utils.export_additional_data(asset.additional_data.file.get_full_path(), asset.additional_data.data)
+
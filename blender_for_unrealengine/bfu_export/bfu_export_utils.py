@@ -28,6 +28,7 @@ from .. import bfu_adv_object
 
 # @TODO: Move this to a config file.
 dup_temp_name = "BFU_Temp"  # Duplicate object temporary name
+dup_temp_collection_name = "BFU_Temp_Duplicate"  # Collection of the duplicated objects (Data API duplicate)
 export_temp_preFix = "_ESO_Temp"  # _ExportSubObject_TempName
 
 previous_enabled_armature_constraints_key = "BFU_PreviousEnabledArmatureConstraints"
@@ -126,11 +127,69 @@ class DelegateOldData():
     def remove_data(self):
         bfu_utils.remove_useless_specific_data(self.data_name, self.data_type)
 
+def get_valid_ids(ids: List[bpy.types.ID]) -> List[bpy.types.ID]:
+    # Skip the data blocks already removed.
+    valid_ids: List[bpy.types.ID] = []
+    for data_id in ids:
+        try:
+            data_id.name
+        except ReferenceError:
+            continue
+        valid_ids.append(data_id)
+    return valid_ids
+
+def remap_struct_object_pointers(struct: bpy.types.bpy_struct, duplicates: Dict[bpy.types.Object, bpy.types.Object]):
+    # Eg. modifier.object, constraint.target, constraint.pole_target
+    for prop in struct.bl_rna.properties:
+        if prop.type == 'POINTER' and not prop.is_readonly and prop.fixed_type.identifier == "Object":  # type: ignore
+            value = getattr(struct, prop.identifier)
+            if value in duplicates:
+                setattr(struct, prop.identifier, duplicates[value])
+
+def remap_duplicated_object_references(obj: bpy.types.Object, duplicates: Dict[bpy.types.Object, bpy.types.Object]):
+    # Same as bpy.ops.object.duplicate(): the references to the duplicated objects use the copies.
+    if obj.parent in duplicates:
+        obj.parent = duplicates[obj.parent]
+
+    for modifier in obj.modifiers:
+        remap_struct_object_pointers(modifier, duplicates)
+        if modifier.type == "NODES":
+            # Geometry nodes inputs
+            for key in modifier.keys():
+                if isinstance(modifier[key], bpy.types.Object) and modifier[key] in duplicates:
+                    modifier[key] = duplicates[modifier[key]]
+
+    constraints: List[bpy.types.Constraint] = list(obj.constraints)
+    if obj.pose:
+        for pose_bone in obj.pose.bones:
+            constraints.extend(pose_bone.constraints)
+    for constraint in constraints:
+        remap_struct_object_pointers(constraint, duplicates)
+        if constraint.type == "ARMATURE":
+            for target in constraint.targets:  # type: ignore
+                remap_struct_object_pointers(target, duplicates)
+
+    animation_datas: List[Optional[bpy.types.AnimData]] = [obj.animation_data]
+    if obj.data is not None:
+        animation_datas.append(getattr(obj.data, "animation_data", None))
+        shape_keys: Optional[bpy.types.Key] = getattr(obj.data, "shape_keys", None)
+        if shape_keys:
+            animation_datas.append(shape_keys.animation_data)
+    for animation_data in animation_datas:
+        if animation_data:
+            for driver_fcurve in animation_data.drivers:
+                for variable in driver_fcurve.driver.variables:
+                    for target in variable.targets:
+                        if target.id in duplicates:
+                            target.id = duplicates[target.id]  # type: ignore
+
+
 class DuplicateData():
     def __init__(self):
         self.data_to_remove: List[DelegateOldData] = []
         self.origin_select: Optional[bbpl.save_data.select_save.UserSelectSave] = None
         self.duplicate_select: Optional[bbpl.save_data.select_save.UserSelectSave] = None
+        self.created_ids: List[bpy.types.ID] = []  # Data blocks created by the data API duplicate.
 
     def duplicate_select_for_export(self, context: bpy.types.Context, reset_simplify_after_duplicate: bool = True):
         duplicate_time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Duplicate asset selection")
@@ -140,8 +199,6 @@ class DuplicateData():
         saved_simplify.simplify_scene()
 
         log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Prepare duplicate")
-        scene = context.scene
-
         self.set_origin_select()
         if self.origin_select:
             for user_selected in self.origin_select.user_selecteds:
@@ -149,7 +206,64 @@ class DuplicateData():
                     bfu_utils.save_obj_current_name(user_selected)
                     if user_selected.type == "ARMATURE":  # type: ignore
                         bfu_utils.set_obj_proxy_data(user_selected)
+        log_4.end_time_log()
+
+        # Both methods have their own time logs to compare them.
+        addon_prefs = bfu_addon_prefs.get_addon_preferences()
+        if addon_prefs.duplicate_method == "OPERATOR":
+            self.duplicate_select_with_operator(context)
+        else:
+            self.duplicate_select_with_data_api(context)
+
+        if reset_simplify_after_duplicate:
+            saved_simplify.reset_scene()
+
+        log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Update select")
+        self.set_duplicate_select()
+        log_4.end_time_log()
+
+        duplicate_time_log.end_time_log()
+
+    def duplicate_select_with_data_api(self, context: bpy.types.Context):
+        # Copy the selected objects and their data without operator.
+        # The copies are linked in a temporary collection and all the created data blocks are tracked.
+        log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Duplicate (data API)")
+        scene = context.scene
+        view_layer = context.view_layer
+        origin_objects: List[bpy.types.Object] = []
+        if self.origin_select:
+            origin_objects = [obj for obj in self.origin_select.user_selecteds if obj]
+
+        temp_collection = bpy.data.collections.new(dup_temp_collection_name)
+        scene.collection.children.link(temp_collection)
+        self.created_ids.append(temp_collection)
+
+        duplicates: Dict[bpy.types.Object, bpy.types.Object] = {}
+        for obj in origin_objects:
+            # Object.copy() share the actions, so no action to clean after.
+            new_obj = obj.copy()
+            self.created_ids.append(new_obj)
+            if obj.data is not None:
+                # Make sigle user.
+                new_obj.data = obj.data.copy()
+                self.created_ids.append(new_obj.data)
+            temp_collection.objects.link(new_obj)
+            duplicates[obj] = new_obj
+
+        for new_obj in duplicates.values():
+            remap_duplicated_object_references(new_obj, duplicates)
+
+        # Give the duplicated selection like the operator.
+        for obj in origin_objects:
+            obj.select_set(False)
+        for new_obj in duplicates.values():
+            new_obj.select_set(True)
+        if self.origin_select and self.origin_select.user_active in duplicates:
+            view_layer.objects.active = duplicates[self.origin_select.user_active]
+        log_4.end_time_log()
 
+    def duplicate_select_with_operator(self, context: bpy.types.Context):
+        scene = context.scene
         data_to_remove: List[DelegateOldData] = []
 
         # Save action befor export
@@ -157,10 +271,7 @@ class DuplicateData():
         for action in bpy.data.actions:
             action_names.append(action.name)
 
-        log_4.end_time_log()
-
-        log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Duplicate")
-        # Note: Need look for a optimized duplicate, This is too long
+        log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Duplicate (operator)")
         bpy.ops.object.duplicate()  # type: ignore
         log_4.end_time_log()
 
@@ -180,6 +291,7 @@ class DuplicateData():
                 oldData = objScene.data.name
                 objScene.data = objScene.data.copy()
                 data_to_remove.append(DelegateOldData(oldData, objScene.type))  # type: ignore
+        self.data_to_remove.extend(data_to_remove)
         log_4.end_time_log()
 
         log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Clean")
@@ -187,16 +299,19 @@ class DuplicateData():
         for action in bpy.data.actions:
             if action.name not in action_names:
                 bpy.data.actions.remove(action)  # type: ignore
-
-        if reset_simplify_after_duplicate:
-            saved_simplify.reset_scene()
         log_4.end_time_log()
 
-        log_4 = bfu_export_logs.bfu_process_time_logs_utils.start_time_log(f"Update select")
-        self.set_duplicate_select()
-        log_4.end_time_log()
+    def remove_duplicated_data(self):
+        # Call after delete the exported objects.
+        for data in self.data_to_remove:
+            data.remove_data()
+        self.data_to_remove.clear()
 
-        duplicate_time_log.end_time_log()
+        # The copies and the temporary collection in a single batch.
+        ids_to_remove = get_valid_ids(self.created_ids)
+        if ids_to_remove:
+            bpy.data.batch_remove(ids_to_remove)  # type: ignore
+        self.created_ids.clear()
 
     def set_origin_select(self):
         select = bbpl.save_data.select_save.UserSelectSave()
@@ -565,14 +680,9 @@ def ConvertGeometryNodeAttributeToUV(obj: bpy.types.Object, attrib_name: str):
 
 def CorrectExtremUVAtExport(obj: bpy.types.Object):
     if obj.bfu_use_correct_extrem_uv_scale:
-        SavedSelect = bbpl.save_data.select_save.UserSelectSave()
-        SavedSelect.save_current_select()
-        bbpl.utils.select_specific_object(obj)
-        if bfu_utils.GoToMeshEditMode():
-            bfu_utils.CorrectExtremeUV(obj.bfu_correct_extrem_uv_scale_step_scale, obj.bfu_correct_extrem_uv_scale_use_absolute)
-            bbpl.utils.safe_mode_set('OBJECT')
-            SavedSelect.reset_select()
-            return True
+        if isinstance(obj.data, bpy.types.Mesh):
+            # Works on the mesh data in Object mode.
+            return bfu_utils.correct_extreme_mesh_uv(obj.data, obj.bfu_correct_extrem_uv_scale_step_scale, obj.bfu_correct_extrem_uv_scale_use_absolute)
     return False
 
 
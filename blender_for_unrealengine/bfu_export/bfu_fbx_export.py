@@ -13,15 +13,60 @@
 
 import traceback
 import bpy
+from contextlib import contextmanager
 from mathutils import Matrix
-from typing import Set, Dict, Any
+from typing import Set, Dict, Any, Iterator
 from .. import bpl
 from .. import fbxio
+from .. import bfu_addon_prefs
+from .. import bfu_export_logs
 
 
 debug_show_arguments = False
 
 
+def add_fbx_cache_log(name: str, cache: Any, max_size: int) -> None:
+    cache_log = bfu_export_logs.bfu_export_cache_logs.ExportCacheLog(name)
+    cache_log.hits = cache.hits
+    cache_log.misses = cache.misses
+    cache_log.evictions = cache.evictions
+    cache_log.reused_size = cache.reused_size
+    cache_log.max_size = max_size
+    bfu_export_logs.bfu_export_cache_logs.export_cache_log_store.add_log(cache_log)
+
+
+@contextmanager
+def fbx_array_cache_cm() -> Iterator[None]:
+    # Compressed FBX arrays and extracted mesh elements are reused by the next files of the export run.
+    addon_prefs = bfu_addon_prefs.get_addon_preferences()
+    max_size: int = addon_prefs.fbx_array_cache_size * 1024 * 1024
+    if max_size <= 0:
+        yield
+        return
+
+    encode_bin = fbxio.current_fbxio.encode_bin
+    cache = encode_bin.FBXCompressedArrayCache(max_size)
+    previous_cache = encode_bin.set_compressed_array_cache(cache)
+
+    # Mesh element cache, only with Blender 4.1 and newer.
+    export_fbx_bin = fbxio.current_fbxio.export_fbx_bin
+    mesh_cache = None
+    previous_mesh_cache = None
+    if hasattr(export_fbx_bin, "set_mesh_element_cache"):
+        mesh_cache = export_fbx_bin.FBXMeshElementCache(max_size)
+        previous_mesh_cache = export_fbx_bin.set_mesh_element_cache(mesh_cache)
+    try:
+        yield
+    finally:
+        encode_bin.set_compressed_array_cache(previous_cache)
+        add_fbx_cache_log("FBX compressed arrays", cache, max_size)
+        cache.clear()
+        if mesh_cache is not None:
+            export_fbx_bin.set_mesh_element_cache(previous_mesh_cache)
+            add_fbx_cache_log("FBX mesh elements", mesh_cache, max_size)
+            mesh_cache.clear()
+
+
 
 def export_scene_fbx_with_custom_fbx_io(
     operator: bpy.types.Operator, 
@@ -141,6 +186,12 @@ def export_scene_fbx_with_custom_fbx_io(
     if blender_version >= (3, 5, 0):
         params['prioritize_active_color'] = prioritize_active_color
 
+    if blender_version >= (4, 0, 0):
+        params['use_fast_fk_bake'] = bfu_addon_prefs.get_addon_preferences().use_fast_fk_bake
+
+    if blender_version >= (4, 1, 0):
+        params['use_stream_writer'] = bfu_addon_prefs.get_addon_preferences().use_fbx_stream_writer
+
     try:
         # Call the FBX export operator with the appropriate parameters
         if (debug_show_arguments):
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# ---------------------------------------------------------------
+#  This script is run by the distributed export workers:
+#  blender --background file.blend --addons <addon_module> --python distributed_export_worker_script.py
+#      -- --addon_module <addon_module> --shard <shard.json>
+#  See bfu_export_distributed.py
+# ----------------------------------------------------------------
+
+from pathlib import Path
+import argparse
+import importlib
+import sys
+import traceback
+
+argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+parser = argparse.ArgumentParser(description="Blender For UnrealEngine distributed export worker")
+parser.add_argument("--addon_module", type=str, required=True, help="Module name of the enabled addon")
+parser.add_argument("--shard", type=str, required=True, help="Shard file with the assets to export")
+args = parser.parse_args(argv)
+
+try:
+    addon_module = importlib.import_module(args.addon_module)
+    addon_module.bfu_export.bfu_export_distributed.run_worker(Path(args.shard))
+except Exception:
+    traceback.print_exc()
+    sys.exit(1)
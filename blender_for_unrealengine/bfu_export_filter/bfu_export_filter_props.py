@@ -55,9 +55,11 @@ def get_preset_values() -> List[str]:
         'scene.bfu_use_text_import_asset_script',
         'scene.bfu_use_text_import_sequence_script',
         'scene.bfu_use_text_additional_data',
+        'scene.bfu_text_files_json_format',
 
         # Export Filter
         'scene.bfu_export_selection_filter',
+        'scene.bfu_export_changed_only',
         ]
     return preset_values
 
@@ -98,6 +100,9 @@ def scene_use_text_import_sequence_script(scene: bpy.types.Scene) -> bool:
 def scene_use_text_additional_data(scene: bpy.types.Scene) -> bool:
     return scene.bfu_use_text_additional_data # type: ignore
 
+def scene_text_files_json_format(scene: bpy.types.Scene) -> str:
+    return scene.bfu_text_files_json_format # type: ignore
+
 def scene_export_selection_filter(scene: bpy.types.Scene) -> BFU_ExportSelectionFilterEnum:
     for item in BFU_ExportSelectionFilterEnum:
         if item.value == scene.bfu_export_selection_filter:  # type: ignore
@@ -106,6 +111,9 @@ def scene_export_selection_filter(scene: bpy.types.Scene) -> BFU_ExportSelection
     print(f"Warning: Scene has unknown export selection filter '{scene.bfu_export_selection_filter}'. Falling back to default export selection filter...")  # type: ignore
     return BFU_ExportSelectionFilterEnum.default()
 
+def scene_export_changed_only(scene: bpy.types.Scene) -> bool:
+    return scene.bfu_export_changed_only # type: ignore
+
 # -------------------------------------------------------------------
 #   Register & Unregister
 # -------------------------------------------------------------------
@@ -196,6 +204,18 @@ def register():
         default=True
         )
     
+    bpy.types.Scene.bfu_text_files_json_format = bpy.props.EnumProperty(  # type: ignore[attr-defined]
+        name="JSON format",
+        items=[
+            ("COMPACT", "Compact", "JSON without indentation and spaces. Smallest files."),
+            ("INDENTED", "Indented", "Indented JSON, easier to read."),
+            ("NDJSON", "NDJSON", "One JSON record per line. Assets can be read before the end of the file."),
+        ],
+        description=(
+            "Format of the import data and additional data files"),
+        default="COMPACT"
+        )
+    
     # Export Filter
     bpy.types.Scene.bfu_export_selection_filter = bpy.props.EnumProperty(  # type: ignore[attr-defined]
         name="Selection filter",
@@ -205,9 +225,19 @@ def register():
         default=get_default_export_selection_filter_enum()
         )
 
+    bpy.types.Scene.bfu_export_changed_only = bpy.props.BoolProperty(  # type: ignore[attr-defined]
+        name="Export changed only",
+        description=(
+            "Skip packages not changed since the last export." +
+            " A manifest with the package fingerprints is written next to the import asset data file"),
+        default=False
+        )
+
 def unregister():
+    del bpy.types.Scene.bfu_export_changed_only  # type: ignore[attr-defined]
     del bpy.types.Scene.bfu_export_selection_filter  # type: ignore[attr-defined]
 
+    del bpy.types.Scene.bfu_text_files_json_format  # type: ignore[attr-defined]
     del bpy.types.Scene.bfu_use_text_additional_data  # type: ignore[attr-defined]
     del bpy.types.Scene.bfu_use_text_import_sequence_script  # type: ignore[attr-defined]
     del bpy.types.Scene.bfu_use_text_import_asset_script  # type: ignore[attr-defined]
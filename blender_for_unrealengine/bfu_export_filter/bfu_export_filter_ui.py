@@ -44,7 +44,10 @@ def draw_ui(layout: bpy.types.UILayout, context: bpy.types.Context):
             FileCol.prop(scene, 'bfu_use_text_import_sequence_script')
             if addon_prefs.useGeneratedScripts:
                 FileCol.prop(scene, 'bfu_use_text_additional_data')
+            FileCol.prop(scene, 'bfu_text_files_json_format')
 
             # exportProperty
             export_by_select = panel.row()
-            export_by_select.prop(scene, 'bfu_export_selection_filter')
\ No newline at end of file
+            export_by_select.prop(scene, 'bfu_export_selection_filter')
+            export_changed_only = panel.row()
+            export_changed_only.prop(scene, 'bfu_export_changed_only')
\ No newline at end of file
@@ -14,6 +14,7 @@ from . import bfu_asset_export_logs_types
 from . import bfu_asset_export_logs_utils
 from . import bfu_process_time_logs_types
 from . import bfu_process_time_logs_utils
+from . import bfu_export_cache_logs
 
 if "bfu_asset_export_logs_types" in locals():
     importlib.reload(bfu_asset_export_logs_types)
@@ -23,10 +24,13 @@ if "bfu_process_time_logs_types" in locals():
     importlib.reload(bfu_process_time_logs_types)
 if "bfu_process_time_logs_utils" in locals():
     importlib.reload(bfu_process_time_logs_utils)
+if "bfu_export_cache_logs" in locals():
+    importlib.reload(bfu_export_cache_logs)
 
 
 def clear_all_logs():
     bfu_process_time_logs_utils.clear_process_time_logs()
+    bfu_export_cache_logs.export_cache_log_store.clear()
 
 classes = (
 )
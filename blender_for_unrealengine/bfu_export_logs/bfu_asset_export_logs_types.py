@@ -9,7 +9,7 @@
 
 import bpy
 import time
-from typing import Dict
+from typing import Dict, Any
 from ..bfu_assets_manager.bfu_asset_manager_type import AssetToExport, AssetPackage
 
 class ExportedPackageLog():
@@ -19,6 +19,7 @@ class ExportedPackageLog():
         self.export_start_time = 0.0
         self.export_end_time = 0.0
         self.export_success = False
+        self.export_skipped = False
 
     def start_package_export(self):
         self.export_start_time = time.perf_counter()
@@ -27,9 +28,29 @@ class ExportedPackageLog():
         self.export_end_time = time.perf_counter()
         self.export_success = success
 
+    def skip_package_export(self):
+        # Package not changed since the last export, the file on disk is kept.
+        self.export_end_time = time.perf_counter()
+        self.export_success = True
+        self.export_skipped = True
+
     def get_package_export_time(self):
         return self.export_end_time - self.export_start_time
 
+    def get_log_as_data(self) -> Dict[str, Any]:
+        # Used to send the log from a distributed export worker.
+        return {
+            "export_time": self.get_package_export_time(),
+            "export_success": self.export_success,
+            "export_skipped": self.export_skipped,
+        }
+
+    def set_log_from_data(self, data: Dict[str, Any]):
+        self.export_start_time = 0.0
+        self.export_end_time = data["export_time"]
+        self.export_success = data["export_success"]
+        self.export_skipped = data["export_skipped"]
+
 class ExportedAssetLog():
     # [AssetName , AssetType , ExportPath, ExportTime]
 
@@ -47,6 +68,25 @@ class ExportedAssetLog():
     def get_asset_export_time(self):
         return self.export_end_time - self.export_start_time
 
+    def get_log_as_data(self) -> Dict[str, Any]:
+        # Used to send the log from a distributed export worker.
+        return {
+            "asset_name": self.exported_asset.name,
+            "export_time": self.get_asset_export_time(),
+            "export_success": self.export_success,
+            "packages": {name: package_log.get_log_as_data() for name, package_log in self.package_logs.items()},
+        }
+
+    def set_log_from_data(self, data: Dict[str, Any]):
+        self.export_start_time = 0.0
+        self.export_end_time = data["export_time"]
+        self.export_success = data["export_success"]
+        self.package_logs.clear()
+        for name, package_data in data["packages"].items():
+            package_log = ExportedPackageLog()
+            package_log.set_log_from_data(package_data)
+            self.package_logs[name] = package_log
+
     def start_package_export(self, package: AssetPackage):
         new_package_log = ExportedPackageLog()
         new_package_log.start_package_export()
@@ -58,6 +98,24 @@ class ExportedAssetLog():
         else:
             raise KeyError(f"Package {package.name} not found in logs for asset {self.exported_asset.name}.")
         
+    def skip_package_export(self, package: AssetPackage):
+        if package.name in self.package_logs:
+            self.package_logs[package.name].skip_package_export()
+        else:
+            raise KeyError(f"Package {package.name} not found in logs for asset {self.exported_asset.name}.")
+
+    def get_package_export_skipped(self, package: AssetPackage):
+        if package.name in self.package_logs:
+            return self.package_logs[package.name].export_skipped
+        else:
+            raise KeyError(f"Package {package.name} not found in logs for asset {self.exported_asset.name}.")
+
+    def get_asset_export_skipped(self) -> bool:
+        # An asset is skipped when all its packages are skipped.
+        if not self.package_logs:
+            return False
+        return all(package_log.export_skipped for package_log in self.package_logs.values())
+
     def get_package_export_time(self, package: AssetPackage):
         if package.name in self.package_logs:
             return self.package_logs[package.name].get_package_export_time()
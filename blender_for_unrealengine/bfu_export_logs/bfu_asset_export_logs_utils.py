@@ -82,7 +82,11 @@ def get_export_asset_logs_details(exported_asset_log: List[bfu_asset_export_logs
 
             # Success status
             export_sucess = True if asset.get_package_export_success(package) else False
-            if console_use:
+            if asset.get_package_export_skipped(package):
+                export_sucess_status = "UNCHANGED"
+                if console_use:
+                    export_sucess_status = bpl.color_set.yellow(export_sucess_status)
+            elif console_use:
                 export_sucess_status = bpl.color_set.green("SUCCESS") if export_sucess else bpl.color_set.red("FAILED")
             else:
                 export_sucess_status = "SUCCESS" if export_sucess else "FAILED"
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Hits and misses of the caches used during an export run.
+
+from typing import List
+
+
+class ExportCacheLog():
+
+    def __init__(self, cache_name: str):
+        self.cache_name = cache_name
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.reused_size: int = 0  # bytes
+        self.max_size: int = 0  # bytes
+
+    def get_cache_detail(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0.0
+        return (
+            f"{self.cache_name}: {self.hits} hit(s), {self.misses} miss(es) ({hit_rate:.1f}% hit), "
+            f"{self.evictions} eviction(s), {self.reused_size / (1024 * 1024):.1f} MiB reused, "
+            f"limit {self.max_size / (1024 * 1024):.0f} MiB"
+        )
+
+
+class ExportCacheLogStore():
+
+    def __init__(self):
+        self.logs: List[ExportCacheLog] = []
+
+    def clear(self) -> None:
+        self.logs.clear()
+
+    def add_log(self, log: ExportCacheLog) -> None:
+        self.logs.append(log)
+
+
+export_cache_log_store = ExportCacheLogStore()
+
+
+def get_export_cache_logs_details() -> str:
+    lines = [f"- {log.get_cache_detail()} \n" for log in export_cache_log_store.logs]
+    return "".join(lines)
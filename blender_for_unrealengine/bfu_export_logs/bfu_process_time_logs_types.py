@@ -9,7 +9,7 @@
 
 import bpy
 import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, List, Dict, Union
 from .. import bpl
 
 
@@ -64,36 +64,134 @@ class BFU_OT_ExportProcessTimeLog(bpy.types.PropertyGroup):
 
         return elapsed_time
 
+class ProcessTimeRecord():
+    # Python side time log.
+    # Timers are written in the scene collection only when flushed for the UI.
+    __slots__ = ("process_id", "process_info", "start_time", "end_time", "sub_step", "finished_success")
+
+    def __init__(self, process_id: str, process_info: str, sub_step: int):
+        self.process_id: str = process_id
+        self.process_info: str = process_info
+        self.start_time: float = time.perf_counter()
+        self.end_time: float = 0.0
+        self.sub_step: int = sub_step
+        self.finished_success: bool = False
+
+
+def get_process_detail(record: Union[ProcessTimeRecord, BFU_OT_ExportProcessTimeLog], faster: float, slower: float) -> str:
+    if record.finished_success:
+        result = "Success"
+    else:
+        result = bpl.color_set.red("Never finished")
+
+    elapsed = record.end_time - record.start_time
+
+    # Colorize 20% faster times in green, 20% slower in red and other in yellow
+    faster_max: float = ((slower - faster) * 0.2) + faster # 20% faster
+    slower_min: float = slower - ((slower - faster) * 0.2)  # 20% slower
+
+    if elapsed <= faster_max:
+        str_time = bpl.color_set.green(bpl.utils.get_formatted_time(elapsed))
+    elif elapsed >= slower_min:
+        str_time = bpl.color_set.red(bpl.utils.get_formatted_time(elapsed))
+    else:
+        str_time = bpl.color_set.yellow(bpl.utils.get_formatted_time(elapsed))
+
+    str_sub_steps = record.sub_step * "   |"
+    return f"{str_sub_steps}{record.process_info}, {str_time}, {result}"
+
+
+class ProcessTimeLogStore():
+    # In-memory ring buffer of time logs indexed by process_id.
+    # When the buffer is full the oldest logs are dropped.
+
+    def __init__(self, max_logs: int = 65536):
+        self.max_logs: int = max_logs
+        self.records: List[Optional[ProcessTimeRecord]] = [None] * max_logs
+        self.record_by_id: Dict[str, ProcessTimeRecord] = {}
+        self.next_index: int = 0  # Total number of started timers, also used for unique ids.
+        self.current_sub_step: int = 0
+        self.faster_time: float = 0.0
+        self.slower_time: float = 0.0
+
+    def clear(self) -> None:
+        self.records = [None] * self.max_logs
+        self.record_by_id.clear()
+        self.next_index = 0
+        self.current_sub_step = 0
+        self.faster_time = 0.0
+        self.slower_time = 0.0
+
+    def get_new_process_id(self) -> str:
+        return "pid_" + str(self.next_index)
+
+    def start_timer(self, process_id: str, process_info: str) -> ProcessTimeRecord:
+        slot = self.next_index % self.max_logs
+        old_record = self.records[slot]
+        if old_record is not None:
+            del self.record_by_id[old_record.process_id]
+
+        record = ProcessTimeRecord(process_id, process_info, self.current_sub_step)
+        self.records[slot] = record
+        self.record_by_id[process_id] = record
+        self.next_index += 1
 
-    def get_process_detail(self):
-        if self.finished_success:
-            result = "Success"
-        else:
-            result = bpl.color_set.red("Never finished")
+        # Increment the sub step counter
+        self.current_sub_step += 1
+        return record
 
-        scene = bpy.context.scene
-        elapsed = self.end_time - self.start_time
-        faster: float = scene.bfu_export_process_faster_time # type: ignore[attr-defined]
-        slower: float = scene.bfu_export_process_slower_time # type: ignore[attr-defined]
+    def finish_timer(self, record: ProcessTimeRecord) -> float:
+        record.end_time = time.perf_counter()
+        record.finished_success = True
+
+        # Decrement the sub step counter
+        self.current_sub_step -= 1
+
+        elapsed_time = record.end_time - record.start_time
+        if elapsed_time < self.faster_time:
+            self.faster_time = elapsed_time
+        elif elapsed_time > self.slower_time:
+            self.slower_time = elapsed_time
+        return elapsed_time
+
+    def get_record(self, process_id: str) -> Optional[ProcessTimeRecord]:
+        return self.record_by_id.get(process_id)
+
+    def get_records(self) -> List[ProcessTimeRecord]:
+        # Records in start order.
+        count = min(self.next_index, self.max_logs)
+        first = self.next_index - count
+        records: List[ProcessTimeRecord] = []
+        for index in range(first, self.next_index):
+            record = self.records[index % self.max_logs]
+            if record is not None:
+                records.append(record)
+        return records
+
+    def flush_to_scene(self, scene: bpy.types.Scene) -> None:
+        # Write the time logs in the scene collection for the UI.
+        scene.bfu_export_process_current_sub_step = self.current_sub_step  # type: ignore[attr-defined]
+        scene.bfu_export_process_faster_time = self.faster_time  # type: ignore[attr-defined]
+        scene.bfu_export_process_slower_time = self.slower_time  # type: ignore[attr-defined]
+        scene.bfu_export_process_time_logs.clear()  # type: ignore[attr-defined]
+        for record in self.get_records():
+            process_task = scene.bfu_export_process_time_logs.add()  # type: ignore[attr-defined]
+            if TYPE_CHECKING:
+                process_task = BFU_OT_ExportProcessTimeLog()
+            process_task.process_id = record.process_id
+            process_task.process_info = record.process_info
+            process_task.start_time = record.start_time
+            process_task.end_time = record.end_time
+            process_task.sub_step = record.sub_step
+            process_task.finished_success = record.finished_success
 
-        # Colorize 20% faster times in green, 20% slower in red and other in yellow
-        faster_max: float = ((slower - faster) * 0.2) + faster # 20% faster
-        slower_min: float = slower - ((slower - faster) * 0.2)  # 20% slower
-        
-        if elapsed <= faster_max:
-            str_time = bpl.color_set.green(bpl.utils.get_formatted_time(elapsed))
-        elif elapsed >= slower_min:
-            str_time = bpl.color_set.red(bpl.utils.get_formatted_time(elapsed))
-        else:
-            str_time = bpl.color_set.yellow(bpl.utils.get_formatted_time(elapsed))
 
-        str_sub_steps = self.sub_step * "   |"
-        return f"{str_sub_steps}{self.process_info}, {str_time}, {result}"
+process_time_log_store = ProcessTimeLogStore()
+
 
 class SafeTimeLogHandle():
-    # I need to store a proxy class
-    # because BFU_OT_ExportProcessTimeLog ref is lost
-    # when scene update and this produce a crash.
+    # Handle to a time log in process_time_log_store.
+    # Only the process_id is stored because the record can be dropped from the ring buffer.
 
     def __init__(self):
         self.process_id: str = self.get_process_time_unique_id()
@@ -101,33 +199,15 @@ class SafeTimeLogHandle():
         
 
     def start_timer(self, timer_name: str) -> float:
-        if bpy.context is None:
-            return 0.0
-        self.print_log(self.get_process_info(), "Start!")
-        scene = bpy.context.scene
-        process_task = scene.bfu_export_process_time_logs.add()  # type: ignore[attr-defined]
-        if TYPE_CHECKING:
-            process_task = BFU_OT_ExportProcessTimeLog()
-        return process_task.start_timer(self.process_id, timer_name)
+        self.print_log(timer_name, "Start!")
+        process_task = process_time_log_store.start_timer(self.process_id, timer_name)
+        return process_task.start_time
 
     def get_process_time_unique_id(self) -> str:
-        if bpy.context is None:
-            return ""
-        scene = bpy.context.scene
-        prefix = "pid_"
-        index = str(len(scene.bfu_export_process_time_logs))  # type: ignore[attr-defined]
-        return prefix + index
+        return process_time_log_store.get_new_process_id()
 
-    def get_process_ref(self) -> Optional[BFU_OT_ExportProcessTimeLog]:
-        if bpy.context is None:
-            return None
-        scene = bpy.context.scene
-        for process_task in scene.bfu_export_process_time_logs:  # type: ignore[attr-defined]
-            if TYPE_CHECKING:
-                process_task = BFU_OT_ExportProcessTimeLog()
-            if process_task.process_id == self.process_id:
-                return process_task
-        return None
+    def get_process_ref(self) -> Optional[ProcessTimeRecord]:
+        return process_time_log_store.get_record(self.process_id)
         
     def get_process_info(self) -> str:
         process_ref = self.get_process_ref()
@@ -139,7 +219,7 @@ class SafeTimeLogHandle():
         process_ref = self.get_process_ref()
         if process_ref:
             self.print_log(process_ref.process_info, "End!")
-            process_ref.finish_timer()
+            process_time_log_store.finish_timer(process_ref)
 
     def print_log(self, *args: str):
         if self.should_print_log:
@@ -13,9 +13,11 @@ from . import bfu_process_time_logs_types
 
 
 def get_process_time_logs() -> List[bfu_process_time_logs_types.BFU_OT_ExportProcessTimeLog]:
+    # Time logs are flushed in the scene collection only when requested.
     if bpy.context is None:
         return []
     scene = bpy.context.scene
+    bfu_process_time_logs_types.process_time_log_store.flush_to_scene(scene)
     return scene.bfu_export_process_time_logs  # type: ignore[attr-defined]
 
 def start_time_log(process_info: str) -> bfu_process_time_logs_types.SafeTimeLogHandle:
@@ -24,6 +26,7 @@ def start_time_log(process_info: str) -> bfu_process_time_logs_types.SafeTimeLog
     return process_task_proxy
 
 def clear_process_time_logs():
+    bfu_process_time_logs_types.process_time_log_store.clear()
     if bpy.context is None:
         return
     scene = bpy.context.scene
@@ -33,8 +36,6 @@ def clear_process_time_logs():
     scene.bfu_export_process_time_logs.clear()  # type: ignore[attr-defined]
 
 def get_process_time_logs_details():
-    export_log = ""
-    for log in get_process_time_logs():
-        export_log += f"- {log.get_process_detail()} \n"
-
-    return export_log
\ No newline at end of file
+    store = bfu_process_time_logs_types.process_time_log_store
+    lines = [f"- {bfu_process_time_logs_types.get_process_detail(record, store.faster_time, store.slower_time)} \n" for record in store.get_records()]
+    return "".join(lines)
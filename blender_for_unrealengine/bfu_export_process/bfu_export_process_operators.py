@@ -23,6 +23,7 @@ from .. import bfu_export_text_files
 from .. import bfu_export_logs
 from .. import bfu_export_filter
 from . import bfu_export_process_utils
+from . import bfu_export_process_props
 
 
 class BFU_OT_ExportForUnrealEngineButton(bpy.types.Operator):
@@ -101,15 +102,58 @@ class BFU_OT_ExportForUnrealEngineButton(bpy.types.Operator):
         # Clear logs before export
         bfu_export_logs.clear_all_logs()
 
-        counter = bpl.utils.CounterTimer()
+        self.counter = bpl.utils.CounterTimer()
         bfu_check_potential_error.bfu_check_utils.process_general_fix()
-        exported_asset_log = bfu_export.bfu_export_asset.process_export(self, final_asset_list_to_export)
-        bfu_export_text_files.bfu_export_text_files_process.write_all_data_files(exported_asset_log)
-        
+        # Data files are written during the export, asset by asset.
+        self.data_files_writer = bfu_export_text_files.bfu_export_text_files_process.DataFilesStreamWriter()
+        self.data_files_writer.begin()
+        try:
+            if bfu_export_process_props.scene_use_distributed_export(scene):
+                self.distributed_export = bfu_export.bfu_export_distributed.DistributedExport(final_asset_list_to_export)
+                self.distributed_export.start()
+                if context.window is None:
+                    # No timer without window, in background mode.
+                    self.distributed_export.wait()
+                    return self.finish_export(self.distributed_export.finish())
+
+                # Workers are checked with a timer so the UI is not blocked.
+                self.timer = context.window_manager.event_timer_add(0.2, window=context.window)
+                context.window_manager.modal_handler_add(self)
+                return {'RUNNING_MODAL'}
+            else:
+                exported_asset_log = bfu_export.bfu_export_asset.process_export(self, final_asset_list_to_export, on_asset_exported=self.data_files_writer.add_exported_asset)
+        except Exception:
+            self.data_files_writer.abort()
+            raise
+        return self.finish_export(exported_asset_log)
+
+    def modal(self, context: bpy.types.Context, event: bpy.types.Event) -> Set[Any]:
+        if event.type == 'ESC':
+            context.window_manager.event_timer_remove(self.timer)
+            self.distributed_export.cancel()
+            self.data_files_writer.abort()
+            self.report({'WARNING'}, "Distributed export canceled.")
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+            try:
+                is_finished = self.distributed_export.update()
+            except Exception:
+                context.window_manager.event_timer_remove(self.timer)
+                self.distributed_export.cancel()
+                self.data_files_writer.abort()
+                raise
+            if is_finished:
+                context.window_manager.event_timer_remove(self.timer)
+                return self.finish_export(self.distributed_export.finish())
+
+        return {'PASS_THROUGH'}
+
+    def finish_export(self, exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]) -> Set[Any]:
+        bfu_export_text_files.bfu_export_text_files_process.write_all_data_files(exported_asset_log, self.data_files_writer)
 
-        
         asset_list = str(len(exported_asset_log))
-        report_text = f"Export of {asset_list} asset(s) has been finalized in " + counter.get_str_time() + " Look in console for more info."
+        report_text = f"Export of {asset_list} asset(s) has been finalized in " + self.counter.get_str_time() + " Look in console for more info."
         self.report({'INFO'}, report_text)
 
         bfu_export_process_utils.print_exported_asset_detail(exported_asset_log)
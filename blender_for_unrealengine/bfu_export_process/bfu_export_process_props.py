@@ -8,6 +8,7 @@
 # ----------------------------------------------
 
 
+import os
 from typing import List
 import bpy
 from .. import bbpl
@@ -15,9 +16,18 @@ from .. import bbpl
 
 def get_preset_values() -> List[str]:
     preset_values = [
+        'scene.bfu_use_distributed_export',
+        'scene.bfu_distributed_export_worker_count',
+        'scene.bfu_distributed_export_max_retry',
         ]
     return preset_values
 
+def get_default_worker_count() -> int:
+    return max(1, (os.cpu_count() or 2) // 2)
+
+def scene_use_distributed_export(scene: bpy.types.Scene) -> bool:
+    return scene.bfu_use_distributed_export # type: ignore
+
 # -------------------------------------------------------------------
 #   Register & Unregister
 # -------------------------------------------------------------------
@@ -33,9 +43,37 @@ def register():
     bpy.types.Scene.bfu_export_process_properties_expanded = bbpl.blender_layout.layout_accordion.add_ui_accordion(name="Export process")
     bpy.types.Scene.bfu_script_tool_expanded = bbpl.blender_layout.layout_accordion.add_ui_accordion(name="Copy Import Script")
 
+    bpy.types.Scene.bfu_use_distributed_export = bpy.props.BoolProperty(  # type: ignore[attr-defined]
+        name="Distributed export",
+        description=(
+            "Split the asset list and export it with multiple background Blender processes." +
+            " A copy of the current file is saved next to it for the workers"),
+        default=False
+        )
+
+    bpy.types.Scene.bfu_distributed_export_worker_count = bpy.props.IntProperty(  # type: ignore[attr-defined]
+        name="Workers",
+        description="Number of background Blender processes used for the distributed export",
+        min=1,
+        soft_max=32,
+        default=get_default_worker_count()
+        )
+
+    bpy.types.Scene.bfu_distributed_export_max_retry = bpy.props.IntProperty(  # type: ignore[attr-defined]
+        name="Max retry",
+        description="Number of times the assets of a failed worker are exported again",
+        min=0,
+        max=10,
+        default=1
+        )
+
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    del bpy.types.Scene.bfu_distributed_export_max_retry
+    del bpy.types.Scene.bfu_distributed_export_worker_count
+    del bpy.types.Scene.bfu_use_distributed_export
+
     del bpy.types.Scene.bfu_script_tool_expanded
     del bpy.types.Scene.bfu_export_process_properties_expanded
\ No newline at end of file
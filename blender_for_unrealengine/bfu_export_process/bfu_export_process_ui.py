@@ -37,6 +37,14 @@ def draw_export_ui(
             checkButton.operator("object.checkpotentialerror", icon='FILE_TICK')
             checkButton.operator("object.openpotentialerror", icon='LOOP_BACK', text="")
 
+            # Distributed export :
+            distributed_export = panel.row(align=True)
+            distributed_export.prop(scene, 'bfu_use_distributed_export')
+            distributed_export_settings = distributed_export.row(align=True)
+            distributed_export_settings.enabled = scene.bfu_use_distributed_export  # type: ignore[attr-defined]
+            distributed_export_settings.prop(scene, 'bfu_distributed_export_worker_count')
+            distributed_export_settings.prop(scene, 'bfu_distributed_export_max_retry')
+
             exportButton = panel.row()
             exportButton.scale_y = 2.0
             exportButton.operator("object.exportforunreal", icon='EXPORT')
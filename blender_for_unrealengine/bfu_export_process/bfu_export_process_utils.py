@@ -25,4 +25,11 @@ def print_exported_asset_detail(exported_asset_log: List[bfu_export_logs.bfu_ass
     for line in lines:
         print(line)
     print("")
+    if bfu_export_logs.bfu_export_cache_logs.export_cache_log_store.logs:
+        bpl.advprint.print_simple_title("Caches")
+        print("")
+        lines = bfu_export_logs.bfu_export_cache_logs.get_export_cache_logs_details().splitlines()
+        for line in lines:
+            print(line)
+        print("")
     bpl.advprint.print_separator()
\ No newline at end of file
@@ -23,23 +23,14 @@ from .. import bfu_lod
 from ..bfu_assets_manager.bfu_asset_manager_type import AssetType
 from .. import bfu_export_nomenclature
 
-def write_main_assets_data(exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]) -> Dict[str, Any]:
-    # Generate a script for import assets in Unreal Engine.
-
+def write_main_assets_header_data() -> Dict[str, Any]:
+    # Data written before the asset list.
     data: Dict[str, Any] = {}
 
     bfu_export_text_files_utils.add_generated_json_header(data, bpy.app.translations.pgettext("It used for import into Unreal Engine all the assets of type StaticMesh, SkeletalMesh, Animation, Pose, Camera, [...]", "interface.write_text_additional_track_all"))
     bfu_export_text_files_utils.add_generated_json_meta_data(data)
 
     data['unreal_import_location'] = str(bfu_export_nomenclature.bfu_export_nomenclature_utils.get_import_location())
-
-    # Import assets
-    assets: List[Dict[str, Any]] = []
-    for unreal_exported_asset in exported_asset_log:
-        assets.append(write_single_asset_data(unreal_exported_asset))
-    data['assets'] = assets
-
-    bfu_export_text_files_utils.add_generated_json_footer(data)
     return data
 
 def write_single_asset_data(unreal_exported_asset: bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog) -> Dict[str, Union[str, bool, float, List[Any]]]:
@@ -51,6 +42,7 @@ def write_single_asset_data(unreal_exported_asset: bfu_export_logs.bfu_asset_exp
     asset_data["asset_import_name"] = unreal_exported_asset.exported_asset.import_name
     asset_data["asset_import_path"] = str(unreal_exported_asset.exported_asset.import_dirpath) 
     asset_data["files"] = unreal_exported_asset.exported_asset.get_asset_files_as_data()
+    asset_data["export_skipped"] = unreal_exported_asset.get_asset_export_skipped()
 
     asset_type = unreal_exported_asset.exported_asset.asset_type
     if asset_type in [AssetType.SKELETAL_MESH, AssetType.ANIM_ACTION, AssetType.ANIM_POSE, AssetType.ANIM_NLA]:
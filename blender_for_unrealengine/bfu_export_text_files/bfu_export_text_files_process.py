@@ -11,8 +11,7 @@ import os
 import pathlib
 import bpy
 import datetime
-from shutil import copyfile
-from typing import List
+from typing import List, Optional, Set, Dict, Any
 
 from pathlib import Path
 from . import bfu_export_text_files_asset_data
@@ -24,14 +23,123 @@ from .. import bfu_basics
 from .. import bfu_export_logs
 
 
-def write_all_data_files(exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]) -> None:
+class DataFilesStreamWriter():
+    # Write the import asset and sequencer data files during the export.
+    # Each asset is added to the files when its export is finished.
+
+    def __init__(self):
+        self.root_dirpath: Path = Path()
+        self.asset_data_header: Optional[Dict[str, Any]] = None
+        self.sequencer_data_header: Optional[Dict[str, Any]] = None
+        self.asset_data_writer: Optional[bfu_export_text_files_utils.JsonFileStreamWriter] = None
+        self.sequencer_data_writer: Optional[bfu_export_text_files_utils.JsonFileStreamWriter] = None
+        self.written_asset_logs: Set[int] = set()
+
+    def begin(self) -> None:
+        # The headers use the user scene data, they need be created before the export.
+        scene = bpy.context.scene
+        if scene is None:
+            raise ValueError("No active scene found!")
+
+        self.root_dirpath = get_root_dirpath(scene)
+        if scene.bfu_use_text_import_asset_script:  # type: ignore[attr-defined]
+            self.asset_data_header = bfu_export_text_files_asset_data.write_main_assets_header_data()
+        if scene.bfu_use_text_import_sequence_script:  # type: ignore[attr-defined]
+            self.sequencer_data_header = bfu_export_text_files_sequencer_data.write_sequencer_header_data()
+
+    def open_writers(self) -> None:
+        # Files are opened with the first asset, after the export folders cleanup.
+        if self.asset_data_header is not None:
+            writer = bfu_export_text_files_utils.JsonFileStreamWriter(self.root_dirpath / "ImportAssetData.json")
+            if writer.open():
+                writer.write_fields(self.asset_data_header)
+                writer.begin_list("assets")
+                self.asset_data_writer = writer
+            self.asset_data_header = None
+
+        if self.sequencer_data_header is not None:
+            writer = bfu_export_text_files_utils.JsonFileStreamWriter(self.root_dirpath / "ImportSequencerData.json")
+            if writer.open():
+                writer.write_fields(self.sequencer_data_header)
+                writer.begin_list("cameras")
+                self.sequencer_data_writer = writer
+            self.sequencer_data_header = None
+
+    def add_exported_asset(self, exported_asset: bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog) -> None:
+        if id(exported_asset) in self.written_asset_logs:
+            return
+        self.written_asset_logs.add(id(exported_asset))
+        self.open_writers()
+
+        if self.asset_data_writer:
+            self.asset_data_writer.add_list_item(bfu_export_text_files_asset_data.write_single_asset_data(exported_asset))
+        if self.sequencer_data_writer and bfu_export_text_files_sequencer_data.is_sequencer_camera_asset(exported_asset):
+            self.sequencer_data_writer.add_list_item(bfu_export_text_files_sequencer_data.write_single_asset_camera_data(exported_asset))
+
+    def finish(self, exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]) -> None:
+        # Assets not added during the export (Eg. distributed export) are added here.
+        self.open_writers()
+        for exported_asset in exported_asset_log:
+            self.add_exported_asset(exported_asset)
+
+        if self.asset_data_writer:
+            self.asset_data_writer.end_list()
+            self.asset_data_writer.close()
+            self.asset_data_writer = None
+        if self.sequencer_data_writer:
+            self.sequencer_data_writer.end_list()
+            self.sequencer_data_writer.write_fields(bfu_export_text_files_sequencer_data.write_sequencer_footer_data())
+            self.sequencer_data_writer.close()
+            self.sequencer_data_writer = None
+
+    def abort(self) -> None:
+        for writer in [self.asset_data_writer, self.sequencer_data_writer]:
+            if writer:
+                writer.abort()
+        self.asset_data_writer = None
+        self.sequencer_data_writer = None
+        self.asset_data_header = None
+        self.sequencer_data_header = None
+
+
+def get_root_dirpath(scene: bpy.types.Scene) -> Path:
+    return Path(bpy.path.abspath(scene.bfu_export_other_file_path)).resolve()  # type: ignore[attr-defined]
+
+
+def get_import_module_path() -> Path:
+    if bpy.app.version >= (4, 2, 0):
+        package_path = bbpl.blender_extension.extension_utils.get_package_path()
+        if package_path:
+            return Path(package_path) / "bfu_import_module"
+        else:
+            return Path("unknown")
+    else:
+        return Path(bbpl.blender_addon.addon_utils.get_addon_path("Unreal Engine Assets Exporter")) / "bfu_import_module"
+
+
+def copy_import_script(source: Path, destination: Path) -> None:
+    # The script loads the data files with the addon import module, the addon path is written in the copy.
+    if bfu_export_text_files_utils.is_read_only(destination):
+        print(f"Cannot replace '{destination}': File is read-only.")
+    else:
+        addon_path = bfu_export_text_files_utils.get_addon_path()
+        text = source.read_text(encoding="utf8")
+        text = text.replace('ADDON_PATH = ""', f'ADDON_PATH = {repr(str(addon_path or ""))}', 1)
+        destination.write_text(text, encoding="utf8")
+
+
+def write_all_data_files(
+    exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog],
+    stream_writer: Optional[DataFilesStreamWriter] = None
+) -> None:
+    # stream_writer: data files already started during the export.
 
     time_log = bfu_export_logs.bfu_process_time_logs_utils.start_time_log("Write text files")
     scene = bpy.context.scene
     if scene is None:
         raise ValueError("No active scene found!")
 
-    root_dirpath = Path(bpy.path.abspath(scene.bfu_export_other_file_path)).resolve()
+    root_dirpath = get_root_dirpath(scene)
 
 
     # Export log
@@ -39,6 +147,9 @@ def write_all_data_files(exported_asset_log: List[bfu_export_logs.bfu_asset_expo
         Text = bpy.app.translations.pgettext("This file was generated with the addons Blender for UnrealEngine : https://github.com/xavier150/Blender-For-UnrealEngine-Addons", "interface.write_text_additional_track_start") + "\n"
         Text += "" + "\n"
         Text += bfu_export_logs.bfu_asset_export_logs_utils.get_export_asset_logs_details(exported_asset_log)
+        cache_logs_details = bfu_export_logs.bfu_export_cache_logs.get_export_cache_logs_details()
+        if cache_logs_details:
+            Text += "\n" + cache_logs_details
         if Text is not None:
             Filename = bfu_basics.valid_file_name(scene.bfu_file_export_log_name)
             log_fullpath = root_dirpath / Filename
@@ -46,42 +157,21 @@ def write_all_data_files(exported_asset_log: List[bfu_export_logs.bfu_asset_expo
 
 
     # Import script
-    if bpy.app.version >= (4, 2, 0):
-        package_path = bbpl.blender_extension.extension_utils.get_package_path()
-        if package_path:
-            bfu_path = Path(package_path) / "bfu_import_module"
-        else:
-            bfu_path = Path("unknown")
-    else:
-        bfu_path = Path(bbpl.blender_addon.addon_utils.get_addon_path("Unreal Engine Assets Exporter")) / "bfu_import_module"
+    bfu_path = get_import_module_path()
 
-    # Asset data
-    if scene.bfu_use_text_import_asset_script:
-        json_data = bfu_export_text_files_asset_data.write_main_assets_data(exported_asset_log)
-        asset_data_fullpath = root_dirpath / "ImportAssetData.json"
-        bfu_export_text_files_utils.export_single_json_file(json_data, asset_data_fullpath)
+    # Asset and sequencer data
+    if stream_writer is None:
+        stream_writer = DataFilesStreamWriter()
+        stream_writer.begin()
+    stream_writer.finish(exported_asset_log)
 
+    if scene.bfu_use_text_import_asset_script:
         source = bfu_path / "asset_import_script.py"
         filename = bfu_basics.valid_file_name(scene.bfu_file_import_asset_script_name)
-        destination = root_dirpath / filename
-        if bfu_export_text_files_utils.is_read_only(destination):
-            print(f"Cannot replace '{destination}': File is read-only.")
-        else:
-            copyfile(source, destination)
+        copy_import_script(source, root_dirpath / filename)
 
-    # Sequencer data
     if scene.bfu_use_text_import_sequence_script:
-        json_data = bfu_export_text_files_sequencer_data.write_sequencer_tracks_data(exported_asset_log)
-        sequencer_data_fullpath = root_dirpath / "ImportSequencerData.json"
-        bfu_export_text_files_utils.export_single_json_file(json_data, sequencer_data_fullpath)
-
-
         source = bfu_path / "sequencer_import_script.py"
         filename = bfu_basics.valid_file_name(scene.bfu_file_import_sequencer_script_name)
-        destination = root_dirpath / filename
-        if bfu_export_text_files_utils.is_read_only(destination):
-            print(f"Cannot replace '{destination}': File is read-only.")
-        else:
-            copyfile(source, destination)
+        copy_import_script(source, root_dirpath / filename)
     time_log.end_time_log()
-
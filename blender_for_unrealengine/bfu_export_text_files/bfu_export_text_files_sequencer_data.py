@@ -17,7 +17,8 @@ from . import bfu_export_text_files_utils
 
 
 
-def write_sequencer_tracks_data(exported_asset_log: List[bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog]) -> Dict[str, Any]:    
+def write_sequencer_header_data() -> Dict[str, Any]:
+    # Data written before the camera list.
     scene = bpy.context.scene
     if scene is None:
         raise ValueError("No active scene found!")
@@ -40,14 +41,14 @@ def write_sequencer_tracks_data(exported_asset_log: List[bfu_export_logs.bfu_ass
         data['render_resolution_y'] = render.resolution_y
     data['secure_crop'] = 0.0001  # add end crop for avoid section overlay
     data['unreal_import_location'] = bfu_utils.get_unreal_import_location()
+    return data
+
+def is_sequencer_camera_asset(unreal_exported_asset: bfu_export_logs.bfu_asset_export_logs_types.ExportedAssetLog) -> bool:
+    return unreal_exported_asset.exported_asset.asset_type == AssetType.CAMERA
 
-    # Import camera
-    cameras: List[Dict[str, Any]] = []
-    for unreal_exported_asset in exported_asset_log:
-        asset_type = unreal_exported_asset.exported_asset.asset_type
-        if asset_type == AssetType.CAMERA:
-            cameras.append(write_single_asset_camera_data(unreal_exported_asset))
-    data['cameras'] = cameras
+def write_sequencer_footer_data() -> Dict[str, Any]:
+    # Data written after the camera list.
+    data: Dict[str, Any] = {}
 
     def get_marker_scene_sections():
         scene = bpy.context.scene
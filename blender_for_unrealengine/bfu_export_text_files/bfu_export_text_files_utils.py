@@ -11,10 +11,11 @@ import os
 import bpy
 import datetime
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TextIO
 from pathlib import Path
 from .. import bbpl
 from .. import bfu_utils
+from .. import bfu_export_filter
 
 
 def add_generated_json_header(json_data: Dict[str, Any], text: str):
@@ -29,6 +30,12 @@ def add_generated_json_footer(json_data: Dict[str, Any]):
     # Empty for the momment.
     pass
 
+def get_addon_path() -> Optional[str]:
+    if bpy.app.version >= (4, 2, 0):
+        return bbpl.blender_extension.extension_utils.get_package_path()
+    else:
+        return bbpl.blender_addon.addon_utils.get_addon_path("Unreal Engine Assets Exporter")
+
 def add_generated_json_meta_data(json_data: Dict[str, Any]):
 
     current_datetime = datetime.datetime.now()
@@ -40,14 +47,11 @@ def add_generated_json_meta_data(json_data: Dict[str, Any]):
     import_module_path: Path = Path("unknown")
     if bpy.app.version >= (4, 2, 0):
         version_str = 'Version '+ str(bbpl.blender_extension.extension_utils.get_package_version())
-        addon_path = bbpl.blender_extension.extension_utils.get_package_path()
-        if addon_path:
-            import_module_path = Path(addon_path) / "bfu_import_module"
     else:
         version_str = 'Version '+ bbpl.blender_addon.addon_utils.get_addon_version_str("Unreal Engine Assets Exporter")
-        addon_path = bbpl.blender_addon.addon_utils.get_addon_path("Unreal Engine Assets Exporter")
-        if addon_path:
-            import_module_path = Path(addon_path) / "bfu_import_module"
+    addon_path = get_addon_path()
+    if addon_path:
+        import_module_path = Path(addon_path) / "bfu_import_module"
     
     
 
@@ -79,17 +83,161 @@ def export_single_text_file(text: str, fullpath: Path):
         file.write(text)
         
 
-def export_single_json_file(json_data: Dict[str, Any], fullpath: Path) -> bool:
-
-    if not bfu_utils.check_and_make_export_path(fullpath):
-        print(f"Cannot write to '{fullpath}': Path is invalid.")
+# Values of the scene property bfu_text_files_json_format
+JSON_FORMAT_COMPACT = "COMPACT"
+JSON_FORMAT_INDENTED = "INDENTED"
+JSON_FORMAT_NDJSON = "NDJSON"
+
+# First NDJSON record, used by the readers to detect the format.
+NDJSON_FORMAT_KEY = "bfu_ndjson_format"
+NDJSON_FORMAT_VERSION = 1
+
+
+def get_json_format() -> str:
+    scene = bpy.context.scene
+    if scene is None:
+        return JSON_FORMAT_COMPACT
+    return bfu_export_filter.bfu_export_filter_props.scene_text_files_json_format(scene)
+
+
+class JsonFileStreamWriter():
+    # Write a JSON object field by field, list items can be added one by one.
+    # NDJSON: one record per line, {"key": ..., "value": ...} for fields
+    # and {"key": ..., "item": ...} for list items.
+    # NDJSON is written in the final file, the records are readable during the export.
+    # A JSON object is only valid when it is closed, so it is written in a temporary file
+    # then renamed at close(), readers never see a partial object.
+
+    def __init__(self, fullpath: Path, json_format: Optional[str] = None):
+        self.fullpath: Path = fullpath
+        self.json_format: str = json_format if json_format else get_json_format()
+        if self.json_format == JSON_FORMAT_NDJSON:
+            self.temp_fullpath: Path = fullpath
+        else:
+            self.temp_fullpath = fullpath.with_name(fullpath.name + ".tmp")
+        self.file: Optional[TextIO] = None
+        self.field_count: int = 0
+        self.list_key: Optional[str] = None
+        self.list_item_count: int = 0
+
+    def is_open(self) -> bool:
+        return self.file is not None
+
+    def open(self) -> bool:
+        if not bfu_utils.check_and_make_export_path(self.fullpath):
+            print(f"Cannot write to '{self.fullpath}': Path is invalid.")
+            return False
+
+        if is_read_only(self.fullpath):
+            print(f"Cannot write to '{self.fullpath}': File is read-only.")
+            return False
+
+        self.file = open(self.temp_fullpath, "w", encoding="utf8")
+        if self.json_format == JSON_FORMAT_NDJSON:
+            self.write_record({"key": NDJSON_FORMAT_KEY, "value": NDJSON_FORMAT_VERSION})
+        else:
+            self.file.write("{")
+        return True
+
+    def dumps(self, value: Any, indent_level: int = 1) -> str:
+        if self.json_format == JSON_FORMAT_INDENTED:
+            return json.dumps(value, ensure_ascii=False, indent=4).replace("\n", "\n" + "    " * indent_level)
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        assert self.file is not None
+        self.file.write(self.dumps(record) + "\n")
+
+    def write_key(self, key: str) -> None:
+        assert self.file is not None
+        if self.field_count > 0:
+            self.file.write(",")
+        if self.json_format == JSON_FORMAT_INDENTED:
+            self.file.write("\n    ")
+        self.file.write(json.dumps(key, ensure_ascii=False) + (": " if self.json_format == JSON_FORMAT_INDENTED else ":"))
+        self.field_count += 1
+
+    def write_field(self, key: str, value: Any) -> None:
+        if self.list_key is not None:
+            self.end_list()
+        if self.json_format == JSON_FORMAT_NDJSON:
+            self.write_record({"key": key, "value": value})
+        else:
+            self.write_key(key)
+            assert self.file is not None
+            self.file.write(self.dumps(value))
+
+    def write_fields(self, json_data: Dict[str, Any]) -> None:
+        for key, value in json_data.items():
+            self.write_field(key, value)
+
+    def begin_list(self, key: str) -> None:
+        if self.list_key is not None:
+            self.end_list()
+        self.list_key = key
+        self.list_item_count = 0
+        if self.json_format == JSON_FORMAT_NDJSON:
+            # Write the empty list to keep the key when no item is added.
+            self.write_record({"key": key, "value": []})
+        else:
+            self.write_key(key)
+            assert self.file is not None
+            self.file.write("[")
+
+    def add_list_item(self, item: Any) -> None:
+        assert self.file is not None and self.list_key is not None
+        if self.json_format == JSON_FORMAT_NDJSON:
+            self.write_record({"key": self.list_key, "item": item})
+        else:
+            if self.list_item_count > 0:
+                self.file.write(",")
+            if self.json_format == JSON_FORMAT_INDENTED:
+                self.file.write("\n        ")
+            self.file.write(self.dumps(item, 2))
+        self.list_item_count += 1
+        # Items are readable before the end of the export.
+        self.file.flush()
+
+    def end_list(self) -> None:
+        assert self.file is not None and self.list_key is not None
+        if self.json_format != JSON_FORMAT_NDJSON:
+            if self.json_format == JSON_FORMAT_INDENTED and self.list_item_count > 0:
+                self.file.write("\n    ")
+            self.file.write("]")
+        self.list_key = None
+
+    def close(self) -> bool:
+        if self.file is None:
+            return False
+        if self.list_key is not None:
+            self.end_list()
+        if self.json_format != JSON_FORMAT_NDJSON:
+            if self.json_format == JSON_FORMAT_INDENTED:
+                self.file.write("\n")
+            self.file.write("}")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+        if self.temp_fullpath != self.fullpath:
+            os.replace(self.temp_fullpath, self.fullpath)
+        return True
+
+    def abort(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if self.temp_fullpath.exists():
+            self.temp_fullpath.unlink()
+
+
+def export_single_json_file(json_data: Dict[str, Any], fullpath: Path, json_format: Optional[str] = None) -> bool:
+    writer = JsonFileStreamWriter(fullpath, json_format)
+    if not writer.open():
         return False
-
-    if is_read_only(fullpath):
-        print(f"Cannot write to '{fullpath}': File is read-only.")
-        return False
-
-    with open(fullpath, 'w') as json_file:
-        json.dump(json_data, json_file, ensure_ascii=False, sort_keys=False, indent=4)
-    return True
-    return True
+    try:
+        writer.write_fields(json_data)
+    except Exception:
+        writer.abort()
+        raise
+    return writer.close()
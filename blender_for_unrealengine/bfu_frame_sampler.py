@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Frame sampler shared by the animated data evaluators (cameras, focus distances, matrices...).
+# Consumers register the values they need for each frame,
+# then the timeline is stepped only once for all the consumers.
+
+import math
+import bpy
+import numpy as np
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+from . import bfu_utils
+
+FrameFilter = Callable[[float], bool]
+ChannelGetter = Callable[[float], Union[float, Sequence[float]]]
+
+
+class FrameSampleConsumer():
+    # frame_range limits the consumer to [start, end) inside the sampler frames.
+    def __init__(self, frame_filter: Optional[FrameFilter], frame_range: Optional[Tuple[float, float]]):
+        self.frame_filter: Optional[FrameFilter] = frame_filter
+        self.frame_range: Optional[Tuple[float, float]] = frame_range
+
+    def get_frame_mask(self, frames: np.ndarray) -> np.ndarray:
+        mask = get_frame_filter_mask(self.frame_filter, frames)
+        if self.frame_range is not None:
+            mask &= (frames >= self.frame_range[0]) & (frames < self.frame_range[1])
+        return mask
+
+
+class FrameSampleChannel(FrameSampleConsumer):
+    # Values of one consumer, written in a preallocated array.
+    # values[i] is the value at frames[i], only valid where mask[i] is True.
+    def __init__(self, getter: ChannelGetter, width: int, frames: np.ndarray, frame_filter: Optional[FrameFilter], frame_range: Optional[Tuple[float, float]]):
+        super().__init__(frame_filter, frame_range)
+        self.getter: ChannelGetter = getter
+        self.width: int = width
+        self.frames: np.ndarray = frames
+        self.values: np.ndarray = np.empty((len(frames), width), dtype=np.float64)
+        self.mask: np.ndarray = np.zeros(len(frames), dtype=bool)  # Set by FrameSampler.sample()
+
+    def get_frames(self) -> np.ndarray:
+        # Sampled frames.
+        return self.frames[self.mask]
+
+    def get_values(self) -> np.ndarray:
+        # (sampled frames, width) values.
+        return self.values[self.mask]
+
+
+class FrameSampleCallback(FrameSampleConsumer):
+    # Consumer with its own storage, called after each frame change.
+    def __init__(self, callback: Callable[[float], None], frame_filter: Optional[FrameFilter], frame_range: Optional[Tuple[float, float]]):
+        super().__init__(frame_filter, frame_range)
+        self.callback: Callable[[float], None] = callback
+
+
+class FrameSampler():
+
+    def __init__(self, frame_start: float, frame_end: float, frame_step: float = 1.0):
+        # Frames from frame_start to frame_end (excluded), sub frames are supported with frame_step < 1.
+        if frame_step <= 0:
+            raise ValueError("frame_step need be greater than 0.")
+        self.frames = np.arange(frame_start, frame_end, frame_step, dtype=np.float64)
+        self.channels: List[FrameSampleChannel] = []
+        self.callbacks: List[FrameSampleCallback] = []
+
+    def get_frame_count(self) -> int:
+        return len(self.frames)
+
+    def add_channel(
+        self,
+        getter: ChannelGetter,
+        width: int = 1,
+        frame_filter: Optional[FrameFilter] = None,
+        frame_range: Optional[Tuple[float, float]] = None
+    ) -> FrameSampleChannel:
+        # getter(frame) returns the width values of the frame, they are written in channel.values.
+        channel = FrameSampleChannel(getter, width, self.frames, frame_filter, frame_range)
+        self.channels.append(channel)
+        return channel
+
+    def add_attribute_channel(
+        self,
+        owner: bpy.types.bpy_struct,
+        data_path: str,
+        width: int = 1,
+        frame_filter: Optional[FrameFilter] = None,
+        frame_range: Optional[Tuple[float, float]] = None
+    ) -> FrameSampleChannel:
+        # Channel of an attribute of owner, Eg. (camera, "matrix_world") or (camera.data, "lens").
+        if width == 1:
+            return self.add_channel(lambda frame: owner.path_resolve(data_path), width, frame_filter, frame_range)
+        # Matrices are flattened row by row.
+        return self.add_channel(lambda frame: np.ravel(owner.path_resolve(data_path)), width, frame_filter, frame_range)
+
+    def add_frame_callback(
+        self,
+        callback: Callable[[float], None],
+        frame_filter: Optional[FrameFilter] = None,
+        frame_range: Optional[Tuple[float, float]] = None
+    ) -> None:
+        self.callbacks.append(FrameSampleCallback(callback, frame_filter, frame_range))
+
+    def sample(self) -> None:
+        # Step the timeline once and sample all the consumers.
+        scene = bpy.context.scene
+        if scene is None:
+            return
+
+        save_frame = scene.frame_current
+        save_subframe = scene.frame_subframe
+
+        # Frames requested by each consumer, computed once for the whole range.
+        for channel in self.channels:
+            channel.mask = channel.get_frame_mask(self.frames)
+        callback_masks = [c.get_frame_mask(self.frames) for c in self.callbacks]
+
+        try:
+            for index, frame in enumerate(self.frames.tolist()):
+                frame_channels = [c for c in self.channels if c.mask[index]]
+                frame_callbacks = [c for c, mask in zip(self.callbacks, callback_masks) if mask[index]]
+                if not frame_channels and not frame_callbacks:
+                    # Nothing requested for this frame, avoid the depsgraph update.
+                    continue
+
+                int_frame = math.floor(frame)
+                scene.frame_set(int_frame, subframe=frame - int_frame)
+                for channel in frame_channels:
+                    channel.values[index] = channel.getter(frame)
+                for frame_callback in frame_callbacks:
+                    frame_callback.callback(frame)
+        finally:
+            # Also restore the frame when a consumer failed.
+            scene.frame_set(save_frame, subframe=save_subframe)
+
+
+def get_frame_filter_mask(frame_filter: Optional[FrameFilter], frames: np.ndarray) -> np.ndarray:
+    # Frames accepted by the filter, with the bulk method of the filter when it has one.
+    if frame_filter is None:
+        return np.ones(len(frames), dtype=bool)
+    if isinstance(frame_filter, CameraCutFrameFilter):
+        return frame_filter.get_frame_mask(frames)
+    return np.fromiter((frame_filter(frame) for frame in frames.tolist()), dtype=bool, count=len(frames))
+
+
+class CameraCutFrameFilter():
+    # Frames where the camera is used by a timeline marker.
+
+    def __init__(self, camera: bpy.types.Object, timeline_marker_sequence: bfu_utils.TimelineMarkerSequence):
+        self.timeline_marker_sequence = timeline_marker_sequence
+        # For each marker sequence, True when it uses the camera. The last item is for the frames without sequence (-1).
+        self.sequence_use_camera = np.array(
+            [bool(s.marker and s.marker.camera == camera) for s in timeline_marker_sequence.marker_sequences] + [False],
+            dtype=bool
+        )
+
+    def __call__(self, frame: float) -> bool:
+        return bool(self.sequence_use_camera[self.timeline_marker_sequence.get_marker_sequence_index_at_frame(int(frame))])
+
+    def get_frame_mask(self, frames: np.ndarray) -> np.ndarray:
+        return self.sequence_use_camera[self.timeline_marker_sequence.get_marker_sequence_indices(frames)]
+
+
+def get_camera_cut_frame_filter(camera: bpy.types.Object, timeline_marker_sequence: Optional[bfu_utils.TimelineMarkerSequence] = None) -> Optional[FrameFilter]:
+    # Filter the frames where the camera is used by a timeline marker.
+    # Returns None when the scene has no timeline markers.
+    if timeline_marker_sequence is None:
+        timeline_marker_sequence = bfu_utils.TimelineMarkerSequence()
+    if len(timeline_marker_sequence.marker_sequences) == 0:
+        return None
+
+    return CameraCutFrameFilter(camera, timeline_marker_sequence)
@@ -29,6 +29,7 @@ from . import import_module_post_treatment
 from . import asset_import
 from . import asset_import
 from . import sequencer_import
+from . import sequencer_track_format
 from . import sequencer_utils
 from . import bfu_import_animations
 from . import bfu_import_lods
@@ -57,6 +58,8 @@ if "asset_import" in locals():
     importlib.reload(asset_import)
 if "sequencer_import" in locals():
     importlib.reload(sequencer_import)
+if "sequencer_track_format" in locals():
+    importlib.reload(sequencer_track_format)
 if "sequencer_utils" in locals():
     importlib.reload(sequencer_utils)
 if "bfu_import_animations" in locals():
@@ -508,11 +508,16 @@ def import_all_assets(assets_data: Dict[str, Any], show_finished_popup: bool = T
     import_counter = 0
     imported_list = []
     import_fail_list = []
+    skipped_list = []
 
     def get_asset_by_type(types: List[str]) -> List[Dict[str, Any]]:
         target_assets: List[Dict[str, Any]] = []
         for asset in assets_data["assets"]:
             if asset["asset_type"] in types:
+                if asset.get("export_skipped", False):
+                    # Asset not changed since the last export, no need to import it again.
+                    skipped_list.append(asset)
+                    continue
                 target_assets.append(asset)
         return target_assets
 
@@ -576,6 +581,7 @@ def import_all_assets(assets_data: Dict[str, Any], show_finished_popup: bool = T
     import_log.append('Imported Alembic: '+str(len(Alembic_ImportedList)))
     import_log.append('Imported Animation: '+str(len(Animation_ImportedList)))
     import_log.append('Import failled: '+str(len(import_fail_list)))
+    import_log.append('Skipped unchanged: '+str(len(skipped_list)))
 
     for import_row in import_log:
         print(import_row)
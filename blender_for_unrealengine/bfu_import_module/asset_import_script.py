@@ -16,33 +16,17 @@
 import importlib
 import importlib.util
 import os
-import sys
-import json
 
-def JsonLoad(json_file):
-    # Changed in Python 3.9: The keyword argument encoding has been removed.
-    if sys.version_info >= (3, 9):
-        return json.load(json_file)
-    else:
-        return json.load(json_file, encoding="utf8")
-
-
-def JsonLoadFile(json_file_path):
-    if sys.version_info[0] < 3:
-        with open(json_file_path, "r") as json_file:
-            return JsonLoad(json_file)
-    else:
-        with open(json_file_path, "r", encoding="utf8") as json_file:
-            return JsonLoad(json_file)
+# Addon path, set by Blender when the script is written next to the data file.
+ADDON_PATH = ""
 
 def RunImportScriptWithJsonData():
     # Prepare process import
     json_data_file = 'ImportAssetData.json'
     dir_path = os.path.dirname(os.path.realpath(__file__))
     import_file_path = os.path.join(dir_path, json_data_file)
-    assets_data = JsonLoadFile(import_file_path)
     
-    file_path = os.path.join(assets_data["info"]["addon_path"],'run_unreal_import_script.py')
+    file_path = os.path.join(ADDON_PATH,'run_unreal_import_script.py')
     spec = importlib.util.spec_from_file_location("__import_assets__", file_path)
     module = importlib.util.module_from_spec(spec)
 
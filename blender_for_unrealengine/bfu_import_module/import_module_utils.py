@@ -10,7 +10,7 @@
 import sys
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from . import config
 
 
@@ -22,13 +22,47 @@ def json_load(json_file: object) -> Dict[str, Any]:
         return json.load(json_file, encoding="utf8")
 
 
-def json_load_file(json_file_path: Path) -> Dict[str, Any]:
+# First record of the NDJSON data files written by Blender.
+NDJSON_FORMAT_KEY = "bfu_ndjson_format"
+# Blender writes the NDJSON records without spaces, the format is detected without parsing the file.
+NDJSON_FIRST_RECORD_PREFIX = '{"key":"' + NDJSON_FORMAT_KEY + '"'
+
+
+def json_open_file(json_file_path: Path):
     if sys.version_info[0] < 3:
-        with open(json_file_path, "r") as json_file:
-            return json_load(json_file)
+        return open(json_file_path, "r")
     else:
-        with open(json_file_path, "r", encoding="utf8") as json_file:
-            return json_load(json_file)
+        return open(json_file_path, "r", encoding="utf8")
+
+
+def json_iter_records(json_file_path: Path) -> Iterator[Dict[str, Any]]:
+    # Streaming reader, yields the NDJSON records while the file is read.
+    # A JSON object file is loaded at once and yields one record per field.
+    with json_open_file(json_file_path) as json_file:
+        if json_file.read(len(NDJSON_FIRST_RECORD_PREFIX)) == NDJSON_FIRST_RECORD_PREFIX:
+            json_file.readline()  # End of the format record.
+            for line in json_file:
+                if not line.endswith("\n"):
+                    # Last record still written by Blender.
+                    break
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        json_file.seek(0)
+        for key, value in json_load(json_file).items():
+            yield {"key": key, "value": value}
+
+
+def json_load_file(json_file_path: Path) -> Dict[str, Any]:
+    # Supports JSON object files and NDJSON files.
+    data: Dict[str, Any] = {}
+    for record in json_iter_records(json_file_path):
+        if "item" in record:
+            data.setdefault(record["key"], []).append(record["item"])
+        else:
+            data[record["key"]] = record["value"]
+    return data
 
 def print_debug_step(*args: object):
     if config.print_debug_steps:
@@ -44,6 +44,7 @@ def create_sequencer(sequence_data: Dict[str, Any], show_finished_popup: bool =
 
     seq = sequencer_utils.create_new_sequence()
     print("Sequencer reference created", seq)
+    sequencer_utils.reset_keys_timing_report()
 
     # Process import
     bpl.advprint.print_simple_title("Import started !")
@@ -99,6 +100,7 @@ def create_sequencer(sequence_data: Dict[str, Any], show_finished_popup: bool =
     # Import result
 
     bpl.advprint.print_simple_title("Imports completed !")
+    sequencer_utils.print_keys_timing_report()
     ImportedCameraStr = []
     for cam in imported_cameras:
         ImportedCameraStr.append(cam[0])
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Read the animated tracks written by Blender.
+# Supports the columnar format (bfu_camera/bfu_camera_track_format.py)
+# and the legacy {frame: value} format.
+# Only uses the standard library, NumPy is not always available in Unreal Engine.
+
+import array
+import base64
+import sys
+from typing import Dict, Any, List, Tuple
+
+TRACK_FORMAT_NAME = "columnar"
+SINGLE_VALUE_CHANNEL = "value"
+
+ChannelKeys = Tuple[List[int], List[Any]]
+
+
+def is_columnar_track(track: Any) -> bool:
+    return isinstance(track, dict) and track.get("track_format") == TRACK_FORMAT_NAME
+
+
+def decode_frames(frames_data: Dict[str, Any]) -> List[int]:
+    if "values" in frames_data:
+        return [int(frame) for frame in frames_data["values"]]
+    start = int(frames_data["start"])
+    step = int(frames_data["step"])
+    return list(range(start, start + step * int(frames_data["count"]), step))
+
+
+def decode_packed_values(channel_data: Dict[str, Any]) -> List[float]:
+    dtype: str = channel_data.get("dtype", "<f4")
+    typecode = {"<f4": "f", "<f8": "d"}.get(dtype)
+    if typecode is None:
+        raise ValueError(f"Unsupported track dtype: {dtype}")
+    values = array.array(typecode)
+    values.frombytes(base64.b64decode(channel_data["base64"]))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+def get_columnar_channel_keys(track: Dict[str, Any]) -> Dict[str, ChannelKeys]:
+    frames = decode_frames(track["frames"])
+    is_bool = track.get("value_type") == "bool"
+    channels: Dict[str, ChannelKeys] = {}
+    for channel_name, channel_data in track["channels"].items():
+        if "constant" in channel_data:
+            # A single key give the same result for a constant channel.
+            channel_frames = frames[:1]
+            values = [channel_data["constant"]] * len(channel_frames)
+        elif "base64" in channel_data:
+            channel_frames = frames
+            values = decode_packed_values(channel_data)
+        else:
+            channel_frames = frames
+            values = list(channel_data["values"])
+
+        if len(values) != len(channel_frames):
+            raise ValueError(f"Track channel {channel_name} has {len(values)} values for {len(channel_frames)} frames.")
+        if is_bool:
+            values = [value > 0.5 for value in values]
+        channels[channel_name] = (channel_frames, values)
+    return channels
+
+
+def get_legacy_channel_keys(track: Dict[str, Any]) -> Dict[str, ChannelKeys]:
+    # Legacy format: {frame: value} or {frame: {channel: value}}
+    frames = [int(key) for key in track.keys()]
+    values = list(track.values())
+    if len(values) == 0:
+        return {}
+    if isinstance(values[0], dict):
+        return {channel_name: (frames, [value[channel_name] for value in values]) for channel_name in values[0].keys()}
+    return {SINGLE_VALUE_CHANNEL: (frames, values)}
+
+
+def get_track_channel_keys(track: Dict[str, Any]) -> Dict[str, ChannelKeys]:
+    # Returns {channel_name: (frames, values)}
+    if is_columnar_track(track):
+        return get_columnar_channel_keys(track)
+    return get_legacy_channel_keys(track)
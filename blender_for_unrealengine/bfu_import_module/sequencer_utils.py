@@ -7,9 +7,11 @@
 #  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
 # ----------------------------------------------
 
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List, Set
 import unreal
+from . import bpl
 from . import import_module_unreal_utils
+from . import sequencer_track_format
 
 # Since 5.1 MovieSceneBindingProxy replace SequencerBindingProxy.
 use_movie_scene = import_module_unreal_utils.get_unreal_version() > (5,1,0)
@@ -52,42 +54,114 @@ if sequencer_scripting_active:
         else:
             return section.get_channels()
 
+    # Keys added by add_key() in the fallback are grouped in chunks to update the progress.
+    KEYS_CHUNK_SIZE = 2000
+
+    class SequencerKeysTimingReport():
+        # Time spent to add the keys, by track type.
+        def __init__(self):
+            self.tracks: Dict[str, List[Any]] = {}  # {track_type: [track_count, key_count, time, bulk_track_count]}
+            self.bulk_fallbacks: List[str] = []  # Channel types where the bulk setter was rejected.
+
+        def add_track(self, track_type: str, key_count: int, elapsed_time: float, use_bulk: bool):
+            track = self.tracks.setdefault(track_type, [0, 0, 0.0, 0])
+            track[0] += 1
+            track[1] += key_count
+            track[2] += elapsed_time
+            track[3] += 1 if use_bulk else 0
+
+        def add_bulk_fallback(self, channel_type: str, error: Exception):
+            self.bulk_fallbacks.append(f"{channel_type} ({type(error).__name__}: {error})")
+
+        def print_report(self):
+            print("Sequencer keys import time:")
+            for track_type, (track_count, key_count, elapsed_time, bulk_track_count) in self.tracks.items():
+                print(f" - {track_type}: {track_count} track(s), {key_count} key(s) in {bpl.utils.get_formatted_time(elapsed_time)} ({bulk_track_count} track(s) with bulk keys)")
+            for bulk_fallback in self.bulk_fallbacks:
+                print(f" - Bulk keys not supported, fallback to add_key(): {bulk_fallback}")
+
+    keys_timing_report = SequencerKeysTimingReport()
+
+    def reset_keys_timing_report():
+        global keys_timing_report
+        keys_timing_report = SequencerKeysTimingReport()
+
+    def print_keys_timing_report():
+        keys_timing_report.print_report()
+
+    def get_channel_bulk_add_keys(section_channel):
+        # Bulk key setters are not exposed by all the engine versions and channel types.
+        for method_name in ("add_keys", "set_keys"):
+            method = getattr(section_channel, method_name, None)
+            if method is not None:
+                return method
+        return None
+
+    def add_channel_keys_by_chunks(section_channel, frames: List[int], values: List[Any]):
+        chunk_count = (len(frames) + KEYS_CHUNK_SIZE - 1) // KEYS_CHUNK_SIZE
+        with unreal.ScopedSlowTask(chunk_count, "Add sequencer keys") as slow_task:
+            for chunk_start in range(0, len(frames), KEYS_CHUNK_SIZE):
+                slow_task.enter_progress_frame(1)
+                chunk_end = chunk_start + KEYS_CHUNK_SIZE
+                for frame, value in zip(frames[chunk_start:chunk_end], values[chunk_start:chunk_end]):
+                    section_channel.add_key(unreal.FrameNumber(frame), value)
+
+    # Channel types where the bulk setter failed, they use add_key() for the rest of the import.
+    bulk_add_keys_failed_types: Set[str] = set()
+
+    def add_channel_keys(section_channel, frames: List[int], values: List[Any]) -> bool:
+        # Returns True when the bulk setter was used.
+        channel_type = type(section_channel).__name__
+        bulk_add_keys = get_channel_bulk_add_keys(section_channel)
+        if bulk_add_keys is not None and len(frames) > 1 and channel_type not in bulk_add_keys_failed_types:
+            try:
+                bulk_add_keys([unreal.FrameNumber(frame) for frame in frames], values)
+                return True
+            except (TypeError, AttributeError) as e:
+                # Different signature or unsupported values in this engine version, the call is rejected before any key is added.
+                # Other errors are not caught because keys may be already added.
+                bulk_add_keys_failed_types.add(channel_type)
+                keys_timing_report.add_bulk_fallback(channel_type, e)
+
+        if len(frames) > KEYS_CHUNK_SIZE:
+            add_channel_keys_by_chunks(section_channel, frames, values)
+        else:
+            for frame, value in zip(frames, values):
+                section_channel.add_key(unreal.FrameNumber(frame), value)
+        return False
+
+    def AddSequencerSectionKeysByChannels(section: unreal.MovieSceneSection, track: Dict[str, Any], channel_names: List[str], track_type: str):
+        # Channels keys are added column by column, the section channels are read only once.
+        counter = bpl.utils.CounterTimer()
+        track_channel_keys = sequencer_track_format.get_track_channel_keys(track)
+        section_channels = get_section_all_channel(section)
+        key_count = 0
+        use_bulk = True
+        for section_channel, channel_name in zip(section_channels, channel_names):
+            if channel_name not in track_channel_keys:
+                continue
+            frames, values = track_channel_keys[channel_name]
+            if not add_channel_keys(section_channel, frames, values):
+                use_bulk = False
+            key_count += len(frames)
+        keys_timing_report.add_track(track_type, key_count, counter.get_time(), use_bulk)
+
     def AddSequencerSectionTransformKeysByIniFile(section: unreal.MovieSceneSection, track_dict: Dict[str, Any]):
-        for key in track_dict.keys():
-            value = track_dict[key]  # (x,y,z x,y,z x,y,z)
-            frame = unreal.FrameNumber(int(key))
-
-            get_section_all_channel(section)[0].add_key(frame, value["location_x"])
-            get_section_all_channel(section)[1].add_key(frame, value["location_y"])
-            get_section_all_channel(section)[2].add_key(frame, value["location_z"])
-            get_section_all_channel(section)[3].add_key(frame, value["rotation_x"])
-            get_section_all_channel(section)[4].add_key(frame, value["rotation_y"])
-            get_section_all_channel(section)[5].add_key(frame, value["rotation_z"])
-            get_section_all_channel(section)[6].add_key(frame, value["scale_x"])
-            get_section_all_channel(section)[7].add_key(frame, value["scale_y"])
-            get_section_all_channel(section)[8].add_key(frame, value["scale_z"])
+        channel_names = [
+            "location_x", "location_y", "location_z",
+            "rotation_x", "rotation_y", "rotation_z",
+            "scale_x", "scale_y", "scale_z",
+        ]
+        AddSequencerSectionKeysByChannels(section, track_dict, channel_names, "Transform")
 
     def AddSequencerSectionDoubleVectorKeysByIniFile(section, track_dict: Dict[str, Any]):
-        for key in track_dict.keys():
-            value = track_dict[key]  # (x,y,z x,y,z x,y,z)
-            frame = unreal.FrameNumber(int(key))
-
-            get_section_all_channel(section)[0].add_key(frame, value["x"])
-            get_section_all_channel(section)[1].add_key(frame, value["y"])
+        AddSequencerSectionKeysByChannels(section, track_dict, ["x", "y"], "Double Vector")
 
     def AddSequencerSectionFloatKeysByIniFile(section, track_dict: Dict[str, Any]):
-        for key in track_dict.keys():
-            frame = unreal.FrameNumber(int(key))
-            value = track_dict[key]
-
-            get_section_all_channel(section)[0].add_key(frame, value)
+        AddSequencerSectionKeysByChannels(section, track_dict, [sequencer_track_format.SINGLE_VALUE_CHANNEL], "Float")
 
     def AddSequencerSectionBoolKeysByIniFile(section, track_dict: Dict[str, Any]):
-        for key in track_dict.keys():
-            frame = unreal.FrameNumber(int(key))
-            value = track_dict[key]
-
-            get_section_all_channel(section)[0].add_key(frame, value)
+        AddSequencerSectionKeysByChannels(section, track_dict, [sequencer_track_format.SINGLE_VALUE_CHANNEL], "Bool")
 
     def create_new_sequence() -> unreal.LevelSequence:
         factory = unreal.LevelSequenceFactoryNew()
@@ -14,6 +14,7 @@ from . import bfu_light_map_props
 from . import bfu_light_map_operator
 from . import bfu_light_map_ui
 from . import bfu_light_map_utils
+from . import bfu_light_map_area
 
 if "bfu_light_map_props" in locals():
     importlib.reload(bfu_light_map_props)
@@ -23,6 +24,8 @@ if "bfu_light_map_ui" in locals():
     importlib.reload(bfu_light_map_ui)
 if "bfu_light_map_utils" in locals():
     importlib.reload(bfu_light_map_utils)
+if "bfu_light_map_area" in locals():
+    importlib.reload(bfu_light_map_area)
 
 classes = (
 )
@@ -33,9 +36,11 @@ def register():
         bpy.utils.register_class(cls)
 
     bfu_light_map_props.register()
+    bfu_light_map_area.register()
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    bfu_light_map_area.unregister()
     bfu_light_map_props.unregister()
\ No newline at end of file
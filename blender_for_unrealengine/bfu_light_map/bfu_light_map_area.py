@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Surface area used for the light map resolution.
+# Computed from the evaluated meshes of the object and its desired childs,
+# without duplicate, selection or view layer changes.
+# The area is measured in the object local space, like the joined mesh of the previous method.
+# Areas are cached per object and reused while the geometry and the relative transforms don't change.
+
+import bpy
+import mathutils
+import numpy as np
+from bpy.app.handlers import persistent
+from typing import List, Dict, Tuple, Optional, Any
+from .. import bfu_utils
+from .. import bfu_collision
+
+# Object types that can be converted to mesh. Curves are ignored like with the previous method.
+AREA_OBJECT_TYPES = {"MESH", "SURFACE", "META", "FONT"}
+
+AreaCacheKey = Tuple[Any, ...]
+
+
+def get_triangles_area(vertices: np.ndarray, triangles: np.ndarray) -> float:
+    # vertices: (n, 3) float64, triangles: (m, 3) vertex indices
+    if len(triangles) == 0:
+        return 0.0
+    a = vertices[triangles[:, 0]]
+    b = vertices[triangles[:, 1]]
+    c = vertices[triangles[:, 2]]
+    return float(np.linalg.norm(np.cross(b - a, c - a), axis=1).sum() * 0.5)
+
+
+def get_mesh_area(mesh: bpy.types.Mesh, matrix: mathutils.Matrix) -> float:
+    mesh.calc_loop_triangles()
+    vertex_count = len(mesh.vertices)
+    triangle_count = len(mesh.loop_triangles)
+    if vertex_count == 0 or triangle_count == 0:
+        return 0.0
+
+    coords = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    triangles = np.empty(triangle_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+
+    np_matrix = np.array(matrix, dtype=np.float64)
+    vertices = coords.reshape(vertex_count, 3).astype(np.float64) @ np_matrix[:3, :3].T + np_matrix[:3, 3]
+    return get_triangles_area(vertices, triangles.reshape(triangle_count, 3))
+
+
+def get_evaluated_object_area(evaluated_obj: bpy.types.Object, matrix: mathutils.Matrix) -> float:
+    mesh = evaluated_obj.to_mesh()
+    try:
+        if mesh is None:
+            return 0.0
+        return get_mesh_area(mesh, matrix)
+    finally:
+        evaluated_obj.to_mesh_clear()
+
+
+def is_area_source(obj: bpy.types.Object) -> bool:
+    if obj.type not in AREA_OBJECT_TYPES:
+        return False
+    if bfu_collision.bfu_collision_utils.is_a_collision(obj):
+        return False
+    return True
+
+
+def get_area_objects(obj: bpy.types.Object) -> List[bpy.types.Object]:
+    # Same objects as bfu_utils.SelectParentAndDesiredChilds()
+    view_layer = bpy.context.view_layer
+    objects: List[bpy.types.Object] = []
+    for child in bfu_utils.get_export_desired_childs(obj):
+        objects.append(child)
+    objects.append(obj)
+    if bfu_utils.GetExportAsProxy(obj):
+        proxy_child = bfu_utils.GetExportProxyChild(obj)
+        if proxy_child is not None:
+            objects.append(proxy_child)
+    return [item for item in dict.fromkeys(objects) if view_layer is None or item.name in view_layer.objects]
+
+
+def get_instanced_objects(obj: bpy.types.Object) -> List[bpy.types.Object]:
+    # Objects that can change the instances of obj.
+    if obj.instance_type == "COLLECTION" and obj.instance_collection:
+        return list(obj.instance_collection.all_objects)
+    if obj.instance_type in {"VERTS", "FACES"}:
+        return list(obj.children)
+    return []
+
+
+def get_matrix_key(matrix: mathutils.Matrix) -> Tuple[float, ...]:
+    return tuple(value for row in matrix for value in row)
+
+
+class LightMapAreaCache():
+
+    def __init__(self):
+        self.geometry_revisions: Dict[int, int] = {}
+        self.areas: Dict[int, Tuple[AreaCacheKey, float]] = {}
+
+    def clear(self) -> None:
+        self.geometry_revisions.clear()
+        self.areas.clear()
+
+    def mark_geometry_updated(self, obj: bpy.types.Object) -> None:
+        pointer = obj.as_pointer()
+        self.geometry_revisions[pointer] = self.geometry_revisions.get(pointer, 0) + 1
+
+    def get_object_key(self, obj: bpy.types.Object, area_objects: List[bpy.types.Object]) -> AreaCacheKey:
+        # Geometry revision and transform relative to obj for each object used in the area.
+        inverted_matrix = obj.matrix_world.inverted_safe()
+        key: List[Any] = []
+        for area_object in area_objects:
+            pointer = area_object.as_pointer()
+            key.append((pointer, self.geometry_revisions.get(pointer, 0), get_matrix_key(inverted_matrix @ area_object.matrix_world)))
+            for instanced_object in get_instanced_objects(area_object):
+                instanced_pointer = instanced_object.as_pointer()
+                key.append((instanced_pointer, self.geometry_revisions.get(instanced_pointer, 0), get_matrix_key(instanced_object.matrix_world)))
+        return tuple(key)
+
+    def get_cached_area(self, obj: bpy.types.Object, key: AreaCacheKey) -> Optional[float]:
+        cached = self.areas.get(obj.as_pointer())
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        return None
+
+    def set_cached_area(self, obj: bpy.types.Object, key: AreaCacheKey, area: float) -> None:
+        self.areas[obj.as_pointer()] = (key, area)
+
+
+light_map_area_cache = LightMapAreaCache()
+
+
+def compute_surface_area(obj: bpy.types.Object, area_objects: List[bpy.types.Object], depsgraph: bpy.types.Depsgraph) -> float:
+    inverted_matrix = obj.matrix_world.inverted_safe()
+    area = 0.0
+    instancers = set()
+    for area_object in area_objects:
+        if area_object.is_instancer:
+            instancers.add(area_object.as_pointer())
+        if is_area_source(area_object):
+            evaluated_obj = area_object.evaluated_get(depsgraph)
+            area += get_evaluated_object_area(evaluated_obj, inverted_matrix @ evaluated_obj.matrix_world)
+
+    if instancers:
+        # Instances are real objects with the previous method (duplicates_make_real).
+        for instance in depsgraph.object_instances:
+            if instance.is_instance and instance.parent and instance.parent.original.as_pointer() in instancers:
+                if is_area_source(instance.object.original):
+                    area += get_evaluated_object_area(instance.object, inverted_matrix @ instance.matrix_world)
+    return area
+
+
+def get_export_surface_area(obj: bpy.types.Object, depsgraph: Optional[bpy.types.Depsgraph] = None, use_cache: bool = True) -> float:
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    area_objects = get_area_objects(obj)
+    key = light_map_area_cache.get_object_key(obj, area_objects)
+    if use_cache:
+        cached_area = light_map_area_cache.get_cached_area(obj, key)
+        if cached_area is not None:
+            return cached_area
+
+    area = compute_surface_area(obj, area_objects, depsgraph)
+    light_map_area_cache.set_cached_area(obj, key, area)
+    return area
+
+
+@persistent
+def bfu_light_map_area_depsgraph_handler(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            light_map_area_cache.mark_geometry_updated(update.id.original)
+
+
+@persistent
+def bfu_light_map_area_clear_handler(*args: Any) -> None:
+    # Pointers are not valid after a load or an undo.
+    light_map_area_cache.clear()
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(bfu_light_map_area_depsgraph_handler)
+    bpy.app.handlers.frame_change_post.append(bfu_light_map_area_depsgraph_handler)
+    bpy.app.handlers.load_post.append(bfu_light_map_area_clear_handler)
+    bpy.app.handlers.undo_post.append(bfu_light_map_area_clear_handler)
+    bpy.app.handlers.redo_post.append(bfu_light_map_area_clear_handler)
+
+
+def unregister():
+    bpy.app.handlers.redo_post.remove(bfu_light_map_area_clear_handler)
+    bpy.app.handlers.undo_post.remove(bfu_light_map_area_clear_handler)
+    bpy.app.handlers.load_post.remove(bfu_light_map_area_clear_handler)
+    bpy.app.handlers.frame_change_post.remove(bfu_light_map_area_depsgraph_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(bfu_light_map_area_depsgraph_handler)
+    light_map_area_cache.clear()
@@ -10,64 +10,19 @@
 import bpy
 from typing import Dict, TYPE_CHECKING, Any, Optional, List
 from .. import bpl
-from .. import bbpl
-from .. import bfu_basics
 from .. import bfu_utils
 from .. import bfu_static_mesh
 from .. import bfu_export_control
-from .. import bfu_export
-from .. import bfu_collision
 from .. bfu_assets_manager.bfu_asset_manager_type import AssetType
 from . import bfu_light_map_props
+from . import bfu_light_map_area
 from .bfu_light_map_props import BFU_StaticMeshLightMapMode
 
 
 
 def GetExportRealSurfaceArea(obj: bpy.types.Object) -> float:
-
-    bbpl.scene_utils.move_to_global_view()
-    bbpl.utils.safe_mode_set('OBJECT')
-
-    SavedSelect = bbpl.save_data.select_save.UserSelectSave()
-    SavedSelect.save_current_select()
-    bfu_utils.SelectParentAndDesiredChilds(obj)
-
-    bpy.ops.object.duplicate()
-    bpy.ops.object.duplicates_make_real(
-        use_base_parent=True,
-        use_hierarchy=True
-        )
-    
-    view_layer = bpy.context.view_layer
-    if view_layer is None:
-        return 0.0
-
-    bfu_export.bfu_export_utils.apply_select_needed_modifiers_for_export()
-    bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-    for selectObj in bpy.context.selected_objects:
-        # Remove unable to convert mesh
-        if selectObj.type == "EMPTY" or selectObj.type == "CURVE":
-            bfu_utils.clean_delete_objects([selectObj])
-
-    for selectObj in bpy.context.selected_objects:
-        # Remove collision box
-        if bfu_collision.bfu_collision_utils.is_a_collision(selectObj):
-            bfu_utils.clean_delete_objects([selectObj])
-
-    if view_layer.objects.active is None:
-        # When the active id a empty
-        view_layer.objects.active = bpy.context.selected_objects[0]
-    bpy.ops.object.convert(target='MESH')
-
-    active = view_layer.objects.active
-
-    bfu_utils.CleanJoinSelect()
-    active = view_layer.objects.active
-    area = bfu_basics.get_surface_area(active)
-    bfu_utils.clean_delete_objects(bpy.context.selected_objects)
-    SavedSelect.reset_select()
-    bbpl.scene_utils.move_to_local_view()
-    return area
+    # Area of the evaluated meshes of the object and its desired childs.
+    return bfu_light_map_area.get_export_surface_area(obj)
 
 def GetCompuntedLightMap(obj: bpy.types.Object) -> int:
     if bfu_light_map_props.get_object_static_mesh_light_map_mode(obj).value == BFU_StaticMeshLightMapMode.DEFAULT.value:
@@ -114,9 +69,11 @@ def update_area_light_map_list(scene: bpy.types.Scene, objects_to_update: Option
 
     UpdatedRes = 0
 
+    # Evaluated once for all the objects, unchanged objects use the cached area.
+    depsgraph = bpy.context.evaluated_depsgraph_get()
     counter = bpl.utils.CounterTimer()
     for obj in objs:
-        bfu_light_map_props.get_object_computed_static_mesh_light_map_res(obj)
+        obj.bfu_computed_static_mesh_light_map_res = bfu_light_map_area.get_export_surface_area(obj, depsgraph)  # type: ignore[attr-defined]
         UpdatedRes += 1
         bfu_utils.update_progress("Update LightMap",(UpdatedRes/len(objs)),counter.get_time())
     return UpdatedRes
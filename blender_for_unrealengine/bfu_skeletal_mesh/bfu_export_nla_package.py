@@ -139,7 +139,7 @@ def process_nla_anim_export(
         scene.unit_settings.scale_length = 0.01
         my_skeletal_export_scale = bfu_utils.SkeletalExportScale(active)
         my_skeletal_export_scale.apply_skeletal_export_scale(rrf, target_animation_data=animation_data)
-        my_action_curve_scale = bfu_utils.ActionCurveScale(rrf*active.scale.z)
+        my_action_curve_scale = bfu_utils.ActionCurveScale(rrf*active.scale.z, list(bpy.context.selected_objects))
         my_action_curve_scale.rescale_for_export()
         my_shape_keys_curve_scale = bfu_utils.ShapeKeysCurveScale(rrf)
         my_shape_keys_curve_scale.rescale_for_unreal_engine()
@@ -289,8 +289,7 @@ def process_nla_anim_export(
     if not is_library:
         bfu_utils.clean_delete_objects(bpy.context.selected_objects)
 
-        for data in duplicate_data.data_to_remove:
-            data.remove_data()
+        duplicate_data.remove_duplicated_data()
 
         duplicate_data.reset_duplicate_name_after_export()
 
@@ -271,8 +271,7 @@ def export_as_skeletal_mesh(
     else:
         bfu_utils.clean_delete_objects(bpy.context.selected_objects)
 
-        for data in duplicate_data.data_to_remove:
-            data.remove_data()
+        duplicate_data.remove_duplicated_data()
 
         duplicate_data.reset_duplicate_name_after_export()
 
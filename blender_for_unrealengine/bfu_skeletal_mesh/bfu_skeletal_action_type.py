@@ -145,6 +145,7 @@ class BFU_SkeletalActionAnimation(BFU_ObjectAssetClass):
                 frame_range = bfu_skeletal_action_utils.get_desired_action_start_end_range(data, details)
                 pak.set_frame_range(frame_range[0], frame_range[1])
                 pak.export_function = bfu_export_action_package.process_action_animation_export_from_package
+                pak.export_session_key = bfu_export_action_package.get_action_export_session_key(pak.objects[0], pak.objects[1:])
                             
         # Set the additional data in the asset, add asset to the list and return the list.
         self.set_additional_data_in_asset(asset, data, details, search_mode)
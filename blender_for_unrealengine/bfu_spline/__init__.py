@@ -15,6 +15,7 @@ from . import bfu_spline_props
 from . import bfu_spline_ui
 from . import bfu_spline_utils
 from . import bfu_spline_unreal_utils
+from . import bfu_spline_evaluate
 from . import bfu_spline_data
 from . import bfu_spline_write_text
 from . import bfu_spline_write_paste_commands
@@ -31,6 +32,8 @@ if "bfu_spline_utils" in locals():
     importlib.reload(bfu_spline_utils)
 if "bfu_spline_unreal_utils" in locals():
     importlib.reload(bfu_spline_unreal_utils)
+if "bfu_spline_evaluate" in locals():
+    importlib.reload(bfu_spline_evaluate)
 if "bfu_spline_data" in locals():
     importlib.reload(bfu_spline_data)
 if "bfu_spline_write_text" in locals():
@@ -10,11 +10,13 @@
 import bpy
 import math
 import mathutils
-from typing import Dict, Any, List, Union, TYPE_CHECKING, Optional, Tuple
+import numpy as np
+from typing import Dict, Any, List, TYPE_CHECKING, Optional, Tuple
 from .. import bbpl
 from .. import bpl
 from . import bfu_spline_utils
 from . import bfu_spline_unreal_utils
+from . import bfu_spline_evaluate
 
 def float_as_ue(my_float: float) -> str:
     return "{:.6f}".format(my_float)
@@ -34,9 +36,52 @@ def quad_as_ue(quad_data: mathutils.Quaternion) -> Dict[str, str]:
     quad["W"] = "{:.6f}".format(quad_data.w)
     return quad
 
+def get_ue_interp_curve_mode(point_type: str) -> str:
+    if point_type in ["BEZIER"]:
+        return "CIM_CurveUser"
+    elif point_type in ["NURBS"]:
+        return "CIM_CurveAuto"
+    elif point_type in ["POLY"]:
+        return "CIM_Linear" 
+    return "CIM_CurveAuto"
+
+def get_out_val_rotation_from_up_vector(in_up_vector: mathutils.Vector) -> mathutils.Quaternion:
+    default_up = mathutils.Vector((0, 0, 1))
+    
+    if in_up_vector.dot(default_up) >= 1.0:
+        # Same direction
+        return mathutils.Quaternion()
+    elif in_up_vector.dot(default_up) <= -1.0:
+        # Opposite direction
+        # Choose an arbitrary axis perpendicular to default_up
+        ortho = mathutils.Vector((1, 0, 0)) if abs(default_up.x) < 0.99 else mathutils.Vector((0, 1, 0))
+        axis: mathutils.Vector = default_up.cross(ortho)  # type: ignore
+        axis = axis.normalized()
+        return mathutils.Quaternion(axis, math.pi)
+
+    return default_up.rotation_difference(in_up_vector)
+
+def get_tangent_rotation_from_up_vector(spline_rot_up_vector: mathutils.Vector) -> mathutils.Quaternion:
+    spline_rot_up_vector = spline_rot_up_vector * 0.5
+    spline_z_up_vector = mathutils.Vector((0, 0, 0.5))  # Unreal Engine Z-up vector
+    tan = spline_z_up_vector + (spline_rot_up_vector - spline_z_up_vector) * 0.5  # Calculate the tangent vector
+
+    # Save the vector in a quaternion format.
+    # Unreal Engine uses a quaternion to store the tangent vector here.
+
+    # X -> Y
+    # -Y -> X
+    # Z -> w
+    quat = mathutils.Quaternion((0, 0, 0, 1))
+    quat.w = tan.z
+    quat.x = -tan.y
+    quat.y = tan.x
+    quat.z = 0
+    return quat
+
 class BFU_SimpleSplinePoint():
 
-    def __init__(self, current_index: int, spline_owner: 'BFU_SimpleSpline', spline_obj: bpy.types.Object, point_data: Union[bpy.types.SplinePoint, bpy.types.BezierSplinePoint], point_type: str):
+    def __init__(self, current_index: int, spline_owner: 'BFU_SimpleSpline'):
 
         """
         # Please notes:
@@ -50,27 +95,17 @@ class BFU_SimpleSplinePoint():
         self.current_index: int = current_index
         self.spline_owner: 'BFU_SimpleSpline' = spline_owner
 
-        # Context stats
-        self.position: mathutils.Vector = mathutils.Vector((0,0,0))
-        self.handle_left: mathutils.Vector = mathutils.Vector((0,0,0)) 
-        self.handle_left_type = "FREE"
-        self.handle_right: mathutils.Vector = mathutils.Vector((0,0,0)) 
-        self.handle_right_type = "FREE"
-        self.curve_roll: float = self.get_curve_roll(spline_obj, point_data)
-        self.curve_radius: float = point_data.radius
-
-        self.point_type = point_type
-
-        if point_type in ["BEZIER"]:
-            if isinstance(point_data, bpy.types.BezierSplinePoint):
-                self.set_point_from_bezier(point_data)
-        elif point_type in ["NURBS"]:
-            print("NURBS curves need to be resampled!")
-        elif point_type in ["POLY"]:
-            if isinstance(point_data, bpy.types.SplinePoint):
-                self.set_point_from_poly(point_data)
-
+        # Context stats, from the evaluated points of the spline owner.
+        points = spline_owner.evaluated_points
+        self.position: mathutils.Vector = mathutils.Vector(points.positions[current_index])
+        self.handle_left: mathutils.Vector = mathutils.Vector(points.handles_left[current_index])
+        self.handle_left_type = "VECTOR"
+        self.handle_right: mathutils.Vector = mathutils.Vector(points.handles_right[current_index])
+        self.handle_right_type = "VECTOR"
+        self.curve_roll: float = float(points.tilts[current_index])
+        self.curve_radius: float = float(points.radii[current_index])
 
+        self.point_type = points.point_type
 
     def get_previous_point(self) -> Optional['BFU_SimpleSplinePoint']:
         return self.spline_owner.spline_points.get(self.current_index - 1)
@@ -78,38 +113,6 @@ class BFU_SimpleSplinePoint():
     def get_next_point(self) -> Optional['BFU_SimpleSplinePoint']:
         return self.spline_owner.spline_points.get(self.current_index + 1)
 
-    def get_curve_roll(self, spline_obj: bpy.types.Object, point_data: Union[bpy.types.SplinePoint, bpy.types.BezierSplinePoint]) -> float:
-        if isinstance(point_data, bpy.types.BezierSplinePoint):
-            if isinstance(spline_obj.data, bpy.types.Curve):
-                # For the momment roll work only with Z_UP mode.
-                # Need a way to evaluate the roll at spline points.
-                # It possible to brut force using a PathDummy with Follow Path constraint but that very heavy...
-                # Please.
-                if spline_obj.data.twist_mode == 'Z_UP':
-                    return point_data.tilt
-        else:
-            return point_data.tilt
-            
-        return 0.0
-    
-    def set_point_from_bezier(self, point_data: bpy.types.BezierSplinePoint):
-        self.handle_left_type = "VECTOR"
-        self.handle_right_type = "VECTOR"
-        self.position = point_data.co.copy()
-        self.handle_left = point_data.handle_left.copy()
-        self.handle_right = point_data.handle_right.copy()
-
-    def set_point_from_poly(self, point_data: bpy.types.SplinePoint):
-        self.handle_left_type = "VECTOR"
-        self.handle_right_type = "VECTOR"
-        real_position = mathutils.Vector((0,0,0))
-        real_position.x = point_data.co.x
-        real_position.y = point_data.co.y
-        real_position.z = point_data.co.z
-        self.position = real_position
-        self.handle_left = real_position
-        self.handle_right = real_position
-
     def get_ue_position(self) -> mathutils.Vector:
         """
         Converts the Blender point position to Unreal.
@@ -183,20 +186,7 @@ class BFU_SimpleSplinePoint():
         degrees_yaw = math.degrees(yaw)
 
         in_up_vector = self.rotator_to_up_vector_fixed(degrees_roll, degrees_pitch, degrees_yaw)
-        default_up = mathutils.Vector((0, 0, 1))
-        
-        if in_up_vector.dot(default_up) >= 1.0:
-            # Same direction
-            return mathutils.Quaternion()
-        elif in_up_vector.dot(default_up) <= -1.0:
-            # Opposite direction
-            # Choose an arbitrary axis perpendicular to default_up
-            ortho = mathutils.Vector((1, 0, 0)) if abs(default_up.x) < 0.99 else mathutils.Vector((0, 1, 0))
-            axis: mathutils.Vector = default_up.cross(ortho)  # type: ignore
-            axis = axis.normalized()
-            return mathutils.Quaternion(axis, math.pi)
-
-        return default_up.rotation_difference(in_up_vector)
+        return get_out_val_rotation_from_up_vector(in_up_vector)
 
 
     def get_arrive_tangent_rotation(self) -> mathutils.Quaternion:
@@ -254,23 +244,7 @@ class BFU_SimpleSplinePoint():
         degrees_yaw = math.degrees(yaw)
 
         spline_rot_up_vector = self.rotator_to_up_vector_fixed(degrees_roll, degrees_pitch, degrees_yaw)
-
-        spline_rot_up_vector *= 0.5
-        spline_z_up_vector = mathutils.Vector((0, 0, 0.5))  # Unreal Engine Z-up vector
-        tan = spline_z_up_vector + (spline_rot_up_vector - spline_z_up_vector) * 0.5  # Calculate the tangent vector
-
-        # Save the vector in a quaternion format.
-        # Unreal Engine uses a quaternion to store the tangent vector here.
-
-        # X -> Y
-        # -Y -> X
-        # Z -> w
-        quat = mathutils.Quaternion((0, 0, 0, 1))
-        quat.w = tan.z
-        quat.x = -tan.y
-        quat.y = tan.x
-        quat.z = 0
-        return quat
+        return get_tangent_rotation_from_up_vector(spline_rot_up_vector)
 
 
     def get_human_readable_ue_rotation(self) -> str:
@@ -292,13 +266,7 @@ class BFU_SimpleSplinePoint():
         return ue_scale
 
     def get_ue_interp_curve_mode(self) -> str:
-        if self.point_type in ["BEZIER"]:
-            return "CIM_CurveUser"
-        elif self.point_type in ["NURBS"]:
-            return "CIM_CurveAuto"
-        elif self.point_type in ["POLY"]:
-            return "CIM_Linear" 
-        return "CIM_CurveAuto"
+        return get_ue_interp_curve_mode(self.point_type)
 
     def get_spline_point_as_dict(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {}
@@ -314,11 +282,15 @@ class BFU_SimpleSpline():
         # Context stats
         self.spline_type = spline_data.type
         self.closed_loop = spline_data.use_cyclic_u
-        self.spline_length = spline_data.calc_length(resolution=512) #512 is the res used in UE5 to calculate length.
-        self.spline_points: Dict[int, BFU_SimpleSplinePoint] = {}
+        self.spline_length: float = 0.0  # Arc length in Unreal units.
+        self._spline_points: Optional[Dict[int, BFU_SimpleSplinePoint]] = None
 
         # Blender Spline Data
-        # ...
+        self.evaluated_points: bfu_spline_evaluate.BFU_SplineEvaluatedPoints = bfu_spline_evaluate.BFU_SplineEvaluatedPoints(
+            np.zeros((0, 3)), np.zeros((0, 3)), np.zeros((0, 3)), np.zeros(0), np.zeros(0), spline_data.type
+        )
+        self.reparam_distances: np.ndarray = np.zeros(1)
+        self.reparam_input_keys: np.ndarray = np.zeros(1)
 
         # Formated data for Unreal Engine
         # ...
@@ -326,6 +298,13 @@ class BFU_SimpleSpline():
         # Formated data for ArchVis Tools in Unreal Engine
         # ...
 
+    @property
+    def spline_points(self) -> Dict[int, BFU_SimpleSplinePoint]:
+        # Points are only created when used, the evaluation keep them as numpy arrays.
+        if self._spline_points is None:
+            self._spline_points = {i: BFU_SimpleSplinePoint(i, self) for i in range(len(self.evaluated_points))}
+        return self._spline_points
+
     def get_simple_spline_values_as_dict(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {}
         # Static data
@@ -339,79 +318,146 @@ class BFU_SimpleSpline():
         return data
     
 
+    def get_ue_point_rotations(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Same as bfu_spline_utils.get_spline_unreal_rotation() for all the points.
+        # The points are float vectors like in mathutils.
+        points = self.evaluated_points
+        direction = points.handles_right.astype(np.float32) - points.positions.astype(np.float32)
+        length = np.sqrt((direction * direction).sum(axis=1))
+        valid = length > 0.0
+        direction[valid] *= (np.float32(1.0) / length[valid])[:, None]
+        direction[:, 1] *= -1.0  # Convert to Unreal space: flip Y
+
+        x, y, z = direction.astype(np.float64).T
+        yaw = np.arctan2(y, x)
+        pitch = -np.arctan2(z, np.sqrt(x ** 2 + y ** 2))
+        roll = ((points.tilts + math.pi) % (2 * math.pi)) - math.pi
+        # Points without direction have no rotation.
+        return np.where(valid, roll, 0.0), np.where(valid, pitch, 0.0), np.where(valid, yaw, 0.0)
+
+    @staticmethod
+    def get_ue_up_vectors(roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray) -> np.ndarray:
+        # Same as BFU_SimpleSplinePoint.rotator_to_up_vector_fixed() for all the points.
+        def normalize(a: np.ndarray) -> np.ndarray: return ((a + 180) % 360) - 180
+
+        # Same angles as BFU_SimpleSplinePoint.get_out_val_rotation()
+        degrees_roll = roll * (180.0 / math.pi)
+        degrees_pitch = -(pitch * (180.0 / math.pi))
+        degrees_yaw = yaw * (180.0 / math.pi)
+
+        pitch = -normalize(degrees_pitch) * math.pi / 180.0
+        yaw = normalize(degrees_yaw) * math.pi / 180.0
+        roll = -normalize(degrees_roll) * math.pi / 180.0
+
+        cz, sz = np.cos(yaw), np.sin(yaw)
+        cp, sp = np.cos(pitch), np.sin(pitch)
+        cr, sr = np.cos(roll), np.sin(roll)
+        up = np.stack((cz*sp*cr + sz*sr, sz*sp*cr - cz*sr, cp*cr), axis=-1)
+        return np.round(up, 3)
+
     def get_ue_format_spline(self) -> str:
         # handle right is leave Tangent in UE
         # handle left is arive Tangent in UE
+        # The points are built from the evaluated points arrays, without BFU_SimpleSplinePoint.
 
         Position: Dict[str, Any] = {}
         Rotation: Dict[str, Any] = {}
         Scale: Dict[str, Any] = {}
         ReparamTable: Dict[str, Any] = {}
-        Position["Points"] = []
-        Rotation["Points"] = []
-        Scale["Points"] = []
-        ReparamTable["Points"] = []
-        reparam_table_sample = 10
 
-        spline_num = len(self.spline_points)
-        spline_length = self.spline_length
+        points = self.evaluated_points
+        spline_num = len(points)
+        interp_mode = get_ue_interp_curve_mode(points.point_type)
 
+        if TYPE_CHECKING:
+            vector_scale = np.ones(3, dtype=np.float32)
+        else:
+            vector_scale = np.array(bpy.context.scene.bfu_spline_vector_scale, dtype=np.float32)
+
+        # Float vectors like in mathutils, Y inverted for Unreal.
+        # Unreal multiplies tangent magnitude by 3.0 internally.
+        ue_axis = np.array((1.0, -1.0, 1.0), dtype=np.float32)
+        positions = points.positions.astype(np.float32)
+        handles_left = points.handles_left.astype(np.float32)
+        handles_right = points.handles_right.astype(np.float32)
+        ue_positions = (positions * ue_axis) * vector_scale
+        arrive_tangents = ((positions - handles_left) * (ue_axis * 3.0)) * vector_scale
+        leave_tangents = ((handles_right - positions) * (ue_axis * 3.0)) * vector_scale
+        radii = points.radii.astype(np.float32)
+
+        # Rotations only depend on the up vector, which is rounded, so most of them are shared.
+        roll, pitch, yaw = self.get_ue_point_rotations()
+        up_vectors = self.get_ue_up_vectors(roll, pitch, yaw)
+        out_val_rotations: Dict[Tuple[float, float, float], Dict[str, str]] = {}
+        tangent_rotations: Dict[Tuple[float, float, float], Dict[str, str]] = {}
+
+        one_vector = vector_as_ue(mathutils.Vector((1, 1, 1)))
 
         Position_Points: List[Any] = []
         Rotation_Points: List[Any] = []
         Scale_Points: List[Any] = []
         ReparamTable_Points: List[Any] = []
 
-        for spline_point_index in self.spline_points:
+        for index, (ue_position, arrive_tangent, leave_tangent, up_vector, radius) in enumerate(zip(
+            ue_positions.tolist(), arrive_tangents.tolist(), leave_tangents.tolist(), map(tuple, up_vectors.tolist()), radii.tolist()
+        )):
+            in_val = float_as_ue(index)
 
-            spline_point: BFU_SimpleSplinePoint = self.spline_points[spline_point_index]
-            point_location = {}
-            point_rotation = {}
-            point_scale = {}
-
-            point_location["InVal"] = float_as_ue(spline_point_index)
-            point_location["OutVal"] = vector_as_ue(spline_point.get_ue_position())
-            point_location["ArriveTangent"] = vector_as_ue(spline_point.get_arrive_tangent_loc())
-            point_location["LeaveTangent"] = vector_as_ue(spline_point.get_leave_tangent_loc())
-            point_location["InterpMode"] = spline_point.get_ue_interp_curve_mode()
-
-            point_rotation["InVal"] = float_as_ue(spline_point_index)
-            point_rotation["OutVal"] = quad_as_ue(spline_point.get_out_val_rotation())
-            point_rotation["ArriveTangent"] = quad_as_ue(spline_point.get_arrive_tangent_rotation())
-            point_rotation["LeaveTangent"] = quad_as_ue(spline_point.get_leave_tangent_rotation())
-            point_rotation["InterpMode"] = spline_point.get_ue_interp_curve_mode()
-
-            point_scale["InVal"] = float_as_ue(spline_point_index)
-            point_scale["OutVal"] = vector_as_ue(spline_point.get_ue_scale())
-            point_scale["ArriveTangent"] = vector_as_ue(mathutils.Vector((1, 1, 1)))
-            point_scale["LeaveTangent"] = vector_as_ue(mathutils.Vector((1, 1, 1)))
-            point_scale["InterpMode"] = spline_point.get_ue_interp_curve_mode()
-           
-            Position_Points.append(point_location)
-            Position["bIsLooped"] = self.closed_loop
-            Position["LoopKeyOffset"] = float_as_ue(1)
-            Rotation_Points.append(point_rotation)
-            Rotation["bIsLooped"] = self.closed_loop
-            Rotation["LoopKeyOffset"] = float_as_ue(spline_num)
-            Scale_Points.append(point_scale)
-            Scale["bIsLooped"] = self.closed_loop
-            Scale["LoopKeyOffset"] = float_as_ue(spline_num)
+            out_val_rotation = out_val_rotations.get(up_vector)
+            if out_val_rotation is None:
+                out_val_rotation = quad_as_ue(get_out_val_rotation_from_up_vector(mathutils.Vector(up_vector)))
+                out_val_rotations[up_vector] = out_val_rotation
 
-            for reparam_index in range(0, reparam_table_sample):
-                reparam_table = {}
-                spline_position_at_time = (reparam_index + reparam_table_sample*spline_point_index + 1)/reparam_table_sample
-                spline_length_at_time = spline_length*(reparam_index + reparam_table_sample*spline_point_index + 1)/(reparam_table_sample*spline_num)
-                InVal = spline_length_at_time
-                OutVal = spline_position_at_time
-                #print(float_as_ue(InVal), "->", float_as_ue(OutVal))
-                reparam_table["InVal"] = float_as_ue(InVal)
-                reparam_table["OutVal"] = float_as_ue(OutVal)
-                ReparamTable_Points.append(reparam_table)
+            if index == 0 or index == spline_num - 1:
+                # Use the point rotation at spline start and end
+                tangent_rotation = quad_as_ue(bfu_spline_utils.get_as_unreal_quaternion(roll[index], pitch[index], yaw[index]))
+            else:
+                tangent_rotation = tangent_rotations.get(up_vector)
+                if tangent_rotation is None:
+                    tangent_rotation = quad_as_ue(get_tangent_rotation_from_up_vector(mathutils.Vector(up_vector)))
+                    tangent_rotations[up_vector] = tangent_rotation
+
+            Position_Points.append({
+                "InVal": in_val,
+                "OutVal": {"X": "{:.6f}".format(ue_position[0]), "Y": "{:.6f}".format(ue_position[1]), "Z": "{:.6f}".format(ue_position[2])},
+                "ArriveTangent": {"X": "{:.6f}".format(arrive_tangent[0]), "Y": "{:.6f}".format(arrive_tangent[1]), "Z": "{:.6f}".format(arrive_tangent[2])},
+                "LeaveTangent": {"X": "{:.6f}".format(leave_tangent[0]), "Y": "{:.6f}".format(leave_tangent[1]), "Z": "{:.6f}".format(leave_tangent[2])},
+                "InterpMode": interp_mode,
+            })
+            Rotation_Points.append({
+                "InVal": in_val,
+                "OutVal": out_val_rotation,
+                "ArriveTangent": tangent_rotation,
+                "LeaveTangent": tangent_rotation,
+                "InterpMode": interp_mode,
+            })
+            str_radius = float_as_ue(radius)
+            Scale_Points.append({
+                "InVal": in_val,
+                "OutVal": {"X": str_radius, "Y": str_radius, "Z": str_radius},
+                "ArriveTangent": one_vector,
+                "LeaveTangent": one_vector,
+                "InterpMode": interp_mode,
+            })
+
+        # InVal is the distance along the spline, OutVal the input key.
+        for distance, input_key in zip(self.reparam_distances.tolist(), self.reparam_input_keys.tolist()):
+            reparam_table = {}
+            reparam_table["InVal"] = float_as_ue(distance)
+            reparam_table["OutVal"] = float_as_ue(input_key)
+            ReparamTable_Points.append(reparam_table)
 
         Position["Points"] = Position_Points
         Rotation["Points"] = Rotation_Points
         Scale["Points"] = Scale_Points
         ReparamTable["Points"] = ReparamTable_Points
+        if spline_num:
+            Position["bIsLooped"] = self.closed_loop
+            Position["LoopKeyOffset"] = float_as_ue(1)
+            Rotation["bIsLooped"] = self.closed_loop
+            Rotation["LoopKeyOffset"] = float_as_ue(spline_num)
+            Scale["bIsLooped"] = self.closed_loop
+            Scale["LoopKeyOffset"] = float_as_ue(spline_num)
 
         data: Dict[str, Any] = {}
         data["SplineCurves"] = {}
@@ -426,39 +472,19 @@ class BFU_SimpleSpline():
     def evaluate_spline_data(self, spline_obj: bpy.types.Object, spline_data: bpy.types.Spline, index: int = 0):
 
         # Clear previous data
-        self.spline_points = {}
-        
-        if spline_data.type in ["POLY"]:
-            for i, poly_point in enumerate(spline_data.points):
-                poly_point: bpy.types.SplinePoint
-                self.spline_points[i] = BFU_SimpleSplinePoint(i, self, spline_obj, poly_point, spline_data.type)
-
-        elif spline_data.type in ["NURBS"]:
-            
-            # Duplicate and resample spline
-            if TYPE_CHECKING:
-                spline_resample_resolution: int = 12
-            else:
-                spline_resample_resolution: int = spline_obj.bfu_spline_resample_resolution
-
-            resampled_spline_obj: Optional[bpy.types.Object] = bfu_spline_utils.create_resampled_spline(spline_data, spline_resample_resolution)
-            if resampled_spline_obj and resampled_spline_obj.data:
-                if isinstance(resampled_spline_obj.data, bpy.types.Curve):
-                    new_spline_data = resampled_spline_obj.data.splines[0]
-                    for i, nurbs_point in enumerate(new_spline_data.bezier_points):
-                        nurbs_point: bpy.types.BezierSplinePoint
-                        self.spline_points[i] = BFU_SimpleSplinePoint(i, self, spline_obj, nurbs_point, new_spline_data.type)
-
-                # Clear temporary objects
-                objects_to_remove: List[bpy.types.Object] = [resampled_spline_obj]
-                data_to_remove: List[bpy.types.ID] = [resampled_spline_obj.data]
-                bpy.data.batch_remove(objects_to_remove)
-                bpy.data.batch_remove(data_to_remove)
-            
-        elif spline_data.type in ["BEZIER"]:
-            for i, bezier_point in enumerate(spline_data.bezier_points):
-                bezier_point: bpy.types.BezierSplinePoint
-                self.spline_points[i] = BFU_SimpleSplinePoint(i, self, spline_obj, bezier_point, spline_data.type)
+        self._spline_points = None
+
+        # NURBS are tessellated with the resample resolution.
+        if TYPE_CHECKING:
+            spline_resample_resolution: int = 12
+            vector_scale = np.ones(3)
+        else:
+            spline_resample_resolution: int = spline_obj.bfu_spline_resample_resolution
+            vector_scale = np.array(bpy.context.scene.bfu_spline_vector_scale)
+
+        self.evaluated_points = bfu_spline_evaluate.evaluate_spline_points(spline_obj, spline_data, spline_resample_resolution)
+        self.reparam_distances, self.reparam_input_keys = bfu_spline_evaluate.get_reparam_table(self.evaluated_points, self.closed_loop, vector_scale)
+        self.spline_length = float(self.reparam_distances[-1])
 
         #print("Evaluate index " + str(index) + " finished in " + counter.get_str_time())
         #print("-----")
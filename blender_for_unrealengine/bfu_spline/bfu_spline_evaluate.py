@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: 2018-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  Blender For UnrealEngine
+#  https://github.com/xavier150/Blender-For-UnrealEngine-Addons
+# ----------------------------------------------
+
+# Vectorized spline evaluation with numpy.
+# The points of a spline are read at once with foreach_get(), NURBS splines are tessellated from their knots
+# and the Unreal ReparamTable is filled with the real arc length of each segment.
+
+import bpy
+import numpy as np
+from typing import Tuple
+
+# Same as the default USplineComponent::ReparamStepsPerSegment in Unreal Engine.
+REPARAM_STEPS_PER_SEGMENT = 10
+
+# Gauss-Legendre quadrature used to integrate the arc length of each reparam step.
+GAUSS_LEGENDRE_POINTS, GAUSS_LEGENDRE_WEIGHTS = np.polynomial.legendre.leggauss(5)
+
+
+class BFU_SplineEvaluatedPoints():
+    """
+    Points of a spline in Blender space, as a bezier curve.
+    Poly points use their position as handles.
+    """
+
+    def __init__(self, positions: np.ndarray, handles_left: np.ndarray, handles_right: np.ndarray, tilts: np.ndarray, radii: np.ndarray, point_type: str):
+        self.positions: np.ndarray = positions  # (n, 3)
+        self.handles_left: np.ndarray = handles_left  # (n, 3)
+        self.handles_right: np.ndarray = handles_right  # (n, 3)
+        self.tilts: np.ndarray = tilts  # (n,)
+        self.radii: np.ndarray = radii  # (n,)
+        self.point_type: str = point_type
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def get_collection_values(collection: bpy.types.bpy_prop_collection, attribute: str, size: int) -> np.ndarray:
+    values = np.empty(len(collection) * size, dtype=np.float32)
+    collection.foreach_get(attribute, values)
+    values = values.astype(np.float64)
+    return values.reshape(-1, size) if size > 1 else values
+
+
+def get_nurbs_knots(point_count: int, order: int, use_cyclic: bool, use_endpoint: bool, use_bezier: bool) -> np.ndarray:
+    # Same as calcknots() in Blender curve.cc.
+    repeat_inner = order - 1 if use_bezier else 1
+    if use_endpoint:
+        head = order - (1 if use_cyclic else 0)
+    else:
+        head = min(2, repeat_inner) if use_bezier else 1
+    tail = 2 * order - 1 if use_cyclic else (order if use_endpoint else 0)
+    knot_count = point_count + order + (order - 1 if use_cyclic else 0)
+
+    knots = np.zeros(knot_count)
+    current = 0.0
+    offset = 1 if use_endpoint and use_cyclic else 0
+    if offset:
+        knots[0] = current
+        current += 1.0
+
+    repeat = head
+    for index in range(offset, knot_count - tail):
+        knots[index] = current
+        repeat -= 1
+        if repeat == 0:
+            current += 1.0
+            repeat = repeat_inner
+
+    tail_index = knot_count - tail
+    for index in range(tail):
+        knots[tail_index + index] = current + (knots[index] - knots[0])
+    return knots
+
+
+def get_nurbs_basis(knots: np.ndarray, degree: int, spans: np.ndarray, params: np.ndarray) -> np.ndarray:
+    # Cox-de Boor basis of the degree + 1 points influencing each param, see "The NURBS Book" A2.2.
+    basis = np.zeros((len(params), degree + 1))
+    basis[:, 0] = 1.0
+    left = np.zeros((len(params), degree + 1))
+    right = np.zeros((len(params), degree + 1))
+    for j in range(1, degree + 1):
+        left[:, j] = params - knots[spans + 1 - j]
+        right[:, j] = knots[spans + j] - params
+        saved = np.zeros(len(params))
+        for r in range(j):
+            temp = basis[:, r] / (right[:, r + 1] + left[:, j - r])
+            basis[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        basis[:, j] = saved
+    return basis
+
+
+def tessellate_nurbs(spline_data: bpy.types.Spline, resolution: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the positions, tilts and radii of the NURBS spline sampled like BKE_nurb_makeCurve(),
+    resolution points per segment.
+    """
+    points = spline_data.points
+    point_count = len(points)
+    order = spline_data.order_u
+    if point_count == 0 or order > point_count or resolution < 1:
+        return np.zeros((0, 3)), np.zeros(0), np.zeros(0)
+
+    co = get_collection_values(points, "co", 4)
+    tilts = get_collection_values(points, "tilt", 1)
+    radii = get_collection_values(points, "radius", 1)
+    use_cyclic = spline_data.use_cyclic_u
+    degree = order - 1
+    knots = get_nurbs_knots(point_count, order, use_cyclic, spline_data.use_endpoint_u, spline_data.use_bezier_u)
+
+    # Cyclic splines repeat their first points at the end.
+    extended_count = point_count + (degree if use_cyclic else 0)
+    segment_count = point_count if use_cyclic else point_count - 1
+    sample_count = resolution * segment_count
+    if sample_count == 0:
+        return np.zeros((0, 3)), np.zeros(0), np.zeros(0)
+    u_start = knots[degree]
+    u_end = knots[extended_count]
+    u_step = (u_end - u_start) / (sample_count - (0 if use_cyclic else 1) or 1)
+    params = u_start + np.arange(sample_count) * u_step
+    params = np.clip(params, u_start, u_end)
+
+    spans = np.clip(np.searchsorted(knots, params, side='right') - 1, degree, extended_count - 1)
+    basis = get_nurbs_basis(knots, degree, spans, params)
+    point_indices = (spans[:, None] - degree + np.arange(order)) % point_count
+
+    # Rational weights, normalized only when needed like in Blender.
+    weighted_basis = basis * co[point_indices, 3]
+    weight_sum = weighted_basis.sum(axis=1)
+    need_normalize = (weight_sum != 0.0) & ((weight_sum < 0.999) | (weight_sum > 1.001))
+    weighted_basis[need_normalize] /= weight_sum[need_normalize, None]
+
+    positions = np.einsum('sk,skc->sc', weighted_basis, co[point_indices, :3])
+    sample_tilts = (weighted_basis * tilts[point_indices]).sum(axis=1)
+    sample_radii = (weighted_basis * radii[point_indices]).sum(axis=1)
+    return positions, sample_tilts, sample_radii
+
+
+def get_auto_handles(positions: np.ndarray, use_cyclic: bool) -> Tuple[np.ndarray, np.ndarray]:
+    # Same as the auto handles of calchandleNurb_intern() in Blender curve.cc.
+    point_count = len(positions)
+    if point_count < 2:
+        return positions.copy(), positions.copy()
+
+    if use_cyclic:
+        previous_positions = np.roll(positions, 1, axis=0)
+        next_positions = np.roll(positions, -1, axis=0)
+    else:
+        # Missing neighbors of the end points are mirrored.
+        previous_positions = np.concatenate((2.0 * positions[:1] - positions[1:2], positions[:-1]))
+        next_positions = np.concatenate((positions[1:], 2.0 * positions[-1:] - positions[-2:-1]))
+
+    dvec_a = positions - previous_positions
+    dvec_b = next_positions - positions
+    len_a = np.linalg.norm(dvec_a, axis=1)
+    len_b = np.linalg.norm(dvec_b, axis=1)
+    len_a[len_a == 0.0] = 1.0
+    len_b[len_b == 0.0] = 1.0
+
+    tvec = dvec_b / len_b[:, None] + dvec_a / len_a[:, None]
+    length = np.linalg.norm(tvec, axis=1) * 2.5614
+    len_a, len_b = np.minimum(len_a, 5.0 * len_b), np.minimum(len_b, 5.0 * len_a)
+
+    handles_left = positions.copy()
+    handles_right = positions.copy()
+    valid = length != 0.0
+    handles_left[valid] -= tvec[valid] * (len_a[valid] / length[valid])[:, None]
+    handles_right[valid] += tvec[valid] * (len_b[valid] / length[valid])[:, None]
+    return handles_left, handles_right
+
+
+def evaluate_spline_points(spline_obj: bpy.types.Object, spline_data: bpy.types.Spline, nurbs_resolution: int) -> BFU_SplineEvaluatedPoints:
+    # For the momment roll work only with Z_UP mode on bezier splines.
+    use_bezier_tilt = isinstance(spline_obj.data, bpy.types.Curve) and spline_obj.data.twist_mode == 'Z_UP'
+
+    if spline_data.type == "BEZIER":
+        bezier_points = spline_data.bezier_points
+        tilts = get_collection_values(bezier_points, "tilt", 1)
+        return BFU_SplineEvaluatedPoints(
+            get_collection_values(bezier_points, "co", 3),
+            get_collection_values(bezier_points, "handle_left", 3),
+            get_collection_values(bezier_points, "handle_right", 3),
+            tilts if use_bezier_tilt else np.zeros_like(tilts),
+            get_collection_values(bezier_points, "radius", 1),
+            "BEZIER",
+        )
+
+    elif spline_data.type == "NURBS":
+        # Tessellated NURBS are exported as bezier points with auto handles.
+        positions, tilts, radii = tessellate_nurbs(spline_data, nurbs_resolution)
+        handles_left, handles_right = get_auto_handles(positions, spline_data.use_cyclic_u)
+        return BFU_SplineEvaluatedPoints(
+            positions,
+            handles_left,
+            handles_right,
+            tilts if use_bezier_tilt else np.zeros_like(tilts),
+            radii,
+            "BEZIER",
+        )
+
+    # Poly
+    positions = get_collection_values(spline_data.points, "co", 4)[:, :3]
+    return BFU_SplineEvaluatedPoints(
+        positions,
+        positions,
+        positions,
+        get_collection_values(spline_data.points, "tilt", 1),
+        get_collection_values(spline_data.points, "radius", 1),
+        "POLY",
+    )
+
+
+def get_reparam_table(points: BFU_SplineEvaluatedPoints, closed_loop: bool, vector_scale: np.ndarray, steps_per_segment: int = REPARAM_STEPS_PER_SEGMENT) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the distances and input keys of the Unreal ReparamTable, same layout as FSplineCurves::UpdateSpline().
+    Distances are in Unreal units, from the arc length of each segment.
+    """
+    point_count = len(points)
+    segment_count = point_count if closed_loop else max(point_count - 1, 0)
+    if segment_count == 0:
+        return np.zeros(1), np.zeros(1)
+
+    # Segment control points in Unreal units. The Y inversion does not change lengths.
+    start_indices = np.arange(segment_count)
+    end_indices = (start_indices + 1) % point_count
+    p0 = points.positions[start_indices] * vector_scale
+    p3 = points.positions[end_indices] * vector_scale
+
+    # Length of each step, shape (segment_count, steps_per_segment).
+    if points.point_type == "POLY":
+        step_lengths = np.repeat(np.linalg.norm(p3 - p0, axis=1)[:, None] / steps_per_segment, steps_per_segment, axis=1)
+    else:
+        p1 = points.handles_right[start_indices] * vector_scale
+        p2 = points.handles_left[end_indices] * vector_scale
+        # Bezier derivative at the quadrature params of each step.
+        step_starts = np.arange(steps_per_segment) / steps_per_segment
+        half_step = 0.5 / steps_per_segment
+        t = (step_starts[:, None] + half_step * (GAUSS_LEGENDRE_POINTS + 1.0)).reshape(-1)
+        u = 1.0 - t
+        d0 = (p1 - p0)[:, None, :]
+        d1 = (p2 - p1)[:, None, :]
+        d2 = (p3 - p2)[:, None, :]
+        derivatives = 3.0 * ((u * u)[None, :, None] * d0 + (2.0 * u * t)[None, :, None] * d1 + (t * t)[None, :, None] * d2)
+        speeds = np.linalg.norm(derivatives, axis=2).reshape(segment_count, steps_per_segment, -1)
+        step_lengths = half_step * (speeds * GAUSS_LEGENDRE_WEIGHTS).sum(axis=2)
+
+    # Distance at the start of each step, then the total length.
+    distances = np.concatenate(([0.0], np.cumsum(step_lengths)))
+    input_keys = np.concatenate((np.arange(segment_count * steps_per_segment) / steps_per_segment, [float(segment_count)]))
+    return distances, input_keys
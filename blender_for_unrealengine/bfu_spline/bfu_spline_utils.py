@@ -8,7 +8,7 @@
 # ----------------------------------------------
 
 import bpy
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple
 import math
 import mathutils
 from .. import bbpl
@@ -136,62 +136,6 @@ def convert_curve_to_bezier(obj: bpy.types.Object, curve_resolution: int = 12):
             bpy.ops.curve.handle_type_set(type='AUTOMATIC')
             bpy.ops.object.mode_set(mode='OBJECT')
 
-def create_resampled_spline(spline_data: bpy.types.Spline, curve_resolution: int = 12) -> Optional[bpy.types.Object]:
-    # Create a new curve data block
-    new_curve_data = bpy.data.curves.new(name="ResampledCurve", type='CURVE')
-    new_curve_data.dimensions = '3D'
-    
-    # Add a new spline to the curve data block based on source spline type
-    if spline_data.type == 'BEZIER':
-        new_spline = new_curve_data.splines.new(type='BEZIER')
-        new_spline.bezier_points.add(len(spline_data.bezier_points) - 1)  # Adjust number of points
-        
-        # Copy source Bezier spline points
-        for i, bp in enumerate(spline_data.bezier_points):
-            new_bp = new_spline.bezier_points[i]
-            new_bp.co = bp.co
-            new_bp.handle_left = bp.handle_left
-            new_bp.handle_left_type = bp.handle_left_type
-            new_bp.handle_right = bp.handle_right
-            new_bp.handle_right_type = bp.handle_right_type
-
-        new_spline.use_cyclic_u = spline_data.use_cyclic_u
-        new_spline.resolution_u = spline_data.resolution_u
-        new_spline.tilt_interpolation = spline_data.tilt_interpolation
-        new_spline.radius_interpolation = spline_data.radius_interpolation
-        new_spline.use_smooth = spline_data.use_smooth
-
-    elif spline_data.type == 'NURBS':
-        new_spline = new_curve_data.splines.new(type='NURBS')
-        new_spline.points.add(len(spline_data.points) - 1)  # Adjust number of points
-        
-        # Copy source NURBS spline points
-        for i, point in enumerate(spline_data.points):
-            new_point = new_spline.points[i]
-            new_point.co = point.co  # copy coordinates and weight (w)
-            new_point.weight = point.weight
-            
-        new_spline.use_cyclic_u = spline_data.use_cyclic_u
-        new_spline.use_bezier_u = spline_data.use_bezier_u
-        new_spline.use_endpoint_u = spline_data.use_endpoint_u
-        new_spline.order_u = spline_data.order_u
-        new_spline.resolution_u = spline_data.resolution_u
-        new_spline.use_smooth = spline_data.use_smooth
-            
-    else:
-        # Add handling for other types if necessary
-        print(f"Spline type {spline_data.type} is not supported.")
-        return None
-
-    # Create a new curve object with this curve data block
-    new_curve_obj = bpy.data.objects.new("ResampledCurveObject", new_curve_data)
-    
-    # Add object to the active scene
-    if bpy.context.collection:
-        bpy.context.collection.objects.link(new_curve_obj)
-    convert_curve_to_bezier(new_curve_obj, curve_resolution)
-    return new_curve_obj
-
 def contain_nurbs_spline(obj: bpy.types.Object) -> bool:
     if obj.type == "CURVE":
         if isinstance(obj.data, bpy.types.Curve):
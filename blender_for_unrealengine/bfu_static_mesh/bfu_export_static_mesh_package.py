@@ -207,8 +207,7 @@ def export_as_static_mesh(
     bfu_export.bfu_export_utils.reset_sockets_export_name(active)
     bfu_export.bfu_export_utils.reset_sockets_transform(active)
     bfu_utils.clean_delete_objects(bpy.context.selected_objects)
-    for data in duplicate_data.data_to_remove:
-        data.remove_data()
+    duplicate_data.remove_duplicated_data()
 
     duplicate_data.reset_duplicate_name_after_export()
 
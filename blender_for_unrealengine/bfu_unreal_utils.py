@@ -9,6 +9,7 @@
 
 import os
 import bpy
+from typing import Optional, Set
 from . import bfu_utils
 from . import bfu_export_nomenclature
 from . import bfu_base_object
@@ -69,8 +70,9 @@ def get_predicted_skeletal_mesh_ref(obj: bpy.types.Object) -> str:
     ref_path = ref_path.replace('\\', '/')
     return f"/Script/Engine.SkeletalMesh'{ref_path}'"
 
-def generate_name_for_unreal_engine(desired_name: str, current_name: str = "") -> str:
+def generate_name_for_unreal_engine(desired_name: str, current_name: str = "", existing_names: Optional[Set[str]] = None) -> str:
     # Generate a new name with suffix number
+    # existing_names: Names of the scene objects, avoid a scene scan for each tested name when naming many objects.
 
     scene = bpy.context.scene
     if scene is None:
@@ -91,6 +93,8 @@ def generate_name_for_unreal_engine(desired_name: str, current_name: str = "") -
             return True
 
         # Ensure no existing object uses this name
+        if existing_names is not None:
+            return tested_name not in existing_names
         for obj in scene.objects:
             if tested_name == obj.name:
                 return False
@@ -10,9 +10,12 @@
 
 
 import string
+import bisect
+import itertools
 import fnmatch
 import math
 import os
+import numpy as np
 from typing import List, Tuple, Optional, TYPE_CHECKING, Any
 from pathlib import Path
 import bpy
@@ -72,38 +75,18 @@ class TimelineMarkerSequence():
         timeline: bpy.types.TimelineMarkers = scene.timeline_markers
         self.marker_sequences: List[MarkerSequence] = self.get_marker_sequences(timeline)
 
+        # Sequence boundaries in frame order, used for the frame lookups.
+        self.sequence_starts = np.array([marker_sequence.start for marker_sequence in self.marker_sequences], dtype=np.int64)
+        self.sequence_ends = np.array([marker_sequence.end for marker_sequence in self.marker_sequences], dtype=np.int64)
+        self.sequence_start_list: List[int] = self.sequence_starts.tolist()
+
     def get_marker_sequences(self, timeline_markers: bpy.types.TimelineMarkers) -> List[MarkerSequence]:
         if len(timeline_markers) == 0:
             print("Scene has no timeline_markers.")
             return []
 
-        def get_first_marker(marker_list: List[bpy.types.TimelineMarker]) -> bpy.types.TimelineMarker:
-            best_marker: bpy.types.TimelineMarker
-            best_marker_frame = 0
-            init = False
-
-            for marker in marker_list:
-
-                if init:
-                    if marker.frame < best_marker_frame:
-                        best_marker = marker
-                        best_marker_frame = marker.frame
-                else:
-                    best_marker = marker
-                    best_marker_frame = marker.frame
-                    init = True
-
-            return best_marker
-
-        marker_list: List[bpy.types.TimelineMarker] = []
-        for marker in timeline_markers:
-            marker_list.append(marker)
-
-        order_marker_list: List[bpy.types.TimelineMarker] = []
-        while len(marker_list) != 0:
-            first_marker = get_first_marker(marker_list)
-            order_marker_list.append(first_marker)
-            marker_list.remove(first_marker)
+        # Stable sort, markers on the same frame keep the timeline order.
+        order_marker_list: List[bpy.types.TimelineMarker] = sorted(timeline_markers, key=lambda marker: marker.frame)
 
         marker_sequences: List[MarkerSequence] = []
 
@@ -118,14 +101,36 @@ class TimelineMarkerSequence():
 
         return marker_sequences
 
+    def get_marker_sequence_index_at_frame(self, frame: int) -> int:
+        # Returns -1 when no sequence uses the frame.
+        index = bisect.bisect_right(self.sequence_start_list, frame) - 1
+        if index >= 0 and frame <= self.sequence_ends[index]:
+            return index
+        return -1
+
     def get_marker_sequence_at_frame(self, frame: int) -> Optional[MarkerSequence]:
         if self.marker_sequences:
-            for marker_sequence in self.marker_sequences:
-                # print(marker_sequence.start, marker_sequence.end, frame)
-                if frame >= marker_sequence.start and frame <= marker_sequence.end:
-                    return marker_sequence
+            index = self.get_marker_sequence_index_at_frame(frame)
+            if index >= 0:
+                return self.marker_sequences[index]
         return None
 
+    def get_marker_sequence_indices(self, frames: np.ndarray) -> np.ndarray:
+        # Sequence index for each frame, -1 when no sequence uses the frame.
+        # Frames are truncated to int like in get_marker_sequence_at_frame(int(frame)).
+        int_frames = np.asarray(frames).astype(np.int64)
+        if len(self.marker_sequences) == 0:
+            return np.full(len(int_frames), -1, dtype=np.int64)
+
+        indices = np.searchsorted(self.sequence_starts, int_frames, side="right") - 1
+        is_valid = indices >= 0
+        is_valid[is_valid] = int_frames[is_valid] <= self.sequence_ends[indices[is_valid]]
+        return np.where(is_valid, indices, -1)
+
+    def get_marker_sequence_indices_in_range(self, frame_start: int, frame_end: int) -> np.ndarray:
+        # Sequence index for each frame from frame_start to frame_end (excluded).
+        return self.get_marker_sequence_indices(np.arange(frame_start, frame_end, dtype=np.int64))
+
 def update_progress(job_title: str, progress: float, time: Optional[float] = None):
 
     length = 20  # modify this to change the length
@@ -606,99 +611,132 @@ def GoToMeshEditMode():
     return False
 
 
-def CorrectExtremeUV(step_scale=2, move_to_absolute=False):
-    
-    def GetHaveConnectedLoop(faceTarget):
-        # In bmesh faces
-        for loop in faceTarget.loops:
-            uv = loop[uv_lay].uv
-            for face in bm.faces:
-                if face.select:
-                    if faceTarget != face:
-                        for loop in face.loops:
-                            if uv == loop[uv_lay].uv:
-                                return True
-        return False
-
-    def SelectRecursiveUVLinked(uv_lay):
-
-        AddedFaces = []
-        for v in [v for v in bm.verts if v.select]:
-            for f in v.link_faces:
-                if not f.select:
-                    if GetHaveConnectedLoop(f):
-                        AddedFaces.append(f)
-                        f.select = True
-
-        if len(AddedFaces) == 0:
-            return AddedFaces
-        else:
-            for addedFace in SelectRecursiveUVLinked(uv_lay):
-                AddedFaces.append(addedFace)
-            return AddedFaces
-
-    def GetAllIsland(bm, uv_lay):
-        ToCheakFace = []
-        Islands = []
-        for face in bm.faces:
-            ToCheakFace.append(face)
-
-        while len(ToCheakFace) > 0:
-            for face in bm.faces:
-                face.select = False
-
-            ToCheakFace[-1].select = True
-            SelectRecursiveUVLinked(uv_lay)
-
-            Island = []
-            for face in bm.faces:
-                if face.select:
-                    Island.append(face)
-                    if face in ToCheakFace:
-                        ToCheakFace.remove(face)
-            Islands.append(Island)
-
-        return Islands
-
-    def MoveItlandToCenter(faces, uv_lay, min_distance, absolute):
-        loop = faces[-1].loops[-1]
+def read_vertex_group_weights(obj: bpy.types.Object) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    # Returns the number of groups per vertex and the flat (group index, weight) buffers.
+    # Vertex group elements have no foreach_get(), the bmesh deform layer is read in a single pass.
+    mesh_data: bpy.types.Mesh = obj.data
+    if not obj.vertex_groups:
+        return None
 
-        delta_x = round(loop[uv_lay].uv[0]/min_distance, 0)*min_distance
-        delta_y = round(loop[uv_lay].uv[1]/min_distance, 0)*min_distance
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh_data)
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is None:
+            return None
+        vertex_items = [vert[deform_layer].items() for vert in bm.verts]
+    finally:
+        bm.free()
+
+    group_counts = np.fromiter(map(len, vertex_items), dtype=np.int64, count=len(vertex_items))
+    pairs = np.fromiter(
+        itertools.chain.from_iterable(itertools.chain.from_iterable(vertex_items)),
+        dtype=np.float64,
+        count=int(group_counts.sum()) * 2
+    )
+    return group_counts, pairs[0::2].astype(np.int64), pairs[1::2]
+
+
+def get_uv_island_indices(
+    loop_starts: np.ndarray,
+    loop_totals: np.ndarray,
+    loop_vertex_indices: np.ndarray,
+    loop_uvs: np.ndarray
+) -> np.ndarray:
+    # Returns the island index of each face.
+    # Faces are in the same island when they share a vertex with the same UV coordinate.
+    face_count = len(loop_starts)
+    loop_count = len(loop_vertex_indices)
+    if face_count == 0:
+        return np.zeros(0, dtype=np.int64)
+    loop_faces = np.repeat(np.arange(face_count, dtype=np.int64), loop_totals)
+
+    # Group the loops with the same vertex and UV. (+ 0.0 for -0.0 == 0.0)
+    uv_bits = (loop_uvs.astype(np.float32) + np.float32(0.0)).view(np.uint32).reshape(loop_count, 2)
+    order = np.lexsort((uv_bits[:, 1], uv_bits[:, 0], loop_vertex_indices))
+    sorted_keys = np.column_stack((loop_vertex_indices[order], uv_bits[order].astype(np.int64)))
+    group_starts = np.ones(loop_count, dtype=bool)
+    group_starts[1:] = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+    first_in_group = np.maximum.accumulate(np.where(group_starts, np.arange(loop_count), 0))
+
+    # Union-find over the faces: each loop links its face with the face of the first loop of its group.
+    edges_a = loop_faces[order]
+    edges_b = edges_a[first_in_group]
+    parent = np.arange(face_count, dtype=np.int64)
+    while True:
+        root_a = parent[edges_a]
+        root_b = parent[edges_b]
+        low = np.minimum(root_a, root_b)
+        high = np.maximum(root_a, root_b)
+        to_link = low != high
+        if not np.any(to_link):
+            break
+        # Link the roots to the smallest root, then compress the paths.
+        np.minimum.at(parent, high[to_link], low[to_link])
+        while True:
+            grand_parent = parent[parent]
+            if np.array_equal(grand_parent, parent):
+                break
+            parent = grand_parent
+
+    _, island_indices = np.unique(parent, return_inverse=True)
+    return island_indices.reshape(face_count)
+
+
+def correct_extreme_mesh_uv(mesh: bpy.types.Mesh, step_scale: float = 2, move_to_absolute: bool = False) -> bool:
+    # Move each UV island near of the center using a grid of step_scale.
+    # Works in Object mode on the mesh data.
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is None:
+        return False
 
-        for face in faces:
-            for loop in face.loops:
-                loop[uv_lay].uv[0] -= delta_x
-                loop[uv_lay].uv[1] -= delta_y
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+    if face_count == 0:
+        return True
 
-        if(absolute == True):
-            # Move Faces to make it alway positive
-            for face in faces:
-                for loop in face.loops:
-                    loop[uv_lay].uv[0] = abs(loop[uv_lay].uv[0])
-                    loop[uv_lay].uv[1] = abs(loop[uv_lay].uv[1])
+    loop_starts = np.empty(face_count, dtype=np.int32)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    loop_vertex_indices = np.empty(loop_count, dtype=np.int32)
+    loop_uvs = np.empty(loop_count * 2, dtype=np.float32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+    uv_layer.data.foreach_get("uv", loop_uvs)
+    loop_uvs = loop_uvs.reshape(loop_count, 2)
+
+    island_indices = get_uv_island_indices(loop_starts, loop_totals, loop_vertex_indices, loop_uvs)
+    island_count = int(island_indices.max()) + 1
+
+    # Reference UV: last loop of the last face of each island.
+    last_faces = np.full(island_count, -1, dtype=np.int64)
+    np.maximum.at(last_faces, island_indices, np.arange(face_count))
+    reference_loops = loop_starts[last_faces] + loop_totals[last_faces] - 1
+    deltas = np.round(loop_uvs[reference_loops] / step_scale) * step_scale
+
+    loop_islands = np.repeat(island_indices, loop_totals)
+    loop_uvs -= deltas[loop_islands].astype(np.float32)
+    if move_to_absolute:
+        # Move Faces to make it alway positive
+        np.abs(loop_uvs, out=loop_uvs)
+
+    uv_layer.data.foreach_set("uv", loop_uvs.ravel())
+    mesh.update()
+    return True
 
 
-    def IsValidForUvEdit(obj):
-        if obj.type == "MESH":
-            return True
-        return False
+def CorrectExtremeUV(step_scale=2, move_to_absolute=False):
+    # Correct the selected meshes. Edit mode is left during the correction.
+    was_in_edit_mode = bpy.context.mode == "EDIT_MESH"
+    if was_in_edit_mode:
+        bbpl.utils.safe_mode_set('OBJECT')
 
     for obj in bpy.context.selected_objects:
-        if IsValidForUvEdit(obj):
-            # pylint: disable=E1128
-            bm = bmesh.from_edit_mesh(obj.data)
-
-            uv_lay = bm.loops.layers.uv.active
-            if uv_lay is None:
-                return
-
-            for faces in GetAllIsland(bm, uv_lay):
-                uv_lay = bm.loops.layers.uv.active
-                MoveItlandToCenter(faces, uv_lay, step_scale, move_to_absolute)
-
-            obj.data.update()
+        if isinstance(obj.data, bpy.types.Mesh):
+            correct_extreme_mesh_uv(obj.data, step_scale, move_to_absolute)
 
+    if was_in_edit_mode:
+        bbpl.utils.safe_mode_set('EDIT')
 
 
 def apply_export_transform(obj: bpy.types.Object, use_type: str = "Object"):
@@ -870,35 +908,97 @@ def rescale_select_curve_hooks(scale: float):
                     bezier_point.radius *= scale
 
 
+def get_object_bound_actions(obj: bpy.types.Object) -> List[bpy.types.Action]:
+    # Active action and NLA strips actions of the object, without duplicates.
+    actions: List[bpy.types.Action] = []
+
+    def add_action(action: Optional[bpy.types.Action]):
+        if action is not None and action not in actions:
+            actions.append(action)
+
+    def add_strips_actions(strips: Any):
+        for strip in strips:
+            add_action(strip.action)
+            add_strips_actions(strip.strips)  # Meta strips
+
+    animation_data = obj.animation_data
+    if animation_data:
+        add_action(animation_data.action)
+        for nla_track in animation_data.nla_tracks:
+            add_strips_actions(nla_track.strips)
+    return actions
+
+
+def rescale_fcurve_keyframes(fcurve: bpy.types.FCurve, scale: float) -> None:
+    # Rescale the Y of co, handle_left and handle_right in one NumPy operation.
+    keyframe_points = fcurve.keyframe_points
+    key_count = len(keyframe_points)
+    if key_count == 0:
+        return
+
+    coords = np.empty((3, key_count * 2), dtype=np.float32)
+    keyframe_points.foreach_get("co", coords[0])
+    keyframe_points.foreach_get("handle_left", coords[1])
+    keyframe_points.foreach_get("handle_right", coords[2])
+    coords[:, 1::2] *= scale
+    keyframe_points.foreach_set("co", coords[0])
+    keyframe_points.foreach_set("handle_left", coords[1])
+    keyframe_points.foreach_set("handle_right", coords[2])
+
+
 class ActionCurveScale():
 
-    def __init__(self, rescale_factor: float):
+    def __init__(self, rescale_factor: float, target_objects: Optional[List[bpy.types.Object]] = None):
+        # target_objects: rescale only the actions bound to these objects (Eg. the export selection), all the actions when None.
         self.rescale_factor = rescale_factor  # rigRescaleFactor
         self.default_unit_length = get_scene_unit_scale()
+        self.target_objects = target_objects
+        self.rescaled_actions: List[bpy.types.Action] = []
         self.print_debug = False  # Debug print
 
+    def get_actions_to_rescale(self) -> List[bpy.types.Action]:
+        if self.target_objects is None:
+            return list(bpy.data.actions)
+        actions: List[bpy.types.Action] = []
+        for obj in self.target_objects:
+            for action in get_object_bound_actions(obj):
+                if action not in actions:
+                    actions.append(action)
+        return actions
+
     def rescale_for_export(self):
         rf = self.rescale_factor
         length = self.default_unit_length
-        self.rescale_all_action_curves(rf, length/0.01)
+        # Restore the same actions even if the bindings change during the export.
+        self.rescaled_actions = self.get_actions_to_rescale()
+        self.rescale_action_curves(self.rescaled_actions, rf, length/0.01)
+
+    def rescale_added_actions_for_export(self):
+        # Rescale only the actions bound since the last rescale. Eg. when the exported action is changed.
+        rf = self.rescale_factor
+        length = self.default_unit_length
+        added_actions = [action for action in self.get_actions_to_rescale() if action not in self.rescaled_actions]
+        self.rescale_action_curves(added_actions, rf, length/0.01)
+        self.rescaled_actions.extend(added_actions)
 
     def restore_scale_after_export(self):
         rf = self.rescale_factor
         length = self.default_unit_length
 
-        self.rescale_all_action_curves(1/(rf), 0.01/length)
+        self.rescale_action_curves(self.rescaled_actions, 1/(rf), 0.01/length)
+        self.rescaled_actions = []
 
     def rescale_all_action_curves(self, bone_scale: float, scene_scale: float):
-        for action in bpy.data.actions:
+        self.rescale_action_curves(list(bpy.data.actions), bone_scale, scene_scale)
+
+    def rescale_action_curves(self, actions: List[bpy.types.Action], bone_scale: float, scene_scale: float):
+        for action in actions:
             if self.print_debug:
                 print(f"Rescale: {action.name} bone_scale: {bone_scale} scene_scale: {scene_scale}")
 
             def rescale_fcurve(fcurve: bpy.types.FCurve, scale: float):
                 # Rescale fcurve keyframe points
-                for key in fcurve.keyframe_points:
-                    key.co[1] *= scale
-                    key.handle_left[1] *= scale
-                    key.handle_right[1] *= scale
+                rescale_fcurve_keyframes(fcurve, scale)
 
                 # Rescale fcurve modifiers
                 for mod in fcurve.modifiers:
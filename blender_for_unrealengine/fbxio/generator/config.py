@@ -22,6 +22,13 @@ export_fbx_files_with_threading: List[str] = [
     'fbx_utils.py',
 ]
 
+# Multithreaded array compression is backported to the versions older than Blender 4.1.
+threading_backport_version: Tuple[int, int, int] = (4, 1, 0)
+threading_backport_source: str = "4_1"
+threading_backport_files: List[str] = [
+    'fbx_utils_threading.py',
+]
+
 all_export_fbx_files: List[str] = [
     'data_types.py',
     'encode_bin.py',
@@ -0,0 +1,430 @@
+# SPDX-FileCopyrightText: 2023-2025 Xavier Loux (BleuRaven)
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# ----------------------------------------------
+#  BPL -> BleuRaven Python Library
+#  https://github.com/xavier150/BPL
+# ----------------------------------------------
+
+from . import edit_files
+from typing import Tuple
+from pathlib import Path
+
+def update_encode_bin(file_path: Path, version: Tuple[int, int, int]):
+    if version < (4,1,0):
+        backport_multithreaded_compression(file_path) # fbx_utils_threading.py is copied from the 4.1 version
+    add_compressed_array_cache(file_path)
+    if version >= (4,1,0):
+        add_stream_writer(file_path) # Use the multithreaded array compression added in Blender 4.1
+
+def backport_multithreaded_compression(file_path: Path):
+    # Same multithreaded array compression as Blender 4.1 and newer.
+    search_lines_data_types_import = '''
+try:
+    from . import data_types
+except:
+    import data_types
+'''
+
+    threading_import = '''
+try:
+    from . import data_types
+    from .fbx_utils_threading import MultiThreadedTaskConsumer
+except:
+    import data_types
+    from fbx_utils_threading import MultiThreadedTaskConsumer
+'''
+
+    if edit_files.lines_exist(file_path, search_lines_data_types_import):
+        edit_files.replace_lines(file_path, search_lines_data_types_import, threading_import)
+    else:
+        edit_files.print_edit_error(f"Neither set of search lines were found in {file_path}")
+
+
+    search_lines_pack_import = '''
+from struct import pack
+'''
+
+    contextmanager_import = '''from contextlib import contextmanager
+'''
+
+    edit_files.add_after_lines(file_path, search_lines_pack_import, contextmanager_import)
+
+
+    search_lines_end_of_elem_init = '''
+        self._end_offset = -1
+        self._props_length = -1
+'''
+
+    enable_multithreading_cm = '''
+    @classmethod
+    @contextmanager
+    def enable_multithreading_cm(cls):
+        \"\"\"Temporarily enable multithreaded array compression.
+
+        The context manager handles starting up and shutting down the threads.
+
+        Only exits once all the threads are done (either all tasks were completed or an error occurred and the threads
+        were stopped prematurely).
+
+        Writing to a file is temporarily disabled as a safeguard.\"\"\"
+        # __enter__()
+        orig_func = cls._add_compressed_array_helper
+        orig_write = cls._write
+
+        def insert_compressed_array(props, insert_at, data, length):
+            # zlib.compress releases the GIL, so can be multithreaded.
+            data = zlib.compress(data, 1)
+            comp_len = len(data)
+
+            encoding = 1
+            data = pack('<3I', length, encoding, comp_len) + data
+            props[insert_at] = data
+
+        with MultiThreadedTaskConsumer.new_cpu_bound_cm(insert_compressed_array) as wrapped_func:
+            try:
+                def _add_compressed_array_helper_multi(self, data, length):
+                    # Append a dummy value that will be replaced with the compressed array data later.
+                    self.props.append(...)
+                    # The index to insert the compressed array into.
+                    insert_at = len(self.props) - 1
+                    # Schedule the array to be compressed on a separate thread and then inserted into the hierarchy at
+                    # `insert_at`.
+                    wrapped_func(self.props, insert_at, data, length)
+
+                # As an extra safeguard, temporarily replace the `_write` function to raise an error if called.
+                def temp_write(*_args, **_kwargs):
+                    raise RuntimeError("Writing is not allowed until multithreaded array compression has been disabled")
+
+                cls._add_compressed_array_helper = _add_compressed_array_helper_multi
+                cls._write = temp_write
+
+                # Return control back to the caller of __enter__().
+                yield
+            finally:
+                # __exit__()
+                # Restore the original functions.
+                cls._add_compressed_array_helper = orig_func
+                cls._write = orig_write
+            # Exiting the MultiThreadedTaskConsumer context manager will wait for all scheduled tasks to complete.
+'''
+
+    if edit_files.lines_exist(file_path, search_lines_end_of_elem_init):
+        edit_files.add_after_lines(file_path, search_lines_end_of_elem_init, enable_multithreading_cm)
+    else:
+        edit_files.print_edit_error(f"Neither set of search lines were found in {file_path}")
+
+
+    search_lines_array_helper_end = '''
+        # mimic behavior of fbxconverter (also common sense)
+        # we could make this configurable.
+        encoding = 0 if len(data) <= 128 else 1
+        if encoding == 0:
+            pass
+        elif encoding == 1:
+            data = zlib.compress(data, 1)
+
+        comp_len = len(data)
+
+        data = pack('<3I', length, encoding, comp_len) + data
+
+        self.props_type.append(prop_type)
+        self.props.append(data)
+'''
+
+    array_helper_end_with_compressed_array_helper = '''
+        self.props_type.append(prop_type)
+        # mimic behavior of fbxconverter (also common sense)
+        # we could make this configurable.
+        encoding = 0 if len(data) <= 128 else 1
+        if encoding == 0:
+            data = pack('<3I', length, encoding, len(data)) + data
+            self.props.append(data)
+        elif encoding == 1:
+            self._add_compressed_array_helper(data, length)
+
+    def _add_compressed_array_helper(self, data, length):
+        \"\"\"Note: This function may be swapped out by enable_multithreading_cm with an equivalent that supports
+        multithreading.\"\"\"
+        data = zlib.compress(data, 1)
+        comp_len = len(data)
+
+        encoding = 1
+        data = pack('<3I', length, encoding, comp_len) + data
+        self.props.append(data)
+'''
+
+    if edit_files.lines_exist(file_path, search_lines_array_helper_end):
+        edit_files.replace_lines(file_path, search_lines_array_helper_end, array_helper_end_with_compressed_array_helper)
+    else:
+        edit_files.print_edit_error(f"Neither set of search lines were found in {file_path}")
+
+def add_stream_writer(file_path: Path):
+    search_lines_end_of_write = '''
+        # unknown magic (always the same)
+        write(b'\\0' * 120)
+        write(b'\\xf8\\x5a\\x8c\\x6a\\xde\\xf5\\xd9\\x7e\\xec\\xe9\\x0c\\xe3\\x75\\x8f\\x29\\x0b')
+'''
+
+    stream_writer = '''
+
+# Blender-For-UnrealEngine: Stream writer.
+# Write the elements as soon as they are complete, then free them, so the whole FBX tree is never in memory.
+# The written file is the same as with write().
+
+def _elem_need_is_last(elem):
+    # Only the elements without children and props write a block sentinel that depend of is_last.
+    return not elem.elems and not elem.props and elem.id not in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL
+
+
+class FBXElemStreamWriter:
+    """Write an FBX file while its element tree is created.
+
+    Elements opened with open_elem() (like Objects) are written before their children and their end offset is written
+    back when they are closed with close_elem(). An opened element must not be the last child of its parent."""
+
+    def __init__(self, fn, version):
+        init_version(version)
+        self._version = version
+        self._file = open(fn, 'wb')
+        # [parent, elem, position of the end offset in the file, written children count]
+        self._open_elems = []
+        self._timedate_done = False
+
+        self._file.write(_HEAD_MAGIC)
+        self._file.write(pack('<I', version))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.close()
+
+    def _write_elems(self, parent, count, is_last):
+        """Write and free the `count` first children of parent, is_last is used for the last written child."""
+        if parent.id == b'' and not self._timedate_done:
+            # hack since we don't decode time.
+            # ideally we would _not_ modify this data.
+            _write_timedate_hack(parent)
+            self._timedate_done = True
+
+        write = self._file.write
+        tell = self._file.tell
+        elems = parent.elems
+        for i in range(count):
+            elem_is_last = is_last and i == count - 1
+            elems[i]._calc_offsets(tell(), elem_is_last)
+            elems[i]._write(write, tell, elem_is_last)
+        del elems[:count]
+
+        if self._open_elems and self._open_elems[-1][1] is parent:
+            self._open_elems[-1][3] += count
+
+    def write_complete_elems(self, parent):
+        """Write and free the children of parent.
+        The last child is kept when its data depend on whether it is the last one."""
+        count = len(parent.elems)
+        if count and _elem_need_is_last(parent.elems[-1]):
+            count -= 1
+        self._write_elems(parent, count, False)
+
+    @contextmanager
+    def write_step_cm(self, parent):
+        """Create elements with multithreaded array compression, then write the children of parent once all the
+        arrays are compressed."""
+        with FBXElem.enable_multithreading_cm():
+            yield
+        self.write_complete_elems(parent)
+
+    def open_elem(self, parent, elem):
+        """Write the header of elem, that must be the last child of parent. Its children are written later."""
+        assert(parent.elems and parent.elems[-1] is elem)
+
+        # The previous children are followed by elem, so they are not the last ones.
+        self._write_elems(parent, len(parent.elems) - 1, False)
+        parent.elems.pop()
+        if self._open_elems and self._open_elems[-1][1] is parent:
+            self._open_elems[-1][3] += 1
+
+        props_length = 0
+        for data in elem.props:
+            props_length += 1 + len(data)
+        elem._props_length = props_length
+
+        write = self._file.write
+        end_offset_pos = self._file.tell()
+        write(pack(_ELEM_META_FORMAT, 0, len(elem.props), props_length))  # End offset is written in close_elem().
+        write(bytes((len(elem.id),)))
+        write(elem.id)
+        for i, data in enumerate(elem.props):
+            write(bytes((elem.props_type[i],)))
+            write(data)
+
+        self._open_elems.append([parent, elem, end_offset_pos, 0])
+
+    def close_elem(self, elem):
+        """Write the remaining children of elem, then its end offset."""
+        assert(self._open_elems and self._open_elems[-1][1] is elem)
+        self._write_elems(elem, len(elem.elems), True)
+        _parent, _elem, end_offset_pos, written_count = self._open_elems.pop()
+
+        # Same as FBXElem._write_children(), with is_last False.
+        if written_count or not elem.props or elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL:
+            self._file.write(_BLOCK_SENTINEL_DATA)
+
+        end_offset = self._file.tell()
+        self._file.seek(end_offset_pos)
+        self._file.write(pack(_ELEM_META_FORMAT, end_offset, len(elem.props), elem._props_length))
+        self._file.seek(end_offset)
+        elem._end_offset = end_offset
+
+    def close(self, elem_root):
+        """Write the remaining root elements and the end of the file."""
+        assert(elem_root.id == b'')
+        assert(not self._open_elems)
+        self._write_elems(elem_root, len(elem_root.elems), True)
+
+        write = self._file.write
+        tell = self._file.tell
+        version = self._version
+
+        # Root has no props and is not the last, so it always ends with a block sentinel.
+        write(_BLOCK_SENTINEL_DATA)
+
+        write(_FOOT_ID)
+        write(b'\\x00' * 4)
+
+        # padding for alignment (values between 1 & 16 observed)
+        # if already aligned to 16, add a full 16 bytes padding.
+        ofs = tell()
+        pad = ((ofs + 15) & ~15) - ofs
+        if pad == 0:
+            pad = 16
+
+        write(b'\\0' * pad)
+
+        write(pack('<I', version))
+
+        # unknown magic (always the same)
+        write(b'\\0' * 120)
+        write(b'\\xf8\\x5a\\x8c\\x6a\\xde\\xf5\\xd9\\x7e\\xec\\xe9\\x0c\\xe3\\x75\\x8f\\x29\\x0b')
+'''
+
+    if edit_files.lines_exist(file_path, search_lines_end_of_write):
+        edit_files.add_after_lines(file_path, search_lines_end_of_write, stream_writer)
+    else:
+        edit_files.print_edit_error(f"Neither set of search lines were found in {file_path}")
+
+def add_compressed_array_cache(file_path: Path):
+    search_lines_zlib_import = '''
+import zlib
+'''
+
+    new_imports = '''import hashlib
+import threading
+from collections import OrderedDict
+'''
+
+    edit_files.add_after_lines(file_path, search_lines_zlib_import, new_imports)
+
+
+    # Replace the zlib calls before adding _compress_array_data().
+    search_lines_compress = '''zlib.compress(data, 1)'''
+
+    compress_with_cache = '''_compress_array_data(data)'''
+
+    if edit_files.lines_exist(file_path, search_lines_compress):
+        edit_files.replace_lines(file_path, search_lines_compress, compress_with_cache)
+    else:
+        edit_files.print_edit_error(f"Neither set of search lines were found in {file_path}")
+
+
+    search_lines_fbx_elem_class = '''
+class FBXElem:
+'''
+
+    compressed_array_cache = '''
+# Blender-For-UnrealEngine: Compressed array cache.
+# The same arrays are often written in several FBX files of an export (mesh exported with each action, LODs, etc.).
+# The key is a hash of the array data, so it already includes the mesh data and the export settings.
+
+class FBXCompressedArrayCache:
+    """Compressed array data reused between FBX exports. Thread safe.
+    When the cache is bigger than max_size (in bytes), the least recently used arrays are removed."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reused_size = 0  # Size of the arrays that were not compressed again.
+        self._arrays = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(data):
+        # hashlib releases the GIL with large data, like zlib.
+        return (len(data), hashlib.blake2b(data, digest_size=32).digest())
+
+    def get(self, key):
+        with self._lock:
+            comp_data = self._arrays.get(key)
+            if comp_data is None:
+                self.misses += 1
+                return None
+            self._arrays.move_to_end(key)
+            self.hits += 1
+            self.reused_size += key[0]
+            return comp_data
+
+    def add(self, key, comp_data):
+        comp_len = len(comp_data)
+        if comp_len > self.max_size:
+            return
+        with self._lock:
+            if key in self._arrays:
+                return
+            self._arrays[key] = comp_data
+            self.size += comp_len
+            while self.size > self.max_size:
+                _key, removed_data = self._arrays.popitem(last=False)
+                self.size -= len(removed_data)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._arrays.clear()
+            self.size = 0
+
+
+_compressed_array_cache = None
+
+
+def set_compressed_array_cache(cache):
+    """Use cache for the next compressed arrays, None to disable it. Returns the previous cache."""
+    global _compressed_array_cache
+    previous_cache = _compressed_array_cache
+    _compressed_array_cache = cache
+    return previous_cache
+
+
+def _compress_array_data(data):
+    cache = _compressed_array_cache
+    if cache is None:
+        return zlib.compress(data, 1)
+
+    key = cache.get_key(data)
+    comp_data = cache.get(key)
+    if comp_data is None:
+        comp_data = zlib.compress(data, 1)
+        cache.add(key, comp_data)
+    return comp_data
+
+'''
+
+    if edit_files.lines_exist(file_path, search_lines_fbx_elem_class):
+        edit_files.add_before_lines(file_path, search_lines_fbx_elem_class, compressed_array_cache)
+    else:
+        edit_files.print_edit_error(f"Neither set of search lines were found in {file_path}")
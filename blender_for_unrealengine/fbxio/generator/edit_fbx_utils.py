@@ -42,6 +42,9 @@ def update_fbx_utils(file_path: Path, version: Tuple[int, int, int]):
         new_func = add_aling_matrix_funcs(new_func, file_path)
         add_disable_free_scale_animation(file_path)
 
+    if version >= (4,0,0):
+        add_fast_fk_bake_setting(file_path)
+
 
 def add_re_import(file_path: Path):
     # 4.1 and older
@@ -239,6 +242,16 @@ def add_is_basic_bone_func(previous_func: str, file_path: Path):
     edit_files.add_after_lines(file_path, previous_func, new_function)
     return new_function
 
+def add_fast_fk_bake_setting(file_path: Path):
+
+    search_lines_FBXExportSettings = '''    "use_ue_mannequin_bone_alignment", "bone_align_matrix_dict", "disable_free_scale_animation",
+'''
+
+    new_FBXExportSettings = '''    "use_fast_fk_bake",
+'''
+
+    edit_files.add_after_lines(file_path, search_lines_FBXExportSettings, new_FBXExportSettings)
+
 def add_disable_free_scale_animation(file_path: Path):
 
     old_FBXExportSettings = '''
@@ -16,6 +16,7 @@ from pathlib import Path
 from . import edit_files
 from . import edit_fbx_utils
 from . import edit_export_fbx_bin
+from . import edit_encode_bin
 from . import config
 
 # Detect the current operating system
@@ -80,6 +81,8 @@ class FBXExporterGenerate:
 
         new_files: List[Path] = self.copy_export_files(dest_folder)
         new_files.append(self.create_init_file(dest_folder))
+        # Already generated, so not edited again.
+        self.copy_backported_files(dest_folder)
 
         for new_file in new_files:
             print("Process file:", new_file)
@@ -88,6 +91,8 @@ class FBXExporterGenerate:
                 edit_export_fbx_bin.update_export_fbx_bin(new_file, self.version, self.fbx_addon_version)
             if str(new_file).endswith('fbx_utils.py'):
                 edit_fbx_utils.update_fbx_utils(new_file, self.version)
+            if str(new_file).endswith('encode_bin.py'):
+                edit_encode_bin.update_encode_bin(new_file, self.version)
         return (self.version, version_as_module)
     
     def update_fbx_addon_version(self):
@@ -145,8 +150,32 @@ class FBXExporterGenerate:
         return new_files
 
 
+    def get_backported_files(self) -> List[str]:
+        if self.version < config.threading_backport_version:
+            return [file_name for file_name in config.threading_backport_files if file_name not in self.files]
+        return []
+
+    def copy_backported_files(self, dest_folder: Path) -> List[Path]:
+        # Files of a newer version already generated, generated var are ordered from new to older.
+        source_folder: Path = parent_directory / (config.io_scene_fbx_prefix + config.threading_backport_source)
+        new_files: List[Path] = []
+        for file_name in self.get_backported_files():
+            source_file: Path = source_folder / file_name
+            destination_file: Path = dest_folder / file_name
+            if source_file.exists():
+                shutil.copy2(source_file, destination_file)
+                new_files.append(destination_file)
+            else:
+                print(f"File does not exist: {source_file}")
+
+        if new_files:
+            print(f"Copied backported FBX exporter files.")
+            print(f"Source: {source_folder}")
+            print(f"Target: {dest_folder}")
+        return new_files
+
     def create_init_file(self, dest_folder: Path) -> Path:
-        files = self.files
+        files = self.files + self.get_backported_files()
         init_file_path = dest_folder / '__init__.py'
         with open(init_file_path, 'w', newline='\n') as init_file:
             # Write imports
@@ -12,6 +12,7 @@ from . import data_types
 from . import encode_bin
 from . import export_fbx_bin
 from . import fbx_utils
+from . import fbx_utils_threading
 
 if "bpy" in locals():
 	import importlib
@@ -24,3 +25,5 @@ if "bpy" in locals():
 # import_fbx and fbx_utils should not be reload or the export will produce StructRNA errors. 
 #	if "fbx_utils" in locals():
 #		importlib.reload(fbx_utils)
+	if "fbx_utils_threading" in locals():
+		importlib.reload(fbx_utils_threading)
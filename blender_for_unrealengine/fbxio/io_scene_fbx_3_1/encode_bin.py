@@ -32,12 +32,18 @@
 
 try:
     from . import data_types
+    from .fbx_utils_threading import MultiThreadedTaskConsumer
 except:
     import data_types
+    from fbx_utils_threading import MultiThreadedTaskConsumer
 
 from struct import pack
+from contextlib import contextmanager
 import array
 import zlib
+import hashlib
+import threading
+from collections import OrderedDict
 
 _BLOCK_SENTINEL_LENGTH = 13
 _BLOCK_SENTINEL_DATA = (b'\0' * _BLOCK_SENTINEL_LENGTH)
@@ -56,6 +62,84 @@ _FOOT_ID = b'\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e'
 _ELEMS_ID_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
 
 
+# Blender-For-UnrealEngine: Compressed array cache.
+# The same arrays are often written in several FBX files of an export (mesh exported with each action, LODs, etc.).
+# The key is a hash of the array data, so it already includes the mesh data and the export settings.
+
+class FBXCompressedArrayCache:
+    """Compressed array data reused between FBX exports. Thread safe.
+    When the cache is bigger than max_size (in bytes), the least recently used arrays are removed."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reused_size = 0  # Size of the arrays that were not compressed again.
+        self._arrays = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(data):
+        # hashlib releases the GIL with large data, like zlib.
+        return (len(data), hashlib.blake2b(data, digest_size=32).digest())
+
+    def get(self, key):
+        with self._lock:
+            comp_data = self._arrays.get(key)
+            if comp_data is None:
+                self.misses += 1
+                return None
+            self._arrays.move_to_end(key)
+            self.hits += 1
+            self.reused_size += key[0]
+            return comp_data
+
+    def add(self, key, comp_data):
+        comp_len = len(comp_data)
+        if comp_len > self.max_size:
+            return
+        with self._lock:
+            if key in self._arrays:
+                return
+            self._arrays[key] = comp_data
+            self.size += comp_len
+            while self.size > self.max_size:
+                _key, removed_data = self._arrays.popitem(last=False)
+                self.size -= len(removed_data)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._arrays.clear()
+            self.size = 0
+
+
+_compressed_array_cache = None
+
+
+def set_compressed_array_cache(cache):
+    """Use cache for the next compressed arrays, None to disable it. Returns the previous cache."""
+    global _compressed_array_cache
+    previous_cache = _compressed_array_cache
+    _compressed_array_cache = cache
+    return previous_cache
+
+
+def _compress_array_data(data):
+    cache = _compressed_array_cache
+    if cache is None:
+        return zlib.compress(data, 1)
+
+    key = cache.get_key(data)
+    comp_data = cache.get(key)
+    if comp_data is None:
+        comp_data = zlib.compress(data, 1)
+        cache.add(key, comp_data)
+    return comp_data
+
+
 class FBXElem:
     __slots__ = (
         "id",
@@ -76,6 +160,57 @@ class FBXElem:
         self._end_offset = -1
         self._props_length = -1
 
+    @classmethod
+    @contextmanager
+    def enable_multithreading_cm(cls):
+        """Temporarily enable multithreaded array compression.
+
+        The context manager handles starting up and shutting down the threads.
+
+        Only exits once all the threads are done (either all tasks were completed or an error occurred and the threads
+        were stopped prematurely).
+
+        Writing to a file is temporarily disabled as a safeguard."""
+        # __enter__()
+        orig_func = cls._add_compressed_array_helper
+        orig_write = cls._write
+
+        def insert_compressed_array(props, insert_at, data, length):
+            # zlib.compress releases the GIL, so can be multithreaded.
+            data = _compress_array_data(data)
+            comp_len = len(data)
+
+            encoding = 1
+            data = pack('<3I', length, encoding, comp_len) + data
+            props[insert_at] = data
+
+        with MultiThreadedTaskConsumer.new_cpu_bound_cm(insert_compressed_array) as wrapped_func:
+            try:
+                def _add_compressed_array_helper_multi(self, data, length):
+                    # Append a dummy value that will be replaced with the compressed array data later.
+                    self.props.append(...)
+                    # The index to insert the compressed array into.
+                    insert_at = len(self.props) - 1
+                    # Schedule the array to be compressed on a separate thread and then inserted into the hierarchy at
+                    # `insert_at`.
+                    wrapped_func(self.props, insert_at, data, length)
+
+                # As an extra safeguard, temporarily replace the `_write` function to raise an error if called.
+                def temp_write(*_args, **_kwargs):
+                    raise RuntimeError("Writing is not allowed until multithreaded array compression has been disabled")
+
+                cls._add_compressed_array_helper = _add_compressed_array_helper_multi
+                cls._write = temp_write
+
+                # Return control back to the caller of __enter__().
+                yield
+            finally:
+                # __exit__()
+                # Restore the original functions.
+                cls._add_compressed_array_helper = orig_func
+                cls._write = orig_write
+            # Exiting the MultiThreadedTaskConsumer context manager will wait for all scheduled tasks to complete.
+
     def add_bool(self, data):
         assert(isinstance(data, bool))
         data = pack('?', data)
@@ -151,19 +286,24 @@ class FBXElem:
             data.byteswap()
         data = data.tobytes()
 
+        self.props_type.append(prop_type)
         # mimic behavior of fbxconverter (also common sense)
         # we could make this configurable.
         encoding = 0 if len(data) <= 128 else 1
         if encoding == 0:
-            pass
+            data = pack('<3I', length, encoding, len(data)) + data
+            self.props.append(data)
         elif encoding == 1:
-            data = zlib.compress(data, 1)
+            self._add_compressed_array_helper(data, length)
 
+    def _add_compressed_array_helper(self, data, length):
+        """Note: This function may be swapped out by enable_multithreading_cm with an equivalent that supports
+        multithreading."""
+        data = _compress_array_data(data)
         comp_len = len(data)
 
+        encoding = 1
         data = pack('<3I', length, encoding, comp_len) + data
-
-        self.props_type.append(prop_type)
         self.props.append(data)
 
     def add_int32_array(self, data):
@@ -2206,6 +2206,358 @@ def fbx_generate_leaf_bones(settings, data_bones):
     return leaf_bones
 
 
+# Blender-For-UnrealEngine: Fast FK bake.
+# Armatures only animated by the loc/rot/scale F-Curves of their pose bones (no constraints, drivers, IK or NLA mix)
+# are baked from their action without calling scene.frame_set() for each frame, which evaluates the whole scene.
+# The local matrix of these bones is `matrix_rest_local @ basis`, it is composed for all the frames at once with numpy.
+# The bake is only used when it matches the pose evaluated by scene.frame_set() on the current and a few sampled frames.
+
+FAST_FK_BAKE_TRANSFORM_PROPS = {'location': 3, 'rotation_quaternion': 4, 'rotation_euler': 3, 'rotation_axis_angle': 4, 'scale': 3}
+# Frames of the bake compared with the frame_set() pose before it is used.
+FAST_FK_BAKE_CHECK_FRAME_COUNT = 5
+
+
+def fast_fk_bake_is_static_object(ob):
+    # Objects without animation, driver or constraint in their whole parent chain.
+    while ob is not None:
+        anim_data = ob.animation_data
+        if anim_data and (anim_data.action or anim_data.drivers or anim_data.nla_tracks):
+            return False
+        if ob.constraints or ob.rigid_body or ob.parent_type not in {'OBJECT', 'ARMATURE'}:
+            return False
+        ob = ob.parent
+    return True
+
+
+def fast_fk_bake_get_fcurves(anim_data):
+    action = anim_data.action
+    if action is None:
+        return ()
+    if hasattr(anim_data, "action_slot"):
+        # Slotted actions, Blender 4.4 and newer.
+        from bpy_extras import anim_utils
+        if anim_data.action_slot is None:
+            return ()
+        channelbag = anim_utils.action_get_channelbag_for_slot(action, anim_data.action_slot)
+        return channelbag.fcurves if channelbag else ()
+    return action.fcurves
+
+
+def fast_fk_bake_get_armature_channels(arm):
+    """
+    Return the F-Curves of the pose bones of the armature object as {bone_name: {prop: {array_index: fcurve}}},
+    or None when the pose is not only driven by them.
+    """
+    if arm.constraints or arm.rigid_body or arm.data.pose_position != 'POSE':
+        return None
+    if arm.parent_type not in {'OBJECT', 'ARMATURE'} or not fast_fk_bake_is_static_object(arm.parent):
+        return None
+    arm_data_anim = arm.data.animation_data
+    if arm_data_anim and (arm_data_anim.action or arm_data_anim.drivers):
+        return None
+    for pose_bone in arm.pose.bones:
+        bone = pose_bone.bone
+        if (pose_bone.constraints or not bone.use_inherit_rotation or bone.inherit_scale != 'FULL'
+                or not bone.use_local_location):
+            return None
+
+    channels = {}
+    anim_data = arm.animation_data
+    if anim_data is None:
+        return channels
+    if anim_data.drivers or anim_data.use_tweak_mode:
+        return None
+    if anim_data.use_nla and any(not track.mute and track.strips for track in anim_data.nla_tracks):
+        return None
+    if anim_data.action_influence != 1.0 or anim_data.action_blend_type != 'REPLACE':
+        return None
+
+    for fcurve in fast_fk_bake_get_fcurves(anim_data):
+        if fcurve.mute or (fcurve.group and fcurve.group.mute):
+            continue
+        data_path = fcurve.data_path
+        if not data_path.startswith("pose.bones["):
+            # Object transform or property, the armature object would not be static.
+            return None
+        if data_path.endswith('"]'):
+            # Bone custom property.
+            continue
+        bone_path, _, prop = data_path.rpartition('.')
+        if prop.startswith("bbone_"):
+            continue
+        if prop not in FAST_FK_BAKE_TRANSFORM_PROPS:
+            return None
+        try:
+            pose_bone = arm.path_resolve(bone_path)
+        except ValueError:
+            continue  # Invalid F-Curves are not evaluated by Blender.
+        if fcurve.array_index < FAST_FK_BAKE_TRANSFORM_PROPS[prop]:
+            channels.setdefault(pose_bone.name, {}).setdefault(prop, {})[fcurve.array_index] = fcurve
+    return channels
+
+
+def fast_fk_bake_evaluate_fcurve(fcurve, frames):
+    keyframe_points = fcurve.keyframe_points
+    num_keys = len(keyframe_points)
+    if num_keys and not fcurve.modifiers and fcurve.extrapolation == 'CONSTANT':
+        co = np.empty(num_keys * 2, dtype=np.float32)
+        keyframe_points.foreach_get("co", co)
+        key_frames = co[0::2]
+        # Linear keys, or all the frames on keys, are interpolated for all the frames at once.
+        if (all(key.interpolation == 'LINEAR' for key in keyframe_points[:-1])
+                or np.isin(frames.astype(np.float32), key_frames).all()):
+            return np.interp(frames, key_frames, co[1::2])
+    return np.fromiter(map(fcurve.evaluate, frames.tolist()), dtype=float, count=len(frames))
+
+
+def fast_fk_bake_channel_values(pose_bone, prop, channels, frames):
+    # First row is the current value, used to check the result.
+    current = tuple(getattr(pose_bone, prop))
+    values = np.empty((len(frames) + 1, len(current)))
+    values[:] = current
+    for array_index, fcurve in channels.get(prop, {}).items():
+        values[1:, array_index] = fast_fk_bake_evaluate_fcurve(fcurve, frames)
+    return values
+
+
+def fast_fk_bake_quaternion_matrices(quaternions):
+    # Same as normalize_qt(), a null quaternion is a 180 degrees rotation around X.
+    length = np.linalg.norm(quaternions, axis=1)
+    is_null = length == 0.0
+    quaternions = quaternions / np.where(is_null, 1.0, length)[:, None]
+    quaternions[is_null] = (0.0, 1.0, 0.0, 0.0)
+    w, x, y, z = quaternions.T
+    matrices = np.empty((len(quaternions), 3, 3))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - w * z)
+    matrices[:, 0, 2] = 2.0 * (x * z + w * y)
+    matrices[:, 1, 0] = 2.0 * (x * y + w * z)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - w * x)
+    matrices[:, 2, 0] = 2.0 * (x * z - w * y)
+    matrices[:, 2, 1] = 2.0 * (y * z + w * x)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+def fast_fk_bake_axis_angle_matrices(axis_angles):
+    # Same as axis_angle_to_mat3(), a null axis is no rotation.
+    angle, axis = axis_angles[:, 0], axis_angles[:, 1:]
+    length = np.linalg.norm(axis, axis=1)
+    is_null = length == 0.0
+    quaternions = np.empty((len(axis_angles), 4))
+    quaternions[:, 0] = np.cos(angle / 2.0)
+    quaternions[:, 1:] = axis * (np.sin(angle / 2.0) / np.where(is_null, 1.0, length))[:, None]
+    quaternions[is_null] = (1.0, 0.0, 0.0, 0.0)
+    return fast_fk_bake_quaternion_matrices(quaternions)
+
+
+def fast_fk_bake_euler_matrices(eulers, order):
+    # The first axis of the order is applied first, 'XYZ' is Rz @ Ry @ Rx.
+    matrices = np.broadcast_to(np.identity(3), (len(eulers), 3, 3))
+    for axis in order:
+        index = 'XYZ'.index(axis)
+        i, j = ((1, 2), (2, 0), (0, 1))[index]
+        cos, sin = np.cos(eulers[:, index]), np.sin(eulers[:, index])
+        axis_matrices = np.zeros((len(eulers), 3, 3))
+        axis_matrices[:, index, index] = 1.0
+        axis_matrices[:, i, i] = cos
+        axis_matrices[:, i, j] = -sin
+        axis_matrices[:, j, i] = sin
+        axis_matrices[:, j, j] = cos
+        matrices = axis_matrices @ matrices
+    return matrices
+
+
+def fast_fk_bake_basis_matrices(pose_bone, channels, frames):
+    # Same as BKE_pchan_to_mat4(), `loc @ rot @ scale`.
+    rotation_mode = pose_bone.rotation_mode
+    if rotation_mode == 'QUATERNION':
+        rot = fast_fk_bake_quaternion_matrices(fast_fk_bake_channel_values(pose_bone, 'rotation_quaternion', channels, frames))
+    elif rotation_mode == 'AXIS_ANGLE':
+        rot = fast_fk_bake_axis_angle_matrices(fast_fk_bake_channel_values(pose_bone, 'rotation_axis_angle', channels, frames))
+    else:
+        rot = fast_fk_bake_euler_matrices(fast_fk_bake_channel_values(pose_bone, 'rotation_euler', channels, frames), rotation_mode)
+    scale = fast_fk_bake_channel_values(pose_bone, 'scale', channels, frames)
+    basis = np.zeros((len(frames) + 1, 4, 4))
+    basis[:, :3, :3] = rot * scale[:, None, :]
+    basis[:, 3, 3] = 1.0
+    if not pose_bone.bone.use_connect:
+        # Connected bones ignore their location.
+        basis[:, :3, 3] = fast_fk_bake_channel_values(pose_bone, 'location', channels, frames)
+    return basis
+
+
+def fast_fk_bake_bone_correction_matrices(scene_data, bo_obj):
+    # Matrices applied before and after the bone local matrix in ObjectWrapper.fbx_object_matrix().
+    settings = scene_data.settings
+    parent = bo_obj.parent
+    matrix_pre = Matrix()
+    if settings.bone_correction_matrix_inv and parent and parent.is_bone:
+        par_mat_align_inv = bo_obj.get_parent_bone_align_matrix_inv(scene_data)
+        if par_mat_align_inv:
+            matrix_pre = par_mat_align_inv @ matrix_pre
+        if settings.reverse_direction_bone_correction_matrix_inv and parent.is_reverse_direction_bone(scene_data):
+            matrix_pre = settings.reverse_direction_bone_correction_matrix_inv @ matrix_pre
+        elif settings.bone_correction_matrix_inv:
+            matrix_pre = settings.bone_correction_matrix_inv @ matrix_pre
+    matrix_post = Matrix()
+    mat_align = bo_obj.get_bone_align_matrix(scene_data)
+    if mat_align:
+        matrix_post = matrix_post @ mat_align
+    if settings.reverse_direction_bone_correction_matrix and bo_obj.is_reverse_direction_bone(scene_data):
+        matrix_post = matrix_post @ settings.reverse_direction_bone_correction_matrix
+    elif settings.bone_correction_matrix:
+        matrix_post = matrix_post @ settings.bone_correction_matrix
+    return matrix_pre, matrix_post
+
+
+def fast_fk_bake_euler_candidates(rot):
+    # Same as mat3_normalized_to_eul2(), the two 'XYZ' eulers of the rotation matrices.
+    cy = np.hypot(rot[..., 0, 0], rot[..., 1, 0])
+    is_valid = cy > 16.0 * np.finfo(np.float32).eps
+    eul1 = np.empty(rot.shape[:-1])
+    eul2 = np.empty(rot.shape[:-1])
+    eul1[..., 0] = np.where(is_valid, np.arctan2(rot[..., 2, 1], rot[..., 2, 2]), np.arctan2(-rot[..., 1, 2], rot[..., 1, 1]))
+    eul1[..., 1] = np.arctan2(-rot[..., 2, 0], cy)
+    eul1[..., 2] = np.where(is_valid, np.arctan2(rot[..., 1, 0], rot[..., 0, 0]), 0.0)
+    eul2[..., 0] = np.where(is_valid, np.arctan2(-rot[..., 2, 1], -rot[..., 2, 2]), eul1[..., 0])
+    eul2[..., 1] = np.where(is_valid, np.arctan2(-rot[..., 2, 0], -cy), eul1[..., 1])
+    eul2[..., 2] = np.where(is_valid, np.arctan2(-rot[..., 1, 0], -rot[..., 0, 0]), 0.0)
+    return eul1, eul2
+
+
+def fast_fk_bake_compatible_euler(eul, old):
+    # Same as compatible_eul().
+    pi_x2 = 2.0 * math.pi
+    deul = eul - old
+    wrap = np.floor(np.abs(deul) / pi_x2 + 0.5) * pi_x2
+    eul = np.where(deul > math.pi, eul - wrap, np.where(deul < -math.pi, eul + wrap, eul))
+    deul = eul - old
+    abs_deul = np.abs(deul)
+    for i, j, k in ((0, 1, 2), (1, 0, 2), (2, 0, 1)):
+        flip = (abs_deul[:, i] > 3.2) & (abs_deul[:, j] < 1.6) & (abs_deul[:, k] < 1.6)
+        eul[flip, i] -= np.copysign(pi_x2, deul[flip, i])
+    return eul
+
+
+def fast_fk_bake_matrices_match(scene_data, bones, matrices):
+    # True when the composed matrices are the ones of the evaluated pose, used by the frame_set() path.
+    for bone_index, bo_obj in enumerate(bones):
+        pose_matrix = np.array(bo_obj.fbx_object_matrix(scene_data))
+        if not np.allclose(matrices[bone_index], pose_matrix, rtol=1e-4, atol=1e-4 * max(1.0, np.abs(pose_matrix).max())):
+            return False
+    return True
+
+
+def fast_fk_bake_sampled_frames_match(scene_data, bones, matrices, frames):
+    # Compare a few frames of the bake with the pose evaluated by scene.frame_set(), like the default bake.
+    scene = scene_data.scene
+    back_frame = scene.frame_current
+    back_subframe = scene.frame_subframe
+    frame_indices = np.unique(np.linspace(0, len(frames) - 1, FAST_FK_BAKE_CHECK_FRAME_COUNT).round().astype(int))
+    try:
+        for frame_index in frame_indices.tolist():
+            frame = frames[frame_index]
+            int_frame = int(frame)
+            scene.frame_set(int_frame, subframe=frame - int_frame)
+            if not fast_fk_bake_matrices_match(scene_data, bones, matrices[frame_index]):
+                return False
+    finally:
+        scene.frame_set(back_frame, subframe=back_subframe)
+    return True
+
+
+def fast_fk_bake_bones_values(scene_data, bones, p_rots, armature_channels, frames):
+    """
+    Return the (frames, bones, 9) baked loc/rot/scale values of the bones, same as fbx_object_tx() for each frame,
+    or None when the composed matrices are not the ones of the evaluated poses.
+    """
+    matrices = np.empty((len(frames) + 1, len(bones), 4, 4))
+    for bone_index, bo_obj in enumerate(bones):
+        pose_bone = bo_obj.bdata_pose_bone
+        channels = armature_channels[bo_obj.armature.bdata].get(pose_bone.name, {})
+        basis = fast_fk_bake_basis_matrices(pose_bone, channels, frames)
+        matrix_pre, matrix_post = fast_fk_bake_bone_correction_matrices(scene_data, bo_obj)
+        matrices[:, bone_index] = np.array(matrix_pre @ bo_obj.matrix_rest_local) @ basis @ np.array(matrix_post)
+    # The first matrices are the current pose, then check a few sampled frames.
+    if not fast_fk_bake_matrices_match(scene_data, bones, matrices[0]):
+        return None
+    matrices = matrices[1:]
+    if len(frames) and not fast_fk_bake_sampled_frames_match(scene_data, bones, matrices, frames):
+        return None
+
+    # Same as Matrix.decompose().
+    values = np.empty((len(frames), len(bones), 9))
+    values[..., 0:3] = matrices[..., :3, 3]
+    mat3 = matrices[..., :3, :3]
+    scale = np.linalg.norm(mat3, axis=-2)
+    rot = mat3 / np.where(scale == 0.0, 1.0, scale)[..., None, :]
+    is_negative = np.linalg.det(rot) < 0.0
+    rot[is_negative] *= -1.0
+    scale[is_negative] *= -1.0
+    # Sheared matrices (non uniform scale in the parents) are converted through a quaternion by decompose().
+    if not np.allclose(rot @ np.swapaxes(rot, -1, -2), np.identity(3), atol=1e-5):
+        return None
+
+    if scene_data.settings.disable_free_scale_animation:
+        is_basic_bone = np.array([bo_obj.is_basic_bone() for bo_obj in bones])
+        scale_value = scale[:, is_basic_bone].mean(axis=-1)
+        scale_value[np.abs(scale_value - 1.0) <= 0.00001 * np.maximum(np.abs(scale_value), 1.0)] = 1.0
+        scale[:, is_basic_bone] = scale_value[..., None]
+    values[..., 6:9] = scale
+
+    # Same as Quaternion.to_euler('XYZ', rot_euler_compat), each frame is compatible with the previous one.
+    eul1, eul2 = fast_fk_bake_euler_candidates(rot)
+    old = np.array(p_rots, dtype=float).reshape(len(bones), 3)
+    for frame_index in range(len(frames)):
+        compat1 = fast_fk_bake_compatible_euler(eul1[frame_index], old)
+        compat2 = fast_fk_bake_compatible_euler(eul2[frame_index], old)
+        use_eul2 = np.abs(compat1 - old).sum(axis=1) > np.abs(compat2 - old).sum(axis=1)
+        old = np.where(use_eul2[:, None], compat2, compat1)
+        values[frame_index, :, 3:6] = old
+    return values
+
+
+def fast_fk_bake_values(scene_data, animdata_ob, p_rots, frames):
+    """
+    Return the baked loc/rot/scale values of animdata_ob in the same order as frame_values_gen(),
+    or None when an object is not only animated by the FK of an armature.
+    """
+    scene = scene_data.scene
+    if scene.render.frame_map_old != scene.render.frame_map_new:
+        return None
+
+    armature_channels = {}
+    static_values = {}
+    bones = []
+    for ob_obj in animdata_ob:
+        if ob_obj.is_bone or (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
+            arm = ob_obj.armature.bdata if ob_obj.is_bone else ob_obj.bdata
+            if arm not in armature_channels:
+                armature_channels[arm] = fast_fk_bake_get_armature_channels(arm)
+            if armature_channels[arm] is None:
+                return None
+        elif not ob_obj.is_object or not fast_fk_bake_is_static_object(ob_obj.bdata):
+            return None
+        if ob_obj.is_bone:
+            bones.append(ob_obj)
+        else:
+            loc, rot, scale, _m, _mr = ob_obj.fbx_object_tx(scene_data, rot_euler_compat=p_rots[ob_obj])
+            static_values[ob_obj] = (*loc, *rot, *scale)
+
+    values = np.empty((len(frames), len(animdata_ob), 9))
+    if bones:
+        bone_values = fast_fk_bake_bones_values(scene_data, bones, [p_rots[bo_obj] for bo_obj in bones], armature_channels, frames)
+        if bone_values is None:
+            return None
+        values[:, [index for index, ob_obj in enumerate(animdata_ob) if ob_obj.is_bone]] = bone_values
+    for index, ob_obj in enumerate(animdata_ob):
+        if not ob_obj.is_bone:
+            values[:, index] = static_values[ob_obj]
+    return values.reshape(-1)
+
+
 def fbx_animations_do(scene_data, ref_id, f_start, f_end, start_zero, objects=None, force_keep=False):
     """
     Generate animation data (a single AnimStack) from objects, for a given frame range.
@@ -2360,7 +2712,12 @@ def fbx_animations_do(scene_data, ref_id, f_start, f_end, start_zero, objects=No
     num_custom_curve_values = len(animdata_custom_curves)  # Only 1 value per custom property
     num_values_per_frame = num_ob_values + num_shape_values + num_camera_values + num_custom_curve_values
     num_frames = len(real_currframes)
-    all_values_flat = np.fromiter(frame_values_gen(), dtype=float, count=num_frames * num_values_per_frame)
+    # Blender-For-UnrealEngine: Bake the armatures only animated by FK from their F-Curves, without frame_set().
+    all_values_flat = None
+    if scene_data.settings.use_fast_fk_bake and num_values_per_frame == num_ob_values and not has_animated_duplis:
+        all_values_flat = fast_fk_bake_values(scene_data, animdata_ob, p_rots, currframes)
+    if all_values_flat is None:
+        all_values_flat = np.fromiter(frame_values_gen(), dtype=float, count=num_frames * num_values_per_frame)
 
     # Restore the scene's current frame.
     scene.frame_set(back_currframe, subframe=0.0)
@@ -3453,6 +3810,7 @@ def save_single(operator, scene, depsgraph, filepath="",
                 mirror_symmetry_right_side_bones=False,
                 use_ue_mannequin_bone_alignment=False,
                 disable_free_scale_animation=False,
+                use_fast_fk_bake=False,
                 use_metadata=True,
                 path_mode='AUTO',
                 use_mesh_edges=True,
@@ -3562,6 +3920,7 @@ def save_single(operator, scene, depsgraph, filepath="",
         add_leaf_bones, bone_correction_matrix, bone_correction_matrix_inv,
         reverse_direction_bone_correction_matrix, reverse_direction_bone_correction_matrix_inv,
         use_ue_mannequin_bone_alignment, bone_align_matrix_dict, disable_free_scale_animation,
+        use_fast_fk_bake,
         bake_anim, bake_anim_use_all_bones, bake_anim_use_nla_strips, bake_anim_use_all_actions,
         bake_anim_step, bake_anim_simplify_factor, bake_anim_force_startend_keying,
         False, media_settings, use_custom_props, colors_type, prioritize_active_color
@@ -3575,31 +3934,35 @@ def save_single(operator, scene, depsgraph, filepath="",
     # Generate some data about exported scene...
     scene_data = fbx_data_from_scene(scene, depsgraph, settings)
 
-    root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
+    # Enable multithreaded array compression in FBXElem and wait until all threads are done before exiting the context
+    # manager.
+    with encode_bin.FBXElem.enable_multithreading_cm():
+        # Writing elements into an FBX hierarchy can now begin.
+        root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
 
-    # Mostly FBXHeaderExtension and GlobalSettings.
-    fbx_header_elements(root, scene_data)
+        # Mostly FBXHeaderExtension and GlobalSettings.
+        fbx_header_elements(root, scene_data)
 
-    # Documents and References are pretty much void currently.
-    fbx_documents_elements(root, scene_data)
-    fbx_references_elements(root, scene_data)
+        # Documents and References are pretty much void currently.
+        fbx_documents_elements(root, scene_data)
+        fbx_references_elements(root, scene_data)
 
-    # Templates definitions.
-    fbx_definitions_elements(root, scene_data)
+        # Templates definitions.
+        fbx_definitions_elements(root, scene_data)
 
-    # Actual data.
-    fbx_objects_elements(root, scene_data)
+        # Actual data.
+        fbx_objects_elements(root, scene_data)
 
-    # How data are inter-connected.
-    fbx_connections_elements(root, scene_data)
+        # How data are inter-connected.
+        fbx_connections_elements(root, scene_data)
 
-    # Animation.
-    fbx_takes_elements(root, scene_data)
+        # Animation.
+        fbx_takes_elements(root, scene_data)
 
-    # Cleanup!
-    fbx_scene_data_cleanup(scene_data)
+        # Cleanup!
+        fbx_scene_data_cleanup(scene_data)
 
-    # And we are down, we can write the whole thing!
+    # And we are done, all multithreaded tasks are complete, and we can write the whole thing to file!
     encode_bin.write(filepath, root, FBX_VERSION)
 
     # Clear cached ObjectWrappers!
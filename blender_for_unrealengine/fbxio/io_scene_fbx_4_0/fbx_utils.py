@@ -1974,6 +1974,7 @@ FBXExportSettings = namedtuple("FBXExportSettings", (
     "bone_correction_matrix", "bone_correction_matrix_inv",
     "reverse_direction_bone_correction_matrix", "reverse_direction_bone_correction_matrix_inv",
     "use_ue_mannequin_bone_alignment", "bone_align_matrix_dict", "disable_free_scale_animation",
+    "use_fast_fk_bake",
     "bake_anim", "bake_anim_use_all_bones", "bake_anim_use_nla_strips", "bake_anim_use_all_actions",
     "bake_anim_step", "bake_anim_simplify_factor", "bake_anim_force_startend_keying",
     "use_metadata", "media_settings", "use_custom_props", "colors_type", "prioritize_active_color"
@@ -24,6 +24,9 @@ from contextlib import contextmanager
 import array
 import numpy as np
 import zlib
+import hashlib
+import threading
+from collections import OrderedDict
 
 _BLOCK_SENTINEL_LENGTH = ...
 _BLOCK_SENTINEL_DATA = ...
@@ -44,6 +47,84 @@ _FOOT_ID = b'\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e'
 _ELEMS_ID_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
 
 
+# Blender-For-UnrealEngine: Compressed array cache.
+# The same arrays are often written in several FBX files of an export (mesh exported with each action, LODs, etc.).
+# The key is a hash of the array data, so it already includes the mesh data and the export settings.
+
+class FBXCompressedArrayCache:
+    """Compressed array data reused between FBX exports. Thread safe.
+    When the cache is bigger than max_size (in bytes), the least recently used arrays are removed."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reused_size = 0  # Size of the arrays that were not compressed again.
+        self._arrays = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(data):
+        # hashlib releases the GIL with large data, like zlib.
+        return (len(data), hashlib.blake2b(data, digest_size=32).digest())
+
+    def get(self, key):
+        with self._lock:
+            comp_data = self._arrays.get(key)
+            if comp_data is None:
+                self.misses += 1
+                return None
+            self._arrays.move_to_end(key)
+            self.hits += 1
+            self.reused_size += key[0]
+            return comp_data
+
+    def add(self, key, comp_data):
+        comp_len = len(comp_data)
+        if comp_len > self.max_size:
+            return
+        with self._lock:
+            if key in self._arrays:
+                return
+            self._arrays[key] = comp_data
+            self.size += comp_len
+            while self.size > self.max_size:
+                _key, removed_data = self._arrays.popitem(last=False)
+                self.size -= len(removed_data)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._arrays.clear()
+            self.size = 0
+
+
+_compressed_array_cache = None
+
+
+def set_compressed_array_cache(cache):
+    """Use cache for the next compressed arrays, None to disable it. Returns the previous cache."""
+    global _compressed_array_cache
+    previous_cache = _compressed_array_cache
+    _compressed_array_cache = cache
+    return previous_cache
+
+
+def _compress_array_data(data):
+    cache = _compressed_array_cache
+    if cache is None:
+        return zlib.compress(data, 1)
+
+    key = cache.get_key(data)
+    comp_data = cache.get(key)
+    if comp_data is None:
+        comp_data = zlib.compress(data, 1)
+        cache.add(key, comp_data)
+    return comp_data
+
+
 class FBXElem:
     __slots__ = (
         "id",
@@ -81,7 +162,7 @@ class FBXElem:
 
         def insert_compressed_array(props, insert_at, data, length):
             # zlib.compress releases the GIL, so can be multithreaded.
-            data = zlib.compress(data, 1)
+            data = _compress_array_data(data)
             comp_len = len(data)
 
             encoding = 1
@@ -197,7 +278,7 @@ class FBXElem:
     def _add_compressed_array_helper(self, data, length):
         """Note: This function may be swapped out by enable_multithreading_cm with an equivalent that supports
         multithreading."""
-        data = zlib.compress(data, 1)
+        data = _compress_array_data(data)
         comp_len = len(data)
 
         encoding = 1
@@ -442,3 +523,145 @@ def write(fn, elem_root, version):
         # unknown magic (always the same)
         write(b'\0' * 120)
         write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+
+
+# Blender-For-UnrealEngine: Stream writer.
+# Write the elements as soon as they are complete, then free them, so the whole FBX tree is never in memory.
+# The written file is the same as with write().
+
+def _elem_need_is_last(elem):
+    # Only the elements without children and props write a block sentinel that depend of is_last.
+    return not elem.elems and not elem.props and elem.id not in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL
+
+
+class FBXElemStreamWriter:
+    """Write an FBX file while its element tree is created.
+
+    Elements opened with open_elem() (like Objects) are written before their children and their end offset is written
+    back when they are closed with close_elem(). An opened element must not be the last child of its parent."""
+
+    def __init__(self, fn, version):
+        init_version(version)
+        self._version = version
+        self._file = open(fn, 'wb')
+        # [parent, elem, position of the end offset in the file, written children count]
+        self._open_elems = []
+        self._timedate_done = False
+
+        self._file.write(_HEAD_MAGIC)
+        self._file.write(pack('<I', version))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._file.close()
+
+    def _write_elems(self, parent, count, is_last):
+        """Write and free the `count` first children of parent, is_last is used for the last written child."""
+        if parent.id == b'' and not self._timedate_done:
+            # hack since we don't decode time.
+            # ideally we would _not_ modify this data.
+            _write_timedate_hack(parent)
+            self._timedate_done = True
+
+        write = self._file.write
+        tell = self._file.tell
+        elems = parent.elems
+        for i in range(count):
+            elem_is_last = is_last and i == count - 1
+            elems[i]._calc_offsets(tell(), elem_is_last)
+            elems[i]._write(write, tell, elem_is_last)
+        del elems[:count]
+
+        if self._open_elems and self._open_elems[-1][1] is parent:
+            self._open_elems[-1][3] += count
+
+    def write_complete_elems(self, parent):
+        """Write and free the children of parent.
+        The last child is kept when its data depend on whether it is the last one."""
+        count = len(parent.elems)
+        if count and _elem_need_is_last(parent.elems[-1]):
+            count -= 1
+        self._write_elems(parent, count, False)
+
+    @contextmanager
+    def write_step_cm(self, parent):
+        """Create elements with multithreaded array compression, then write the children of parent once all the
+        arrays are compressed."""
+        with FBXElem.enable_multithreading_cm():
+            yield
+        self.write_complete_elems(parent)
+
+    def open_elem(self, parent, elem):
+        """Write the header of elem, that must be the last child of parent. Its children are written later."""
+        assert(parent.elems and parent.elems[-1] is elem)
+
+        # The previous children are followed by elem, so they are not the last ones.
+        self._write_elems(parent, len(parent.elems) - 1, False)
+        parent.elems.pop()
+        if self._open_elems and self._open_elems[-1][1] is parent:
+            self._open_elems[-1][3] += 1
+
+        props_length = 0
+        for data in elem.props:
+            props_length += 1 + len(data)
+        elem._props_length = props_length
+
+        write = self._file.write
+        end_offset_pos = self._file.tell()
+        write(pack(_ELEM_META_FORMAT, 0, len(elem.props), props_length))  # End offset is written in close_elem().
+        write(bytes((len(elem.id),)))
+        write(elem.id)
+        for i, data in enumerate(elem.props):
+            write(bytes((elem.props_type[i],)))
+            write(data)
+
+        self._open_elems.append([parent, elem, end_offset_pos, 0])
+
+    def close_elem(self, elem):
+        """Write the remaining children of elem, then its end offset."""
+        assert(self._open_elems and self._open_elems[-1][1] is elem)
+        self._write_elems(elem, len(elem.elems), True)
+        _parent, _elem, end_offset_pos, written_count = self._open_elems.pop()
+
+        # Same as FBXElem._write_children(), with is_last False.
+        if written_count or not elem.props or elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL:
+            self._file.write(_BLOCK_SENTINEL_DATA)
+
+        end_offset = self._file.tell()
+        self._file.seek(end_offset_pos)
+        self._file.write(pack(_ELEM_META_FORMAT, end_offset, len(elem.props), elem._props_length))
+        self._file.seek(end_offset)
+        elem._end_offset = end_offset
+
+    def close(self, elem_root):
+        """Write the remaining root elements and the end of the file."""
+        assert(elem_root.id == b'')
+        assert(not self._open_elems)
+        self._write_elems(elem_root, len(elem_root.elems), True)
+
+        write = self._file.write
+        tell = self._file.tell
+        version = self._version
+
+        # Root has no props and is not the last, so it always ends with a block sentinel.
+        write(_BLOCK_SENTINEL_DATA)
+
+        write(_FOOT_ID)
+        write(b'\x00' * 4)
+
+        # padding for alignment (values between 1 & 16 observed)
+        # if already aligned to 16, add a full 16 bytes padding.
+        ofs = tell()
+        pad = ((ofs + 15) & ~15) - ofs
+        if pad == 0:
+            pad = 16
+
+        write(b'\0' * pad)
+
+        write(pack('<I', version))
+
+        # unknown magic (always the same)
+        write(b'\0' * 120)
+        write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
@@ -18,11 +18,14 @@ import math
 import numpy as np
 import os
 import time
+import hashlib
+from collections import OrderedDict
 
 from itertools import zip_longest
 from functools import cache
 
 from .. import __package__ as parent_package
+from contextlib import nullcontext
 
 if "bpy" in locals():
     import importlib
@@ -839,6 +842,138 @@ def fbx_data_mesh_shapes_elements(root, me_obj, me, scene_data, fbx_me_tmpl, fbx
                                 animatable=True)
 
 
+# Blender-For-UnrealEngine: Mesh element cache.
+# The same mesh data is often written in several FBX files of an export (mesh exported with each action, LODs, etc.).
+# The extracted vertices, normals, tangents and UVs are reused when the hash of the mesh data is the same.
+
+class FBXMeshElementCache:
+    """Mesh element arrays reused between FBX exports. Only used from the main thread.
+    When the cache is bigger than max_size (in bytes), the least recently used elements are removed."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reused_size = 0  # Size of the arrays that were not extracted again.
+        self._elements = OrderedDict()
+
+    @staticmethod
+    def get_size(value):
+        if isinstance(value, tuple):
+            return sum(array.nbytes for array in value)
+        return value.nbytes
+
+    def __contains__(self, key):
+        return key in self._elements
+
+    def get(self, key):
+        value = self._elements.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._elements.move_to_end(key)
+        self.hits += 1
+        self.reused_size += self.get_size(value)
+        return value
+
+    def add(self, key, value):
+        value_size = self.get_size(value)
+        if value_size > self.max_size or key in self._elements:
+            return
+        self._elements[key] = value
+        self.size += value_size
+        while self.size > self.max_size:
+            _key, removed_value = self._elements.popitem(last=False)
+            self.size -= self.get_size(removed_value)
+            self.evictions += 1
+
+    def clear(self):
+        self._elements.clear()
+        self.size = 0
+
+
+_mesh_element_cache = None
+
+
+def set_mesh_element_cache(cache):
+    """Use cache for the next exported meshes, None to disable it. Returns the previous cache."""
+    global _mesh_element_cache
+    previous_cache = _mesh_element_cache
+    _mesh_element_cache = cache
+    return previous_cache
+
+
+def get_mesh_element_key(me, geom_mat_co, geom_mat_no):
+    """Hash of the mesh data the cached elements are extracted from, None when there is no cache."""
+    if _mesh_element_cache is None:
+        return None
+
+    attributes = me.attributes
+    mesh_hash = hashlib.blake2b(digest_size=32)
+    mesh_hash.update(MESH_ATTRIBUTE_POSITION.to_ndarray(attributes).tobytes())
+    mesh_hash.update(MESH_ATTRIBUTE_CORNER_VERT.to_ndarray(attributes).tobytes())
+    t_ls = np.empty(len(me.polygons), dtype=np.uintc)
+    me.polygons.foreach_get("loop_start", t_ls)
+    mesh_hash.update(t_ls.tobytes())
+
+    # Same normals as the ones read in fbx_data_mesh_elements().
+    mesh_hash.update(me.normals_domain.encode())
+    normal_source = me.vertex_normals if me.normals_domain == 'POINT' else me.corner_normals
+    t_normal = np.empty(len(normal_source) * 3, dtype=np.single)
+    normal_source.foreach_get("vector", t_normal)
+    mesh_hash.update(t_normal.tobytes())
+
+    t_luv = np.empty(len(me.loops) * 2, dtype=np.single)
+    for uvlayer in me.uv_layers:
+        uvlayer.uv.foreach_get("vector", t_luv)
+        mesh_hash.update(uvlayer.name.encode())
+        mesh_hash.update(t_luv.tobytes())
+
+    for matrix in (geom_mat_co, geom_mat_no):
+        matrix_values = None if matrix is None else tuple(tuple(row) for row in matrix)
+        mesh_hash.update(repr(matrix_values).encode())
+    return mesh_hash.digest()
+
+
+def get_cached_mesh_element(mesh_key, name, compute):
+    """Element of the mesh from the cache, compute() is only called when it is not already in the cache.
+    The returned arrays are shared between the exports and must not be modified."""
+    cache = _mesh_element_cache
+    if cache is None or mesh_key is None:
+        return compute()
+
+    key = (mesh_key, name)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.add(key, value)
+    return value
+
+
+def get_cached_normals_unique(mesh_key, normals):
+    # Unique normals and the index of each normal in them.
+    return get_cached_mesh_element(
+        mesh_key, "NormalsUnique", lambda: fast_first_axis_unique(normals.reshape(-1, 3), return_inverse=True))
+
+
+def fbx_mesh_calc_tangents(me, uvmap, mesh_key):
+    # Tangents are slow to compute, skip them when they are already in the cache.
+    cache = _mesh_element_cache
+    if cache is not None and mesh_key is not None and (mesh_key, ("TangentSpace", uvmap)) in cache:
+        return
+    me.calc_tangents(uvmap=uvmap)
+
+
+def fbx_mesh_read_tangent_space(me, t_ln, geom_mat_no, normal_fbx_dtype):
+    me.loops.foreach_get("bitangent", t_ln)
+    t_binormal = nors_transformed(t_ln, geom_mat_no, normal_fbx_dtype)
+    me.loops.foreach_get("tangent", t_ln)
+    t_tangent = nors_transformed(t_ln, geom_mat_no, normal_fbx_dtype)
+    return t_binormal, t_tangent
+
+
 def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     """
     Write the Mesh (Geometry) data block.
@@ -911,11 +1046,13 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     elem_data_single_int32(geom, b"GeometryVersion", FBX_GEOMETRY_VERSION)
 
     attributes = me.attributes
+    mesh_element_key = get_mesh_element_key(me, geom_mat_co, geom_mat_no)
 
     # Vertex cos.
     pos_fbx_dtype = np.float64
-    t_pos = MESH_ATTRIBUTE_POSITION.to_ndarray(attributes)
-    elem_data_single_float64_array(geom, b"Vertices", vcos_transformed(t_pos, geom_mat_co, pos_fbx_dtype))
+    t_pos = get_cached_mesh_element(mesh_element_key, "Vertices", lambda: vcos_transformed(
+        MESH_ATTRIBUTE_POSITION.to_ndarray(attributes), geom_mat_co, pos_fbx_dtype))
+    elem_data_single_float64_array(geom, b"Vertices", t_pos)
     del t_pos
 
     # Polygon indices.
@@ -1190,9 +1327,11 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
                 # Unreachable
                 raise AssertionError("Unexpected normals domain '%s'" % me.normals_domain)
         # Each normal has 3 components, so the length is multiplied by 3.
-        t_normal = np.empty(len(normal_source) * 3, dtype=normal_bl_dtype)
-        normal_source.foreach_get("vector", t_normal)
-        t_normal = nors_transformed(t_normal, geom_mat_no, normal_fbx_dtype)
+        def get_normals():
+            t_normal = np.empty(len(normal_source) * 3, dtype=normal_bl_dtype)
+            normal_source.foreach_get("vector", t_normal)
+            return nors_transformed(t_normal, geom_mat_no, normal_fbx_dtype)
+        t_normal = get_cached_mesh_element(mesh_element_key, "Normals", get_normals)
         normal_idx_fbx_dtype = np.int32
         lay_nor = elem_data_single_int32(geom, b"LayerElementNormal", 0)
         elem_data_single_int32(lay_nor, b"Version", FBX_GEOMETRY_NORMAL_VERSION)
@@ -1210,7 +1349,7 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
             # Tuple of unique sorted normals and then the index in the unique sorted normals of each normal in t_normal.
             # Since we don't care about how the normals are sorted, only that they're unique, we can use the fast unique
             # helper function.
-            t_normal, t_normal_idx = fast_first_axis_unique(t_normal.reshape(-1, 3), return_inverse=True)
+            t_normal, t_normal_idx = get_cached_normals_unique(mesh_element_key, t_normal)
 
             # Convert to the type for fbx
             t_normal_idx = astype_view_signedness(t_normal_idx, normal_idx_fbx_dtype)
@@ -1249,32 +1388,32 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
                     # Annoying, `me.calc_tangent` errors in case there is no geometry...
                     if num_loops > 0:
                         for name in uv_names:
-                            me.calc_tangents(uvmap=name)
+                            fbx_mesh_calc_tangents(me, name, mesh_element_key)
                     for idx, uvlayer in enumerate(me.uv_layers):
                         name = uvlayer.name
                         # Loop bitangents (aka binormals).
                         # NOTE: this is not supported by importer currently.
-                        me.loops.foreach_get("bitangent", t_ln)
+                        t_binormal, t_tangent = get_cached_mesh_element(
+                            mesh_element_key, ("TangentSpace", name),
+                            lambda: fbx_mesh_read_tangent_space(me, t_ln, geom_mat_no, normal_fbx_dtype))
                         lay_nor = elem_data_single_int32(geom, b"LayerElementBinormal", idx)
                         elem_data_single_int32(lay_nor, b"Version", FBX_GEOMETRY_BINORMAL_VERSION)
                         elem_data_single_string_unicode(lay_nor, b"Name", name)
                         elem_data_single_string(lay_nor, b"MappingInformationType", b"ByPolygonVertex")
                         elem_data_single_string(lay_nor, b"ReferenceInformationType", b"Direct")
-                        elem_data_single_float64_array(lay_nor, b"Binormals",
-                                                       nors_transformed(t_ln, geom_mat_no, normal_fbx_dtype))
+                        elem_data_single_float64_array(lay_nor, b"Binormals", t_binormal)
                         # Binormal weights, no idea what it is.
                         # elem_data_single_float64_array(lay_nor, b"BinormalsW", t_lnw)
 
                         # Loop tangents.
                         # NOTE: this is not supported by importer currently.
-                        me.loops.foreach_get("tangent", t_ln)
+                        # Already read with the binormals.
                         lay_nor = elem_data_single_int32(geom, b"LayerElementTangent", idx)
                         elem_data_single_int32(lay_nor, b"Version", FBX_GEOMETRY_TANGENT_VERSION)
                         elem_data_single_string_unicode(lay_nor, b"Name", name)
                         elem_data_single_string(lay_nor, b"MappingInformationType", b"ByPolygonVertex")
                         elem_data_single_string(lay_nor, b"ReferenceInformationType", b"Direct")
-                        elem_data_single_float64_array(lay_nor, b"Tangents",
-                                                       nors_transformed(t_ln, geom_mat_no, normal_fbx_dtype))
+                        elem_data_single_float64_array(lay_nor, b"Tangents", t_tangent)
                         # Tangent weights, no idea what it is.
                         # elem_data_single_float64_array(lay_nor, b"TangentsW", t_lnw)
 
@@ -1374,64 +1513,66 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
             elem_data_single_string(lay_uv, b"MappingInformationType", b"ByPolygonVertex")
             elem_data_single_string(lay_uv, b"ReferenceInformationType", b"IndexToDirect")
 
-            uvlayer.uv.foreach_get("vector", t_luv)
-
-            # t_luv_fast_pair_view is a view in a dtype that compares elements by individual bytes, but float types have
-            # separate byte representations of positive and negative zero. For uniqueness, these should be considered
-            # the same, so replace all -0.0 with 0.0 in advance.
-            t_luv[t_luv == -0.0] = 0.0
-
-            # These steps to create unique_uv_pairs are the same as how np.unique would find unique values by sorting a
-            # structured array where each element is a triplet of (uv, vertex_idx), except uv and vertex_idx are
-            # separate arrays here and vertex_idx has already been sorted in advance.
-
-            # Sort according to the vertex_idx column, using the precalculated indices that sort it.
-            sorted_t_luv_fast = t_luv_fast_pair_view[perm_vidx]
-
-            # Get the indices that would sort the sorted uv pairs. Stable sorting must be used to maintain the sorting
-            # of the vertex indices.
-            perm_uv_pairs = sorted_t_luv_fast.argsort(kind='stable')
-            # Use the indices to sort both the uv pairs and the vertex_idx columns.
-            perm_combined = perm_vidx[perm_uv_pairs]
-            sorted_vidx = t_lvidx[perm_combined]
-            sorted_t_luv_fast = sorted_t_luv_fast[perm_uv_pairs]
-
-            # Create a mask where either the uv pair doesn't equal the previous value in the array, or the vertex index
-            # doesn't equal the previous value, these will be the unique uv-vidx triplets.
-            # For an imaginary triplet array:
-            # ...
-            # [(0.4, 0.2), 0]
-            # [(0.4, 0.2), 1] -> Unique because vertex index different from previous
-            # [(0.4, 0.2), 2] -> Unique because vertex index different from previous
-            # [(0.7, 0.6), 2] -> Unique because uv different from previous
-            # [(0.7, 0.6), 2]
-            # ...
-            # Output the result into unique_mask.
-            np.logical_or(sorted_t_luv_fast[1:] != sorted_t_luv_fast[:-1], sorted_vidx[1:] != sorted_vidx[:-1],
-                          out=unique_mask[1:])
-
-            # Get each uv pair marked as unique by the unique_mask and then view as the original dtype.
-            unique_uvs = sorted_t_luv_fast[unique_mask].view(luv_bl_dtype)
-
-            # NaN values are considered invalid and indicate a bug somewhere else in Blender or in an addon, we want
-            # these bugs to be reported instead of hiding them by allowing the export to continue.
-            if np.isnan(unique_uvs).any():
-                raise RuntimeError("UV layer %s on %r has invalid UVs containing NaN values" % (uvlayer.name, me))
-
-            # Convert to the type needed for fbx
-            unique_uvs = unique_uvs.astype(luv_fbx_dtype, copy=False)
-
-            # Set the indices of pairs in unique_uvs that reconstruct the pairs in t_luv into uv_indices.
-            # uv_indices will then be the same as an inverse array returned by np.unique with return_inverse=True.
-            uv_indices[perm_combined] = np.cumsum(unique_mask, dtype=uv_indices.dtype) - 1
+            def get_uv_elements():
+                uvlayer.uv.foreach_get("vector", t_luv)
+
+                # t_luv_fast_pair_view is a view in a dtype that compares elements by individual bytes, but float types have
+                # separate byte representations of positive and negative zero. For uniqueness, these should be considered
+                # the same, so replace all -0.0 with 0.0 in advance.
+                t_luv[t_luv == -0.0] = 0.0
+
+                # These steps to create unique_uv_pairs are the same as how np.unique would find unique values by sorting a
+                # structured array where each element is a triplet of (uv, vertex_idx), except uv and vertex_idx are
+                # separate arrays here and vertex_idx has already been sorted in advance.
+
+                # Sort according to the vertex_idx column, using the precalculated indices that sort it.
+                sorted_t_luv_fast = t_luv_fast_pair_view[perm_vidx]
+
+                # Get the indices that would sort the sorted uv pairs. Stable sorting must be used to maintain the sorting
+                # of the vertex indices.
+                perm_uv_pairs = sorted_t_luv_fast.argsort(kind='stable')
+                # Use the indices to sort both the uv pairs and the vertex_idx columns.
+                perm_combined = perm_vidx[perm_uv_pairs]
+                sorted_vidx = t_lvidx[perm_combined]
+                sorted_t_luv_fast = sorted_t_luv_fast[perm_uv_pairs]
+
+                # Create a mask where either the uv pair doesn't equal the previous value in the array, or the vertex index
+                # doesn't equal the previous value, these will be the unique uv-vidx triplets.
+                # For an imaginary triplet array:
+                # ...
+                # [(0.4, 0.2), 0]
+                # [(0.4, 0.2), 1] -> Unique because vertex index different from previous
+                # [(0.4, 0.2), 2] -> Unique because vertex index different from previous
+                # [(0.7, 0.6), 2] -> Unique because uv different from previous
+                # [(0.7, 0.6), 2]
+                # ...
+                # Output the result into unique_mask.
+                np.logical_or(sorted_t_luv_fast[1:] != sorted_t_luv_fast[:-1], sorted_vidx[1:] != sorted_vidx[:-1],
+                              out=unique_mask[1:])
+
+                # Get each uv pair marked as unique by the unique_mask and then view as the original dtype.
+                unique_uvs = sorted_t_luv_fast[unique_mask].view(luv_bl_dtype)
+
+                # NaN values are considered invalid and indicate a bug somewhere else in Blender or in an addon, we want
+                # these bugs to be reported instead of hiding them by allowing the export to continue.
+                if np.isnan(unique_uvs).any():
+                    raise RuntimeError("UV layer %s on %r has invalid UVs containing NaN values" % (uvlayer.name, me))
+
+                # Convert to the type needed for fbx
+                unique_uvs = unique_uvs.astype(luv_fbx_dtype, copy=False)
+
+                # Set the indices of pairs in unique_uvs that reconstruct the pairs in t_luv into uv_indices.
+                # uv_indices will then be the same as an inverse array returned by np.unique with return_inverse=True.
+                uv_indices[perm_combined] = np.cumsum(unique_mask, dtype=uv_indices.dtype) - 1
+                return unique_uvs, uv_indices.copy()
+
+            # Blender-For-UnrealEngine: Reuse the UV elements of the same mesh data.
+            unique_uvs, t_uv_indices = get_cached_mesh_element(mesh_element_key, ("UV", uvlayer.name), get_uv_elements)
 
             elem_data_single_float64_array(lay_uv, b"UV", unique_uvs)
-            elem_data_single_int32_array(lay_uv, b"UVIndex", uv_indices)
+            elem_data_single_int32_array(lay_uv, b"UVIndex", t_uv_indices)
             del unique_uvs
-            del sorted_t_luv_fast
-            del sorted_vidx
-            del perm_uv_pairs
-            del perm_combined
+            del t_uv_indices
         del uv_indices
         del unique_mask
         del perm_vidx
@@ -2217,6 +2358,358 @@ def fbx_generate_leaf_bones(settings, data_bones):
     return leaf_bones
 
 
+# Blender-For-UnrealEngine: Fast FK bake.
+# Armatures only animated by the loc/rot/scale F-Curves of their pose bones (no constraints, drivers, IK or NLA mix)
+# are baked from their action without calling scene.frame_set() for each frame, which evaluates the whole scene.
+# The local matrix of these bones is `matrix_rest_local @ basis`, it is composed for all the frames at once with numpy.
+# The bake is only used when it matches the pose evaluated by scene.frame_set() on the current and a few sampled frames.
+
+FAST_FK_BAKE_TRANSFORM_PROPS = {'location': 3, 'rotation_quaternion': 4, 'rotation_euler': 3, 'rotation_axis_angle': 4, 'scale': 3}
+# Frames of the bake compared with the frame_set() pose before it is used.
+FAST_FK_BAKE_CHECK_FRAME_COUNT = 5
+
+
+def fast_fk_bake_is_static_object(ob):
+    # Objects without animation, driver or constraint in their whole parent chain.
+    while ob is not None:
+        anim_data = ob.animation_data
+        if anim_data and (anim_data.action or anim_data.drivers or anim_data.nla_tracks):
+            return False
+        if ob.constraints or ob.rigid_body or ob.parent_type not in {'OBJECT', 'ARMATURE'}:
+            return False
+        ob = ob.parent
+    return True
+
+
+def fast_fk_bake_get_fcurves(anim_data):
+    action = anim_data.action
+    if action is None:
+        return ()
+    if hasattr(anim_data, "action_slot"):
+        # Slotted actions, Blender 4.4 and newer.
+        from bpy_extras import anim_utils
+        if anim_data.action_slot is None:
+            return ()
+        channelbag = anim_utils.action_get_channelbag_for_slot(action, anim_data.action_slot)
+        return channelbag.fcurves if channelbag else ()
+    return action.fcurves
+
+
+def fast_fk_bake_get_armature_channels(arm):
+    """
+    Return the F-Curves of the pose bones of the armature object as {bone_name: {prop: {array_index: fcurve}}},
+    or None when the pose is not only driven by them.
+    """
+    if arm.constraints or arm.rigid_body or arm.data.pose_position != 'POSE':
+        return None
+    if arm.parent_type not in {'OBJECT', 'ARMATURE'} or not fast_fk_bake_is_static_object(arm.parent):
+        return None
+    arm_data_anim = arm.data.animation_data
+    if arm_data_anim and (arm_data_anim.action or arm_data_anim.drivers):
+        return None
+    for pose_bone in arm.pose.bones:
+        bone = pose_bone.bone
+        if (pose_bone.constraints or not bone.use_inherit_rotation or bone.inherit_scale != 'FULL'
+                or not bone.use_local_location):
+            return None
+
+    channels = {}
+    anim_data = arm.animation_data
+    if anim_data is None:
+        return channels
+    if anim_data.drivers or anim_data.use_tweak_mode:
+        return None
+    if anim_data.use_nla and any(not track.mute and track.strips for track in anim_data.nla_tracks):
+        return None
+    if anim_data.action_influence != 1.0 or anim_data.action_blend_type != 'REPLACE':
+        return None
+
+    for fcurve in fast_fk_bake_get_fcurves(anim_data):
+        if fcurve.mute or (fcurve.group and fcurve.group.mute):
+            continue
+        data_path = fcurve.data_path
+        if not data_path.startswith("pose.bones["):
+            # Object transform or property, the armature object would not be static.
+            return None
+        if data_path.endswith('"]'):
+            # Bone custom property.
+            continue
+        bone_path, _, prop = data_path.rpartition('.')
+        if prop.startswith("bbone_"):
+            continue
+        if prop not in FAST_FK_BAKE_TRANSFORM_PROPS:
+            return None
+        try:
+            pose_bone = arm.path_resolve(bone_path)
+        except ValueError:
+            continue  # Invalid F-Curves are not evaluated by Blender.
+        if fcurve.array_index < FAST_FK_BAKE_TRANSFORM_PROPS[prop]:
+            channels.setdefault(pose_bone.name, {}).setdefault(prop, {})[fcurve.array_index] = fcurve
+    return channels
+
+
+def fast_fk_bake_evaluate_fcurve(fcurve, frames):
+    keyframe_points = fcurve.keyframe_points
+    num_keys = len(keyframe_points)
+    if num_keys and not fcurve.modifiers and fcurve.extrapolation == 'CONSTANT':
+        co = np.empty(num_keys * 2, dtype=np.float32)
+        keyframe_points.foreach_get("co", co)
+        key_frames = co[0::2]
+        # Linear keys, or all the frames on keys, are interpolated for all the frames at once.
+        if (all(key.interpolation == 'LINEAR' for key in keyframe_points[:-1])
+                or np.isin(frames.astype(np.float32), key_frames).all()):
+            return np.interp(frames, key_frames, co[1::2])
+    return np.fromiter(map(fcurve.evaluate, frames.tolist()), dtype=float, count=len(frames))
+
+
+def fast_fk_bake_channel_values(pose_bone, prop, channels, frames):
+    # First row is the current value, used to check the result.
+    current = tuple(getattr(pose_bone, prop))
+    values = np.empty((len(frames) + 1, len(current)))
+    values[:] = current
+    for array_index, fcurve in channels.get(prop, {}).items():
+        values[1:, array_index] = fast_fk_bake_evaluate_fcurve(fcurve, frames)
+    return values
+
+
+def fast_fk_bake_quaternion_matrices(quaternions):
+    # Same as normalize_qt(), a null quaternion is a 180 degrees rotation around X.
+    length = np.linalg.norm(quaternions, axis=1)
+    is_null = length == 0.0
+    quaternions = quaternions / np.where(is_null, 1.0, length)[:, None]
+    quaternions[is_null] = (0.0, 1.0, 0.0, 0.0)
+    w, x, y, z = quaternions.T
+    matrices = np.empty((len(quaternions), 3, 3))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - w * z)
+    matrices[:, 0, 2] = 2.0 * (x * z + w * y)
+    matrices[:, 1, 0] = 2.0 * (x * y + w * z)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - w * x)
+    matrices[:, 2, 0] = 2.0 * (x * z - w * y)
+    matrices[:, 2, 1] = 2.0 * (y * z + w * x)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+def fast_fk_bake_axis_angle_matrices(axis_angles):
+    # Same as axis_angle_to_mat3(), a null axis is no rotation.
+    angle, axis = axis_angles[:, 0], axis_angles[:, 1:]
+    length = np.linalg.norm(axis, axis=1)
+    is_null = length == 0.0
+    quaternions = np.empty((len(axis_angles), 4))
+    quaternions[:, 0] = np.cos(angle / 2.0)
+    quaternions[:, 1:] = axis * (np.sin(angle / 2.0) / np.where(is_null, 1.0, length))[:, None]
+    quaternions[is_null] = (1.0, 0.0, 0.0, 0.0)
+    return fast_fk_bake_quaternion_matrices(quaternions)
+
+
+def fast_fk_bake_euler_matrices(eulers, order):
+    # The first axis of the order is applied first, 'XYZ' is Rz @ Ry @ Rx.
+    matrices = np.broadcast_to(np.identity(3), (len(eulers), 3, 3))
+    for axis in order:
+        index = 'XYZ'.index(axis)
+        i, j = ((1, 2), (2, 0), (0, 1))[index]
+        cos, sin = np.cos(eulers[:, index]), np.sin(eulers[:, index])
+        axis_matrices = np.zeros((len(eulers), 3, 3))
+        axis_matrices[:, index, index] = 1.0
+        axis_matrices[:, i, i] = cos
+        axis_matrices[:, i, j] = -sin
+        axis_matrices[:, j, i] = sin
+        axis_matrices[:, j, j] = cos
+        matrices = axis_matrices @ matrices
+    return matrices
+
+
+def fast_fk_bake_basis_matrices(pose_bone, channels, frames):
+    # Same as BKE_pchan_to_mat4(), `loc @ rot @ scale`.
+    rotation_mode = pose_bone.rotation_mode
+    if rotation_mode == 'QUATERNION':
+        rot = fast_fk_bake_quaternion_matrices(fast_fk_bake_channel_values(pose_bone, 'rotation_quaternion', channels, frames))
+    elif rotation_mode == 'AXIS_ANGLE':
+        rot = fast_fk_bake_axis_angle_matrices(fast_fk_bake_channel_values(pose_bone, 'rotation_axis_angle', channels, frames))
+    else:
+        rot = fast_fk_bake_euler_matrices(fast_fk_bake_channel_values(pose_bone, 'rotation_euler', channels, frames), rotation_mode)
+    scale = fast_fk_bake_channel_values(pose_bone, 'scale', channels, frames)
+    basis = np.zeros((len(frames) + 1, 4, 4))
+    basis[:, :3, :3] = rot * scale[:, None, :]
+    basis[:, 3, 3] = 1.0
+    if not pose_bone.bone.use_connect:
+        # Connected bones ignore their location.
+        basis[:, :3, 3] = fast_fk_bake_channel_values(pose_bone, 'location', channels, frames)
+    return basis
+
+
+def fast_fk_bake_bone_correction_matrices(scene_data, bo_obj):
+    # Matrices applied before and after the bone local matrix in ObjectWrapper.fbx_object_matrix().
+    settings = scene_data.settings
+    parent = bo_obj.parent
+    matrix_pre = Matrix()
+    if settings.bone_correction_matrix_inv and parent and parent.is_bone:
+        par_mat_align_inv = bo_obj.get_parent_bone_align_matrix_inv(scene_data)
+        if par_mat_align_inv:
+            matrix_pre = par_mat_align_inv @ matrix_pre
+        if settings.reverse_direction_bone_correction_matrix_inv and parent.is_reverse_direction_bone(scene_data):
+            matrix_pre = settings.reverse_direction_bone_correction_matrix_inv @ matrix_pre
+        elif settings.bone_correction_matrix_inv:
+            matrix_pre = settings.bone_correction_matrix_inv @ matrix_pre
+    matrix_post = Matrix()
+    mat_align = bo_obj.get_bone_align_matrix(scene_data)
+    if mat_align:
+        matrix_post = matrix_post @ mat_align
+    if settings.reverse_direction_bone_correction_matrix and bo_obj.is_reverse_direction_bone(scene_data):
+        matrix_post = matrix_post @ settings.reverse_direction_bone_correction_matrix
+    elif settings.bone_correction_matrix:
+        matrix_post = matrix_post @ settings.bone_correction_matrix
+    return matrix_pre, matrix_post
+
+
+def fast_fk_bake_euler_candidates(rot):
+    # Same as mat3_normalized_to_eul2(), the two 'XYZ' eulers of the rotation matrices.
+    cy = np.hypot(rot[..., 0, 0], rot[..., 1, 0])
+    is_valid = cy > 16.0 * np.finfo(np.float32).eps
+    eul1 = np.empty(rot.shape[:-1])
+    eul2 = np.empty(rot.shape[:-1])
+    eul1[..., 0] = np.where(is_valid, np.arctan2(rot[..., 2, 1], rot[..., 2, 2]), np.arctan2(-rot[..., 1, 2], rot[..., 1, 1]))
+    eul1[..., 1] = np.arctan2(-rot[..., 2, 0], cy)
+    eul1[..., 2] = np.where(is_valid, np.arctan2(rot[..., 1, 0], rot[..., 0, 0]), 0.0)
+    eul2[..., 0] = np.where(is_valid, np.arctan2(-rot[..., 2, 1], -rot[..., 2, 2]), eul1[..., 0])
+    eul2[..., 1] = np.where(is_valid, np.arctan2(-rot[..., 2, 0], -cy), eul1[..., 1])
+    eul2[..., 2] = np.where(is_valid, np.arctan2(-rot[..., 1, 0], -rot[..., 0, 0]), 0.0)
+    return eul1, eul2
+
+
+def fast_fk_bake_compatible_euler(eul, old):
+    # Same as compatible_eul().
+    pi_x2 = 2.0 * math.pi
+    deul = eul - old
+    wrap = np.floor(np.abs(deul) / pi_x2 + 0.5) * pi_x2
+    eul = np.where(deul > math.pi, eul - wrap, np.where(deul < -math.pi, eul + wrap, eul))
+    deul = eul - old
+    abs_deul = np.abs(deul)
+    for i, j, k in ((0, 1, 2), (1, 0, 2), (2, 0, 1)):
+        flip = (abs_deul[:, i] > 3.2) & (abs_deul[:, j] < 1.6) & (abs_deul[:, k] < 1.6)
+        eul[flip, i] -= np.copysign(pi_x2, deul[flip, i])
+    return eul
+
+
+def fast_fk_bake_matrices_match(scene_data, bones, matrices):
+    # True when the composed matrices are the ones of the evaluated pose, used by the frame_set() path.
+    for bone_index, bo_obj in enumerate(bones):
+        pose_matrix = np.array(bo_obj.fbx_object_matrix(scene_data))
+        if not np.allclose(matrices[bone_index], pose_matrix, rtol=1e-4, atol=1e-4 * max(1.0, np.abs(pose_matrix).max())):
+            return False
+    return True
+
+
+def fast_fk_bake_sampled_frames_match(scene_data, bones, matrices, frames):
+    # Compare a few frames of the bake with the pose evaluated by scene.frame_set(), like the default bake.
+    scene = scene_data.scene
+    back_frame = scene.frame_current
+    back_subframe = scene.frame_subframe
+    frame_indices = np.unique(np.linspace(0, len(frames) - 1, FAST_FK_BAKE_CHECK_FRAME_COUNT).round().astype(int))
+    try:
+        for frame_index in frame_indices.tolist():
+            frame = frames[frame_index]
+            int_frame = int(frame)
+            scene.frame_set(int_frame, subframe=frame - int_frame)
+            if not fast_fk_bake_matrices_match(scene_data, bones, matrices[frame_index]):
+                return False
+    finally:
+        scene.frame_set(back_frame, subframe=back_subframe)
+    return True
+
+
+def fast_fk_bake_bones_values(scene_data, bones, p_rots, armature_channels, frames):
+    """
+    Return the (frames, bones, 9) baked loc/rot/scale values of the bones, same as fbx_object_tx() for each frame,
+    or None when the composed matrices are not the ones of the evaluated poses.
+    """
+    matrices = np.empty((len(frames) + 1, len(bones), 4, 4))
+    for bone_index, bo_obj in enumerate(bones):
+        pose_bone = bo_obj.bdata_pose_bone
+        channels = armature_channels[bo_obj.armature.bdata].get(pose_bone.name, {})
+        basis = fast_fk_bake_basis_matrices(pose_bone, channels, frames)
+        matrix_pre, matrix_post = fast_fk_bake_bone_correction_matrices(scene_data, bo_obj)
+        matrices[:, bone_index] = np.array(matrix_pre @ bo_obj.matrix_rest_local) @ basis @ np.array(matrix_post)
+    # The first matrices are the current pose, then check a few sampled frames.
+    if not fast_fk_bake_matrices_match(scene_data, bones, matrices[0]):
+        return None
+    matrices = matrices[1:]
+    if len(frames) and not fast_fk_bake_sampled_frames_match(scene_data, bones, matrices, frames):
+        return None
+
+    # Same as Matrix.decompose().
+    values = np.empty((len(frames), len(bones), 9))
+    values[..., 0:3] = matrices[..., :3, 3]
+    mat3 = matrices[..., :3, :3]
+    scale = np.linalg.norm(mat3, axis=-2)
+    rot = mat3 / np.where(scale == 0.0, 1.0, scale)[..., None, :]
+    is_negative = np.linalg.det(rot) < 0.0
+    rot[is_negative] *= -1.0
+    scale[is_negative] *= -1.0
+    # Sheared matrices (non uniform scale in the parents) are converted through a quaternion by decompose().
+    if not np.allclose(rot @ np.swapaxes(rot, -1, -2), np.identity(3), atol=1e-5):
+        return None
+
+    if scene_data.settings.disable_free_scale_animation:
+        is_basic_bone = np.array([bo_obj.is_basic_bone() for bo_obj in bones])
+        scale_value = scale[:, is_basic_bone].mean(axis=-1)
+        scale_value[np.abs(scale_value - 1.0) <= 0.00001 * np.maximum(np.abs(scale_value), 1.0)] = 1.0
+        scale[:, is_basic_bone] = scale_value[..., None]
+    values[..., 6:9] = scale
+
+    # Same as Quaternion.to_euler('XYZ', rot_euler_compat), each frame is compatible with the previous one.
+    eul1, eul2 = fast_fk_bake_euler_candidates(rot)
+    old = np.array(p_rots, dtype=float).reshape(len(bones), 3)
+    for frame_index in range(len(frames)):
+        compat1 = fast_fk_bake_compatible_euler(eul1[frame_index], old)
+        compat2 = fast_fk_bake_compatible_euler(eul2[frame_index], old)
+        use_eul2 = np.abs(compat1 - old).sum(axis=1) > np.abs(compat2 - old).sum(axis=1)
+        old = np.where(use_eul2[:, None], compat2, compat1)
+        values[frame_index, :, 3:6] = old
+    return values
+
+
+def fast_fk_bake_values(scene_data, animdata_ob, p_rots, frames):
+    """
+    Return the baked loc/rot/scale values of animdata_ob in the same order as frame_values_gen(),
+    or None when an object is not only animated by the FK of an armature.
+    """
+    scene = scene_data.scene
+    if scene.render.frame_map_old != scene.render.frame_map_new:
+        return None
+
+    armature_channels = {}
+    static_values = {}
+    bones = []
+    for ob_obj in animdata_ob:
+        if ob_obj.is_bone or (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
+            arm = ob_obj.armature.bdata if ob_obj.is_bone else ob_obj.bdata
+            if arm not in armature_channels:
+                armature_channels[arm] = fast_fk_bake_get_armature_channels(arm)
+            if armature_channels[arm] is None:
+                return None
+        elif not ob_obj.is_object or not fast_fk_bake_is_static_object(ob_obj.bdata):
+            return None
+        if ob_obj.is_bone:
+            bones.append(ob_obj)
+        else:
+            loc, rot, scale, _m, _mr = ob_obj.fbx_object_tx(scene_data, rot_euler_compat=p_rots[ob_obj])
+            static_values[ob_obj] = (*loc, *rot, *scale)
+
+    values = np.empty((len(frames), len(animdata_ob), 9))
+    if bones:
+        bone_values = fast_fk_bake_bones_values(scene_data, bones, [p_rots[bo_obj] for bo_obj in bones], armature_channels, frames)
+        if bone_values is None:
+            return None
+        values[:, [index for index, ob_obj in enumerate(animdata_ob) if ob_obj.is_bone]] = bone_values
+    for index, ob_obj in enumerate(animdata_ob):
+        if not ob_obj.is_bone:
+            values[:, index] = static_values[ob_obj]
+    return values.reshape(-1)
+
+
 def fbx_animations_do(scene_data, ref_id, f_start, f_end, start_zero, objects=None, force_keep=False):
     """
     Generate animation data (a single AnimStack) from objects, for a given frame range.
@@ -2371,7 +2864,12 @@ def fbx_animations_do(scene_data, ref_id, f_start, f_end, start_zero, objects=No
     num_custom_curve_values = len(animdata_custom_curves)  # Only 1 value per custom property
     num_values_per_frame = num_ob_values + num_shape_values + num_camera_values + num_custom_curve_values
     num_frames = len(real_currframes)
-    all_values_flat = np.fromiter(frame_values_gen(), dtype=float, count=num_frames * num_values_per_frame)
+    # Blender-For-UnrealEngine: Bake the armatures only animated by FK from their F-Curves, without frame_set().
+    all_values_flat = None
+    if scene_data.settings.use_fast_fk_bake and num_values_per_frame == num_ob_values and not has_animated_duplis:
+        all_values_flat = fast_fk_bake_values(scene_data, animdata_ob, p_rots, currframes)
+    if all_values_flat is None:
+        all_values_flat = np.fromiter(frame_values_gen(), dtype=float, count=num_frames * num_values_per_frame)
 
     # Restore the scene's current frame.
     scene.frame_set(back_currframe, subframe=0.0)
@@ -3334,7 +3832,7 @@ def fbx_definitions_elements(root, scene_data):
     fbx_templates_generate(definitions, scene_data.templates)
 
 
-def fbx_objects_elements(root, scene_data):
+def fbx_objects_elements(root, scene_data, stream_writer=None):
     """
     Data (objects, geometry, material, textures, armatures, etc.).
     """
@@ -3342,63 +3840,84 @@ def fbx_objects_elements(root, scene_data):
     perfmon.level_up()
     objects = elem_empty(root, b"Objects")
 
+    # Blender-For-UnrealEngine: With the stream writer, each step compresses its arrays with multiple threads,
+    # then writes its elements to the file and frees them.
+    if stream_writer:
+        stream_writer.open_elem(root, objects)
+
+        def step():
+            return stream_writer.write_step_cm(objects)
+    else:
+        def step():
+            return nullcontext()
+
     perfmon.step("FBX export fetch empties (%d)..." % len(scene_data.data_empties))
 
-    for empty in scene_data.data_empties:
-        fbx_data_empty_elements(objects, empty, scene_data)
+    with step():
+        for empty in scene_data.data_empties:
+            fbx_data_empty_elements(objects, empty, scene_data)
 
     perfmon.step("FBX export fetch lamps (%d)..." % len(scene_data.data_lights))
 
-    for lamp in scene_data.data_lights:
-        fbx_data_light_elements(objects, lamp, scene_data)
+    with step():
+        for lamp in scene_data.data_lights:
+            fbx_data_light_elements(objects, lamp, scene_data)
 
     perfmon.step("FBX export fetch cameras (%d)..." % len(scene_data.data_cameras))
 
-    for cam in scene_data.data_cameras:
-        fbx_data_camera_elements(objects, cam, scene_data)
+    with step():
+        for cam in scene_data.data_cameras:
+            fbx_data_camera_elements(objects, cam, scene_data)
 
     perfmon.step("FBX export fetch meshes (%d)..."
                  % len({me_key for me_key, _me, _free in scene_data.data_meshes.values()}))
 
     done_meshes = set()
     for me_obj in scene_data.data_meshes:
-        fbx_data_mesh_elements(objects, me_obj, scene_data, done_meshes)
+        with step():
+            fbx_data_mesh_elements(objects, me_obj, scene_data, done_meshes)
     del done_meshes
 
     perfmon.step("FBX export fetch objects (%d)..." % len(scene_data.objects))
 
-    for ob_obj in scene_data.objects:
-        if ob_obj.is_dupli:
-            continue
-        fbx_data_object_elements(objects, ob_obj, scene_data)
-        for dp_obj in ob_obj.dupli_list_gen(scene_data.depsgraph):
-            if dp_obj not in scene_data.objects:
+    with step():
+        for ob_obj in scene_data.objects:
+            if ob_obj.is_dupli:
                 continue
-            fbx_data_object_elements(objects, dp_obj, scene_data)
+            fbx_data_object_elements(objects, ob_obj, scene_data)
+            for dp_obj in ob_obj.dupli_list_gen(scene_data.depsgraph):
+                if dp_obj not in scene_data.objects:
+                    continue
+                fbx_data_object_elements(objects, dp_obj, scene_data)
 
     perfmon.step("FBX export fetch remaining...")
 
-    for ob_obj in scene_data.objects:
-        if not (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
-            continue
-        fbx_data_armature_elements(objects, ob_obj, scene_data)
+    with step():
+        for ob_obj in scene_data.objects:
+            if not (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
+                continue
+            fbx_data_armature_elements(objects, ob_obj, scene_data)
 
-    if scene_data.data_leaf_bones:
-        fbx_data_leaf_bone_elements(objects, scene_data)
+        if scene_data.data_leaf_bones:
+            fbx_data_leaf_bone_elements(objects, scene_data)
 
-    for ma in scene_data.data_materials:
-        fbx_data_material_elements(objects, ma, scene_data)
+        for ma in scene_data.data_materials:
+            fbx_data_material_elements(objects, ma, scene_data)
 
-    for blender_tex_key in scene_data.data_textures:
-        fbx_data_texture_file_elements(objects, blender_tex_key, scene_data)
+        for blender_tex_key in scene_data.data_textures:
+            fbx_data_texture_file_elements(objects, blender_tex_key, scene_data)
 
-    for vid in scene_data.data_videos:
-        fbx_data_video_elements(objects, vid, scene_data)
+        for vid in scene_data.data_videos:
+            fbx_data_video_elements(objects, vid, scene_data)
 
     perfmon.step("FBX export fetch animations...")
     start_time = time.process_time()
 
-    fbx_data_animation_elements(objects, scene_data)
+    with step():
+        fbx_data_animation_elements(objects, scene_data)
+
+    if stream_writer:
+        stream_writer.close_elem(objects)
 
     perfmon.level_down()
 
@@ -3466,6 +3985,8 @@ def save_single(operator, scene, depsgraph, filepath="",
                 mirror_symmetry_right_side_bones=False,
                 use_ue_mannequin_bone_alignment=False,
                 disable_free_scale_animation=False,
+                use_fast_fk_bake=False,
+                use_stream_writer=False,
                 use_metadata=True,
                 path_mode='AUTO',
                 use_mesh_edges=True,
@@ -3574,6 +4095,7 @@ def save_single(operator, scene, depsgraph, filepath="",
         add_leaf_bones, bone_correction_matrix, bone_correction_matrix_inv,
         reverse_direction_bone_correction_matrix, reverse_direction_bone_correction_matrix_inv,
         use_ue_mannequin_bone_alignment, bone_align_matrix_dict, disable_free_scale_animation,
+        use_fast_fk_bake,
         bake_anim, bake_anim_use_all_bones, bake_anim_use_nla_strips, bake_anim_use_all_actions,
         bake_anim_step, bake_anim_simplify_factor, bake_anim_force_startend_keying,
         False, media_settings, use_custom_props, colors_type, prioritize_active_color
@@ -3587,36 +4109,66 @@ def save_single(operator, scene, depsgraph, filepath="",
     # Generate some data about exported scene...
     scene_data = fbx_data_from_scene(scene, depsgraph, settings)
 
-    # Enable multithreaded array compression in FBXElem and wait until all threads are done before exiting the context
-    # manager.
-    with encode_bin.FBXElem.enable_multithreading_cm():
-        # Writing elements into an FBX hierarchy can now begin.
-        root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
+    if use_stream_writer:
+        # Blender-For-UnrealEngine: Write the Objects elements to the file as soon as they are created, so the whole
+        # FBX hierarchy is never kept in memory. The written file is the same.
+        with encode_bin.FBXElemStreamWriter(filepath, FBX_VERSION) as stream_writer:
+            root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
+
+            # Mostly FBXHeaderExtension and GlobalSettings.
+            fbx_header_elements(root, scene_data)
+
+            # Documents and References are pretty much void currently.
+            fbx_documents_elements(root, scene_data)
+            fbx_references_elements(root, scene_data)
+
+            # Templates definitions.
+            fbx_definitions_elements(root, scene_data)
+
+            # Actual data.
+            fbx_objects_elements(root, scene_data, stream_writer)
+
+            # How data are inter-connected.
+            fbx_connections_elements(root, scene_data)
+
+            # Animation.
+            fbx_takes_elements(root, scene_data)
+
+            # Cleanup!
+            fbx_scene_data_cleanup(scene_data)
+
+            stream_writer.close(root)
+    else:
+        # Enable multithreaded array compression in FBXElem and wait until all threads are done before exiting the context
+        # manager.
+        with encode_bin.FBXElem.enable_multithreading_cm():
+            # Writing elements into an FBX hierarchy can now begin.
+            root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
 
-        # Mostly FBXHeaderExtension and GlobalSettings.
-        fbx_header_elements(root, scene_data)
+            # Mostly FBXHeaderExtension and GlobalSettings.
+            fbx_header_elements(root, scene_data)
 
-        # Documents and References are pretty much void currently.
-        fbx_documents_elements(root, scene_data)
-        fbx_references_elements(root, scene_data)
+            # Documents and References are pretty much void currently.
+            fbx_documents_elements(root, scene_data)
+            fbx_references_elements(root, scene_data)
 
-        # Templates definitions.
-        fbx_definitions_elements(root, scene_data)
+            # Templates definitions.
+            fbx_definitions_elements(root, scene_data)
 
-        # Actual data.
-        fbx_objects_elements(root, scene_data)
+            # Actual data.
+            fbx_objects_elements(root, scene_data)
 
-        # How data are inter-connected.
-        fbx_connections_elements(root, scene_data)
+            # How data are inter-connected.
+            fbx_connections_elements(root, scene_data)
 
-        # Animation.
-        fbx_takes_elements(root, scene_data)
+            # Animation.
+            fbx_takes_elements(root, scene_data)
 
-        # Cleanup!
-        fbx_scene_data_cleanup(scene_data)
+            # Cleanup!
+            fbx_scene_data_cleanup(scene_data)
 
-    # And we are done, all multithreaded tasks are complete, and we can write the whole thing to file!
-    encode_bin.write(filepath, root, FBX_VERSION)
+        # And we are done, all multithreaded tasks are complete, and we can write the whole thing to file!
+        encode_bin.write(filepath, root, FBX_VERSION)
 
     # Clear cached ObjectWrappers!
     ObjectWrapper.cache_clear()
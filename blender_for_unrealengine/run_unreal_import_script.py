@@ -17,23 +17,6 @@ import os
 import sys
 import importlib.util
 import argparse
-import json
-
-def json_load(json_file):
-    # In Python 3.9: The keyword argument encoding has been removed.
-    if sys.version_info >= (3, 9):
-        return json.load(json_file)
-    else:
-        return json.load(json_file, encoding="utf8")
-
-def json_load_file(json_file_path):
-    # In Python 3.9: The keyword argument encoding has been removed.
-    if sys.version_info[0] < 3:
-        with open(json_file_path, "r") as json_file:
-            return json_load(json_file)
-    else:
-        with open(json_file_path, "r", encoding="utf8") as json_file:
-            return json_load(json_file)
 
 def import_unreal_module():
     # Get the script directory
@@ -52,10 +35,14 @@ def clear_unreal_module():
     module_name = "bfu_import_module"
     del sys.modules[module_name]
 
+def json_load_file(module, import_data_filepath):
+    # Data files are read by the import module, it supports the JSON and NDJSON formats.
+    return module.import_module_utils.json_load_file(import_data_filepath)
+
 def run_from_asset_import_script(import_data_filepath):
     module = import_unreal_module()
     try:
-        module.run_asset_import(json_load_file(import_data_filepath))
+        module.run_asset_import(json_load_file(module, import_data_filepath))
     except Exception as e:
         print(f"An error has occurred: {e}")
     clear_unreal_module()
@@ -63,7 +50,7 @@ def run_from_asset_import_script(import_data_filepath):
 def run_from_sequencer_import_script(import_data_filepath):
     module = import_unreal_module()
     try:
-        module.run_sequencer_import(json_load_file(import_data_filepath))
+        module.run_sequencer_import(json_load_file(module, import_data_filepath))
     except Exception as e:
         print(f"An error has occurred: {e}")
     clear_unreal_module()
@@ -89,17 +76,17 @@ def run_from_arguments():
         show_finished_popup = args.show_finished_popup
 
         if import_type == "assets":
-            asset_data = json_load_file(import_data_filepath)
             module = import_unreal_module()
             try:
+                asset_data = json_load_file(module, import_data_filepath)
                 module.run_asset_import(asset_data, show_finished_popup)
             except Exception as e:
                 print(f"An error has occurred: {e}")
             clear_unreal_module()
         elif import_type == "sequencer":
-            asset_data = json_load_file(import_data_filepath)
             module = import_unreal_module()
             try:
+                asset_data = json_load_file(module, import_data_filepath)
                 module.run_sequencer_import(asset_data, show_finished_popup)
             except Exception as e:
                 print(f"An error has occurred: {e}")